@@ -0,0 +1,69 @@
+"""프레임 인코더 백엔드 비교 벤치마크
+
+같은 합성 프레임을 설치된 인코더(opencv, turbojpeg, simplejpeg, webp)로 인코딩하며
+프레임당 인코딩 시간과 출력 크기를 비교한다. FRAME_ENCODER=auto의 시작 시 측정과 같은 방식이다.
+
+    PYTHONPATH=src python benchmarks/bench_encoders.py
+    PYTHONPATH=src python benchmarks/bench_encoders.py --size 1920x1080 --frames 60 --subsampling 444 --output encoders.json
+"""
+import argparse
+import json
+import os
+import sys
+
+from stream_service.adapters.outbound.external.frame_encoders import (
+    JPEG_BACKENDS,
+    calibration_samples,
+    create_frame_encoder,
+)
+from stream_service.application.services.encoder_calibration import FrameEncoderConfig, calibrate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--size", default="1280x720", type=lambda value: tuple(int(v) for v in value.split("x")),
+        help="합성 프레임 크기 WxH"
+    )
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--quality", type=int, default=80)
+    parser.add_argument("--subsampling", default="420", choices=("444", "422", "420"))
+    parser.add_argument("--no-fast-dct", action="store_true", help="turbojpeg/simplejpeg의 fast DCT 끄기")
+    parser.add_argument("--output", help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    width, height = args.size
+    config = FrameEncoderConfig(
+        subsampling=args.subsampling,
+        fast_dct=not args.no_fast_dct,
+        calibration_width=width,
+        calibration_height=height,
+        calibration_frames=args.frames
+    )
+    encoders = []
+    for backend in JPEG_BACKENDS + ("webp",):
+        try:
+            encoders.append(create_frame_encoder(backend, config))
+        except RuntimeError as e:
+            print(f"skip {backend}: {e}", file=sys.stderr)
+
+    samples = calibration_samples(config)
+    results = {}
+    for encoder, seconds in calibrate(encoders, samples, args.quality):
+        results[encoder.name] = {
+            "ms_per_frame": round(seconds * 1000, 3),
+            "kb_per_frame": round(len(encoder.encode(samples[0], args.quality)) / 1024, 1),
+        }
+
+    print(f"{'encoder':<12}{'ms_per_frame':>16}{'kb_per_frame':>16}")
+    for name, result in results.items():
+        print(f"{name:<12}{result['ms_per_frame']:>16}{result['kb_per_frame']:>16}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"config": vars(args), "cpu_count": os.cpu_count(), "results": results}, f, indent=2)
+        print(f"saved {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
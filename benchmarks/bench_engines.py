@@ -0,0 +1,130 @@
+"""OpenCV vs PyAV 캡처 엔진 디코딩 벤치마크
+
+같은 로컬 영상 파일(없으면 합성 영상 생성)을 각 엔진으로 끝까지 디코딩하며
+첫 프레임까지 시간, 디코딩 fps, 단계별 평균 지연(grab/decode/encode), 프로세스 CPU 사용률을 비교한다.
+PyAV가 설치되어 있지 않으면 해당 엔진은 건너뛴다.
+
+    PYTHONPATH=src python benchmarks/bench_engines.py --video sample.mp4
+    PYTHONPATH=src python benchmarks/bench_engines.py --width 1920 --height 1080 --frames 300
+"""
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+import cv2
+import numpy as np
+
+from stream_service.adapters.outbound.external.opencv_capture_engine import OpenCVCaptureEngine
+from stream_service.adapters.outbound.external.pyav_capture_engine import PyAVCaptureEngine, PyAVCaptureOptions
+from stream_service.application.ports.outbound.capture_engine import CaptureEngine
+from stream_service.monitoring.metrics import CAPTURE_STAGES
+
+
+def make_sample_video(path: str, width: int, height: int, frames: int) -> None:
+    """움직이는 그라디언트 + 노이즈 합성 영상 (MJPG)"""
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 30, (width, height))
+    rng = np.random.default_rng(0)
+    gradient = np.tile(np.linspace(0, 255, width, dtype=np.uint8), (height, 1))
+    for i in range(frames):
+        frame = np.dstack([np.roll(gradient, i * 8, axis=1)] * 3)
+        frame = cv2.add(frame, rng.integers(0, 32, frame.shape, dtype=np.uint8))
+        writer.write(frame)
+    writer.release()
+
+
+async def run_engine(engine: CaptureEngine, video: str, idle_timeout: float, max_duration: float) -> Dict[str, Any]:
+    cpu_start = time.process_time()
+    started = time.perf_counter()
+    await engine.start_capture(video)
+
+    first_frame: Optional[float] = None
+    last_count, last_change = 0, time.perf_counter()
+    timings = engine.get_stage_timings()
+    try:
+        while time.perf_counter() - started < max_duration:
+            if first_frame is None and await engine.get_encoded_frame() is not None:
+                first_frame = time.perf_counter() - started
+            # grab()이 성공한 프레임만 decode 단계에 기록됨 (파일 끝의 실패한 grab 제외)
+            count = timings["decode"].count
+            if count != last_count:
+                last_count, last_change = count, time.perf_counter()
+            elif time.perf_counter() - last_change > idle_timeout:
+                # 파일 끝: grabber가 더 이상 프레임을 읽지 못함
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        elapsed = last_change - started
+        await engine.stop_capture()
+    cpu = time.process_time() - cpu_start
+
+    return {
+        "time_to_first_frame_ms": round((first_frame or 0.0) * 1000, 1),
+        "frames_decoded": last_count,
+        "decode_fps": round(last_count / elapsed, 1) if elapsed > 0 else 0.0,
+        **{
+            f"{stage}_mean_ms": round(timings[stage].sum / timings[stage].count * 1000, 3)
+            if timings[stage].count else 0.0
+            for stage in CAPTURE_STAGES
+        },
+        "cpu_percent": round(cpu / elapsed * 100, 1) if elapsed > 0 else 0.0,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    video = args.video
+    if video is None:
+        video = os.path.join(tempfile.mkdtemp(), "bench_engines.avi")
+        print(f"generating {args.width}x{args.height} x {args.frames} frames -> {video}", file=sys.stderr)
+        make_sample_video(video, args.width, args.height, args.frames)
+
+    engines = {"opencv": OpenCVCaptureEngine}
+    if importlib.util.find_spec("av") is not None:
+        options = PyAVCaptureOptions(decoder_threads=args.decoder_threads, thread_type=args.thread_type)
+        engines["pyav"] = lambda: PyAVCaptureEngine(options)
+    else:
+        print("PyAV is not installed; skipping pyav engine", file=sys.stderr)
+
+    results = {}
+    for name, factory in engines.items():
+        print(f"running {name} ...", file=sys.stderr)
+        results[name] = await run_engine(factory(), video, args.idle_timeout, args.max_duration)
+
+    columns = ["time_to_first_frame_ms", "frames_decoded", "decode_fps"] + [
+        f"{stage}_mean_ms" for stage in CAPTURE_STAGES
+    ] + ["cpu_percent"]
+    print(f"{'engine':<8}" + "".join(f"{column:>24}" for column in columns))
+    for name, result in results.items():
+        print(f"{name:<8}" + "".join(f"{result[column]:>24}" for column in columns))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"video": video, "cpu_count": os.cpu_count(), "results": results}, f, indent=2)
+        print(f"saved {args.output}", file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--video", help="디코딩할 로컬 영상 파일 (없으면 합성 영상 생성)")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--decoder-threads", type=int, default=0, help="PyAV 디코더 스레드 수 (0=auto)")
+    parser.add_argument("--thread-type", default="AUTO", choices=["SLICE", "FRAME", "AUTO"])
+    parser.add_argument("--idle-timeout", type=float, default=1.0, help="이 시간 동안 새 프레임이 없으면 종료")
+    parser.add_argument("--max-duration", type=float, default=60.0)
+    parser.add_argument("--output", help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
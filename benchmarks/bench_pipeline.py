@@ -0,0 +1,372 @@
+"""capture → encode → publish 파이프라인 오프라인 벤치마크
+
+실제 카메라 없이 합성(또는 파일) 프레임을 OpenCVCaptureEngine의 grab/retrieve/encode 경로에 넣고,
+VideoStreamUseCase + SocketIOPublisher를 프로세스 내 stand-in Socket.IO 서버에 연결해 측정한다.
+해상도 × JPEG 품질 조합마다 frames/s, 단계별 지연 백분위수, bytes/frame, 프레임당 할당량을 JSON으로 저장한다.
+
+    PYTHONPATH=src python benchmarks/bench_pipeline.py --duration 5 --output bench.json
+    PYTHONPATH=src python benchmarks/bench_pipeline.py --baseline bench.json --tolerance 10
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+import socketio
+from aiohttp import web
+
+from stream_service.adapters.outbound.external.opencv_capture_engine import OpenCVCaptureEngine
+from stream_service.adapters.outbound.messaging.socketio_publisher import SocketIOPublisher
+from stream_service.application.dto.frame_envelope import EncodedFrame, pack_frame_envelope, unpack_frame_envelope
+from stream_service.application.services.frame_scheduler import percentile
+from stream_service.application.usecases.video_stream_usecase import VideoStreamUseCase
+from stream_service.config.constants import EmitEvent
+from stream_service.domain.services.capture_service import CaptureService
+from stream_service.monitoring.tracing import tracer
+
+RESOLUTIONS: Dict[str, Tuple[int, int]] = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "4k": (3840, 2160),
+}
+# 해상도별 미리 만들어 둘 프레임 메모리 상한
+FRAME_POOL_BYTES = 128 * 1024 * 1024
+# 결과에 보고하는 span (tracer 이름 → 결과 키)
+STAGES = {
+    "capture.read_frame": "read_frame",
+    "capture.encode": "encode",
+    "publisher.send_video_frame": "enqueue",
+    "publisher.emit": "emit",
+}
+CAMERA_ID = "bench"
+
+
+def make_synthetic_frames(width: int, height: int, count: int) -> List[np.ndarray]:
+    """움직이는 사각형 + 그라디언트 + 노이즈 프레임 (JPEG 크기가 실제 장면과 비슷하도록)"""
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    base = np.stack([x + 0 * y, y + 0 * x, (x + y) / 2], axis=-1).astype(np.uint8)
+    frames = []
+    for i in range(count):
+        frame = base.copy()
+        frame += rng.integers(0, 24, size=frame.shape, dtype=np.uint8)
+        size = height // 4
+        left = (i * width // max(count, 1)) % max(width - size, 1)
+        frame[height // 3:height // 3 + size, left:left + size] = (40, 200, 255)
+        frames.append(frame)
+    return frames
+
+
+def load_video_frames(path: str, width: int, height: int, count: int) -> List[np.ndarray]:
+    """비디오 파일의 앞부분 프레임을 지정 해상도로 변환"""
+    cap = cv2.VideoCapture(path)
+    frames = []
+    try:
+        while len(frames) < count:
+            ok, frame = cap.read()
+            if not ok:
+                break
+            frames.append(cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA))
+    finally:
+        cap.release()
+    if not frames:
+        raise RuntimeError(f"No frames could be read from {path}")
+    return frames
+
+
+class SyntheticCapture:
+    """cv2.VideoCapture 대역 (미리 만든 프레임을 source_fps로 순환 재생)
+
+    grab()은 카메라처럼 다음 프레임 시각까지 대기하고, retrieve()는 디코더처럼 새 배열을 반환한다.
+    """
+
+    def __init__(self, frames: List[np.ndarray], fps: float):
+        self._frames = frames
+        self._interval = 1.0 / fps
+        self._index = 0
+        self._next_at: Optional[float] = None
+        self._opened = True
+
+    def isOpened(self) -> bool:
+        return self._opened
+
+    def set(self, prop: int, value: Any) -> bool:
+        return True
+
+    def grab(self) -> bool:
+        if not self._opened:
+            return False
+        now = time.monotonic()
+        if self._next_at is None:
+            self._next_at = now
+        elif now < self._next_at:
+            time.sleep(self._next_at - now)
+        self._next_at = max(self._next_at + self._interval, time.monotonic() - self._interval)
+        self._index += 1
+        return True
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if not self._opened:
+            return False, None
+        return True, self._frames[self._index % len(self._frames)].copy()
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        return self.retrieve() if self.grab() else (False, None)
+
+    def release(self) -> None:
+        self._opened = False
+
+
+class StandInRelayServer:
+    """Event Management Service 대역 (프레임 수, 바이트, capture→수신 지연 집계)"""
+
+    def __init__(self):
+        self.sio = socketio.AsyncServer(async_mode="aiohttp", logger=False, engineio_logger=False)
+        self._app = web.Application()
+        self.sio.attach(self._app)
+        self.sio.on(EmitEvent.VIDEO_FRAME_RELAY, self._on_frame)
+        self._runner: Optional[web.AppRunner] = None
+        self.reset()
+
+    def reset(self) -> None:
+        self.frames = 0
+        self.bytes = 0
+        self.latency: List[float] = []
+
+    async def _on_frame(self, sid, data) -> None:
+        if isinstance(data, (bytes, bytearray)):
+            _, frame = unpack_frame_envelope(data)
+            self.bytes += frame.nbytes
+            self.latency.append(time.time() - frame.captured_at)
+        else:
+            self.bytes += len(data["frame_data"])
+        self.frames += 1
+
+    async def start(self) -> str:
+        self._runner = web.AppRunner(self._app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+def _latency_summary(values_ms: List[float]) -> Dict[str, float]:
+    return {
+        "p50_ms": round(percentile(values_ms, 50), 3),
+        "p95_ms": round(percentile(values_ms, 95), 3),
+        "p99_ms": round(percentile(values_ms, 99), 3),
+        "samples": len(values_ms),
+    }
+
+
+def measure_allocations(frames: List[np.ndarray], quality: int, count: int) -> Dict[str, float]:
+    """retrieve → imencode → envelope 경로의 프레임당 할당량 (tracemalloc)
+
+    peak는 프레임 하나를 처리하는 동안 추가로 잡힌 최대 메모리, retained는 처리 후에도 남은 블록 수다.
+    """
+    capture = SyntheticCapture(frames, fps=1e9)
+    params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+    peaks = []
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for seq in range(1, count + 1):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        capture.grab()
+        _, image = capture.retrieve()
+        _, buffer = cv2.imencode(".jpg", image, params)
+        frame = EncodedFrame(seq, time.time(), image.shape[1], image.shape[0], memoryview(buffer).cast("B"))
+        pack_frame_envelope(CAMERA_ID, frame)
+        del image, buffer, frame
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    return {
+        "alloc_peak_bytes_per_frame": round(sum(peaks) / len(peaks)),
+        "alloc_retained_blocks_per_frame": round(retained / count, 2),
+    }
+
+
+async def run_case(
+    resolution: str, frames: List[np.ndarray], quality: int, args: argparse.Namespace
+) -> Dict[str, Any]:
+    """해상도/품질 조합 하나를 stand-in 서버에 대해 duration초 동안 실행"""
+    height, width = frames[0].shape[:2]
+    server = StandInRelayServer()
+    url = await server.start()
+    sio = socketio.AsyncClient(logger=False, engineio_logger=False)
+    publisher = SocketIOPublisher(sio, EmitEvent(), frame_queue_size=args.queue_size)
+
+    def _engine_factory():
+        engine = OpenCVCaptureEngine(capture_factory=lambda _: SyntheticCapture(frames, args.source_fps))
+        engine.set_encode_params(quality, 1.0)
+        return engine
+
+    usecase = VideoStreamUseCase(
+        capture_service=CaptureService(cameras={CAMERA_ID: f"synthetic://{resolution}"}),
+        event_publisher=publisher,
+        capture_engine_factory=_engine_factory,
+        frame_rate=args.fps
+    )
+
+    try:
+        await sio.connect(url, transports=["websocket"])
+        await usecase.handle_capture_start_request(CAMERA_ID)
+        await asyncio.sleep(args.warmup)
+
+        # 워밍업 이후 구간만 측정
+        server.reset()
+        tracer.clear()
+        queue_before = publisher.get_queue_stats()["streams"].get(CAMERA_ID, {}).get("dropped", 0)
+        stale_before = usecase.get_stream_stats()[CAMERA_ID]["dropped_stale"]
+        cpu_before = time.process_time()
+        started = time.perf_counter()
+        await asyncio.sleep(args.duration)
+        elapsed = time.perf_counter() - started
+        cpu_used = time.process_time() - cpu_before
+
+        received = server.frames
+        stats = usecase.get_stream_stats()[CAMERA_ID]
+        queue_dropped = publisher.get_queue_stats()["streams"].get(CAMERA_ID, {}).get("dropped", 0) - queue_before
+        stage_latency = {
+            key: _latency_summary([span["duration_ms"] for span in tracer.recent(name=name)])
+            for name, key in STAGES.items()
+        }
+        stage_latency["end_to_end"] = _latency_summary([latency * 1000 for latency in server.latency])
+        received_bytes = server.bytes
+    finally:
+        if usecase.capture_service.get_session_status(CAMERA_ID).is_active:
+            await usecase.handle_capture_stop_request(CAMERA_ID)
+        await publisher.close()
+        await sio.disconnect()
+        await server.stop()
+
+    return {
+        "resolution": resolution,
+        "width": width,
+        "height": height,
+        "quality": quality,
+        "target_fps": args.fps,
+        "source_fps": args.source_fps,
+        "frames": received,
+        "fps": round(received / elapsed, 2),
+        "bytes_per_frame": round(received_bytes / received) if received else 0,
+        "dropped_queue": queue_dropped,
+        "dropped_stale": stats["dropped_stale"] - stale_before,
+        "cpu_percent": round(cpu_used / elapsed * 100, 1),
+        "latency": stage_latency,
+        **measure_allocations(frames, quality, args.alloc_frames),
+    }
+
+
+def compare_with_baseline(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """기준 결과 대비 fps 하락 또는 encode/end-to-end p95 증가가 tolerance(%)를 넘는 항목"""
+    previous = {(r["resolution"], r["quality"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        base = previous.get((result["resolution"], result["quality"]))
+        if base is None:
+            continue
+        case = f"{result['resolution']} q{result['quality']}"
+        if result["fps"] < base["fps"] * (1 - tolerance / 100):
+            regressions.append(f"{case}: fps {base['fps']} -> {result['fps']}")
+        for stage in ("encode", "end_to_end"):
+            old, new = base["latency"][stage]["p95_ms"], result["latency"][stage]["p95_ms"]
+            if old > 0 and new > old * (1 + tolerance / 100):
+                regressions.append(f"{case}: {stage} p95 {old}ms -> {new}ms")
+    return regressions
+
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    header = (
+        f"{'case':<12}{'fps':>8}{'KiB/frame':>11}{'read p95':>10}{'encode p95':>12}"
+        f"{'emit p95':>10}{'e2e p95':>10}{'cpu%':>7}{'peak KiB':>10}"
+    )
+    print(header)
+    for r in results:
+        latency = r["latency"]
+        print(
+            f"{r['resolution'] + ' q' + str(r['quality']):<12}{r['fps']:>8.1f}{r['bytes_per_frame'] / 1024:>11.1f}"
+            f"{latency['read_frame']['p95_ms']:>10.2f}{latency['encode']['p95_ms']:>12.2f}"
+            f"{latency['emit']['p95_ms']:>10.2f}{latency['end_to_end']['p95_ms']:>10.2f}"
+            f"{r['cpu_percent']:>7.1f}{r['alloc_peak_bytes_per_frame'] / 1024:>10.1f}"
+        )
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    tracer.configure(True, capacity=200_000)
+    results = []
+    for resolution in args.resolutions:
+        width, height = RESOLUTIONS[resolution]
+        count = max(2, min(16, FRAME_POOL_BYTES // (width * height * 3)))
+        if args.video:
+            frames = load_video_frames(args.video, width, height, count)
+        else:
+            frames = make_synthetic_frames(width, height, count)
+        for quality in args.qualities:
+            print(f"running {resolution} q{quality} ...", file=sys.stderr)
+            results.append(await run_case(resolution, frames, quality, args))
+
+    print_table(results)
+    report = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "opencv": cv2.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "args": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"saved {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_with_baseline(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resolutions", nargs="+", default=list(RESOLUTIONS), choices=list(RESOLUTIONS))
+    parser.add_argument("--qualities", nargs="+", type=int, default=[50, 70, 90])
+    parser.add_argument("--duration", type=float, default=5.0, help="조합별 측정 시간 (seconds)")
+    parser.add_argument("--warmup", type=float, default=1.0)
+    parser.add_argument("--fps", type=float, default=30.0, help="스트리밍 목표 fps")
+    parser.add_argument("--source-fps", type=float, default=30.0, help="합성 카메라 fps")
+    parser.add_argument("--queue-size", type=int, default=3)
+    parser.add_argument("--alloc-frames", type=int, default=30)
+    parser.add_argument("--video", help="합성 프레임 대신 사용할 비디오 파일")
+    parser.add_argument("--output", help="결과 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=10.0, help="회귀 판정 허용 범위 (%%)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    sys.exit(asyncio.run(main_async(args)))
+
+
+if __name__ == "__main__":
+    main()
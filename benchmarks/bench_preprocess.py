@@ -0,0 +1,130 @@
+"""인코딩 전 crop/축소 단계의 인코딩 CPU 절감 벤치마크
+
+같은 합성 프레임(1080p, 4K)을 다음 방식으로 JPEG 인코딩하며 프레임당 CPU 시간(thread_time)과 출력 크기를 비교한다.
+- native: 원본 크기 그대로 인코딩 (기존 동작)
+- resize_alloc: 매 프레임 새 배열을 할당하는 cv2.resize(INTER_AREA) 후 인코딩
+- area: FramePreprocessor(INTER_AREA, 미리 할당한 출력 배열) 후 인코딩
+- linear: FramePreprocessor(입력 크기별로 캐시한 remap 테이블) 후 인코딩
+
+    PYTHONPATH=src python benchmarks/bench_preprocess.py
+    PYTHONPATH=src python benchmarks/bench_preprocess.py --target 800x600 --frames 200 --output preprocess.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import cv2
+import numpy as np
+
+from stream_service.adapters.outbound.external.frame_preprocessor import FramePreprocessor
+from stream_service.application.services.preprocess import PreprocessConfig, plan_preprocess
+
+SOURCES = {"1080p": (1920, 1080), "4k": (3840, 2160)}
+
+
+def make_frames(width: int, height: int, count: int) -> List[np.ndarray]:
+    """움직이는 그라디언트 + 노이즈 합성 프레임"""
+    rng = np.random.default_rng(0)
+    gradient = np.tile(np.linspace(0, 255, width, dtype=np.uint8), (height, 1))
+    frames = []
+    for i in range(count):
+        frame = np.dstack([np.roll(gradient, i * 8, axis=1)] * 3)
+        frames.append(cv2.add(frame, rng.integers(0, 32, frame.shape, dtype=np.uint8)))
+    return frames
+
+
+def run_method(frames: List[np.ndarray], prepare: Callable[[np.ndarray], Any], quality: int) -> Dict[str, Any]:
+    encode_params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+    total_bytes = 0
+    shape: Tuple[int, ...] = ()
+    cpu_start = time.thread_time()
+    wall_start = time.perf_counter()
+    for frame in frames:
+        with prepare(frame) as prepared:
+            success, buffer = cv2.imencode(".jpg", prepared, encode_params)
+            shape = prepared.shape
+        total_bytes += len(buffer) if success else 0
+    cpu = time.thread_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    return {
+        "output": f"{shape[1]}x{shape[0]}",
+        "cpu_ms_per_frame": round(cpu / len(frames) * 1000, 3),
+        "wall_ms_per_frame": round(wall / len(frames) * 1000, 3),
+        "kb_per_frame": round(total_bytes / len(frames) / 1024, 1),
+    }
+
+
+class _Passthrough:
+    def __init__(self, frame: np.ndarray):
+        self.frame = frame
+
+    def __enter__(self) -> np.ndarray:
+        return self.frame
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+def bench_source(width: int, height: int, args: argparse.Namespace) -> Dict[str, Any]:
+    frames = make_frames(width, height, args.frames)
+    target_width, target_height = args.target
+    plan = plan_preprocess(PreprocessConfig(max_width=target_width, max_height=target_height), width, height)
+    area = FramePreprocessor(PreprocessConfig(max_width=target_width, max_height=target_height))
+    linear = FramePreprocessor(
+        PreprocessConfig(max_width=target_width, max_height=target_height, interpolation="linear")
+    )
+
+    methods = {
+        "native": _Passthrough,
+        "resize_alloc": lambda frame: _Passthrough(
+            cv2.resize(frame, (plan.width, plan.height), interpolation=cv2.INTER_AREA)
+        ),
+        "area": area.apply,
+        "linear": linear.apply,
+    }
+    results = {}
+    for name, prepare in methods.items():
+        # 첫 프레임(버퍼/테이블 생성)은 측정에서 제외
+        run_method(frames[:1], prepare, args.quality)
+        results[name] = run_method(frames, prepare, args.quality)
+    native_cpu = results["native"]["cpu_ms_per_frame"]
+    for result in results.values():
+        result["cpu_saved_percent"] = round((1 - result["cpu_ms_per_frame"] / native_cpu) * 100, 1)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--target", default="800x600", type=lambda value: tuple(int(v) for v in value.split("x")),
+        help="출력 최대 크기 WxH (브라우저 뷰어 캔버스 기본 800x600)"
+    )
+    parser.add_argument("--sources", default="1080p,4k", help=f"입력 해상도 ({', '.join(SOURCES)})")
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--quality", type=int, default=80)
+    parser.add_argument("--output", help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    results = {}
+    for source in args.sources.split(","):
+        width, height = SOURCES[source]
+        print(f"running {source} ({width}x{height}) ...", file=sys.stderr)
+        results[source] = bench_source(width, height, args)
+
+    columns = ["output", "cpu_ms_per_frame", "wall_ms_per_frame", "kb_per_frame", "cpu_saved_percent"]
+    print(f"{'source':<8}{'method':<14}" + "".join(f"{column:>20}" for column in columns))
+    for source, methods in results.items():
+        for name, result in methods.items():
+            print(f"{source:<8}{name:<14}" + "".join(f"{result[column]:>20}" for column in columns))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"target": args.target, "cpu_count": os.cpu_count(), "results": results}, f, indent=2)
+        print(f"saved {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
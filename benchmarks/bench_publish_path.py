@@ -0,0 +1,83 @@
+"""프레임 publish 경로 벤치마크 (legacy DTO vs binary envelope)
+
+인코더 출력(numpy 버퍼)에서 sio.emit에 넘길 payload까지의 프레임당 CPU 시간과
+Python 할당량을 측정한다. 네트워크 전송은 포함하지 않는다.
+
+    python benchmarks/bench_publish_path.py --frames 3000 --frame-kb 150
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from stream_service.application.dto.frame_envelope import EncodedFrame, pack_frame_envelope
+from stream_service.application.dto.socketio_dto import VideoFrameFromServiceDTO
+
+
+def legacy_publish(camera_id: str, buffer: np.ndarray, seq: int):
+    """기존 경로: tobytes() 복사 + pydantic 검증 + model_dump()"""
+    dto = VideoFrameFromServiceDTO(frame_data=buffer.tobytes(), camera_id=camera_id)
+    return dto.model_dump()
+
+
+def envelope_publish(camera_id: str, buffer: np.ndarray, seq: int):
+    """새 경로: memoryview 래핑 + 단일 bytearray envelope"""
+    frame = EncodedFrame(
+        seq=seq, captured_at=time.time(), width=1920, height=1080,
+        data=memoryview(buffer).cast("B")
+    )
+    return pack_frame_envelope(camera_id, frame)
+
+
+def measure(publish, buffer: np.ndarray, frames: int):
+    # 워밍업
+    for seq in range(100):
+        publish("cam1", buffer, seq)
+
+    cpu_start = time.process_time()
+    for seq in range(frames):
+        publish("cam1", buffer, seq)
+    cpu_per_frame = (time.process_time() - cpu_start) / frames
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+    # payload는 sender가 소비하기 전까지 살아 있으므로 할당 블록 수를 세기 위해 보관
+    kept = [publish("cam1", buffer, seq) for seq in range(200)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+    allocated = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+    del kept
+    return {
+        "cpu_us_per_frame": cpu_per_frame * 1e6,
+        "blocks_per_frame": blocks / 200,
+        "bytes_per_frame": allocated / 200,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--frame-kb", type=int, default=150, help="인코딩 프레임 크기 (KiB)")
+    args = parser.parse_args()
+
+    buffer = np.random.randint(0, 256, args.frame_kb * 1024, dtype=np.uint8)
+    results = {
+        "legacy_dto": measure(legacy_publish, buffer, args.frames),
+        "binary_envelope": measure(envelope_publish, buffer, args.frames),
+    }
+
+    print(f"{'path':<18}{'cpu us/frame':>14}{'allocs/frame':>14}{'KiB/frame':>12}")
+    for name, result in results.items():
+        print(
+            f"{name:<18}{result['cpu_us_per_frame']:>14.1f}"
+            f"{result['blocks_per_frame']:>14.1f}{result['bytes_per_frame'] / 1024:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
+
+from stream_service.adapters.outbound.storage.mjpeg_avi_writer import clip_fps, save_clip
+from stream_service.adapters.outbound.storage.segment_recorder import (
+    SegmentRange,
+    SegmentRecorder,
+    iter_recorded_frames
+)
+from stream_service.application.dto.frame_envelope import CODEC_MEDIA_TYPES, EncodedFrame, FrameCodec
+from stream_service.application.services.bounded_executor import BoundedExecutor, ExecutorSaturatedError
+from stream_service.application.services.frame_bus import DropPolicy, FrameBus, FrameSubscription, MAIN_TIER
+from stream_service.application.services.pre_event_buffer import PreEventBuffers
+from stream_service.application.usecases.video_stream_usecase import VideoStreamUseCase
+from stream_service.config.container import Container
+from stream_service.config.settings import settings
+
+MJPEG_BOUNDARY = "frame"
+_PART_HEADER = (
+    b"--" + MJPEG_BOUNDARY.encode() + b"\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n"
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/cameras", tags=["cameras"])
+
+
+def frame_etag(frame: EncodedFrame) -> str:
+    """프레임 시퀀스 + 캡처 시각(재시작 시 seq 중복 방지) + 크기로 만든 strong ETag"""
+    return f'"{frame.seq}-{int(frame.captured_at * 1_000_000)}-{frame.width}x{frame.height}"'
+
+
+async def run_control(executor: BoundedExecutor, fn: Callable[..., Any], *args: Any) -> Any:
+    """제어 executor에서 실행 (대기 작업이 한도를 넘으면 503)"""
+    try:
+        return await executor.run(fn, *args)
+    except ExecutorSaturatedError:
+        raise HTTPException(status_code=503, detail="Server is busy", headers={"Retry-After": "1"})
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+async def mjpeg_parts(frame_bus: FrameBus, subscription: FrameSubscription) -> AsyncIterator[bytes]:
+    """multipart/x-mixed-replace 파트 생성 (클라이언트 연결이 끊기면 구독 해제)"""
+    try:
+        while True:
+            item = await subscription.get()
+            if item is None:
+                break
+            _, frame = item
+            if frame.codec != FrameCodec.JPEG:
+                continue
+            yield b"".join((_PART_HEADER % frame.nbytes, frame.data, b"\r\n"))
+    finally:
+        frame_bus.unsubscribe(subscription)
+
+
+def recorded_parts(ranges: List[SegmentRange]) -> Iterator[bytes]:
+    """녹화 구간을 multipart 파트로 생성 (동기 generator라 mmap 페이지 폴트는 threadpool에서 발생)"""
+    for frame in iter_recorded_frames(ranges):
+        yield b"".join((_PART_HEADER % frame.nbytes, frame.data, b"\r\n"))
+
+
+@router.get("/{camera_id}/mjpeg")
+@inject
+async def stream_mjpeg(
+    camera_id: str,
+    tier: str = Query(MAIN_TIER, description="해상도 tier (main 또는 RESOLUTION_TIERS의 이름)"),
+    usecase: VideoStreamUseCase = Depends(Provide[Container.video_stream_usecase]),
+    frame_bus: FrameBus = Depends(Provide[Container.frame_bus])
+) -> StreamingResponse:
+    """이미 인코딩된 JPEG 프레임을 MJPEG로 스트리밍 (재인코딩 없음, 느린 클라이언트는 프레임 건너뜀)"""
+    if camera_id not in usecase.capture_service.camera_ids:
+        raise HTTPException(status_code=404, detail=f"Unknown camera: {camera_id}")
+    if tier != MAIN_TIER and tier not in usecase.resolution_tiers:
+        raise HTTPException(status_code=404, detail=f"Unknown resolution tier: {tier}")
+    if tier == MAIN_TIER and settings.frame_encoder == "webp":
+        # 기본 스트림이 WebP면 보낼 JPEG 프레임이 없음 (해상도 tier는 항상 JPEG)
+        raise HTTPException(
+            status_code=409,
+            detail=f"Main stream is WebP (FRAME_ENCODER=webp), request a resolution tier: {sorted(usecase.resolution_tiers)}"
+        )
+    try:
+        # 클라이언트마다 최신 프레임 하나만 보관
+        subscription = frame_bus.subscribe(
+            "mjpeg", camera_id, policy=DropPolicy.LATEST_ONLY, limit=settings.mjpeg_max_viewers, tier=tier
+        )
+    except OverflowError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    return StreamingResponse(
+        mjpeg_parts(frame_bus, subscription),
+        media_type=f"multipart/x-mixed-replace; boundary={MJPEG_BOUNDARY}",
+        headers={"Cache-Control": "no-cache, no-store", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/{camera_id}/snapshot")
+@inject
+async def get_snapshot(
+    camera_id: str,
+    width: Optional[int] = Query(None, ge=16, le=7680, description="축소할 너비 (px, 원본보다 크면 무시)"),
+    if_none_match: Optional[str] = Header(None),
+    usecase: VideoStreamUseCase = Depends(Provide[Container.video_stream_usecase])
+) -> Response:
+    """메모리의 최신 프레임 반환 (Content-Type은 코덱에 따라, RTSP 연결을 새로 열지 않음, If-None-Match면 304)"""
+    if camera_id not in usecase.capture_service.camera_ids:
+        raise HTTPException(status_code=404, detail=f"Unknown camera: {camera_id}")
+    frame = await usecase.get_snapshot(camera_id, width)
+    if frame is None or frame.codec not in CODEC_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=503, detail=f"No frame available for camera: {camera_id}", headers={"Retry-After": "1"}
+        )
+
+    etag = frame_etag(frame)
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "X-Frame-Seq": str(frame.seq)}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=frame.to_bytes(), media_type=CODEC_MEDIA_TYPES[frame.codec], headers=headers)
+
+
+@router.post("/{camera_id}/clip")
+@inject
+async def export_clip(
+    camera_id: str,
+    seconds: float = Query(10.0, gt=0, description="내보낼 최근 구간 길이 (seconds, CLIP_MAX_SECONDS까지)"),
+    usecase: VideoStreamUseCase = Depends(Provide[Container.video_stream_usecase]),
+    buffers: PreEventBuffers = Depends(Provide[Container.pre_event_buffers]),
+    control_executor: BoundedExecutor = Depends(Provide[Container.control_executor])
+) -> FileResponse:
+    """pre-event ring의 최근 seconds초를 MJPEG AVI로 저장하고 반환
+
+    ring에서 프레임을 나눠 복사한 뒤 파일 쓰기는 제어 executor에서 하므로 라이브 스트림을 막지 않는다.
+    """
+    if camera_id not in usecase.capture_service.camera_ids:
+        raise HTTPException(status_code=404, detail=f"Unknown camera: {camera_id}")
+    if seconds > settings.clip_max_seconds:
+        raise HTTPException(status_code=422, detail=f"seconds must be <= {settings.clip_max_seconds}")
+    buffer = buffers.get(camera_id)
+    requested_from = time.time() - seconds
+    frames = await buffer.export(seconds) if buffer is not None else []
+    if not frames:
+        raise HTTPException(
+            status_code=503, detail=f"No buffered frames for camera: {camera_id}", headers={"Retry-After": "1"}
+        )
+    # ring이 요청 구간 시작까지 거슬러 올라가지 못하면 짧은 clip임을 알림
+    oldest = buffer.oldest_captured_at
+    truncated = oldest is not None and oldest > requested_from and frames[0].captured_at >= oldest
+    clip_seconds = round(frames[-1].captured_at - frames[0].captured_at, 3)
+    if truncated:
+        logger.warning(
+            f"[{camera_id}] Clip truncated: requested {seconds}s, buffered {clip_seconds}s "
+            f"(pre-event target {buffers.target_seconds(camera_id)}s)"
+        )
+
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(frames[-1].captured_at))
+    filename = f"{camera_id}-{stamp}-{frames[-1].seq}.avi"
+    path = await run_control(
+        control_executor, save_clip, settings.clip_dir, filename, frames, clip_fps(frames), settings.clip_max_files
+    )
+    return FileResponse(
+        path,
+        media_type="video/x-msvideo",
+        filename=filename,
+        headers={
+            "X-Clip-Frames": str(len(frames)),
+            "X-Clip-Start-Seq": str(frames[0].seq),
+            "X-Clip-Seconds": str(clip_seconds),
+            "X-Clip-Truncated": "1" if truncated else "0",
+        },
+        # CLIP_MAX_FILES=0이면 보관하지 않고 전송 후 삭제
+        background=BackgroundTask(os.remove, path) if settings.clip_max_files <= 0 else None
+    )
+
+
+@router.get("/{camera_id}/recordings")
+@inject
+async def list_recordings(
+    camera_id: str,
+    usecase: VideoStreamUseCase = Depends(Provide[Container.video_stream_usecase]),
+    recorder: SegmentRecorder = Depends(Provide[Container.segment_recorder]),
+    control_executor: BoundedExecutor = Depends(Provide[Container.control_executor])
+) -> List[Dict[str, Any]]:
+    """카메라의 녹화 세그먼트 목록 (시작/끝 시각, 프레임 수, 크기)"""
+    if camera_id not in usecase.capture_service.camera_ids:
+        raise HTTPException(status_code=404, detail=f"Unknown camera: {camera_id}")
+    segments = await run_control(control_executor, recorder.segments, camera_id)
+    return [segment.as_dict() for segment in segments]
+
+
+@router.get("/{camera_id}/recording")
+@inject
+async def play_recording(
+    camera_id: str,
+    start: float = Query(..., description="구간 시작 (unix seconds)"),
+    end: float = Query(..., description="구간 끝 (unix seconds)"),
+    usecase: VideoStreamUseCase = Depends(Provide[Container.video_stream_usecase]),
+    recorder: SegmentRecorder = Depends(Provide[Container.segment_recorder]),
+    control_executor: BoundedExecutor = Depends(Provide[Container.control_executor])
+) -> StreamingResponse:
+    """녹화된 JPEG을 세그먼트 mmap에서 잘라 MJPEG로 전송 (디코딩/재인코딩 없음)"""
+    if camera_id not in usecase.capture_service.camera_ids:
+        raise HTTPException(status_code=404, detail=f"Unknown camera: {camera_id}")
+    if end < start:
+        raise HTTPException(status_code=422, detail="end must be >= start")
+    ranges = await run_control(control_executor, recorder.find_range, camera_id, start, end)
+    if not ranges:
+        raise HTTPException(status_code=404, detail=f"No recording in range for camera: {camera_id}")
+
+    return StreamingResponse(
+        recorded_parts(ranges),
+        media_type=f"multipart/x-mixed-replace; boundary={MJPEG_BOUNDARY}",
+        headers={"X-Recording-Frames": str(sum(len(records) for _, records in ranges))}
+    )
@@ -0,0 +1,34 @@
+from typing import Any, Dict, Optional
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Query
+
+from stream_service.config.container import Container
+from stream_service.config.settings import settings
+from stream_service.monitoring.loop_monitor import LoopLagMonitor
+from stream_service.monitoring.startup_profile import startup_profile
+from stream_service.monitoring.tracing import tracer
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+@router.get("/timings")
+@inject
+async def get_timings(
+    limit: int = Query(200, ge=1, le=10000),
+    name: Optional[str] = None,
+    loop_monitor: LoopLagMonitor = Depends(Provide[Container.loop_lag_monitor])
+) -> Dict[str, Any]:
+    """최근 span, span 이름별 지연 요약, 이벤트 루프 지연 통계 조회"""
+    return {
+        "tracing_enabled": tracer.enabled,
+        "summary": tracer.summary(),
+        "spans": tracer.recent(limit=limit, name=name),
+        "event_loop": loop_monitor.stats(),
+    }
+
+
+@router.get("/startup")
+async def get_startup_profile() -> Dict[str, Any]:
+    """기동 단계별 소요 시간과 time-to-ready (STARTUP_BUDGET_MS 대비)"""
+    return startup_profile.report(settings.startup_budget_ms / 1000)
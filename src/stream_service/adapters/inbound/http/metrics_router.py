@@ -0,0 +1,225 @@
+from typing import Optional
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from stream_service.adapters.outbound.messaging.socketio_publisher import SocketIOPublisher
+from stream_service.adapters.outbound.storage.segment_recorder import SegmentRecorder
+from stream_service.application.services.bounded_executor import BoundedExecutor
+from stream_service.application.services.frame_bus import FrameBus
+from stream_service.application.services.pre_event_buffer import PreEventBuffers
+from stream_service.application.usecases.video_stream_usecase import VideoStreamUseCase
+from stream_service.config.container import Container
+from stream_service.config.settings import settings
+from stream_service.monitoring.loop_monitor import LoopLagMonitor
+from stream_service.monitoring.metrics import PrometheusExposition
+from stream_service.monitoring.process_stats import process_cpu_seconds, process_rss_bytes
+from stream_service.monitoring.startup_profile import startup_profile
+
+router = APIRouter(tags=["metrics"])
+
+
+def render_metrics(
+    usecase: VideoStreamUseCase,
+    publisher: SocketIOPublisher,
+    loop_monitor: Optional[LoopLagMonitor] = None,
+    frame_bus: Optional[FrameBus] = None,
+    pre_event_buffers: Optional[PreEventBuffers] = None,
+    recorder: Optional[SegmentRecorder] = None,
+    control_executor: Optional[BoundedExecutor] = None
+) -> str:
+    """스트림별 단계 지연, 프레임 레이트, drop/실패 카운터를 Prometheus text format으로 직렬화"""
+    exposition = PrometheusExposition()
+
+    for camera_id, timings in usecase.get_stage_timings().items():
+        for stage, histogram in timings.items():
+            exposition.histogram(
+                "stage_duration_seconds", "Per-frame pipeline stage duration.",
+                histogram, {"camera_id": camera_id, "stage": stage}
+            )
+    for camera_id, histogram in publisher.get_emit_timings().items():
+        exposition.histogram(
+            "stage_duration_seconds", "Per-frame pipeline stage duration.",
+            histogram, {"camera_id": camera_id, "stage": "emit"}
+        )
+
+    for camera_id, stats in usecase.get_stream_stats().items():
+        labels = {"camera_id": camera_id}
+        exposition.gauge("capturing", "1 while the stream is capturing.", stats["is_capturing"], labels)
+        exposition.gauge("target_fps", "Configured streaming frame rate.", stats["target_fps"], labels)
+        exposition.gauge("achieved_fps", "Recent scheduler tick rate.", stats["achieved_fps"], labels)
+        exposition.gauge(
+            "consecutive_read_failures", "Current run of failed frame reads.",
+            stats["consecutive_failures"], labels
+        )
+        exposition.counter(
+            "reconnect_attempts_total", "Connection attempts after a failed open.",
+            stats.get("reconnect_attempts", 0), labels
+        )
+        exposition.counter(
+            "capture_outages_total", "Times the stream stalled and the capture was reopened.",
+            stats.get("outages", 0), labels
+        )
+        exposition.counter(
+            "capture_recoveries_total", "Outages that ended with a new frame.", stats.get("recoveries", 0), labels
+        )
+        exposition.counter(
+            "capture_recovery_seconds_total", "Time from the last frame before an outage to the first frame after it.",
+            stats.get("recovery_seconds_total", 0.0), labels
+        )
+        exposition.gauge(
+            "capture_last_recovery_seconds", "Duration of the most recent outage.",
+            stats.get("last_recovery_seconds", 0.0), labels
+        )
+        exposition.gauge(
+            "capture_recovering", "1 while the capture is reconnecting.", stats.get("recovering", False), labels
+        )
+        exposition.counter(
+            "dropped_frames_total", "Frames dropped before emit, by reason.",
+            stats["dropped_stale"], {**labels, "reason": "stale"}
+        )
+        exposition.counter(
+            "dropped_frames_total", "Frames dropped before emit, by reason.",
+            stats.get("suppressed_frames", 0), {**labels, "reason": "static_scene"}
+        )
+        exposition.counter(
+            "scheduler_skipped_ticks_total", "Ticks skipped to catch up with the schedule.",
+            stats["skipped_ticks"], labels
+        )
+        exposition.counter(
+            "capture_cpu_seconds_total", "CPU time used by capture and encode.",
+            stats["cpu_seconds"], labels
+        )
+        if "executor_queued" in stats:
+            executor_labels = {**labels, "pool": "stream"}
+            exposition.gauge(
+                "executor_queue_depth", "Tasks waiting for an executor thread.", stats["executor_queued"], executor_labels
+            )
+            exposition.gauge(
+                "executor_running", "Tasks running on executor threads.", stats["executor_running"], executor_labels
+            )
+            exposition.counter(
+                "executor_rejected_total", "Tasks rejected because the executor queue was full.",
+                stats["executor_rejected"], executor_labels
+            )
+        if "variant_cache_hits" in stats:
+            exposition.counter(
+                "variant_cache_hits_total", "Encoded variant requests served from cache.",
+                stats["variant_cache_hits"], labels
+            )
+            exposition.counter(
+                "variant_cache_misses_total", "Encoded variant requests that had to encode.",
+                stats["variant_cache_misses"], labels
+            )
+            exposition.counter(
+                "variant_cache_evictions_total", "Encoded variants evicted to stay within the byte budget.",
+                stats["variant_cache_evictions"], labels
+            )
+            exposition.gauge(
+                "variant_cache_bytes", "Bytes held by the encoded variant cache.", stats["variant_cache_bytes"], labels
+            )
+
+    for camera_id, stats in publisher.get_queue_stats()["streams"].items():
+        labels = {"camera_id": camera_id}
+        exposition.counter(
+            "dropped_frames_total", "Frames dropped before emit, by reason.",
+            stats["dropped"], {**labels, "reason": "queue_full"}
+        )
+        exposition.counter("frames_sent_total", "Frames emitted to the Socket.IO server.", stats["sent"], labels)
+        exposition.counter("frame_bytes_total", "Encoded frame bytes emitted.", stats["bytes_sent"], labels)
+        exposition.gauge("outbound_queue_depth", "Frames waiting in the outbound queue.", stats["depth"], labels)
+
+    if frame_bus is not None:
+        for (consumer, camera_id, tier), stats in frame_bus.consumer_stats().items():
+            labels = {"consumer": consumer, "camera_id": camera_id, "tier": tier}
+            exposition.gauge(
+                "frame_bus_subscribers", "Frame bus subscriptions per consumer.", stats.subscribers, labels
+            )
+            exposition.counter(
+                "frame_bus_delivered_total", "Frames taken from the bus by consumers.", stats.delivered, labels
+            )
+            exposition.counter(
+                "frame_bus_dropped_total", "Frames dropped from full consumer queues.", stats.dropped, labels
+            )
+            exposition.histogram(
+                "frame_bus_consumer_lag_seconds", "Time frames wait in consumer queues.", stats.lag, labels
+            )
+
+    if pre_event_buffers is not None:
+        for camera_id, stats in pre_event_buffers.stats().items():
+            labels = {"camera_id": camera_id}
+            exposition.gauge(
+                "pre_event_buffer_capacity_bytes", "Preallocated pre-event ring size.", stats["capacity_bytes"], labels
+            )
+            exposition.gauge(
+                "pre_event_buffer_bytes", "Encoded frame bytes held in the pre-event ring.", stats["used_bytes"], labels
+            )
+            exposition.gauge(
+                "pre_event_buffer_seconds", "Time span covered by the pre-event ring.", stats["span_seconds"], labels
+            )
+
+    if recorder is not None:
+        stats = recorder.stats()
+        exposition.counter("recording_frames_total", "Frames written to recording segments.", stats["recorded_frames"])
+        exposition.counter("recording_bytes_total", "Bytes written to recording segments.", stats["recorded_bytes"])
+        exposition.counter(
+            "recording_dropped_frames_total", "Frames dropped because pending writes exceeded the limit.",
+            stats["dropped_frames"]
+        )
+        exposition.gauge("recording_pending_bytes", "Frame bytes waiting for the segment writer.", stats["pending_bytes"])
+        exposition.histogram(
+            "recording_flush_duration_seconds", "Time the segment writer spends on one batch.", recorder.flush_duration
+        )
+
+    if control_executor is not None:
+        stats = control_executor.stats()
+        labels = {"pool": "control"}
+        exposition.gauge("executor_queue_depth", "Tasks waiting for an executor thread.", stats["queued"], labels)
+        exposition.gauge("executor_running", "Tasks running on executor threads.", stats["running"], labels)
+        exposition.counter(
+            "executor_rejected_total", "Tasks rejected because the executor queue was full.", stats["rejected"], labels
+        )
+
+    if loop_monitor is not None:
+        exposition.histogram(
+            "event_loop_lag_seconds", "Delay between scheduled and actual event loop wakeups.",
+            loop_monitor.lag_histogram
+        )
+        exposition.counter(
+            "event_loop_blocked_total", "Loop lag samples above the blocking threshold.", loop_monitor.blocked
+        )
+        exposition.counter(
+            "executor_saturated_total", "Executor probes that waited above the threshold.",
+            loop_monitor.executor_saturated
+        )
+
+    if startup_profile.is_ready:
+        exposition.gauge(
+            "startup_time_to_ready_seconds", "Time from process start until the Socket.IO namespace was ready.",
+            startup_profile.time_to_ready
+        )
+    exposition.gauge("process_resident_memory_bytes", "Resident set size of the service process.", process_rss_bytes())
+    exposition.counter("process_cpu_seconds_total", "CPU time of the service process.", process_cpu_seconds())
+    return exposition.render()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+@inject
+async def get_metrics(
+    usecase: VideoStreamUseCase = Depends(Provide[Container.video_stream_usecase]),
+    publisher: SocketIOPublisher = Depends(Provide[Container.event_publisher]),
+    loop_monitor: LoopLagMonitor = Depends(Provide[Container.loop_lag_monitor]),
+    frame_bus: FrameBus = Depends(Provide[Container.frame_bus]),
+    pre_event_buffers: PreEventBuffers = Depends(Provide[Container.pre_event_buffers]),
+    recorder: SegmentRecorder = Depends(Provide[Container.segment_recorder]),
+    control_executor: BoundedExecutor = Depends(Provide[Container.control_executor])
+) -> PlainTextResponse:
+    """Prometheus scrape 엔드포인트"""
+    return PlainTextResponse(
+        render_metrics(
+            usecase, publisher, loop_monitor, frame_bus, pre_event_buffers,
+            recorder if settings.recording_enabled else None, control_executor
+        ),
+        media_type=PrometheusExposition.CONTENT_TYPE
+    )
@@ -0,0 +1,57 @@
+from typing import Any, Dict
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from stream_service.adapters.outbound.messaging.socketio_publisher import SocketIOPublisher
+from stream_service.application.services.frame_bus import FrameBus
+from stream_service.application.services.pre_event_buffer import PreEventBuffers
+from stream_service.application.usecases.video_stream_usecase import VideoStreamUseCase
+from stream_service.config.container import Container
+
+router = APIRouter(prefix="/api/streams", tags=["streams"])
+
+
+@router.get("/stats")
+@inject
+async def get_stream_stats(
+    usecase: VideoStreamUseCase = Depends(Provide[Container.video_stream_usecase])
+) -> Dict[str, Any]:
+    """카메라별 프레임/리소스 통계 조회"""
+    return usecase.get_stream_stats()
+
+
+@router.get("/encoding")
+@inject
+async def get_encoding_status(
+    usecase: VideoStreamUseCase = Depends(Provide[Container.video_stream_usecase])
+) -> Dict[str, Any]:
+    """카메라별 적응형 인코딩 설정 및 결정 이력 조회"""
+    return usecase.get_encoding_status()
+
+
+@router.get("/outbound")
+@inject
+async def get_outbound_queue_stats(
+    publisher: SocketIOPublisher = Depends(Provide[Container.event_publisher])
+) -> Dict[str, Any]:
+    """스트림별 송신 큐 깊이, drop 수, emit 지연 조회"""
+    return publisher.get_queue_stats()
+
+
+@router.get("/bus")
+@inject
+async def get_frame_bus_stats(
+    frame_bus: FrameBus = Depends(Provide[Container.frame_bus])
+) -> Dict[str, Any]:
+    """카메라별 구독자 수와 consumer별 전달/drop/큐 대기 지연 조회"""
+    return frame_bus.stats()
+
+
+@router.get("/pre-event")
+@inject
+async def get_pre_event_buffer_stats(
+    buffers: PreEventBuffers = Depends(Provide[Container.pre_event_buffers])
+) -> Dict[str, Any]:
+    """카메라별 pre-event ring 용량/사용량/보관 구간 조회"""
+    return buffers.stats()
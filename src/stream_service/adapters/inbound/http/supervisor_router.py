@@ -0,0 +1,27 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+
+from stream_service.monitoring.metrics import PrometheusExposition
+from stream_service.supervisor import WorkerSupervisor
+
+router = APIRouter(tags=["supervisor"])
+
+
+def get_supervisor(request: Request) -> WorkerSupervisor:
+    return request.app.state.supervisor
+
+
+@router.get("/health")
+async def get_health(request: Request) -> Dict[str, Any]:
+    """워커별 상태, 재시작 횟수, 카메라 배치 (모든 워커가 응답하면 ok)"""
+    return get_supervisor(request).health()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(request: Request) -> PlainTextResponse:
+    """워커 /metrics를 worker 라벨로 합친 Prometheus scrape 엔드포인트"""
+    return PlainTextResponse(
+        await get_supervisor(request).metrics(), media_type=PrometheusExposition.CONTENT_TYPE
+    )
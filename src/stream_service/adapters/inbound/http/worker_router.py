@@ -0,0 +1,47 @@
+import secrets
+from typing import Any, Dict, List, Optional
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from stream_service.application.dto.capture_dto import WorkerAssignmentDTO
+from stream_service.application.usecases.video_stream_usecase import VideoStreamUseCase
+from stream_service.config.container import Container
+from stream_service.config.settings import settings
+
+router = APIRouter(prefix="/worker", tags=["worker"])
+
+
+def verify_supervisor(x_supervisor_token: Optional[str] = Header(None)) -> None:
+    """supervisor가 워커를 띄울 때 넘긴 토큰 확인 (워커 모드가 아니면 항상 거절)"""
+    if not settings.supervisor_token or not x_supervisor_token:
+        raise HTTPException(status_code=403, detail="Supervisor token required")
+    if not secrets.compare_digest(x_supervisor_token, settings.supervisor_token):
+        raise HTTPException(status_code=403, detail="Invalid supervisor token")
+
+
+@router.get("/cameras", dependencies=[Depends(verify_supervisor)])
+@inject
+async def get_worker_cameras(
+    usecase: VideoStreamUseCase = Depends(Provide[Container.video_stream_usecase])
+) -> Dict[str, Any]:
+    """이 워커의 담당 카메라와 캡처 중인 카메라"""
+    cameras: List[str] = usecase.shard.camera_ids or usecase.capture_service.camera_ids
+    return {
+        "worker_index": settings.worker_index,
+        "cameras": cameras,
+        "capturing": [
+            session.camera_id for session in usecase.capture_service.list_sessions()
+            if session.camera_id in cameras and session.is_active
+        ],
+    }
+
+
+@router.put("/cameras", dependencies=[Depends(verify_supervisor)])
+@inject
+async def put_worker_cameras(
+    assignment: WorkerAssignmentDTO,
+    usecase: VideoStreamUseCase = Depends(Provide[Container.video_stream_usecase])
+) -> Dict[str, Any]:
+    """담당 카메라 변경 (빠진 카메라는 중지, resume 카메라는 캡처 시작)"""
+    return await usecase.reassign_cameras(assignment.cameras, assignment.resume)
@@ -1,8 +1,9 @@
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import socketio
 
 from stream_service.application.ports.inbound.event_subscriber import EventSubscriber
+from stream_service.application.dto.socketio_dto import CaptureCommandDTO
 from stream_service.adapters.outbound.messaging.socketio_publisher import SocketIOPublisher
 
 logger = logging.getLogger(__name__)
@@ -13,13 +14,30 @@ class SocketIOClient:
     
     def __init__(self, 
                  sio: socketio.AsyncClient,
-                 event_subscriber: EventSubscriber
+                 event_subscriber: EventSubscriber,
+                 publisher: Optional[SocketIOPublisher] = None
     ):
         self.sio = sio
         self.event_subscriber = event_subscriber
+        # namespace 연결 상태를 알려 줄 publisher (metadata 응답이 연결을 기다림)
+        self.publisher = publisher
     
     def resister_event(self) -> None:
         """Socket.io 이벤트 핸들러를 socketio_adapter에 등록"""
+        @self.sio.event
+        async def connect():
+            """ namespace 연결 완료"""
+            logger.info("Socket.IO namespace 연결됨")
+            if self.publisher is not None:
+                self.publisher.set_connected(True)
+        
+        @self.sio.event
+        async def disconnect(*args):
+            """ namespace 연결 끊김"""
+            logger.info("Socket.IO namespace 연결 끊김")
+            if self.publisher is not None:
+                self.publisher.set_connected(False)
+        
         @self.sio.event
         async def request_client_metadata():
             """ client의 ResponseClientMetadataDTO를 요청 받았습니다."""
@@ -27,22 +45,25 @@ class SocketIOClient:
             await self.event_subscriber.handle_request_client_metadata()
         
         @self.sio.event
-        async def capture_start_request():
+        async def capture_start_request(data=None):
             """ stream_service의 capture start를 요청 받았습니다.""" 
-            logger.info("stream_service의 capture start를 요청 받았습니다.")
-            await self.event_subscriber.handle_capture_start_request()
+            command = CaptureCommandDTO(**(data or {}))
+            logger.info(f"stream_service의 capture start를 요청 받았습니다. (camera: {command.camera_id})")
+            await self.event_subscriber.handle_capture_start_request(command.camera_id)
          
         
         @self.sio.event
-        async def capture_stop_request():
+        async def capture_stop_request(data=None):
             """ stream_service의 capture stop 요청 받았습니다.""" 
-            logger.info("stream_service의 capture stop 요청 받았습니다.")
-            await self.event_subscriber.handle_capture_stop_request()
+            command = CaptureCommandDTO(**(data or {}))
+            logger.info(f"stream_service의 capture stop 요청 받았습니다. (camera: {command.camera_id})")
+            await self.event_subscriber.handle_capture_stop_request(command.camera_id)
             
         @self.sio.event
-        async def request_capture_status():
+        async def request_capture_status(data=None):
             """ stream_service의 현재 capture status를 요청 받았습니다.""" 
-            logger.info("stream_service의 현재 capture status를 요청 받았습니다.")
-            await self.event_subscriber.handle_request_capture_status()
+            camera_id = (data or {}).get("camera_id")
+            logger.info(f"stream_service의 현재 capture status를 요청 받았습니다. (camera: {camera_id or 'all'})")
+            await self.event_subscriber.handle_request_capture_status(camera_id)
             
     
\ No newline at end of file
@@ -0,0 +1,69 @@
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from stream_service.application.dto.frame_envelope import EncodedFrame
+
+# (frame seq, 출력 너비, 품질, 코덱)
+VariantKey = Tuple[int, int, int, int]
+
+
+class EncodedVariantCache:
+    """같은 프레임의 인코딩 결과(해상도/품질/코덱별)를 보관하는 LRU 캐시 (이벤트 루프 전용)
+
+    전체 payload 바이트 수로 크기를 제한하고, 넘치면 가장 오래 사용되지 않은 항목부터 버린다.
+    한 프레임 주기 안에 여러 consumer가 같은 변형을 요청하면 다시 인코딩하지 않는다.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[VariantKey, EncodedFrame]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: VariantKey) -> Optional[EncodedFrame]:
+        frame = self._entries.get(key)
+        if frame is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return frame
+
+    def put(self, key: VariantKey, frame: EncodedFrame) -> None:
+        nbytes = frame.nbytes
+        if nbytes > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.nbytes
+        self._entries[key] = frame
+        self._bytes += nbytes
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "variant_cache_hits": self.hits,
+            "variant_cache_misses": self.misses,
+            "variant_cache_hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "variant_cache_evictions": self.evictions,
+            "variant_cache_entries": len(self._entries),
+            "variant_cache_bytes": self._bytes,
+            "variant_cache_max_bytes": self.max_bytes,
+        }
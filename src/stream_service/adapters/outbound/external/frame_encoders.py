@@ -0,0 +1,176 @@
+import logging
+from typing import Any, List, Optional
+
+import cv2
+import numpy as np
+
+from stream_service.application.dto.frame_envelope import FrameBuffer, FrameCodec
+from stream_service.application.ports.outbound.frame_encoder import FrameEncoder
+from stream_service.application.services.encoder_calibration import FrameEncoderConfig, calibrate
+
+logger = logging.getLogger(__name__)
+
+# auto 선택 후보 (WebP는 코덱이 달라 JPEG 소비자(MJPEG, clip, 녹화)와 호환되지 않으므로 명시적으로만 사용)
+JPEG_BACKENDS = ("opencv", "turbojpeg", "simplejpeg")
+
+_OPENCV_SUBSAMPLING = {
+    "444": cv2.IMWRITE_JPEG_SAMPLING_FACTOR_444,
+    "422": cv2.IMWRITE_JPEG_SAMPLING_FACTOR_422,
+    "420": cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420,
+}
+
+
+def _import_turbojpeg():
+    try:
+        import turbojpeg
+    except ImportError as e:
+        raise RuntimeError("PyTurboJPEG is not installed (pip install 'stream-service[turbojpeg]')") from e
+    return turbojpeg
+
+
+def _import_simplejpeg():
+    try:
+        import simplejpeg
+    except ImportError as e:
+        raise RuntimeError("simplejpeg is not installed (pip install 'stream-service[simplejpeg]')") from e
+    return simplejpeg
+
+
+class OpenCVJpegEncoder(FrameEncoder):
+    """cv2.imencode JPEG (기본, 추가 의존성 없음)"""
+    name = "opencv"
+    codec = FrameCodec.JPEG
+
+    def __init__(self, subsampling: str = "420"):
+        self._sampling = _OPENCV_SUBSAMPLING[subsampling]
+
+    def encode(self, image: Any, quality: int) -> Optional[FrameBuffer]:
+        success, buffer = cv2.imencode(
+            '.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, quality, cv2.IMWRITE_JPEG_SAMPLING_FACTOR, self._sampling]
+        )
+        return memoryview(buffer).cast("B") if success else None
+
+
+class TurboJpegEncoder(FrameEncoder):
+    """PyTurboJPEG (libjpeg-turbo 직접 호출, fast DCT 플래그 지원)"""
+    name = "turbojpeg"
+    codec = FrameCodec.JPEG
+
+    def __init__(self, subsampling: str = "420", fast_dct: bool = True):
+        turbojpeg = _import_turbojpeg()
+        try:
+            # 압축 핸들은 encode() 호출마다 만들므로 인스턴스를 스레드 간에 공유해도 됨
+            self._jpeg = turbojpeg.TurboJPEG()
+        except OSError as e:
+            raise RuntimeError(f"libturbojpeg could not be loaded: {e}") from e
+        self._subsample = {
+            "444": turbojpeg.TJSAMP_444,
+            "422": turbojpeg.TJSAMP_422,
+            "420": turbojpeg.TJSAMP_420,
+        }[subsampling]
+        self._flags = turbojpeg.TJFLAG_FASTDCT if fast_dct else 0
+
+    def encode(self, image: Any, quality: int) -> Optional[FrameBuffer]:
+        return self._jpeg.encode(
+            image, quality=quality, jpeg_subsample=self._subsample, flags=self._flags
+        )
+
+
+class SimpleJpegEncoder(FrameEncoder):
+    """simplejpeg (libjpeg-turbo 번들 wheel, 시스템 라이브러리 불필요)"""
+    name = "simplejpeg"
+    codec = FrameCodec.JPEG
+
+    def __init__(self, subsampling: str = "420", fast_dct: bool = True):
+        self._simplejpeg = _import_simplejpeg()
+        self._subsampling = subsampling
+        self._fast_dct = fast_dct
+
+    def encode(self, image: Any, quality: int) -> Optional[FrameBuffer]:
+        # crop view처럼 연속되지 않은 배열은 받지 않음
+        return self._simplejpeg.encode_jpeg(
+            np.ascontiguousarray(image),
+            quality=quality,
+            colorspace="BGR",
+            colorsubsampling=self._subsampling,
+            fastdct=self._fast_dct
+        )
+
+
+class WebPEncoder(FrameEncoder):
+    """cv2.imencode WebP (같은 품질에서 JPEG보다 작지만 인코딩이 느림)"""
+    name = "webp"
+    codec = FrameCodec.WEBP
+
+    def encode(self, image: Any, quality: int) -> Optional[FrameBuffer]:
+        # 100을 넘으면 lossless로 바뀌므로 1-100으로 제한
+        success, buffer = cv2.imencode('.webp', image, [cv2.IMWRITE_WEBP_QUALITY, min(max(quality, 1), 100)])
+        return memoryview(buffer).cast("B") if success else None
+
+
+def create_frame_encoder(backend: str, config: Optional[FrameEncoderConfig] = None) -> FrameEncoder:
+    """백엔드 이름으로 인코더 생성 (선택 의존성이 없으면 RuntimeError)"""
+    config = config or FrameEncoderConfig()
+    if backend == "opencv":
+        return OpenCVJpegEncoder(config.subsampling)
+    if backend == "turbojpeg":
+        return TurboJpegEncoder(config.subsampling, config.fast_dct)
+    if backend == "simplejpeg":
+        return SimpleJpegEncoder(config.subsampling, config.fast_dct)
+    if backend == "webp":
+        return WebPEncoder()
+    raise ValueError(f"Unknown frame encoder: {backend}")
+
+
+def calibration_samples(config: FrameEncoderConfig) -> List[np.ndarray]:
+    """측정용 합성 프레임 (움직이는 그라디언트 + 노이즈, 카메라 영상과 비슷한 압축률)"""
+    width, height = config.calibration_width, config.calibration_height
+    rng = np.random.default_rng(0)
+    gradient = np.tile(np.linspace(0, 255, width, dtype=np.uint8), (height, 1))
+    samples = []
+    for i in range(max(1, config.calibration_frames)):
+        frame = np.dstack([np.roll(gradient, i * 8, axis=1)] * 3)
+        samples.append(cv2.add(frame, rng.integers(0, 32, frame.shape, dtype=np.uint8)))
+    return samples
+
+
+def select_jpeg_encoder(config: Optional[FrameEncoderConfig] = None) -> FrameEncoder:
+    """JPEG 인코더 선택 (해상도 tier와 JPEG 소비자용)
+
+    backend가 JPEG 백엔드면 그대로 만들고, auto/webp면 설치된 JPEG 백엔드를 샘플 프레임으로 측정해 가장 빠른 것을 고른다.
+    """
+    config = config or FrameEncoderConfig()
+    if config.backend in JPEG_BACKENDS:
+        return create_frame_encoder(config.backend, config)
+    if config.backend not in ("auto", "webp"):
+        raise ValueError(f"Unknown frame encoder: {config.backend}")
+
+    candidates = []
+    for backend in JPEG_BACKENDS:
+        try:
+            candidates.append(create_frame_encoder(backend, config))
+        except RuntimeError as e:
+            logger.debug(f"JPEG encoder '{backend}' unavailable: {e}")
+    if len(candidates) == 1:
+        return candidates[0]
+
+    results = calibrate(candidates, calibration_samples(config), config.calibration_quality)
+    if not results:
+        return OpenCVJpegEncoder(config.subsampling)
+    logger.info(
+        "JPEG encoder calibration "
+        f"({config.calibration_width}x{config.calibration_height}): "
+        + ", ".join(f"{encoder.name}={seconds * 1000:.2f}ms" for encoder, seconds in results)
+        + f" -> {results[0][0].name}"
+    )
+    return results[0][0]
+
+
+def select_frame_encoder(
+    config: Optional[FrameEncoderConfig] = None, jpeg_encoder: Optional[FrameEncoder] = None
+) -> FrameEncoder:
+    """기본 스트림 인코더 (webp면 WebP, 아니면 JPEG 인코더)"""
+    config = config or FrameEncoderConfig()
+    if config.backend == "webp":
+        return WebPEncoder()
+    return jpeg_encoder or select_jpeg_encoder(config)
@@ -0,0 +1,109 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from stream_service.application.services.preprocess import PreprocessConfig, PreprocessPlan, plan_preprocess
+
+
+class FramePreprocessor:
+    """인코딩 전 crop + 축소 (출력 배열과 remap 테이블 재사용)
+
+    입력 크기나 배율이 바뀔 때만 crop/출력 크기 계획, 중간/출력 배열, remap 테이블을 다시 만든다.
+    - area: 목표 크기 이상인 동안 INTER_AREA로 정확히 1/2씩 줄이고(OpenCV 고속 경로), 남은 2배 미만은 remap으로 맞춤.
+      임의 비율 INTER_AREA는 프레임마다 가중치 테이블을 다시 계산해 원본 인코딩보다 느리다.
+    - linear: 원본에서 목표 크기로 바로 bilinear remap (가장 빠르지만 큰 비율 축소에서는 aliasing)
+    출력 배열은 다음 프레임이 덮어쓰므로 apply() 블록 안에서만 사용한다 (블록 동안 lock 유지).
+    """
+
+    def __init__(self, config: Optional[PreprocessConfig] = None):
+        self.config = config or PreprocessConfig()
+        if self.config.interpolation not in ("area", "linear"):
+            raise ValueError(f"Unknown preprocess interpolation: {self.config.interpolation}")
+        self._lock = threading.Lock()
+        self._geometry: Optional[Tuple[Any, ...]] = None
+        self._plan: Optional[PreprocessPlan] = None
+        # 1/2 축소 단계별 출력 배열, 마지막 remap 출력 배열과 테이블
+        self._halvings: List[np.ndarray] = []
+        self._output: Optional[np.ndarray] = None
+        self._maps: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self.rebuilds = 0
+
+    def crop(self, image: np.ndarray) -> np.ndarray:
+        """crop 영역 view (복사 없음, 해상도 tier 입력)"""
+        if self.config.crop is None or not isinstance(image, np.ndarray):
+            return image
+        height, width = image.shape[:2]
+        plan = plan_preprocess(self.config, width, height)
+        return image[plan.y:plan.y + plan.crop_height, plan.x:plan.x + plan.crop_width]
+
+    @contextmanager
+    def apply(self, image: np.ndarray, scale: float = 1.0) -> Iterator[np.ndarray]:
+        """전처리 결과 (crop만 하면 원본 view, 축소하면 재사용 출력 배열)"""
+        with self._lock:
+            yield self._process(image, scale)
+
+    def _prepare(self, image: np.ndarray, scale: float) -> PreprocessPlan:
+        geometry = (image.shape, image.dtype, scale)
+        if geometry == self._geometry:
+            return self._plan
+        height, width = image.shape[:2]
+        plan = plan_preprocess(self.config, width, height, scale)
+        channels = image.shape[2:]
+        self._halvings = []
+        self._output = None
+        self._maps = None
+        if plan.resizes:
+            if self.config.interpolation == "linear":
+                # 테이블에 crop 오프셋이 들어 있으므로 원본에서 바로 샘플링
+                self._maps = _remap_tables(plan.x, plan.y, plan.crop_width, plan.crop_height, plan.width, plan.height)
+            else:
+                source_width, source_height = plan.crop_width, plan.crop_height
+                while source_width // 2 >= plan.width and source_height // 2 >= plan.height:
+                    source_width, source_height = source_width // 2, source_height // 2
+                    self._halvings.append(np.empty((source_height, source_width) + channels, dtype=image.dtype))
+                if (source_width, source_height) != (plan.width, plan.height):
+                    self._maps = _remap_tables(0, 0, source_width, source_height, plan.width, plan.height)
+            if self._maps is not None:
+                self._output = np.empty((plan.height, plan.width) + channels, dtype=image.dtype)
+        self._plan = plan
+        self._geometry = geometry
+        self.rebuilds += 1
+        return plan
+
+    def _process(self, image: np.ndarray, scale: float) -> np.ndarray:
+        if not isinstance(image, np.ndarray):
+            return image
+        plan = self._prepare(image, scale)
+        if self.config.interpolation == "linear" and self._maps is not None:
+            return cv2.remap(image, *self._maps, cv2.INTER_LINEAR, dst=self._output)
+        current = image[plan.y:plan.y + plan.crop_height, plan.x:plan.x + plan.crop_width]
+        for halved in self._halvings:
+            height, width = halved.shape[:2]
+            # 홀수 크기면 마지막 행/열을 버려 정확히 1/2 (고속 경로 유지)
+            current = cv2.resize(
+                current[:height * 2, :width * 2], (width, height), dst=halved, interpolation=cv2.INTER_AREA
+            )
+        if self._maps is not None:
+            current = cv2.remap(current, *self._maps, cv2.INTER_LINEAR, dst=self._output)
+        return current
+
+    def stats(self) -> Dict[str, int]:
+        plan = self._plan
+        return {
+            "preprocess_width": plan.width if plan else 0,
+            "preprocess_height": plan.height if plan else 0,
+            "preprocess_rebuilds": self.rebuilds,
+        }
+
+
+def _remap_tables(
+    x: int, y: int, source_width: int, source_height: int, width: int, height: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """출력 픽셀 중심 -> 입력 좌표 테이블 (고정소수점 CV_16SC2로 변환해 remap 비용을 줄임)"""
+    xs = x + (np.arange(width, dtype=np.float32) + 0.5) * (source_width / width) - 0.5
+    ys = y + (np.arange(height, dtype=np.float32) + 0.5) * (source_height / height) - 0.5
+    map_x, map_y = np.meshgrid(xs, ys)
+    return cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
@@ -0,0 +1,59 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class GrabbedFrame:
+    """grabber 스레드가 디코딩한 프레임"""
+    seq: int
+    image: Any
+    captured_at: float
+
+
+class LatestFrameSlot:
+    """가장 최근에 디코딩된 프레임 하나만 보관하는 lock 보호 슬롯
+
+    grabber 스레드가 put()으로 계속 덮어쓰고, 소비자는 take()로 최신 프레임만 가져간다.
+    소비되기 전에 덮어써진 프레임은 stale drop으로 집계한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frame: Optional[GrabbedFrame] = None
+        self._seq = 0
+        self._consumed_seq = 0
+        self._dropped = 0
+
+    def put(self, image: Any) -> int:
+        """새 프레임 저장 후 시퀀스 번호 반환"""
+        captured_at = time.time()
+        with self._lock:
+            if self._seq > self._consumed_seq:
+                self._dropped += 1
+            self._seq += 1
+            self._frame = GrabbedFrame(seq=self._seq, image=image, captured_at=captured_at)
+            return self._seq
+
+    def take(self) -> Optional[GrabbedFrame]:
+        """최신 프레임 반환 (소비 처리)"""
+        with self._lock:
+            if self._frame is not None:
+                self._consumed_seq = self._frame.seq
+            return self._frame
+
+    def clear(self) -> None:
+        """슬롯 비우기 (시퀀스와 카운터는 유지)"""
+        with self._lock:
+            self._frame = None
+            self._consumed_seq = self._seq
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    @property
+    def dropped(self) -> int:
+        """소비되지 못하고 덮어써진 프레임 수"""
+        return self._dropped
@@ -1,17 +1,48 @@
 import asyncio
 import base64
 import logging
-from typing import AsyncGenerator, Optional
+import threading
+import time
+from typing import Any, AsyncGenerator, Callable, Dict, Mapping, Optional
 
 import cv2
 
 from stream_service.application.ports.outbound.capture_engine import CaptureEngine
+from stream_service.application.ports.outbound.frame_encoder import FrameEncoder
+from stream_service.application.dto.frame_envelope import EncodedFrame, FrameCodec
+from stream_service.adapters.outbound.external.latest_frame_slot import GrabbedFrame, LatestFrameSlot
+from stream_service.adapters.outbound.external.encoded_variant_cache import EncodedVariantCache
+from stream_service.adapters.outbound.external.frame_encoders import OpenCVJpegEncoder
+from stream_service.adapters.outbound.external.frame_preprocessor import FramePreprocessor
+from stream_service.adapters.outbound.external.tier_encoder import (
+    decode_for_tiers,
+    encode_tier_ladder,
+    tier_variant_keys,
+)
+from stream_service.application.services.bounded_executor import BoundedExecutor, ExecutorSaturatedError
+from stream_service.application.services.motion_gate import MotionGate, MotionGateConfig
+from stream_service.application.services.preprocess import PreprocessConfig
+from stream_service.application.services.frame_scheduler import FrameScheduler
+from stream_service.application.services.reconnect import ExponentialBackoff, ReconnectConfig, RecoveryTracker
+from stream_service.monitoring.metrics import LatencyHistogram, new_stage_timings
+from stream_service.monitoring.process_stats import CpuMeter
+from stream_service.monitoring.tracing import tracer
 
 logger = logging.getLogger(__name__)
 
 
 class OpenCVCaptureEngine(CaptureEngine):
-    def __init__(self):
+    def __init__(
+        self,
+        capture_factory: Optional[Callable[[str], Any]] = None,
+        variant_cache: Optional[EncodedVariantCache] = None,
+        reconnect: Optional[ReconnectConfig] = None,
+        executor: Optional[BoundedExecutor] = None,
+        encoder: Optional[FrameEncoder] = None,
+        tier_encoder: Optional[FrameEncoder] = None
+    ):
+        # VideoCapture 생성 함수 (None이면 cv2.VideoCapture, 벤치마크에서는 합성 소스 주입)
+        self._capture_factory = capture_factory
         self._cap: Optional[cv2.VideoCapture] = None
         self._is_capturing = False
         self._frame_rate = 30  # FPS
@@ -20,10 +51,54 @@ class OpenCVCaptureEngine(CaptureEngine):
         # 타임아웃 및 재시도 설정
         self._connection_timeout = 10000  # ms
         self._read_timeout = 5000  # ms
-        self._max_retries = 3
-        self._retry_delay = 2.0  # seconds
+        # 재연결 backoff와 무프레임 watchdog
+        self._reconnect = reconnect or ReconnectConfig()
+        self._backoff = ExponentialBackoff.from_config(self._reconnect)
+        # 끊김부터 복구까지 걸린 시간 (MTTR)
+        self._recovery = RecoveryTracker()
         self._consecutive_failures = 0
         self._max_consecutive_failures = 10
+        self._reconnect_attempts = 0
+        
+        # grabber 스레드 및 최신 프레임 슬롯
+        self._slot = LatestFrameSlot()
+        self._grabber_thread: Optional[threading.Thread] = None
+        # 캡처 실행마다 새로 만듦 (중지 후 grab()에 묶여 남은 이전 grabber가 다음 실행에 끼어들지 않음)
+        self._stop_event = threading.Event()
+        # 이 스트림 전용 executor (연결, 인코딩). 다른 스트림이나 제어 요청과 스레드를 나누지 않음
+        self._executor = executor or BoundedExecutor("capture-stream", max_workers=2)
+        self._failure_backoff = 0.05  # seconds
+        
+        # 인코딩 파라미터 (AdaptiveEncodeController가 조정)
+        self._jpeg_quality = 80
+        self._scale = 1.0
+        # 기본 스트림 인코더와 해상도 tier 인코더 (tier는 MJPEG/snapshot 소비자를 위해 JPEG, 기본은 둘 다 OpenCV JPEG)
+        self._encoder = encoder or OpenCVJpegEncoder()
+        if tier_encoder is None:
+            tier_encoder = self._encoder if self._encoder.codec == FrameCodec.JPEG else OpenCVJpegEncoder()
+        self._tier_encoder = tier_encoder
+        
+        # 마지막으로 인코딩한 프레임 (같은 프레임 재인코딩 방지)
+        self._last_encoded_seq = 0
+        self._last_encoded_params = (self._jpeg_quality, self._scale)
+        self._last_encoded: Optional[EncodedFrame] = None
+        # 마지막으로 인코딩한 원본 프레임 (해상도 tier 인코딩의 입력)
+        self._last_encoded_source: Optional[GrabbedFrame] = None
+        # (seq, 너비, 품질, 코덱)별 인코딩 결과 LRU
+        self._variant_cache = variant_cache or EncodedVariantCache()
+        
+        # 정지 장면 프레임 억제 (configure_motion으로 활성화)
+        self._motion_gate: Optional[MotionGate] = None
+        self._last_gated_seq = 0
+        
+        # 인코딩 전 crop/축소 (configure_preprocess로 설정, 기본은 배율 축소만)
+        self._preprocessor = FramePreprocessor()
+        
+        # 스트림 단위 CPU 사용량 (grabber 스레드 + 인코딩)
+        self._cpu_meter = CpuMeter()
+        
+        # 단계별 지연 히스토그램 (grab / decode / encode)
+        self._stage_timings = new_stage_timings()
     
     async def start_capture(self, rtsp_url: str) -> None:
         """RTSP 스트림 캡처 시작"""
@@ -34,71 +109,23 @@ class OpenCVCaptureEngine(CaptureEngine):
         
         # 캡처 시작 플래그 설정 (재시도 루프에서 사용)
         self._is_capturing = True
+        stop_event = self._stop_event = threading.Event()
+        self._cpu_meter.start()
         
-        # OpenCV VideoCapture는 동기 작업이므로 executor에서 실행
-        loop = asyncio.get_event_loop()
-        
-        def _open_capture():
-            attempt = 0
-            while self._is_capturing:  # 캡처가 중지될 때까지 무한 재시도
-                attempt += 1
-                try:
-                    logger.info(f"RTSP 연결 시도 {attempt}: {rtsp_url}")
-                    
-                    cap = cv2.VideoCapture(rtsp_url)
-                    
-                    # 타임아웃 설정
-                    cap.set(cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, self._connection_timeout)
-                    cap.set(cv2.CAP_PROP_READ_TIMEOUT_MSEC, self._read_timeout)
-                    
-                    # RTSP 스트림 설정 최적화
-                    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # 버퍼 크기 최소화
-                    cap.set(cv2.CAP_PROP_FPS, self._frame_rate)
-                    
-                    # 추가 RTSP 설정
-                    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('H', '2', '6', '4'))
-                    
-                    if not cap.isOpened():
-                        cap.release()
-                        if self._is_capturing:  # 여전히 캡처 중이면 재시도
-                            logger.warning(f"연결 실패, {self._retry_delay}초 후 재시도...")
-                            import time
-                            time.sleep(self._retry_delay)
-                            continue
-                        else:
-                            raise RuntimeError("Capture cancelled during connection")
-                    
-                    # 연결 성공 후 실제 프레임 읽기 테스트
-                    ret, test_frame = cap.read()
-                    if not ret or test_frame is None:
-                        cap.release()
-                        if self._is_capturing:  # 여전히 캡처 중이면 재시도
-                            logger.warning(f"프레임 읽기 실패, {self._retry_delay}초 후 재시도...")
-                            import time
-                            time.sleep(self._retry_delay)
-                            continue
-                        else:
-                            raise RuntimeError("Capture cancelled during frame test")
-                    
-                    logger.info(f"RTSP 연결 성공! (시도 {attempt}회) 프레임 크기: {test_frame.shape if test_frame is not None else 'Unknown'}")
-                    self._consecutive_failures = 0
-                    return cap
-                    
-                except Exception as e:
-                    logger.error(f"연결 시도 {attempt} 실패: {e}")
-                    if self._is_capturing:  # 여전히 캡처 중이면 재시도
-                        logger.info(f"{self._retry_delay}초 후 재시도...")
-                        import time
-                        time.sleep(self._retry_delay)
-                        continue
-                    else:
-                        raise RuntimeError("Capture cancelled during retry")
-            
-            raise RuntimeError("Capture was cancelled")
+        self._backoff.reset()
         
         try:
-            self._cap = await loop.run_in_executor(None, _open_capture)
-            # _is_capturing은 이미 True로 설정됨
+            # OpenCV VideoCapture는 동기 작업이므로 스트림 executor에서 실행 (연결 타임아웃 동안 다른 스트림은 영향 없음)
+            with tracer.span("capture.open"):
+                cap = await self._executor.run(
+                    self._connect, rtsp_url, self._reconnect.initial_attempts, stop_event
+                )
+            if stop_event.is_set():
+                # 연결 중에 stop_capture가 호출됨
+                self._release_capture(cap)
+                raise RuntimeError("Capture was cancelled")
+            self._cap = cap
+            self._start_grabber(cap, rtsp_url, stop_event)
             logger.info("RTSP capture started successfully")
             
         except Exception as e:
@@ -106,57 +133,233 @@ class OpenCVCaptureEngine(CaptureEngine):
             self._cleanup()
             raise
     
+    def _connect(
+        self,
+        rtsp_url: str,
+        max_attempts: Optional[int],
+        stop_event: threading.Event,
+        reconnecting: bool = False
+    ) -> Any:
+        """연결될 때까지 재시도 (블로킹)
+
+        시도 사이에는 jitter가 있는 지수 backoff만큼 stop_event를 기다리므로 중지 요청 시 바로 빠져나온다.
+        max_attempts가 None이면 중지 요청 전까지 계속 시도한다.
+        실패 이후의 시도(끊긴 뒤 재연결이면 첫 시도부터)는 여기서만 reconnect_attempts로 센다.
+        """
+        attempt = 0
+        after_failure = reconnecting
+        while not stop_event.is_set():
+            attempt += 1
+            if after_failure:
+                self._reconnect_attempts += 1
+            after_failure = True
+            try:
+                logger.info(f"RTSP 연결 시도 {attempt}: {rtsp_url}")
+                cap = self._open_once(rtsp_url)
+            except Exception as e:
+                logger.error(f"연결 시도 {attempt} 실패: {e}")
+                cap = None
+            
+            if cap is not None:
+                logger.info(f"RTSP 연결 성공! (시도 {attempt}회)")
+                self._backoff.reset()
+                recovered = self._recovery.mark_up(time.monotonic())
+                if recovered is not None:
+                    logger.info(f"스트림 복구됨 (프레임 공백 {recovered:.2f}초)")
+                return cap
+            
+            if max_attempts is not None and attempt >= max_attempts:
+                raise RuntimeError(f"Failed to open RTSP stream after {attempt} attempts: {rtsp_url}")
+            delay = self._backoff.next_delay()
+            logger.warning(f"{delay:.2f}초 후 재시도...")
+            if stop_event.wait(delay):
+                break
+        
+        raise RuntimeError("Capture was cancelled")
+    
+    def _open_once(self, rtsp_url: str) -> Any:
+        """capture를 열고 첫 프레임까지 읽어 반환 (실패 시 None)"""
+        cap = (self._capture_factory or cv2.VideoCapture)(rtsp_url)
+        
+        # 타임아웃 설정 (read 타임아웃이 watchdog보다 길면 grab()에 묶여 끊김 감지가 늦어짐)
+        cap.set(cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, self._connection_timeout)
+        cap.set(cv2.CAP_PROP_READ_TIMEOUT_MSEC, min(self._read_timeout, self._reconnect.stall_timeout * 1000))
+        
+        # RTSP 스트림 설정 최적화
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # 버퍼 크기 최소화
+        cap.set(cv2.CAP_PROP_FPS, self._frame_rate)
+        
+        # 추가 RTSP 설정
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('H', '2', '6', '4'))
+        
+        if not cap.isOpened():
+            cap.release()
+            logger.warning("연결 실패")
+            return None
+        
+        # 연결 성공 후 실제 프레임 읽기 테스트
+        ret, test_frame = cap.read()
+        if not ret or test_frame is None:
+            cap.release()
+            logger.warning("프레임 읽기 실패")
+            return None
+        
+        logger.info(f"프레임 크기: {getattr(test_frame, 'shape', 'Unknown')}")
+        self._consecutive_failures = 0
+        self._slot.put(test_frame)
+        return cap
+    
     async def stop_capture(self) -> None:
         """RTSP 스트림 캡처 중지"""
         if not self._is_capturing:
             return
         
         logger.info("Stopping RTSP capture")
+        
+        # grabber 종료를 기다리지 않음 (grab()이나 재연결에 묶여 있어도 바로 반환)
+        # grabber는 자기 stop_event를 보고 빠져나오며 capture를 직접 해제한다
         self._cleanup()
         logger.info("RTSP capture stopped")
     
     async def get_current_frame(self) -> Optional[bytes]:
-        """현재 프레임을 JPEG 바이너리로 반환"""
-        if not self._is_capturing or not self._cap:
+        """최신 프레임을 인코딩된 바이너리(JPEG 또는 WebP)로 반환"""
+        frame = await self.get_encoded_frame()
+        return frame.to_bytes() if frame is not None else None
+    
+    async def get_encoded_frame(self) -> Optional[EncodedFrame]:
+        """최신 프레임을 주입된 인코더로 인코딩해 메타데이터와 함께 반환
+
+        네트워크 I/O는 grabber 스레드가 담당하므로 여기서는 슬롯의 최신 프레임만 인코딩한다.
+        인코더 출력 버퍼는 tobytes() 복사 없이 그대로 쓴다 (OpenCV 인코더는 memoryview).
+        """
+        # 재연결 중에도 캡처 세션은 유지되며 슬롯이 비어 있을 뿐
+        if not self._is_capturing:
             return None
         
-        loop = asyncio.get_event_loop()
+        grabbed = self._slot.take()
+        if grabbed is None:
+            return None
         
-        def _read_frame():
-            if not self._cap or not self._cap.isOpened():
-                logger.warning("VideoCapture가 열려있지 않음")
-                return None
-                
-            ret, frame = self._cap.read()
-            if not ret or frame is None:
-                self._consecutive_failures += 1
-                logger.warning(f"프레임 읽기 실패 (연속 실패: {self._consecutive_failures})")
-                
-                # 연속 실패가 많으면 연결 상태 재확인
-                if self._consecutive_failures >= self._max_consecutive_failures:
-                    logger.error(f"연속 {self._max_consecutive_failures}회 실패, 스트림 연결 문제로 판단")
-                    return None
-                
-                return None
+        # 새 프레임이 없고 인코딩 파라미터도 같으면 직전 인코딩 결과 재사용
+        params = (self._jpeg_quality, self._scale)
+        if grabbed.seq == self._last_encoded_seq and params == self._last_encoded_params:
+            return self._last_encoded
+        
+        # 이미 정지 장면으로 걸러낸 프레임
+        if grabbed.seq == self._last_gated_seq:
+            return None
+        
+        quality, scale = params
+        motion_gate = self._motion_gate
+        preprocessor = self._preprocessor
+        encoder = self._encoder
+        encode_timing = self._stage_timings["encode"]
+        
+        def _encode_frame():
+            cpu_start = time.thread_time()
+            image = grabbed.image
             
-            # 성공 시 연속 실패 카운터 리셋
-            if self._consecutive_failures > 0:
-                logger.info(f"프레임 읽기 복구됨 (이전 연속 실패: {self._consecutive_failures}회)")
-                self._consecutive_failures = 0
+            # 정지 장면이면 인코딩 생략 (keep-alive 주기는 통과, 전송할 crop 영역만 비교)
+            if motion_gate is not None and not motion_gate.admit(preprocessor.crop(image), grabbed.captured_at):
+                self._last_gated_seq = grabbed.seq
+                self._cpu_meter.add(time.thread_time() - cpu_start)
+                return None
             
-            # 프레임을 JPEG로 인코딩
-            success, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-            if not success:
-                logger.warning("JPEG 인코딩 실패")
+            # crop/축소 후 인코딩 (축소 결과는 미리 할당한 배열에 기록)
+            encode_start = time.perf_counter()
+            with preprocessor.apply(image, scale) as prepared:
+                data = encoder.encode(prepared, quality)
+                height, width = getattr(prepared, "shape", (0, 0))[:2]
+            encode_elapsed = time.perf_counter() - encode_start
+            encode_timing.observe(encode_elapsed)
+            tracer.record("capture.encode", encode_elapsed)
+            self._cpu_meter.add(time.thread_time() - cpu_start)
+            if data is None:
+                logger.warning(f"프레임 인코딩 실패 ({encoder.name})")
                 return None
             
-            return buffer.tobytes()
+            return EncodedFrame(
+                seq=grabbed.seq,
+                captured_at=grabbed.captured_at,
+                width=width,
+                height=height,
+                data=data,
+                codec=encoder.codec
+            )
         
         try:
-            return await loop.run_in_executor(None, _read_frame)
+            frame = await self._executor.run(_encode_frame)
+        except ExecutorSaturatedError:
+            # 스트림 executor가 밀려 있으면 이번 tick은 건너뜀
+            return None
         except Exception as e:
-            logger.error(f"Error reading frame: {e}")
+            logger.error(f"Error encoding frame: {e}")
             return None
+        
+        if frame is not None:
+            self._last_encoded_seq = grabbed.seq
+            self._last_encoded_params = params
+            self._last_encoded = frame
+            self._last_encoded_source = grabbed
+            self._variant_cache.put((frame.seq, frame.width, quality, frame.codec), frame)
+        return frame
+    
+    async def encode_tiers(self, frame: EncodedFrame, tiers: Mapping[str, int]) -> Dict[str, EncodedFrame]:
+        """해상도 tier별 인코딩 (이미 인코딩한 변형은 캐시에서 반환)
+
+        원본 프레임이 남아 있으면 그대로 축소하고, 없으면 인코딩된 프레임을 필요한 크기까지만 축소 디코딩한다.
+        """
+        source = self._last_encoded_source
+        # 원본이 남아 있으면 기본 tier와 같은 crop 영역에서 축소
+        image = self._preprocessor.crop(source.image) if source is not None and source.seq == frame.seq else None
+        source_height, source_width = image.shape[:2] if image is not None else (frame.height, frame.width)
+        quality = self._jpeg_quality
+        tier_encoder = self._tier_encoder
+        
+        keys = tier_variant_keys(frame.seq, source_width, source_height, tiers, quality, tier_encoder.codec)
+        frames = {}
+        for name, key in keys.items():
+            cached = self._variant_cache.get(key)
+            if cached is not None:
+                frames[name] = cached
+        missing = {name: tiers[name] for name in keys if name not in frames}
+        if not missing:
+            return frames
+        
+        def _encode_tiers():
+            cpu_start = time.thread_time()
+            started_at = time.perf_counter()
+            source_image = image
+            if source_image is None:
+                source_image = decode_for_tiers(frame.data, frame.height, missing)
+            encoded = encode_tier_ladder(source_image, frame.seq, frame.captured_at, missing, quality, tier_encoder)
+            tracer.record("capture.encode_tiers", time.perf_counter() - started_at, {"tiers": len(missing)})
+            self._cpu_meter.add(time.thread_time() - cpu_start)
+            return encoded
+        
+        try:
+            encoded = await self._executor.run(_encode_tiers)
+        except Exception as e:
+            logger.error(f"Error encoding resolution tiers: {e}")
+            return frames
+        for name, tier_frame in encoded.items():
+            self._variant_cache.put(keys[name], tier_frame)
+            frames[name] = tier_frame
+        return frames
+    
+    def set_encode_params(self, quality: int, scale: float) -> None:
+        """JPEG 품질과 해상도 배율 설정"""
+        self._jpeg_quality = quality
+        self._scale = scale
+    
+    def configure_motion(self, config: Optional[MotionGateConfig]) -> None:
+        """정지 장면 프레임 억제 설정 (None이면 비활성화)"""
+        self._motion_gate = MotionGate(config) if config is not None else None
+        self._last_gated_seq = 0
+    
+    def configure_preprocess(self, config: Optional[PreprocessConfig]) -> None:
+        """인코딩 전 crop/축소 설정 (None이면 적응형 인코딩 배율만 적용)"""
+        self._preprocessor = FramePreprocessor(config)
     
     def is_capturing(self) -> bool:
         """현재 캡처 중인지 확인"""
@@ -169,25 +372,18 @@ class OpenCVCaptureEngine(CaptureEngine):
             return
         
         logger.info("Starting frame stream")
+        # 고정 deadline 페이싱 (소비자 쪽에서 추가로 sleep하지 않아야 이중 페이싱이 없음)
+        scheduler = FrameScheduler(1.0 / self._frame_interval)
         
-        while self._is_capturing and self._cap:
+        while self._is_capturing:
             try:
+                await scheduler.wait_next()
                 frame_data = await self.get_current_frame()
                 
+                # 연결이 끊기면 grabber가 재연결하는 동안 프레임 없이 계속 대기
                 if frame_data:
-                    # frame_data는 이미 JPEG 바이너리
+                    # frame_data는 이미 인코딩된 바이너리
                     yield frame_data
-                    
-                    # 프레임 레이트 제어
-                    await asyncio.sleep(self._frame_interval)
-                else:
-                    # 프레임 없을 때는 좀 더 대기
-                    await asyncio.sleep(0.1)
-                    
-                    # 연속 실패가 너무 많으면 스트림 중지 고려
-                    if self._consecutive_failures >= self._max_consecutive_failures:
-                        logger.error("프레임 스트림 연속 실패로 인한 스트림 중지")
-                        break
                 
             except asyncio.CancelledError:
                 logger.info("Frame stream cancelled")
@@ -198,17 +394,180 @@ class OpenCVCaptureEngine(CaptureEngine):
         
         logger.info("Frame stream ended")
     
-    def _cleanup(self) -> None:
-        """리소스 정리"""
-        self._is_capturing = False
+    def get_frame_stats(self) -> Dict[str, float]:
+        """grabber 통계 (최신 시퀀스, stale drop 수, 연속 실패 수, 재연결 시도 수, 복구 시간, 변형 캐시, CPU 사용량)"""
+        return {
+            "seq": self._slot.seq,
+            "dropped_stale": self._slot.dropped,
+            "consecutive_failures": self._consecutive_failures,
+            "reconnect_attempts": self._reconnect_attempts,
+            **self._recovery.as_dict(),
+            **{f"executor_{key}": value for key, value in self._executor.stats().items()},
+            "suppressed_frames": self._motion_gate.suppressed if self._motion_gate else 0,
+            **self._preprocessor.stats(),
+            **self._variant_cache.stats(),
+            **self._cpu_meter.as_dict(),
+        }
+    
+    def get_stage_timings(self) -> Dict[str, LatencyHistogram]:
+        """단계별 지연 히스토그램 (grab / decode / encode)"""
+        return self._stage_timings
+    
+    @property
+    def dropped_frames(self) -> int:
+        """소비되기 전에 최신 프레임으로 대체된 프레임 수"""
+        return self._slot.dropped
+    
+    def _start_grabber(self, cap: Any, rtsp_url: str, stop_event: threading.Event) -> None:
+        """스트림을 계속 비워내는 grabber 스레드 시작"""
+        self._grabber_thread = threading.Thread(
+            target=self._grab_loop,
+            args=(cap, rtsp_url, stop_event),
+            name="opencv-frame-grabber",
+            daemon=True
+        )
+        self._grabber_thread.start()
+    
+    def _grab_loop(self, cap: Any, rtsp_url: str, stop_event: threading.Event) -> None:
+        """백그라운드에서 프레임을 읽어 최신 프레임 슬롯에 저장 (종료 시 capture도 직접 해제)"""
+        try:
+            cap = self._run_grab_loop(cap, rtsp_url, stop_event)
+        except Exception as e:
+            # 세션이 running으로 남은 채 프레임만 멈추지 않도록 캡처 중지로 표시 (스트리밍 task가 ERROR로 전환)
+            logger.error(f"Frame grabber failed: {e}")
+            if self._stop_event is stop_event:
+                self._is_capturing = False
+            if self._cap is not None:
+                cap = self._cap
+        finally:
+            # grab() 도중에 다른 스레드가 release하지 않도록 capture는 grabber가 해제
+            if self._cap is cap:
+                self._cap = None
+            self._release_capture(cap)
+    
+    def _run_grab_loop(self, cap: Any, rtsp_url: str, stop_event: threading.Event) -> Any:
+        """stop_event가 설정될 때까지 프레임을 읽고 마지막으로 사용한 capture 반환"""
+        logger.info("Frame grabber started")
+        cpu_mark = time.thread_time()
+        grab_timing = self._stage_timings["grab"]
+        decode_timing = self._stage_timings["decode"]
+        stall_timeout = self._reconnect.stall_timeout
+        last_frame_at = time.monotonic()
         
-        if self._cap:
+        while self._is_capturing and not stop_event.is_set():
+            now = time.thread_time()
+            self._cpu_meter.add(now - cpu_mark)
+            cpu_mark = now
+            # read()를 grab(다음 프레임 수신)과 retrieve(디코딩/BGR 변환)로 나눠 단계별 시간 측정
+            # (FFmpeg 백엔드는 코덱 디코딩 일부가 grab에서 수행됨)
             try:
-                self._cap.release()
+                started_at = time.perf_counter()
+                ret = cap.grab()
+                grabbed_at = time.perf_counter()
+                grab_timing.observe(grabbed_at - started_at)
+                frame = None
+                if ret:
+                    ret, frame = cap.retrieve()
+                    decode_timing.observe(time.perf_counter() - grabbed_at)
+                tracer.record("capture.read_frame", time.perf_counter() - started_at)
             except Exception as e:
-                logger.error(f"Error releasing capture: {e}")
-            finally:
-                self._cap = None
+                logger.error(f"Error reading frame: {e}")
+                ret, frame = False, None
+            
+            if not ret or frame is None:
+                self._consecutive_failures += 1
+                logger.warning(f"프레임 읽기 실패 (연속 실패: {self._consecutive_failures})")
+                
+                # watchdog: 연속 실패가 한도에 닿거나 stall_timeout 동안 프레임이 없으면 capture만 다시 연결
+                if (
+                    self._consecutive_failures >= self._max_consecutive_failures
+                    or time.monotonic() - last_frame_at >= stall_timeout
+                ):
+                    cap = self._reopen_capture(cap, rtsp_url, last_frame_at, stop_event)
+                    if cap is None:
+                        break
+                    last_frame_at = time.monotonic()
+                    continue
+                
+                stop_event.wait(self._failure_backoff)
+                continue
+            
+            # 성공 시 연속 실패 카운터 리셋
+            last_frame_at = time.monotonic()
+            if self._consecutive_failures > 0:
+                logger.info(f"프레임 읽기 복구됨 (이전 연속 실패: {self._consecutive_failures}회)")
+                self._consecutive_failures = 0
+            
+            # 중지 후 늦게 끝난 grab()의 프레임은 다음 실행의 슬롯에 넣지 않음
+            if not stop_event.is_set():
+                self._slot.put(frame)
+        
+        logger.info("Frame grabber stopped")
+        return cap
+    
+    def _reopen_capture(
+        self, cap: Any, rtsp_url: str, last_frame_at: float, stop_event: threading.Event
+    ) -> Any:
+        """끊긴 capture를 해제하고 다시 연결해 반환 (grabber 스레드, 캡처 세션과 스트리밍 task는 유지)
+
+        중지 요청으로 재연결을 포기하면 None을 반환한다. 재연결 중 예상치 못한 오류가 나도 중지 전까지 다시 시도한다.
+        """
+        logger.error(
+            f"{(time.monotonic() - last_frame_at) * 1000:.0f}ms 동안 프레임 없음 "
+            f"(연속 실패 {self._consecutive_failures}회), 재연결"
+        )
+        self._recovery.mark_down(last_frame_at)
+        if self._cap is cap:
+            self._cap = None
+        self._release_capture(cap)
+        
+        while True:
+            try:
+                cap = self._connect(rtsp_url, None, stop_event, reconnecting=True)
+                break
+            except Exception as e:
+                if stop_event.is_set():
+                    return None
+                logger.error(f"재연결 중 오류, {self._reconnect.backoff_max:.0f}초 후 다시 시도: {e}")
+                self._backoff.reset()
+                if stop_event.wait(self._reconnect.backoff_max):
+                    return None
+        if stop_event.is_set():
+            self._release_capture(cap)
+            return None
+        self._cap = cap
+        return cap
+    
+    @staticmethod
+    def _release_capture(cap: Any) -> None:
+        if cap is None:
+            return
+        try:
+            cap.release()
+        except Exception as e:
+            logger.error(f"Error releasing capture: {e}")
+    
+    def _cleanup(self) -> None:
+        """리소스 정리 (대기 없음, 이벤트 루프에서 호출해도 막히지 않음)
+
+        grabber 스레드가 있으면 capture는 grabber가 종료하면서 해제한다.
+        아직 grab()에 묶여 있으면 여기서 해제하지 않고 넘긴다.
+        """
+        self._is_capturing = False
+        self._stop_event.set()
+        thread = self._grabber_thread
+        self._grabber_thread = None
+        self._slot.clear()
+        self._last_encoded_seq = 0
+        self._last_encoded = None
+        self._last_encoded_source = None
+        self._variant_cache.clear()
+        
+        cap, self._cap = self._cap, None
+        if thread is None:
+            self._release_capture(cap)
+        elif thread.is_alive():
+            logger.debug("Frame grabber still running, capture will be released when it exits")
     
     def __del__(self):
         """소멸자에서 리소스 정리"""
@@ -0,0 +1,472 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from typing import AsyncGenerator, Callable, Dict, Mapping, Optional
+
+from stream_service.application.ports.outbound.capture_engine import CaptureEngine
+from stream_service.application.ports.outbound.frame_encoder import FrameEncoder
+from stream_service.application.dto.frame_envelope import EncodedFrame
+from stream_service.adapters.outbound.external.encoded_variant_cache import EncodedVariantCache
+from stream_service.adapters.outbound.external.shared_frame_ring import SharedFrameRing
+from stream_service.application.services.bounded_executor import BoundedExecutor
+from stream_service.application.services.encoder_calibration import FrameEncoderConfig
+from stream_service.application.services.motion_gate import MotionGateConfig
+from stream_service.application.services.preprocess import PreprocessConfig
+from stream_service.application.services.reconnect import ReconnectConfig, RecoveryTracker
+from stream_service.monitoring.metrics import LatencyHistogram, new_stage_timings
+from stream_service.monitoring.process_stats import CpuMeter
+
+logger = logging.getLogger(__name__)
+
+
+def _capture_worker_main(
+    rtsp_url: str,
+    ring_name: str,
+    notify_conn,
+    stop_event,
+    motion_config: Optional[MotionGateConfig] = None,
+    capture_backend: str = "opencv",
+    pyav_options=None,
+    reconnect: Optional[ReconnectConfig] = None,
+    preprocess_config: Optional[PreprocessConfig] = None,
+    encoder_config: Optional[FrameEncoderConfig] = None
+) -> None:
+    """캡처 워커 프로세스 진입점"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    asyncio.run(_run_capture_worker(
+        rtsp_url, ring_name, notify_conn, stop_event, motion_config, capture_backend, pyav_options, reconnect,
+        preprocess_config, encoder_config
+    ))
+
+
+def _create_worker_engine(
+    capture_backend: str,
+    pyav_options,
+    reconnect: Optional[ReconnectConfig] = None,
+    encoder_config: Optional[FrameEncoderConfig] = None
+):
+    """워커 프로세스에서 사용할 캡처 엔진 생성 (워커에서만 cv2/av를 로드, 인코더 측정도 워커에서)"""
+    if capture_backend not in ("opencv", "pyav"):
+        raise ValueError(f"Unknown capture backend: {capture_backend}")
+    from stream_service.adapters.outbound.external.frame_encoders import select_frame_encoder
+    encoder = select_frame_encoder(encoder_config)
+    if capture_backend == "pyav":
+        from stream_service.adapters.outbound.external.pyav_capture_engine import PyAVCaptureEngine
+        return PyAVCaptureEngine(pyav_options, reconnect=reconnect, encoder=encoder)
+    from stream_service.adapters.outbound.external.opencv_capture_engine import OpenCVCaptureEngine
+    return OpenCVCaptureEngine(reconnect=reconnect, encoder=encoder)
+
+
+def _publish_worker_stats(ring: SharedFrameRing, engine) -> None:
+    """워커 통계와 단계별 지연 히스토그램을 공유 메모리에 기록"""
+    stats = engine.get_frame_stats()
+    ring.write_stats(
+        int(stats["dropped_stale"]),
+        int(stats["consecutive_failures"]),
+        time.process_time(),
+        int(stats["suppressed_frames"]),
+        int(stats["reconnect_attempts"])
+    )
+    ring.write_recovery(
+        int(stats.get("outages", 0)),
+        int(stats.get("recoveries", 0)),
+        float(stats.get("recovery_seconds_total", 0.0)),
+        float(stats.get("last_recovery_seconds", 0.0)),
+        bool(stats.get("recovering", False))
+    )
+    ring.write_timings(engine.get_stage_timings())
+
+
+async def _run_capture_worker(
+    rtsp_url: str,
+    ring_name: str,
+    notify_conn,
+    stop_event,
+    motion_config: Optional[MotionGateConfig],
+    capture_backend: str = "opencv",
+    pyav_options=None,
+    reconnect: Optional[ReconnectConfig] = None,
+    preprocess_config: Optional[PreprocessConfig] = None,
+    encoder_config: Optional[FrameEncoderConfig] = None
+) -> None:
+    """워커 프로세스에서 캡처/인코딩 후 공유 메모리 링에 기록"""
+    ring = SharedFrameRing.attach(ring_name)
+    # 부모가 느려도 워커가 알림 전송에서 막히지 않도록 non-blocking (알림은 합쳐져도 무방)
+    os.set_blocking(notify_conn.fileno(), False)
+    engine = _create_worker_engine(capture_backend, pyav_options, reconnect, encoder_config)
+    engine.configure_motion(motion_config)
+    engine.configure_preprocess(preprocess_config)
+
+    async def _watch_stop():
+        while not stop_event.is_set():
+            await asyncio.sleep(0.1)
+        await engine.stop_capture()
+
+    watcher = asyncio.create_task(_watch_stop())
+    try:
+        await engine.start_capture(rtsp_url)
+
+        last_seq = 0
+        while engine.is_capturing():
+            engine.set_encode_params(*ring.read_encode_params())
+            frame = await engine.get_encoded_frame()
+            if frame is None or frame.seq == last_seq:
+                _publish_worker_stats(ring, engine)
+                await asyncio.sleep(0.005)
+                continue
+            last_seq = frame.seq
+
+            try:
+                ring.write(frame.data, frame.captured_at, frame.width, frame.height, frame.codec)
+            except ValueError as e:
+                logger.warning(f"프레임 기록 실패: {e}")
+                continue
+
+            _publish_worker_stats(ring, engine)
+            try:
+                notify_conn.send_bytes(b"\x01")
+            except BlockingIOError:
+                pass
+    except Exception as e:
+        logger.error(f"Capture worker stopped: {e}")
+    finally:
+        watcher.cancel()
+        await engine.stop_capture()
+        notify_conn.close()
+        ring.close()
+
+
+class ProcessCaptureEngine(CaptureEngine):
+    """캡처/인코딩을 자식 프로세스에서 실행하고 공유 메모리 링으로 프레임을 받는 엔진
+
+    GIL 경합 없이 스트림마다 별도 코어를 사용할 수 있다.
+    """
+
+    def __init__(
+        self,
+        slot_count: int = 4,
+        slot_size: int = 2 * 1024 * 1024,
+        capture_backend: str = "opencv",
+        pyav_options=None,
+        variant_cache: Optional[EncodedVariantCache] = None,
+        reconnect: Optional[ReconnectConfig] = None,
+        executor: Optional[BoundedExecutor] = None,
+        encoder_config: Optional[FrameEncoderConfig] = None,
+        tier_encoder: Optional[Callable[[], FrameEncoder]] = None
+    ):
+        self._slot_count = slot_count
+        self._slot_size = slot_size
+        # 워커에서 사용할 캡처 백엔드 (opencv | pyav)
+        self._capture_backend = capture_backend
+        self._pyav_options = pyav_options
+        # 워커 엔진의 재연결 설정 (끊기면 워커 안에서 다시 연결, 워커 프로세스는 유지)
+        self._reconnect = reconnect
+        # 워커 인코더 설정 (auto면 워커가 시작할 때 측정)과 부모의 tier JPEG 인코더 (첫 tier 요청 때 생성)
+        self._encoder_config = encoder_config
+        self._tier_encoder_factory = tier_encoder
+        self._tier_encoder: Optional[FrameEncoder] = None
+        self._ctx = multiprocessing.get_context("spawn")
+        # tier 인코딩용 스트림 전용 executor (워커 종료는 sentinel로 기다려 스레드를 쓰지 않음)
+        self._executor = executor or BoundedExecutor("capture-stream", max_workers=2)
+
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._ring: Optional[SharedFrameRing] = None
+        self._notify_reader = None
+        self._stop_event = None
+        self._frame_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._is_capturing = False
+        self._last_seq = 0
+        self._last_frame: Optional[EncodedFrame] = None
+        # (seq, 너비, 품질, 코덱)별 인코딩 결과 LRU (부모에서 만든 tier 변형)
+        self._variant_cache = variant_cache or EncodedVariantCache()
+        # 부모 프로세스에서 tier 인코딩에 쓴 CPU 시간 (워커 CPU에 더해 보고)
+        self._tier_cpu_seconds = 0.0
+        self._stop_timeout = 10.0  # seconds
+        self._cpu_meter = CpuMeter()
+        self._encode_params = (80, 1.0)
+        self._motion_config: Optional[MotionGateConfig] = None
+        self._preprocess_config: Optional[PreprocessConfig] = None
+        # 워커가 공유 메모리에 기록한 단계별 지연 히스토그램의 사본
+        self._stage_timings = new_stage_timings()
+
+    async def start_capture(self, rtsp_url: str) -> None:
+        """캡처 워커 프로세스 시작 후 첫 프레임까지 대기"""
+        if self._is_capturing:
+            raise RuntimeError("Capture is already running")
+
+        logger.info(f"Starting capture worker process for {rtsp_url}")
+        self._is_capturing = True
+        self._last_seq = 0
+        self._last_frame = None
+        self._variant_cache.clear()
+        self._tier_cpu_seconds = 0.0
+        self._cpu_meter.start()
+
+        self._loop = asyncio.get_running_loop()
+        self._frame_event = asyncio.Event()
+        self._ring = SharedFrameRing.create(self._slot_count, self._slot_size)
+        self._ring.write_encode_params(*self._encode_params)
+        self._notify_reader, notify_writer = self._ctx.Pipe(duplex=False)
+        self._stop_event = self._ctx.Event()
+
+        self._process = self._ctx.Process(
+            target=_capture_worker_main,
+            args=(
+                rtsp_url, self._ring.name, notify_writer, self._stop_event, self._motion_config,
+                self._capture_backend, self._pyav_options, self._reconnect, self._preprocess_config,
+                self._encoder_config
+            ),
+            name="capture-worker",
+            daemon=True
+        )
+        self._process.start()
+        notify_writer.close()
+        self._loop.add_reader(self._notify_reader.fileno(), self._on_notify)
+
+        try:
+            while self._ring.write_seq == 0:
+                if not self._is_capturing:
+                    raise RuntimeError("Capture was cancelled")
+                if not self._process.is_alive():
+                    raise RuntimeError("Capture worker exited before the first frame")
+                try:
+                    await asyncio.wait_for(self._frame_event.wait(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    pass
+            logger.info(f"Capture worker started (pid {self._process.pid})")
+        except Exception as e:
+            logger.error(f"Failed to start capture worker: {e}")
+            await self.stop_capture()
+            raise
+
+    async def stop_capture(self) -> None:
+        """캡처 워커 프로세스 종료"""
+        if self._process is None:
+            self._is_capturing = False
+            return
+
+        logger.info("Stopping capture worker process")
+        self._is_capturing = False
+        self._stop_event.set()
+
+        process = self._process
+        try:
+            if not await self._wait_exit(process, self._stop_timeout):
+                logger.warning("Capture worker did not stop in time, terminating")
+                process.terminate()
+                await self._wait_exit(process, 1.0)
+        finally:
+            # 대기가 취소되거나 실패해도 워커와 공유 메모리를 남기지 않음
+            if process.is_alive():
+                process.kill()
+                process.join(1.0)
+            self._cleanup()
+        logger.info("Capture worker process stopped")
+
+    @staticmethod
+    async def _wait_exit(process: multiprocessing.process.BaseProcess, timeout: float) -> bool:
+        """워커 종료를 process.sentinel로 기다림 (executor 스레드를 쓰지 않으므로 포화되어도 거절되지 않음)"""
+        if not process.is_alive():
+            return True
+        loop = asyncio.get_running_loop()
+        exited = loop.create_future()
+        sentinel = process.sentinel
+        loop.add_reader(sentinel, lambda: exited.done() or exited.set_result(None))
+        try:
+            await asyncio.wait_for(exited, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            loop.remove_reader(sentinel)
+        # sentinel은 프로세스가 회수 가능해지기 직전에 닫히므로 잠깐 더 확인 (is_alive가 좀비도 회수)
+        for _ in range(100):
+            if not process.is_alive():
+                return True
+            await asyncio.sleep(0.01)
+        return False
+
+    async def get_current_frame(self) -> Optional[bytes]:
+        """공유 메모리 링의 최신 프레임 반환 (대기하지 않음)"""
+        frame = await self.get_encoded_frame()
+        return frame.to_bytes() if frame is not None else None
+
+    async def get_encoded_frame(self) -> Optional[EncodedFrame]:
+        """공유 메모리 링의 최신 프레임을 메타데이터와 함께 반환 (대기하지 않음)"""
+        if not self._is_capturing or self._ring is None:
+            return None
+
+        latest = self._ring.read_latest(self._last_seq)
+        if latest is not None:
+            self._last_seq = latest.seq
+            self._last_frame = latest
+        return self._last_frame
+
+    async def encode_tiers(self, frame: EncodedFrame, tiers: Mapping[str, int]) -> Dict[str, EncodedFrame]:
+        """해상도 tier별 인코딩 (워커의 프레임을 부모에서 축소 디코딩 후 JPEG로 재인코딩, 인코딩한 변형은 캐시)"""
+        # 부모 프로세스는 tier가 처음 요청될 때만 cv2를 로드
+        from stream_service.adapters.outbound.external.tier_encoder import (
+            decode_for_tiers,
+            encode_tier_ladder,
+            tier_variant_keys,
+        )
+
+        quality = self._encode_params[0]
+        keys = tier_variant_keys(frame.seq, frame.width, frame.height, tiers, quality)
+        frames = {}
+        for name, key in keys.items():
+            cached = self._variant_cache.get(key)
+            if cached is not None:
+                frames[name] = cached
+        missing = {name: tiers[name] for name in keys if name not in frames}
+        if not missing:
+            return frames
+
+        def _encode_tiers():
+            cpu_start = time.thread_time()
+            image = decode_for_tiers(frame.data, frame.height, missing)
+            tier_encoder = self._get_tier_encoder()
+            encoded = encode_tier_ladder(image, frame.seq, frame.captured_at, missing, quality, tier_encoder)
+            self._tier_cpu_seconds += time.thread_time() - cpu_start
+            return encoded
+
+        try:
+            encoded = await self._executor.run(_encode_tiers)
+        except Exception as e:
+            logger.error(f"Error encoding resolution tiers: {e}")
+            return frames
+        for name, tier_frame in encoded.items():
+            self._variant_cache.put(keys[name], tier_frame)
+            frames[name] = tier_frame
+        return frames
+
+    def _get_tier_encoder(self) -> FrameEncoder:
+        # executor 스레드에서 호출 (auto면 측정이 이벤트 루프를 막지 않음)
+        if self._tier_encoder is None:
+            if self._tier_encoder_factory is not None:
+                self._tier_encoder = self._tier_encoder_factory()
+            else:
+                from stream_service.adapters.outbound.external.frame_encoders import select_jpeg_encoder
+                self._tier_encoder = select_jpeg_encoder(self._encoder_config)
+        return self._tier_encoder
+
+    def set_encode_params(self, quality: int, scale: float) -> None:
+        """인코딩 파라미터를 공유 메모리로 워커에 전달"""
+        self._encode_params = (quality, scale)
+        if self._ring is not None:
+            self._ring.write_encode_params(quality, scale)
+
+    def configure_motion(self, config: Optional[MotionGateConfig]) -> None:
+        """정지 장면 억제 설정 (다음 워커 시작 시 적용)"""
+        self._motion_config = config
+
+    def configure_preprocess(self, config: Optional[PreprocessConfig]) -> None:
+        """인코딩 전 crop/축소 설정 (다음 워커 시작 시 적용, 워커에서 인코딩 전에 수행)"""
+        self._preprocess_config = config
+
+    def is_capturing(self) -> bool:
+        """현재 캡처 중인지 확인"""
+        return self._is_capturing
+
+    async def frame_stream(self) -> AsyncGenerator[bytes, None]:
+        """워커 알림을 기다려 새 프레임마다 yield"""
+        if not self._is_capturing:
+            logger.warning("Cannot start frame stream: capture is not running")
+            return
+
+        while self._is_capturing and self._ring is not None:
+            latest = self._ring.read_latest(self._last_seq)
+            if latest is not None:
+                self._last_seq = latest.seq
+                self._last_frame = latest
+                yield latest.to_bytes()
+                continue
+
+            self._frame_event.clear()
+            if self._ring.write_seq > self._last_seq:
+                continue
+            try:
+                await asyncio.wait_for(self._frame_event.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                if self._process is not None and not self._process.is_alive():
+                    logger.error("Capture worker exited unexpectedly")
+                    break
+
+    def get_frame_stats(self) -> Dict[str, float]:
+        """워커 프로세스 통계 (CPU는 워커 프로세스 전체 + 부모의 tier 인코딩 기준)"""
+        if self._ring is None:
+            return {
+                "seq": self._last_seq,
+                "dropped_stale": 0,
+                "consecutive_failures": 0,
+                "suppressed_frames": 0,
+                "reconnect_attempts": 0,
+                **RecoveryTracker().as_dict(),
+                **{f"executor_{key}": value for key, value in self._executor.stats().items()},
+                **self._variant_cache.stats(),
+                **self._cpu_meter.as_dict(),
+            }
+
+        dropped_stale, consecutive_failures, cpu_seconds, suppressed_frames, reconnect_attempts = (
+            self._ring.read_stats()
+        )
+        outages, recoveries, recovery_seconds_total, last_recovery_seconds, recovering = self._ring.read_recovery()
+        self._cpu_meter.set_total(cpu_seconds + self._tier_cpu_seconds)
+        return {
+            "seq": self._ring.write_seq,
+            "dropped_stale": dropped_stale,
+            "consecutive_failures": consecutive_failures,
+            "suppressed_frames": suppressed_frames,
+            "reconnect_attempts": reconnect_attempts,
+            "outages": outages,
+            "recoveries": recoveries,
+            "recovering": recovering,
+            "recovery_seconds_total": round(recovery_seconds_total, 3),
+            "last_recovery_seconds": round(last_recovery_seconds, 3),
+            "mean_recovery_seconds": round(recovery_seconds_total / recoveries, 3) if recoveries else 0.0,
+            "worker_pid": self._process.pid if self._process else 0,
+            **{f"executor_{key}": value for key, value in self._executor.stats().items()},
+            **self._variant_cache.stats(),
+            **self._cpu_meter.as_dict(),
+        }
+
+    def get_stage_timings(self) -> Dict[str, LatencyHistogram]:
+        """워커 프로세스의 단계별 지연 히스토그램 (링이 닫히면 마지막 값 유지)"""
+        if self._ring is not None:
+            self._ring.read_timings(self._stage_timings)
+        return self._stage_timings
+
+    def _on_notify(self) -> None:
+        """워커 알림 파이프 수신 (이벤트 루프 콜백)"""
+        try:
+            while self._notify_reader.poll():
+                self._notify_reader.recv_bytes()
+        except (EOFError, OSError):
+            # 워커 종료로 파이프가 닫힘
+            self._loop.remove_reader(self._notify_reader.fileno())
+        self._frame_event.set()
+
+    def _cleanup(self) -> None:
+        """리소스 정리"""
+        self._is_capturing = False
+
+        if self._notify_reader is not None:
+            try:
+                self._loop.remove_reader(self._notify_reader.fileno())
+            except (OSError, ValueError):
+                pass
+            self._notify_reader.close()
+            self._notify_reader = None
+
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+
+        self._process = None
+        self._stop_event = None
@@ -0,0 +1,140 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from stream_service.adapters.outbound.external.encoded_variant_cache import EncodedVariantCache
+from stream_service.adapters.outbound.external.opencv_capture_engine import OpenCVCaptureEngine
+from stream_service.application.ports.outbound.frame_encoder import FrameEncoder
+from stream_service.application.services.bounded_executor import BoundedExecutor
+from stream_service.application.services.reconnect import ReconnectConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PyAVCaptureOptions:
+    """PyAV 입력/디코더 설정"""
+    rtsp_transport: str = "tcp"  # tcp | udp
+    decoder_threads: int = 0  # 0이면 FFmpeg가 코어 수에 맞춰 결정
+    thread_type: str = "AUTO"  # SLICE | FRAME | AUTO (FRAME은 프레임 단위 지연이 늘어남)
+    low_latency: bool = True  # 입력 버퍼링 없이 low_delay 디코딩
+    keyframes_only: bool = False  # 키프레임만 디코딩 (썸네일 스트림용)
+    open_timeout: float = 10.0  # seconds
+    read_timeout: float = 5.0  # seconds
+
+
+def _import_av():
+    try:
+        import av
+    except ImportError as e:
+        raise RuntimeError("PyAV is not installed (pip install 'stream-service[pyav]')") from e
+    return av
+
+
+class PyAVVideoSource:
+    """cv2.VideoCapture와 같은 grab/retrieve 인터페이스를 제공하는 PyAV 입력
+
+    grab()은 패킷 수신과 코덱 디코딩, retrieve()는 BGR ndarray 변환만 수행한다.
+    """
+
+    def __init__(self, url: str, options: PyAVCaptureOptions):
+        av = _import_av()
+        self._av = av
+
+        container_options: Dict[str, str] = {}
+        codec_options: Dict[str, str] = {}
+        if url.startswith(("rtsp://", "rtsps://")):
+            container_options["rtsp_transport"] = options.rtsp_transport
+        if options.low_latency:
+            container_options["fflags"] = "nobuffer"
+            codec_options["flags"] = "low_delay"
+
+        self._container = av.open(
+            url,
+            container_options=container_options,
+            timeout=(options.open_timeout, options.read_timeout)
+        )
+        self._stream = self._container.streams.video[0]
+        codec_context = self._stream.codec_context
+        codec_context.thread_type = options.thread_type
+        codec_context.thread_count = options.decoder_threads
+        if codec_options:
+            codec_context.options = codec_options
+        if options.keyframes_only:
+            codec_context.skip_frame = "NONKEY"
+
+        self._frames: Optional[Iterator[Any]] = self._container.decode(self._stream)
+        self._frame = None
+
+    def isOpened(self) -> bool:
+        return self._frames is not None
+
+    def set(self, prop: int, value: Any) -> bool:
+        # OpenCV capture 속성은 적용 대상이 아님 (설정은 PyAVCaptureOptions로)
+        return False
+
+    def grab(self) -> bool:
+        if self._frames is None:
+            return False
+        try:
+            self._frame = next(self._frames)
+            return True
+        except StopIteration:
+            self._frame = None
+            return False
+        except self._av.error.FFmpegError as e:
+            logger.warning(f"PyAV decode error: {e}")
+            self._frame = None
+            return False
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self._frame is None:
+            return False, None
+        return True, self._frame.to_ndarray(format="bgr24")
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        return self.retrieve() if self.grab() else (False, None)
+
+    def release(self) -> None:
+        if self._frames is not None:
+            self._frames = None
+            self._frame = None
+            self._container.close()
+
+
+class PyAVCaptureEngine(OpenCVCaptureEngine):
+    """PyAV(FFmpeg) 디코딩 캡처 엔진
+
+    grabber 스레드, 최신 프레임 슬롯, 인코딩, 정지 장면 억제, 통계는 OpenCVCaptureEngine을 그대로 쓰고
+    입력만 PyAVVideoSource로 교체한다. 디코더 스레드 수, RTSP transport, low-latency 플래그,
+    키프레임 전용 디코딩을 직접 제어할 수 있다.
+    """
+
+    def __init__(
+        self,
+        options: Optional[PyAVCaptureOptions] = None,
+        variant_cache: Optional[EncodedVariantCache] = None,
+        reconnect: Optional[ReconnectConfig] = None,
+        executor: Optional[BoundedExecutor] = None,
+        encoder: Optional[FrameEncoder] = None,
+        tier_encoder: Optional[FrameEncoder] = None
+    ):
+        self._options = options or PyAVCaptureOptions()
+        super().__init__(
+            capture_factory=self._open_source,
+            variant_cache=variant_cache,
+            reconnect=reconnect,
+            executor=executor,
+            encoder=encoder,
+            tier_encoder=tier_encoder
+        )
+
+    def _open_source(self, url: str) -> PyAVVideoSource:
+        return PyAVVideoSource(url, self._options)
+
+    async def start_capture(self, rtsp_url: str) -> None:
+        # PyAV가 없으면 연결 재시도 루프에 들어가기 전에 실패
+        _import_av()
+        await super().start_capture(rtsp_url)
@@ -0,0 +1,184 @@
+import struct
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+
+from stream_service.application.dto.frame_envelope import EncodedFrame, FrameCodec
+from stream_service.monitoring.metrics import CAPTURE_STAGES, STAGE_LATENCY_BUCKETS, LatencyHistogram
+
+# 링 헤더: write_seq, slot_count, slot_size,
+# (워커 통계) dropped_stale, consecutive_failures, cpu_seconds, suppressed_frames, reconnect_attempts,
+# (부모가 쓰는 인코딩 파라미터) jpeg_quality, scale
+_RING_HEADER = struct.Struct("=QIIQIdQQId")
+_STATS = struct.Struct("=QIdQQ")
+_STATS_OFFSET = 16
+_ENCODE_PARAMS = struct.Struct("=Id")
+_ENCODE_PARAMS_OFFSET = _STATS_OFFSET + _STATS.size
+# 헤더 뒤 워커의 재연결/복구 통계: outages, recoveries, recovery_seconds_total, last_recovery_seconds, recovering
+_RECOVERY = struct.Struct("=QQddB")
+_RECOVERY_OFFSET = _RING_HEADER.size
+# 그 뒤 단계별 지연 히스토그램 (버킷 개수들 + 합계), CAPTURE_STAGES 순서
+_TIMINGS = struct.Struct("=" + "Q" * (len(STAGE_LATENCY_BUCKETS) + 1) + "d")
+_TIMINGS_OFFSET = _RECOVERY_OFFSET + _RECOVERY.size
+_SLOTS_OFFSET = _TIMINGS_OFFSET + len(CAPTURE_STAGES) * _TIMINGS.size
+# 슬롯 헤더: seq, captured_at, length, width, height, codec
+_SLOT_HEADER = struct.Struct("=QdIHHB")
+
+
+class SharedFrameRing:
+    """multiprocessing.shared_memory 위의 인코딩 프레임 링 버퍼
+
+    단일 writer(캡처 워커 프로세스)와 단일 reader(asyncio 프로세스)를 가정한다.
+    writer는 슬롯 seq를 0으로 무효화한 뒤 payload를 쓰고 마지막에 seq를 기록하며,
+    reader는 복사 전후의 seq를 비교해 쓰는 도중인 슬롯을 걸러낸다 (seqlock).
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, slot_count: int, slot_size: int, owner: bool):
+        self._shm = shm
+        self._buf = shm.buf
+        self._slot_count = slot_count
+        self._slot_size = slot_size
+        self._owner = owner
+
+    @classmethod
+    def create(cls, slot_count: int, slot_size: int) -> "SharedFrameRing":
+        """링 생성 (부모 프로세스)"""
+        size = _SLOTS_OFFSET + slot_count * (_SLOT_HEADER.size + slot_size)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        _RING_HEADER.pack_into(shm.buf, 0, 0, slot_count, slot_size, 0, 0, 0.0, 0, 0, 80, 1.0)
+        return cls(shm, slot_count, slot_size, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedFrameRing":
+        """기존 링에 연결 (워커 프로세스)"""
+        shm = shared_memory.SharedMemory(name=name)
+        _, slot_count, slot_size = struct.unpack_from("=QII", shm.buf, 0)
+        return cls(shm, slot_count, slot_size, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def slot_size(self) -> int:
+        return self._slot_size
+
+    @property
+    def write_seq(self) -> int:
+        return struct.unpack_from("=Q", self._buf, 0)[0]
+
+    def _slot_offset(self, seq: int) -> int:
+        index = seq % self._slot_count
+        return _SLOTS_OFFSET + index * (_SLOT_HEADER.size + self._slot_size)
+
+    def write(
+        self, data, captured_at: float, width: int = 0, height: int = 0, codec: int = FrameCodec.JPEG
+    ) -> int:
+        """인코딩 프레임 기록 후 seq 반환 (슬롯보다 큰 프레임은 ValueError)"""
+        data = memoryview(data).cast("B")
+        length = data.nbytes
+        if length > self._slot_size:
+            raise ValueError(f"Frame of {length} bytes exceeds ring slot size {self._slot_size}")
+
+        seq = self.write_seq + 1
+        offset = self._slot_offset(seq)
+        payload_offset = offset + _SLOT_HEADER.size
+
+        _SLOT_HEADER.pack_into(self._buf, offset, 0, 0.0, 0, 0, 0, 0)
+        self._buf[payload_offset:payload_offset + length] = data
+        _SLOT_HEADER.pack_into(self._buf, offset, seq, captured_at, length, width, height, codec)
+        struct.pack_into("=Q", self._buf, 0, seq)
+        return seq
+
+    def read_latest(self, after_seq: int = 0) -> Optional[EncodedFrame]:
+        """after_seq 이후의 최신 프레임 반환
+
+        공유 메모리에서 결과 bytes로 한 번만 복사한다.
+        """
+        for _ in range(3):
+            seq = self.write_seq
+            if seq == 0 or seq <= after_seq:
+                return None
+
+            offset = self._slot_offset(seq)
+            slot_seq, captured_at, length, width, height, codec = _SLOT_HEADER.unpack_from(self._buf, offset)
+            if slot_seq != seq:
+                continue
+
+            payload_offset = offset + _SLOT_HEADER.size
+            data = bytes(self._buf[payload_offset:payload_offset + length])
+
+            # 복사 중 writer가 같은 슬롯을 덮어썼으면 재시도
+            if _SLOT_HEADER.unpack_from(self._buf, offset)[0] == seq:
+                return EncodedFrame(
+                    seq=seq,
+                    captured_at=captured_at,
+                    width=width,
+                    height=height,
+                    data=data,
+                    codec=codec,
+                )
+        return None
+
+    def write_stats(
+        self,
+        dropped_stale: int,
+        consecutive_failures: int,
+        cpu_seconds: float,
+        suppressed_frames: int = 0,
+        reconnect_attempts: int = 0
+    ) -> None:
+        """워커 통계 기록"""
+        _STATS.pack_into(
+            self._buf, _STATS_OFFSET,
+            dropped_stale, consecutive_failures, cpu_seconds, suppressed_frames, reconnect_attempts
+        )
+
+    def read_stats(self) -> Tuple[int, int, float, int, int]:
+        """워커 통계 (dropped_stale, consecutive_failures, cpu_seconds, suppressed_frames, reconnect_attempts)"""
+        return _STATS.unpack_from(self._buf, _STATS_OFFSET)
+
+    def write_recovery(
+        self, outages: int, recoveries: int, recovery_seconds_total: float, last_recovery_seconds: float, recovering: bool
+    ) -> None:
+        """워커의 끊김/복구 통계 기록"""
+        _RECOVERY.pack_into(
+            self._buf, _RECOVERY_OFFSET,
+            outages, recoveries, recovery_seconds_total, last_recovery_seconds, recovering
+        )
+
+    def read_recovery(self) -> Tuple[int, int, float, float, bool]:
+        """워커의 끊김/복구 통계 (outages, recoveries, recovery_seconds_total, last_recovery_seconds, recovering)"""
+        outages, recoveries, total, last, recovering = _RECOVERY.unpack_from(self._buf, _RECOVERY_OFFSET)
+        return outages, recoveries, total, last, bool(recovering)
+
+    def write_timings(self, timings: Dict[str, LatencyHistogram]) -> None:
+        """워커의 단계별 지연 히스토그램 기록 (metrics용이라 seqlock 없이 덮어씀)"""
+        for index, stage in enumerate(CAPTURE_STAGES):
+            histogram = timings[stage]
+            _TIMINGS.pack_into(
+                self._buf, _TIMINGS_OFFSET + index * _TIMINGS.size, *histogram.counts, histogram.sum
+            )
+
+    def read_timings(self, timings: Dict[str, LatencyHistogram]) -> None:
+        """공유 메모리의 히스토그램 값으로 timings 갱신"""
+        for index, stage in enumerate(CAPTURE_STAGES):
+            *counts, total = _TIMINGS.unpack_from(self._buf, _TIMINGS_OFFSET + index * _TIMINGS.size)
+            timings[stage].load(counts, total)
+
+    def write_encode_params(self, quality: int, scale: float) -> None:
+        """인코딩 파라미터 기록 (부모 → 워커)"""
+        _ENCODE_PARAMS.pack_into(self._buf, _ENCODE_PARAMS_OFFSET, quality, scale)
+
+    def read_encode_params(self) -> Tuple[int, float]:
+        """인코딩 파라미터 (jpeg_quality, scale)"""
+        return _ENCODE_PARAMS.unpack_from(self._buf, _ENCODE_PARAMS_OFFSET)
+
+    def close(self) -> None:
+        """매핑 해제 (생성한 쪽이면 공유 메모리 삭제)"""
+        self._buf = None
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
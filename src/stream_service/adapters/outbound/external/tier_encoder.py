@@ -0,0 +1,87 @@
+from typing import Any, Dict, Mapping, Optional
+
+import cv2
+import numpy as np
+
+from stream_service.adapters.outbound.external.encoded_variant_cache import VariantKey
+from stream_service.adapters.outbound.external.frame_encoders import OpenCVJpegEncoder
+from stream_service.application.dto.frame_envelope import EncodedFrame, FrameCodec, FrameBuffer
+from stream_service.application.ports.outbound.frame_encoder import FrameEncoder
+
+# (축소 배율, imdecode 플래그) - 큰 배율부터 확인
+_REDUCED_DECODE = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+
+def tier_width(source_width: int, source_height: int, height: int) -> int:
+    """tier 목표 높이에 해당하는 출력 너비 (원본보다 크거나 0이면 원본 너비)"""
+    if height <= 0 or height >= source_height:
+        return source_width
+    return max(1, round(source_width * height / source_height))
+
+
+def tier_variant_keys(
+    seq: int,
+    source_width: int,
+    source_height: int,
+    tiers: Mapping[str, int],
+    quality: int,
+    codec: int = FrameCodec.JPEG
+) -> Dict[str, VariantKey]:
+    """tier 이름 -> 인코딩 변형 캐시 키"""
+    return {
+        name: (seq, tier_width(source_width, source_height, height), quality, codec)
+        for name, height in tiers.items()
+    }
+
+
+def encode_tier_ladder(
+    image: Any,
+    seq: int,
+    captured_at: float,
+    tiers: Mapping[str, int],
+    quality: int,
+    encoder: Optional[FrameEncoder] = None
+) -> Dict[str, EncodedFrame]:
+    """해상도 tier별 인코딩 (tier 이름 -> 목표 높이, 0이면 원본, 기본 인코더는 OpenCV JPEG)
+
+    높은 tier부터 내려가며 직전 tier 결과를 다시 축소하므로 프레임당 tier마다 resize는 한 번이고,
+    작은 tier일수록 더 작은 입력에서 줄인다. 원본보다 큰 tier는 원본 크기로 인코딩한다.
+    """
+    encoder = encoder or OpenCVJpegEncoder()
+    source_height, source_width = image.shape[:2]
+    frames: Dict[str, EncodedFrame] = {}
+    current = image
+    ladder = sorted(tiers.items(), key=lambda item: item[1] if item[1] > 0 else float("inf"), reverse=True)
+    for name, height in ladder:
+        if 0 < height < current.shape[0]:
+            width = tier_width(source_width, source_height, height)
+            current = cv2.resize(current, (width, height), interpolation=cv2.INTER_AREA)
+        data = encoder.encode(current, quality)
+        if data is None:
+            continue
+        frames[name] = EncodedFrame(
+            seq=seq,
+            captured_at=captured_at,
+            width=current.shape[1],
+            height=current.shape[0],
+            data=data,
+            codec=encoder.codec
+        )
+    return frames
+
+
+def decode_for_tiers(data: FrameBuffer, source_height: int, tiers: Mapping[str, int]) -> Any:
+    """tier 인코딩에 필요한 만큼만 축소 디코딩 (JPEG은 DCT 단계에서 1/2, 1/4, 1/8 축소, WebP는 디코딩 후 축소)"""
+    flag = cv2.IMREAD_COLOR
+    heights = tiers.values()
+    if source_height > 0 and all(height > 0 for height in heights):
+        needed = max(heights)
+        for factor, reduced in _REDUCED_DECODE:
+            if source_height // factor >= needed:
+                flag = reduced
+                break
+    return cv2.imdecode(np.frombuffer(data, dtype=np.uint8), flag)
@@ -1,11 +1,18 @@
 import logging
 import socketio
 import asyncio
-from typing import Dict, Any
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
 
-from stream_service.application.ports.outbound.event_publisher import EventPublisher
+from stream_service.application.ports.outbound.event_publisher import EventPublisher, FrameEmitListener
+from stream_service.application.services.frame_bus import DropPolicy
+from stream_service.application.services.frame_scheduler import percentile
+from stream_service.monitoring.metrics import LatencyHistogram
+from stream_service.monitoring.tracing import tracer
 
 from stream_service.config.constants import EmitEvent
+from stream_service.application.dto.frame_envelope import EncodedFrame, pack_frame_envelope
 from stream_service.application.dto.socketio_dto import (
     ResponseClientMetadataDTO,
     VideoFrameFromServiceDTO,
@@ -13,36 +20,228 @@ from stream_service.application.dto.socketio_dto import (
 )
 logger = logging.getLogger(__name__)
 
+
+class OutboundFrameQueue:
+    """스트림 하나의 bounded 프레임 송신 큐
+
+    가득 차면 가장 오래된 프레임을 버린다 (latest_only는 크기 1).
+    payload는 binary envelope(bytes) 또는 legacy DTO dict다.
+    """
+
+    def __init__(self, maxsize: int = 3, policy: str = DropPolicy.DROP_OLDEST, latency_window: int = 300):
+        if policy == DropPolicy.LATEST_ONLY:
+            maxsize = 1
+        elif policy != DropPolicy.DROP_OLDEST:
+            raise ValueError(f"Unknown drop policy: {policy}")
+        self.policy = policy
+        self._frames: Deque[Tuple[Any, int, float]] = deque(maxlen=maxsize)
+        self.dropped = 0
+        self.sent = 0
+        self.bytes_sent = 0
+        self._emit_latency: Deque[float] = deque(maxlen=latency_window)
+        self.emit_timing = LatencyHistogram()
+
+    def put(self, data: Any, nbytes: int) -> None:
+        if len(self._frames) == self._frames.maxlen:
+            self.dropped += 1
+        self._frames.append((data, nbytes, time.perf_counter()))
+
+    def pop(self) -> Optional[Tuple[Any, int, float]]:
+        return self._frames.popleft() if self._frames else None
+
+    def record_sent(self, emit_latency: float, nbytes: int = 0) -> None:
+        self.sent += 1
+        self.bytes_sent += nbytes
+        self._emit_latency.append(emit_latency)
+        self.emit_timing.observe(emit_latency)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def stats(self) -> Dict[str, Any]:
+        latency_ms = [latency * 1000 for latency in self._emit_latency]
+        return {
+            "policy": self.policy,
+            "depth": len(self._frames),
+            "capacity": self._frames.maxlen,
+            "dropped": self.dropped,
+            "sent": self.sent,
+            "bytes_sent": self.bytes_sent,
+            "emit_latency_p50_ms": round(percentile(latency_ms, 50), 2),
+            "emit_latency_p95_ms": round(percentile(latency_ms, 95), 2),
+        }
+
+
 class SocketIOPublisher(EventPublisher):
     def __init__(
-        self, 
+        self,
         sio: socketio.AsyncClient,
-        emit_event: EmitEvent
+        emit_event: EmitEvent,
+        frame_queue_size: int = 3,
+        drop_policy: str = DropPolicy.DROP_OLDEST,
+        binary_envelope: bool = False,
+        ready_timeout: float = 5.0
     ):
         self.sio = sio
+        # namespace 연결 상태 (inbound adapter가 connect/disconnect 이벤트로 갱신)
         self._connected = False
+        self._ready = asyncio.Event()
+        self._ready_timeout = ready_timeout
         self.emit_event = emit_event
-    
+        # True면 pydantic DTO 대신 고정 헤더 binary envelope로 전송
+        self._binary_envelope = binary_envelope
+
+        # 스트림별 프레임 큐 + 절대 버리지 않는 상태 이벤트 우선 lane
+        self._frame_queue_size = frame_queue_size
+        self._drop_policy = drop_policy
+        self._frame_queues: Dict[str, OutboundFrameQueue] = {}
+        self._priority: Deque[Tuple[str, Dict[str, Any], asyncio.Future]] = deque()
+        self._wakeup = asyncio.Event()
+        self._sender_task: Optional[asyncio.Task] = None
+        self._frame_emit_listener: Optional[FrameEmitListener] = None
+
+    def set_connected(self, connected: bool) -> None:
+        """namespace 연결/해제 반영"""
+        self._connected = connected
+        if connected:
+            self._ready.set()
+        else:
+            self._ready.clear()
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    async def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        """namespace가 연결될 때까지 대기 (timeout 안에 연결되지 않으면 False)"""
+        if self._ready.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
     async def response_client_metadata(self, dto: ResponseClientMetadataDTO) -> None:
         data = dto.model_dump()
-        logger.info("네임스페이스 연결 대기")
-        await asyncio.sleep(1)
+        # 고정 대기 대신 namespace connect 이벤트를 기다림 (이미 연결돼 있으면 바로 전송)
+        if not await self.wait_connected(self._ready_timeout):
+            logger.warning(f"네임스페이스가 {self._ready_timeout}초 안에 연결되지 않아 metadata 응답 생략")
+            return
         logger.info("stream_service client ResponseClientMetadataDTO 전송")
         await self.sio.emit(
             self.emit_event.RESPONSE_CLIENT_METADATA,
             data
         )
 
-    async def send_video_frame(self, dto: VideoFrameFromServiceDTO) -> None:
-        data = dto.model_dump()
-        await self.sio.emit(
-            self.emit_event.VIDEO_FRAME_RELAY,
-            data
-        )
-    
+    async def send_video_frame(self, camera_id: str, frame: EncodedFrame) -> None:
+        """프레임을 스트림 큐에 넣고 즉시 반환 (전송은 sender task가 담당)"""
+        queue = self._frame_queues.get(camera_id)
+        if queue is None:
+            queue = OutboundFrameQueue(self._frame_queue_size, self._drop_policy)
+            self._frame_queues[camera_id] = queue
+
+        with tracer.span("publisher.send_video_frame"):
+            if self._binary_envelope:
+                payload = pack_frame_envelope(camera_id, frame)
+            else:
+                payload = VideoFrameFromServiceDTO(frame_data=frame.to_bytes(), camera_id=camera_id).model_dump()
+            queue.put(payload, frame.nbytes)
+        self._ensure_sender()
+        self._wakeup.set()
+
     async def emit_capture_status(self, dto: CaptureStatusResponseDTO) -> None:
+        """상태 이벤트는 우선 lane으로 전송하고 전송 완료까지 대기"""
         data = dto.model_dump()
-        await self.sio.emit(
-            self.emit_event.BROADCAST_CAPTURE_STATUS,
-            data
-        )
\ No newline at end of file
+        done = asyncio.get_running_loop().create_future()
+        self._priority.append((self.emit_event.BROADCAST_CAPTURE_STATUS, data, done))
+        self._ensure_sender()
+        self._wakeup.set()
+        await done
+
+    def set_frame_emit_listener(self, listener: Optional[FrameEmitListener]) -> None:
+        self._frame_emit_listener = listener
+
+    def get_queue_stats(self) -> Dict[str, Any]:
+        """스트림별 큐 깊이, drop 수, emit 지연"""
+        return {
+            "priority_depth": len(self._priority),
+            "streams": {
+                camera_id: queue.stats()
+                for camera_id, queue in self._frame_queues.items()
+            },
+        }
+
+    def get_emit_timings(self) -> Dict[str, LatencyHistogram]:
+        """스트림별 Socket.IO emit 지연 히스토그램"""
+        return {camera_id: queue.emit_timing for camera_id, queue in self._frame_queues.items()}
+
+    async def close(self) -> None:
+        """sender task 종료 (남은 프레임은 폐기)"""
+        if self._sender_task is not None:
+            self._sender_task.cancel()
+            try:
+                await self._sender_task
+            except asyncio.CancelledError:
+                pass
+            self._sender_task = None
+
+        while self._priority:
+            _, _, done = self._priority.popleft()
+            if not done.done():
+                done.cancel()
+
+    def _ensure_sender(self) -> None:
+        if self._sender_task is None or self._sender_task.done():
+            self._sender_task = asyncio.create_task(self._sender_loop())
+
+    def _next_frame(self) -> Optional[Tuple[str, OutboundFrameQueue]]:
+        """프레임이 남은 스트림을 round-robin으로 선택"""
+        for camera_id in list(self._frame_queues):
+            queue = self._frame_queues[camera_id]
+            if len(queue):
+                # 선택한 스트림을 뒤로 보내 다른 스트림에 차례를 넘김
+                self._frame_queues[camera_id] = self._frame_queues.pop(camera_id)
+                return camera_id, queue
+        return None
+
+    async def _sender_loop(self) -> None:
+        """우선 lane을 먼저 비우고 스트림 큐에서 프레임을 하나씩 전송"""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            while True:
+                if self._priority:
+                    event, data, done = self._priority.popleft()
+                    try:
+                        await self.sio.emit(event, data)
+                        if not done.done():
+                            done.set_result(None)
+                    except Exception as e:
+                        if not done.done():
+                            done.set_exception(e)
+                    continue
+
+                selected = self._next_frame()
+                if selected is None:
+                    break
+
+                camera_id, queue = selected
+                data, nbytes, _ = queue.pop()
+                started_at = time.perf_counter()
+                try:
+                    await self.sio.emit(self.emit_event.VIDEO_FRAME_RELAY, data)
+                except Exception as e:
+                    logger.error(f"[{camera_id}] Frame emit error: {e}")
+                    continue
+
+                emit_latency = time.perf_counter() - started_at
+                queue.record_sent(emit_latency, nbytes)
+                if tracer.enabled:
+                    tracer.record("publisher.emit", emit_latency, {"camera_id": camera_id, "bytes": nbytes})
+                if self._frame_emit_listener is not None:
+                    try:
+                        self._frame_emit_listener(camera_id, nbytes, emit_latency)
+                    except Exception as e:
+                        logger.error(f"[{camera_id}] Frame emit listener error: {e}")
@@ -0,0 +1,112 @@
+import os
+import struct
+from typing import BinaryIO, Sequence
+
+from stream_service.application.services.pre_event_buffer import ClipFrame
+
+_AVIF_HASINDEX = 0x10
+_AVIIF_KEYFRAME = 0x10
+_CHUNK_ID = b"00dc"
+
+
+def _chunk(fourcc: bytes, payload: bytes) -> bytes:
+    return fourcc + struct.pack("<I", len(payload)) + payload
+
+
+def _padded(size: int) -> int:
+    return size + (size & 1)
+
+
+def clip_fps(frames: Sequence[ClipFrame]) -> float:
+    """캡처 시각 간격으로 계산한 평균 프레임 레이트"""
+    if len(frames) < 2:
+        return 1.0
+    span = frames[-1].captured_at - frames[0].captured_at
+    return (len(frames) - 1) / span if span > 0 else 1.0
+
+
+def write_mjpeg_avi(path: str, frames: Sequence[ClipFrame], fps: float) -> int:
+    """JPEG 프레임을 재인코딩 없이 MJPEG AVI(RIFF)로 기록하고 파일 크기를 반환
+
+    모든 프레임 크기를 미리 알고 있으므로 헤더와 인덱스를 한 번에 순서대로 쓴다.
+    """
+    if not frames:
+        raise ValueError("No frames to write")
+    width, height = frames[0].width, frames[0].height
+    max_frame = max(len(frame.data) for frame in frames)
+    rate = max(1, round(fps * 1000))
+    usec_per_frame = round(1_000_000 / fps) if fps > 0 else 0
+    total_bytes = sum(len(frame.data) for frame in frames)
+
+    avih = struct.pack(
+        "<14I",
+        usec_per_frame,
+        round(total_bytes / len(frames) * fps),
+        0,
+        _AVIF_HASINDEX,
+        len(frames),
+        0,
+        1,
+        max_frame,
+        width,
+        height,
+        0, 0, 0, 0
+    )
+    strh = struct.pack(
+        "<4s4sIHHIIIIIIII4h",
+        b"vids", b"MJPG", 0, 0, 0, 0,
+        1000, rate, 0, len(frames), max_frame, 0xFFFFFFFF, 0,
+        0, 0, width, height
+    )
+    strf = struct.pack("<IiiHH4sIiiII", 40, width, height, 1, 24, b"MJPG", width * height * 3, 0, 0, 0, 0)
+    strl = _chunk(b"LIST", b"strl" + _chunk(b"strh", strh) + _chunk(b"strf", strf))
+    hdrl = _chunk(b"LIST", b"hdrl" + _chunk(b"avih", avih) + strl)
+
+    movi_size = 4 + sum(8 + _padded(len(frame.data)) for frame in frames)
+    idx1_size = 16 * len(frames)
+    riff_size = 4 + len(hdrl) + 8 + movi_size + 8 + idx1_size
+
+    with open(path, "wb") as output:
+        output.write(b"RIFF" + struct.pack("<I", riff_size) + b"AVI ")
+        output.write(hdrl)
+        output.write(b"LIST" + struct.pack("<I", movi_size) + b"movi")
+        for frame in frames:
+            _write_frame(output, frame.data)
+        output.write(b"idx1" + struct.pack("<I", idx1_size))
+        # offset은 'movi' fourcc 기준
+        offset = 4
+        for frame in frames:
+            output.write(_CHUNK_ID + struct.pack("<III", _AVIIF_KEYFRAME, offset, len(frame.data)))
+            offset += 8 + _padded(len(frame.data))
+    return os.path.getsize(path)
+
+
+def save_clip(directory: str, filename: str, frames: Sequence[ClipFrame], fps: float, max_files: int = 0) -> str:
+    """clip을 directory에 기록하고 경로 반환 (max_files > 0이면 오래된 clip부터 삭제해 개수 유지)"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, filename)
+    write_mjpeg_avi(path, frames, fps)
+    if max_files > 0:
+        prune_clips(directory, max_files, keep=path)
+    return path
+
+
+def prune_clips(directory: str, max_files: int, keep: str = "") -> int:
+    """수정 시각 기준으로 오래된 .avi부터 지워 max_files개만 남기고 삭제 수 반환"""
+    paths = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".avi")]
+    paths.sort(key=lambda path: (path == keep, os.path.getmtime(path)))
+    removed = 0
+    for path in paths[:max(0, len(paths) - max_files)]:
+        try:
+            os.remove(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def _write_frame(output: BinaryIO, data: bytes) -> None:
+    output.write(_CHUNK_ID + struct.pack("<I", len(data)))
+    output.write(data)
+    if len(data) & 1:
+        output.write(b"\0")
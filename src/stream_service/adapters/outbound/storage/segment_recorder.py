@@ -0,0 +1,301 @@
+import asyncio
+import bisect
+import logging
+import mmap
+import os
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from stream_service.application.dto.frame_envelope import EncodedFrame, FrameCodec
+from stream_service.application.services.frame_bus import DropPolicy, FrameBus
+from stream_service.monitoring.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# 인덱스 레코드: captured_at, seq, 세그먼트 내 offset, 길이, 너비, 높이
+_INDEX_RECORD = struct.Struct("<dqqIHH")
+SEGMENT_SUFFIX = ".seg"
+INDEX_SUFFIX = ".idx"
+
+
+@dataclass(slots=True)
+class SegmentInfo:
+    path: str
+    start: float
+    end: float
+    frames: int
+    nbytes: int
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "segment": os.path.basename(self.path),
+            "start": self.start,
+            "end": self.end,
+            "frames": self.frames,
+            "bytes": self.nbytes,
+        }
+
+
+# (세그먼트 경로, 구간의 인덱스 레코드 목록)
+SegmentRange = Tuple[str, List[Tuple[float, int, int, int, int, int]]]
+
+
+class _SegmentWriter:
+    """카메라 하나의 현재 세그먼트 파일 쌍 (writer 스레드 전용)"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.data: Optional[BinaryIO] = None
+        self.index: Optional[BinaryIO] = None
+        self.size = 0
+        self.dirty = False
+
+    def open(self, captured_at: float) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, f"{int(captured_at * 1_000_000):016d}")
+        self.data = open(base + SEGMENT_SUFFIX, "ab")
+        self.index = open(base + INDEX_SUFFIX, "ab")
+        self.size = self.data.tell()
+
+    def flush(self) -> None:
+        """데이터를 먼저 내보낸 뒤 인덱스를 내보냄 (인덱스가 가리키는 바이트는 항상 파일에 있음)"""
+        if self.data is not None:
+            self.data.flush()
+            self.index.flush()
+
+    def fsync(self) -> None:
+        if self.data is not None and self.dirty:
+            os.fsync(self.data.fileno())
+            os.fsync(self.index.fileno())
+            self.dirty = False
+
+    def close(self) -> None:
+        if self.data is not None:
+            self.flush()
+            self.fsync()
+            self.data.close()
+            self.index.close()
+            self.data = self.index = None
+
+
+class SegmentRecorder:
+    """인코딩된 프레임을 고정 크기 append-only 세그먼트에 기록하는 frame bus consumer
+
+    세그먼트 파일(.seg)에는 JPEG 바이트만 이어 붙이고, 같은 이름의 .idx에 프레임마다 고정 크기
+    (시각, seq, offset, 길이, 크기) 레코드를 남긴다. 이벤트 루프에서는 프레임 참조만 모으고,
+    flush_interval마다 전용 writer 스레드가 일괄 기록하며 fsync는 fsync_interval마다 한 번 한다.
+    재생은 인덱스에서 시간 구간을 찾은 뒤 세그먼트를 mmap해 잘라 내므로 디코딩/재인코딩이 없다.
+    """
+
+    def __init__(
+        self,
+        root_dir: str = "recordings",
+        segment_bytes: int = 64 * 1024 * 1024,
+        flush_interval: float = 0.5,
+        fsync_interval: float = 5.0,
+        max_pending_bytes: int = 16 * 1024 * 1024,
+        max_segments: int = 0
+    ):
+        self.root_dir = root_dir
+        self.segment_bytes = segment_bytes
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.max_pending_bytes = max_pending_bytes
+        # 카메라별 보관 세그먼트 수 (0이면 무제한)
+        self.max_segments = max_segments
+        self._pending: List[Tuple[str, EncodedFrame]] = []
+        self._pending_bytes = 0
+        self._writers: Dict[str, _SegmentWriter] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="segment-writer")
+        self._flush_task: Optional[asyncio.Task] = None
+        self._last_fsync = time.monotonic()
+        self.recorded_frames = 0
+        self.recorded_bytes = 0
+        self.dropped_frames = 0
+        self.fsyncs = 0
+        self.write_errors = 0
+        # writer 스레드의 일괄 기록 소요 시간
+        self.flush_duration = LatencyHistogram()
+
+    def attach(self, frame_bus: FrameBus) -> None:
+        """모든 카메라의 기본 tier 프레임을 구독"""
+        frame_bus.add_consumer("recorder", self._on_frame, maxsize=64, policy=DropPolicy.DROP_OLDEST)
+
+    async def _on_frame(self, camera_id: str, frame: EncodedFrame) -> None:
+        self.append(camera_id, frame)
+
+    def append(self, camera_id: str, frame: EncodedFrame) -> None:
+        """프레임 참조를 대기 목록에 추가 (I/O 없음, 디스크가 밀려 대기량이 한도를 넘으면 버림)"""
+        if frame.codec != FrameCodec.JPEG:
+            return
+        if self._pending_bytes + frame.nbytes > self.max_pending_bytes:
+            self.dropped_frames += 1
+            return
+        self._pending.append((camera_id, frame))
+        self._pending_bytes += frame.nbytes
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self, fsync: bool = False) -> None:
+        """대기 중인 프레임을 writer 스레드에서 일괄 기록"""
+        batch, self._pending, self._pending_bytes = self._pending, [], 0
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._write_batch, batch, fsync)
+
+    async def close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush(fsync=True)
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._close_writers)
+        self._executor.shutdown(wait=True)
+
+    def _write_batch(self, batch: List[Tuple[str, EncodedFrame]], fsync: bool) -> None:
+        started = time.perf_counter()
+        touched = set()
+        for camera_id, frame in batch:
+            try:
+                self._write_frame(camera_id, frame)
+                touched.add(camera_id)
+            except OSError as e:
+                self.write_errors += 1
+                logger.error(f"[{camera_id}] Segment write failed: {e}")
+        for camera_id in touched:
+            self._writers[camera_id].flush()
+
+        now = time.monotonic()
+        if fsync or now - self._last_fsync >= self.fsync_interval:
+            for writer in self._writers.values():
+                writer.fsync()
+            self._last_fsync = now
+            self.fsyncs += 1
+        if batch:
+            self.flush_duration.observe(time.perf_counter() - started)
+
+    def _write_frame(self, camera_id: str, frame: EncodedFrame) -> None:
+        writer = self._writers.get(camera_id)
+        if writer is None:
+            writer = self._writers[camera_id] = _SegmentWriter(os.path.join(self.root_dir, camera_id))
+        nbytes = frame.nbytes
+        if writer.data is not None and writer.size > 0 and writer.size + nbytes > self.segment_bytes:
+            writer.close()
+            self._enforce_retention(writer.directory)
+        if writer.data is None:
+            writer.open(frame.captured_at)
+
+        writer.data.write(frame.data)
+        writer.index.write(_INDEX_RECORD.pack(
+            frame.captured_at, frame.seq, writer.size, nbytes, frame.width, frame.height
+        ))
+        writer.size += nbytes
+        writer.dirty = True
+        self.recorded_frames += 1
+        self.recorded_bytes += nbytes
+
+    def _enforce_retention(self, directory: str) -> None:
+        if self.max_segments <= 0:
+            return
+        bases = _segment_bases(directory)
+        # 곧 열릴 새 세그먼트 자리를 남김
+        excess = len(bases) - (self.max_segments - 1)
+        for base in bases[:max(0, excess)]:
+            for suffix in (SEGMENT_SUFFIX, INDEX_SUFFIX):
+                try:
+                    os.remove(base + suffix)
+                except FileNotFoundError:
+                    pass
+
+    def _close_writers(self) -> None:
+        for writer in self._writers.values():
+            writer.close()
+
+    def segments(self, camera_id: str) -> List[SegmentInfo]:
+        """카메라의 세그먼트 목록 (시간순)"""
+        infos = []
+        for base in _segment_bases(os.path.join(self.root_dir, camera_id)):
+            records = _read_index(base + INDEX_SUFFIX)
+            if not records:
+                continue
+            last = records[-1]
+            infos.append(SegmentInfo(
+                path=base + SEGMENT_SUFFIX,
+                start=records[0][0],
+                end=last[0],
+                frames=len(records),
+                nbytes=last[2] + last[3]
+            ))
+        return infos
+
+    def find_range(self, camera_id: str, start: float, end: float) -> List[SegmentRange]:
+        """[start, end] 구간에 해당하는 세그먼트별 인덱스 레코드 (인덱스만 읽음)"""
+        ranges = []
+        for base in _segment_bases(os.path.join(self.root_dir, camera_id)):
+            records = _read_index(base + INDEX_SUFFIX)
+            if not records or records[-1][0] < start or records[0][0] > end:
+                continue
+            times = [record[0] for record in records]
+            selected = records[bisect.bisect_left(times, start):bisect.bisect_right(times, end)]
+            if selected:
+                ranges.append((base + SEGMENT_SUFFIX, selected))
+        return ranges
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "recorded_frames": self.recorded_frames,
+            "recorded_bytes": self.recorded_bytes,
+            "dropped_frames": self.dropped_frames,
+            "pending_frames": len(self._pending),
+            "pending_bytes": self._pending_bytes,
+            "fsyncs": self.fsyncs,
+            "write_errors": self.write_errors,
+            "cameras": sorted(self._writers),
+        }
+
+
+def iter_recorded_frames(ranges: List[SegmentRange]) -> Iterator[EncodedFrame]:
+    """세그먼트를 mmap해 인덱스 구간의 JPEG 바이트를 잘라 냄 (동기 generator, 페이지 폴트는 호출 스레드에서)"""
+    for path, records in ranges:
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:
+                continue
+            with mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+                for captured_at, seq, offset, length, width, height in records:
+                    if offset + length > size:
+                        break
+                    yield EncodedFrame(
+                        seq=seq, captured_at=captured_at, width=width, height=height,
+                        data=mapped[offset:offset + length]
+                    )
+
+
+def _segment_bases(directory: str) -> List[str]:
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    return sorted(
+        os.path.join(directory, name[:-len(SEGMENT_SUFFIX)]) for name in names if name.endswith(SEGMENT_SUFFIX)
+    )
+
+
+def _read_index(path: str) -> List[Tuple[float, int, int, int, int, int]]:
+    """인덱스 레코드 목록 (기록 중 잘린 마지막 레코드는 무시)"""
+    try:
+        with open(path, "rb") as file:
+            raw = file.read()
+    except FileNotFoundError:
+        return []
+    usable = len(raw) - len(raw) % _INDEX_RECORD.size
+    return list(_INDEX_RECORD.iter_unpack(raw[:usable]))
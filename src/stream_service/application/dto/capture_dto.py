@@ -1,8 +1,8 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
-from domain.models.capture_session import CaptureSession
+from stream_service.domain.models.capture_session import CaptureSession
 
 
 class CaptureStatusDTO(BaseModel):
@@ -41,4 +41,10 @@ class FrameDTO(BaseModel):
 
 class CaptureStartRequestDTO(BaseModel):
     """캡처 시작 요청 DTO"""
-    rtsp_url: Optional[str] = None
\ No newline at end of file
+    rtsp_url: Optional[str] = None
+
+class WorkerAssignmentDTO(BaseModel):
+    """supervisor가 워커에 보내는 담당 카메라 변경 요청"""
+    cameras: List[str]
+    # 새 담당 카메라 중 이전 워커에서 캡처 중이던 카메라 (이어서 캡처 시작)
+    resume: List[str] = []
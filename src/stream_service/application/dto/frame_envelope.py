@@ -0,0 +1,75 @@
+import struct
+from dataclasses import dataclass
+from typing import Tuple, Union
+
+# 바이너리 프레임 envelope 헤더 (network byte order)
+# version, codec, seq, captured_at(epoch sec), width, height, camera_id 길이 + camera_id(utf-8) + payload
+ENVELOPE_VERSION = 1
+ENVELOPE_HEADER = struct.Struct("!BBQdHHB")
+
+FrameBuffer = Union[bytes, bytearray, memoryview]
+
+
+class FrameCodec:
+    JPEG = 1
+    WEBP = 2
+
+
+# 코덱 -> HTTP Content-Type
+CODEC_MEDIA_TYPES = {FrameCodec.JPEG: "image/jpeg", FrameCodec.WEBP: "image/webp"}
+
+
+@dataclass(slots=True)
+class EncodedFrame:
+    """인코딩된 프레임과 메타데이터
+
+    data는 인코더 출력 버퍼를 복사 없이 감싼 memoryview일 수 있다.
+    프레임마다 생성되므로 frozen(생성 비용 수 배) 대신 slots만 사용한다.
+    """
+    seq: int
+    captured_at: float
+    width: int
+    height: int
+    data: FrameBuffer
+    codec: int = FrameCodec.JPEG
+
+    @property
+    def nbytes(self) -> int:
+        return memoryview(self.data).nbytes
+
+    def to_bytes(self) -> bytes:
+        """payload를 bytes로 반환 (필요할 때만 복사)"""
+        return self.data if isinstance(self.data, bytes) else bytes(self.data)
+
+
+def pack_frame_envelope(camera_id: str, frame: EncodedFrame) -> bytes:
+    """헤더 + payload를 한 번의 할당과 한 번의 payload 복사로 직렬화"""
+    camera = camera_id.encode("utf-8")
+    if len(camera) > 255:
+        raise ValueError(f"camera_id too long for frame envelope: {camera_id}")
+
+    header = ENVELOPE_HEADER.pack(
+        ENVELOPE_VERSION, frame.codec, frame.seq, frame.captured_at,
+        frame.width, frame.height, len(camera)
+    )
+    # join은 결과 크기를 먼저 계산해 한 번에 할당하고 memoryview payload를 직접 복사
+    return b"".join((header, camera, frame.data))
+
+
+def unpack_frame_envelope(envelope: FrameBuffer) -> Tuple[str, EncodedFrame]:
+    """envelope 해석 (payload는 원본 버퍼의 memoryview)"""
+    view = memoryview(envelope)
+    version, codec, seq, captured_at, width, height, camera_len = ENVELOPE_HEADER.unpack_from(view, 0)
+    if version != ENVELOPE_VERSION:
+        raise ValueError(f"Unsupported frame envelope version: {version}")
+
+    header_size = ENVELOPE_HEADER.size + camera_len
+    camera_id = bytes(view[ENVELOPE_HEADER.size:header_size]).decode("utf-8")
+    return camera_id, EncodedFrame(
+        seq=seq,
+        captured_at=captured_at,
+        width=width,
+        height=height,
+        data=view[header_size:],
+        codec=codec,
+    )
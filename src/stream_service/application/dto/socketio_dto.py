@@ -1,13 +1,21 @@
 from typing import Dict, Any, Optional, Literal
 from pydantic import BaseModel
 
+from stream_service.domain.models.capture_session import DEFAULT_CAMERA_ID
+
 class ResponseClientMetadataDTO(BaseModel):
     client_type: str
     
+class CaptureCommandDTO(BaseModel):
+    camera_id: str = DEFAULT_CAMERA_ID
+    
 class VideoFrameFromServiceDTO(BaseModel):
     frame_data: bytes
+    camera_id: str = DEFAULT_CAMERA_ID
     
 class CaptureStatusResponseDTO(BaseModel):
     rtsp_url: str
     status: str
-    is_active: bool
\ No newline at end of file
+    is_active: bool
+    camera_id: str = DEFAULT_CAMERA_ID
+    error_message: Optional[str] = None
\ No newline at end of file
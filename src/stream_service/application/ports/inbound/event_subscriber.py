@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Optional
+
 from stream_service.application.dto.capture_dto import CaptureStatusDTO
+from stream_service.domain.models.capture_session import DEFAULT_CAMERA_ID
 
 class EventSubscriber(ABC):
     """Socket.io server로부터 받는 command를 처리하기 위한 inbound port"""
@@ -11,18 +14,18 @@ class EventSubscriber(ABC):
         pass
     
     @abstractmethod
-    async def handle_capture_start_request(self) -> None:
+    async def handle_capture_start_request(self, camera_id: str = DEFAULT_CAMERA_ID) -> None:
         """Capture 시작 command 처리"""
         pass
     
     @abstractmethod
-    async def handle_capture_stop_request(self) -> None:
+    async def handle_capture_stop_request(self, camera_id: str = DEFAULT_CAMERA_ID) -> None:
         """Capture 중지 command 처리"""
         pass
     
     @abstractmethod
-    async def handle_request_capture_status(self) -> None:
-        """현재 캡처 상태 조회"""
+    async def handle_request_capture_status(self, camera_id: Optional[str] = None) -> None:
+        """현재 캡처 상태 조회 (camera_id가 없으면 전체 카메라)"""
         pass
     
     
@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Dict, Mapping, Optional
+
+from stream_service.application.dto.frame_envelope import EncodedFrame
+from stream_service.application.services.motion_gate import MotionGateConfig
+from stream_service.application.services.preprocess import PreprocessConfig
+from stream_service.monitoring.metrics import LatencyHistogram
 
 
 class CaptureEngine(ABC):
@@ -18,6 +23,31 @@ class CaptureEngine(ABC):
         """현재 프레임을 바이너리로 반환"""
         pass
     
+    @abstractmethod
+    async def get_encoded_frame(self) -> Optional[EncodedFrame]:
+        """현재 프레임을 시퀀스/캡처 시각/크기 메타데이터와 함께 반환"""
+        pass
+    
+    @abstractmethod
+    async def encode_tiers(self, frame: EncodedFrame, tiers: Mapping[str, int]) -> Dict[str, EncodedFrame]:
+        """get_encoded_frame()이 반환한 프레임을 해상도 tier(이름 -> 목표 높이)별로 추가 인코딩"""
+        pass
+    
+    @abstractmethod
+    def set_encode_params(self, quality: int, scale: float) -> None:
+        """JPEG 품질(0-100)과 해상도 배율(0-1] 설정"""
+        pass
+    
+    @abstractmethod
+    def configure_motion(self, config: Optional[MotionGateConfig]) -> None:
+        """정지 장면 프레임 억제 설정 (None이면 매 프레임 전송)"""
+        pass
+    
+    @abstractmethod
+    def configure_preprocess(self, config: Optional[PreprocessConfig]) -> None:
+        """인코딩 전 crop/목표 크기 설정 (None이면 원본 크기)"""
+        pass
+    
     @abstractmethod
     def is_capturing(self) -> bool:
         """현재 캡처 중인지 확인"""
@@ -26,4 +56,14 @@ class CaptureEngine(ABC):
     @abstractmethod
     async def frame_stream(self) -> AsyncGenerator[bytes, None]:
         """실시간 프레임 스트림"""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def get_frame_stats(self) -> Dict[str, float]:
+        """프레임/리소스 통계 반환"""
+        pass
+    
+    @abstractmethod
+    def get_stage_timings(self) -> Dict[str, LatencyHistogram]:
+        """단계별(grab / decode / encode) 지연 히스토그램 반환"""
+        pass
@@ -1,11 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Optional
+from stream_service.application.dto.frame_envelope import EncodedFrame
 from stream_service.application.dto.socketio_dto import (
     ResponseClientMetadataDTO,
-    VideoFrameFromServiceDTO,
     CaptureStatusResponseDTO
 )
 
+# (camera_id, frame_bytes, emit_latency_seconds)
+FrameEmitListener = Callable[[str, int, float], None]
+
 
 class EventPublisher(ABC):
     """Socket.io server로 video frame을 전송하기 위한 outbound port"""
@@ -17,11 +20,19 @@ class EventPublisher(ABC):
         
     
     @abstractmethod
-    async def send_video_frame(self, dto: VideoFrameFromServiceDTO) -> None:
-        """Socket.io server로 video frame 전송 (video_frame_from_service 이벤트)"""
+    async def send_video_frame(self, camera_id: str, frame: EncodedFrame) -> None:
+        """Socket.io server로 video frame 전송 (video_frame_from_service 이벤트)
+
+        캡처 루프를 막지 않도록 큐에 넣고 바로 반환할 수 있다.
+        """
         pass
     
     @abstractmethod
     async def emit_capture_status(self, dto: CaptureStatusResponseDTO) -> None:
         """클라이언트에게 캡처 상태 직접 전송 (capture_status 이벤트)"""
+        pass
+    
+    @abstractmethod
+    def set_frame_emit_listener(self, listener: Optional[FrameEmitListener]) -> None:
+        """프레임이 실제로 전송될 때마다 (camera_id, bytes, emit 지연)을 통지받을 listener 등록"""
         pass
\ No newline at end of file
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from stream_service.application.dto.frame_envelope import FrameBuffer
+
+
+class FrameEncoder(ABC):
+    # 백엔드 이름 (opencv | turbojpeg | simplejpeg | webp)과 출력 코덱 (FrameCodec)
+    name: str
+    codec: int
+
+    @abstractmethod
+    def encode(self, image: Any, quality: int) -> Optional[FrameBuffer]:
+        """BGR 이미지를 품질(0-100)로 인코딩 (실패하면 None, 반환 버퍼는 복사 없이 EncodedFrame.data로 사용)"""
+        pass
@@ -0,0 +1,81 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """대기 작업 수가 한도에 닿아 작업을 받지 않음"""
+
+
+class BoundedExecutor:
+    """스레드 수와 대기 작업 수를 제한한 executor
+
+    기본 executor(run_in_executor(None, ...))는 모든 스트림과 제어 요청이 공유하므로 한 카메라의 긴 연결
+    타임아웃이 다른 작업을 밀어낸다. 스트림마다, 그리고 제어 작업용으로 따로 두고, 한도를 넘는 작업은
+    대기열에 쌓지 않고 ExecutorSaturatedError로 거절한다.
+    """
+
+    def __init__(self, name: str, max_workers: int = 1, max_queue: int = 4):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        # 제출했지만 끝나지 않은 작업 수 (실행 중 포함)
+        self._pending = 0
+        self._running = 0
+        self.completed = 0
+        self.rejected = 0
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """fn(*args)를 executor 스레드에서 실행하고 결과 반환"""
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise ExecutorSaturatedError(f"Executor '{self.name}' is saturated ({self._pending} pending)")
+            self._pending += 1
+        try:
+            future = self._executor.submit(self._call, fn, args)
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        # 실행 전에 취소돼도 호출되므로 대기 수가 새지 않음
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def _call(self, fn: Callable[..., Any], args: tuple) -> Any:
+        with self._lock:
+            self._running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+            if not future.cancelled():
+                self.completed += 1
+
+    @property
+    def queue_depth(self) -> int:
+        """스레드를 기다리는 작업 수"""
+        with self._lock:
+            return self._pending - self._running
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "max_queue": self.max_queue,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,170 @@
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+@dataclass
+class EncodeControllerConfig:
+    """적응형 인코딩 컨트롤러 설정"""
+    bitrate_budget_kbps: int = 4000
+    emit_latency_high_ms: float = 150.0
+    emit_latency_low_ms: float = 50.0
+    min_quality: int = 40
+    max_quality: int = 80
+    quality_step: int = 10
+    scales: Tuple[float, ...] = (1.0, 0.75, 0.5, 0.25)
+    window_seconds: float = 1.0
+    # 히스테리시스: 연속 N개 윈도우가 조건을 만족해야 단계 변경
+    downgrade_windows: int = 2
+    upgrade_windows: int = 5
+    # 예산 대비 이 비율 이하일 때만 상향 고려
+    upgrade_headroom: float = 0.7
+
+
+@dataclass(frozen=True)
+class EncodeDecision:
+    """컨트롤러가 내린 단계 변경 기록"""
+    at: float
+    action: str
+    reason: str
+    quality: int
+    scale: float
+    bitrate_kbps: float
+    emit_latency_ms: float
+
+
+class AdaptiveEncodeController:
+    """emit 지연과 프레임 크기를 보고 JPEG 품질/해상도를 조절
+
+    과부하 시 품질을 먼저 낮추고 최저 품질에 닿으면 해상도를 낮추며,
+    회복 시에는 역순(해상도 → 품질)으로 올린다.
+    """
+
+    def __init__(self, config: Optional[EncodeControllerConfig] = None, history_size: int = 50):
+        self.config = config or EncodeControllerConfig()
+        self._quality = self.config.max_quality
+        self._scale_index = 0
+        self._decisions: Deque[EncodeDecision] = deque(maxlen=history_size)
+
+        self._window_started_at: Optional[float] = None
+        self._window_bytes = 0
+        self._window_frames = 0
+        self._window_latency = 0.0
+        self._over_windows = 0
+        self._under_windows = 0
+        self._last_bitrate_kbps = 0.0
+        self._last_latency_ms = 0.0
+
+    @property
+    def quality(self) -> int:
+        return self._quality
+
+    @property
+    def scale(self) -> float:
+        return self.config.scales[self._scale_index]
+
+    @property
+    def decisions(self) -> List[EncodeDecision]:
+        return list(self._decisions)
+
+    def record(self, frame_bytes: int, emit_latency: float, now: Optional[float] = None) -> bool:
+        """전송한 프레임 하나를 기록하고, 설정이 바뀌었으면 True 반환"""
+        now = time.monotonic() if now is None else now
+        if self._window_started_at is None:
+            self._window_started_at = now
+        self._window_bytes += frame_bytes
+        self._window_frames += 1
+        self._window_latency += emit_latency
+
+        elapsed = now - self._window_started_at
+        if elapsed < self.config.window_seconds:
+            return False
+
+        bitrate_kbps = self._window_bytes * 8 / elapsed / 1000
+        latency_ms = self._window_latency / self._window_frames * 1000
+        self._last_bitrate_kbps = bitrate_kbps
+        self._last_latency_ms = latency_ms
+
+        self._window_started_at = now
+        self._window_bytes = 0
+        self._window_frames = 0
+        self._window_latency = 0.0
+
+        return self._evaluate(bitrate_kbps, latency_ms)
+
+    def _evaluate(self, bitrate_kbps: float, latency_ms: float) -> bool:
+        config = self.config
+        over_budget = bitrate_kbps > config.bitrate_budget_kbps
+        slow_emit = latency_ms > config.emit_latency_high_ms
+
+        if over_budget or slow_emit:
+            self._over_windows += 1
+            self._under_windows = 0
+            if self._over_windows >= config.downgrade_windows:
+                self._over_windows = 0
+                reason = "bitrate over budget" if over_budget else "emit latency high"
+                return self._step_down(reason, bitrate_kbps, latency_ms)
+            return False
+
+        if (bitrate_kbps < config.bitrate_budget_kbps * config.upgrade_headroom
+                and latency_ms < config.emit_latency_low_ms):
+            self._under_windows += 1
+            self._over_windows = 0
+            if self._under_windows >= config.upgrade_windows:
+                self._under_windows = 0
+                return self._step_up("headroom available", bitrate_kbps, latency_ms)
+            return False
+
+        # 중간 구간은 현재 단계 유지
+        self._over_windows = 0
+        self._under_windows = 0
+        return False
+
+    def _step_down(self, reason: str, bitrate_kbps: float, latency_ms: float) -> bool:
+        config = self.config
+        if self._quality > config.min_quality:
+            self._quality = max(config.min_quality, self._quality - config.quality_step)
+            action = "quality_down"
+        elif self._scale_index < len(config.scales) - 1:
+            self._scale_index += 1
+            action = "scale_down"
+        else:
+            return False
+        self._record_decision(action, reason, bitrate_kbps, latency_ms)
+        return True
+
+    def _step_up(self, reason: str, bitrate_kbps: float, latency_ms: float) -> bool:
+        config = self.config
+        if self._scale_index > 0:
+            self._scale_index -= 1
+            action = "scale_up"
+        elif self._quality < config.max_quality:
+            self._quality = min(config.max_quality, self._quality + config.quality_step)
+            action = "quality_up"
+        else:
+            return False
+        self._record_decision(action, reason, bitrate_kbps, latency_ms)
+        return True
+
+    def _record_decision(self, action: str, reason: str, bitrate_kbps: float, latency_ms: float) -> None:
+        self._decisions.append(EncodeDecision(
+            at=time.time(),
+            action=action,
+            reason=reason,
+            quality=self._quality,
+            scale=self.scale,
+            bitrate_kbps=round(bitrate_kbps, 1),
+            emit_latency_ms=round(latency_ms, 1),
+        ))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 설정, 최근 측정값, 결정 이력"""
+        return {
+            "quality": self._quality,
+            "scale": self.scale,
+            "bitrate_kbps": round(self._last_bitrate_kbps, 1),
+            "emit_latency_ms": round(self._last_latency_ms, 1),
+            "config": asdict(self.config),
+            "decisions": [asdict(d) for d in self._decisions],
+        }
@@ -0,0 +1,47 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, List, Sequence, Tuple
+
+from stream_service.application.ports.outbound.frame_encoder import FrameEncoder
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FrameEncoderConfig:
+    """프레임 인코더 선택 설정 (process 모드 워커에 그대로 전달)"""
+    # auto: 사용 가능한 JPEG 인코더를 샘플 프레임으로 측정해 가장 빠른 것, 또는 opencv | turbojpeg | simplejpeg | webp
+    backend: str = "auto"
+    # JPEG 크로마 서브샘플링 (444 | 422 | 420)
+    subsampling: str = "420"
+    # 정수 fast DCT (turbojpeg, simplejpeg). 화질 차이는 작고 인코딩이 빨라짐
+    fast_dct: bool = True
+    # 측정용 샘플 프레임 크기와 수, 인코딩 품질
+    calibration_width: int = 1280
+    calibration_height: int = 720
+    calibration_frames: int = 8
+    calibration_quality: int = 80
+
+
+def calibrate(
+    encoders: Sequence[FrameEncoder], samples: Sequence[Any], quality: int
+) -> List[Tuple[FrameEncoder, float]]:
+    """인코더별 프레임당 인코딩 시간(seconds), 빠른 순
+
+    첫 인코딩(라이브러리 초기화)은 측정에서 빼고, 실패하는 인코더는 결과에서 제외한다.
+    """
+    results = []
+    for encoder in encoders:
+        try:
+            if encoder.encode(samples[0], quality) is None:
+                continue
+            started_at = time.perf_counter()
+            for sample in samples:
+                encoder.encode(sample, quality)
+            elapsed = (time.perf_counter() - started_at) / len(samples)
+        except Exception as e:
+            logger.warning(f"Frame encoder '{encoder.name}' failed calibration: {e}")
+            continue
+        results.append((encoder, elapsed))
+    return sorted(results, key=lambda result: result[1])
@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from stream_service.application.dto.frame_envelope import EncodedFrame
+from stream_service.monitoring.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# (camera_id, frame) -> None
+FrameHandler = Callable[[str, EncodedFrame], Awaitable[None]]
+
+ALL_CAMERAS = "*"
+# 캡처 엔진의 기본 인코딩 결과 (원본 해상도, 적응형 품질/배율 적용)
+MAIN_TIER = "main"
+
+
+class DropPolicy:
+    DROP_OLDEST = "drop_oldest"
+    LATEST_ONLY = "latest_only"
+
+
+class ConsumerStats:
+    """같은 이름 + 카메라 + tier의 구독들이 공유하는 누적 통계"""
+    __slots__ = ("subscribers", "delivered", "dropped", "errors", "lag")
+
+    def __init__(self):
+        self.subscribers = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        # publish → consumer 수신까지 큐 대기 시간
+        self.lag = LatencyHistogram()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "subscribers": self.subscribers,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "lag_mean_ms": round(self.lag.sum / self.lag.count * 1000, 3) if self.lag.count else 0.0,
+        }
+
+
+class FrameSubscription:
+    """consumer 하나의 bounded 프레임 큐 (이벤트 루프 전용)
+
+    가득 차면 가장 오래된 프레임을 버리므로 느린 consumer는 publish나 다른 consumer를 막지 않는다.
+    프레임은 참조로만 전달된다 (복사/재인코딩 없음).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        camera_id: Optional[str],
+        stats: ConsumerStats,
+        maxsize: int = 1,
+        policy: str = DropPolicy.DROP_OLDEST,
+        tier: str = MAIN_TIER
+    ):
+        if policy == DropPolicy.LATEST_ONLY:
+            maxsize = 1
+        elif policy != DropPolicy.DROP_OLDEST:
+            raise ValueError(f"Unknown drop policy: {policy}")
+        self.name = name
+        self.camera_id = camera_id
+        self.tier = tier
+        self.policy = policy
+        self.stats = stats
+        self._frames: Deque[Tuple[str, EncodedFrame, float]] = deque(maxlen=maxsize)
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.task: Optional[asyncio.Task] = None
+
+    def put(self, camera_id: str, frame: EncodedFrame) -> None:
+        if len(self._frames) == self._frames.maxlen:
+            self.stats.dropped += 1
+        self._frames.append((camera_id, frame, time.perf_counter()))
+        self._ready.set()
+
+    async def get(self) -> Optional[Tuple[str, EncodedFrame]]:
+        """다음 프레임까지 대기 (구독이 해제되면 None)"""
+        while not self._frames:
+            if self._closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        camera_id, frame, queued_at = self._frames.popleft()
+        self.stats.delivered += 1
+        self.stats.lag.observe(time.perf_counter() - queued_at)
+        return camera_id, frame
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        self._closed = True
+        self._frames.clear()
+        self._ready.set()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+
+class FrameBus:
+    """카메라 프레임 publish/subscribe 버스
+
+    캡처 엔진이 한 번 인코딩한 프레임을 등록된 모든 consumer(Socket.IO 송신, HTTP 뷰어 등)에 전달한다.
+    consumer마다 별도 bounded 큐를 두어 느린 consumer는 자기 큐에서만 프레임을 잃는다.
+    구독은 해상도 tier 단위이며, 구독자가 있는 tier만 인코딩되도록 active_tiers()로 알린다.
+    - subscribe(): consumer가 직접 get()으로 꺼내는 pull 방식
+    - add_consumer(): 버스가 task를 띄워 handler를 호출하는 push 방식
+    """
+
+    def __init__(self):
+        # (camera_id | ALL_CAMERAS, tier) -> 구독 목록
+        self._subscriptions: Dict[Tuple[str, str], List[FrameSubscription]] = {}
+        self._stats: Dict[Tuple[str, str, str], ConsumerStats] = {}
+        self._pending: List[Tuple[FrameSubscription, FrameHandler]] = []
+
+    def subscribe(
+        self,
+        name: str,
+        camera_id: Optional[str] = None,
+        maxsize: int = 1,
+        policy: str = DropPolicy.DROP_OLDEST,
+        limit: Optional[int] = None,
+        tier: str = MAIN_TIER
+    ) -> FrameSubscription:
+        """camera_id가 None이면 모든 카메라 프레임을 받음. limit은 같은 이름 + 카메라의 최대 구독 수"""
+        key = camera_id or ALL_CAMERAS
+        if limit is not None and self._subscriber_total(name, key) >= limit:
+            raise OverflowError(f"Too many '{name}' subscribers for camera: {key}")
+
+        stats = self._stats.setdefault((name, key, tier), ConsumerStats())
+        subscription = FrameSubscription(name, camera_id, stats, maxsize, policy, tier)
+        self._subscriptions.setdefault((key, tier), []).append(subscription)
+        stats.subscribers += 1
+        return subscription
+
+    def add_consumer(
+        self,
+        name: str,
+        handler: FrameHandler,
+        camera_id: Optional[str] = None,
+        maxsize: int = 1,
+        policy: str = DropPolicy.DROP_OLDEST,
+        tier: str = MAIN_TIER
+    ) -> FrameSubscription:
+        """handler를 전용 task에서 호출하는 consumer 등록 (task는 이벤트 루프에서 첫 publish 때 시작)"""
+        subscription = self.subscribe(name, camera_id, maxsize, policy, tier=tier)
+        self._pending.append((subscription, handler))
+        return subscription
+
+    def unsubscribe(self, subscription: FrameSubscription) -> None:
+        subscription.close()
+        subscriptions = self._subscriptions.get((subscription.camera_id or ALL_CAMERAS, subscription.tier), [])
+        if subscription in subscriptions:
+            subscriptions.remove(subscription)
+            subscription.stats.subscribers -= 1
+        if subscription.task is not None:
+            subscription.task.cancel()
+
+    def publish(self, camera_id: str, frame: EncodedFrame, tier: str = MAIN_TIER) -> None:
+        """프레임을 해당 카메라 + tier 구독자와 전체 카메라 구독자 큐에 넣음 (대기 없음)"""
+        if self._pending:
+            self._start_consumers()
+        for subscription in self._subscriptions.get((camera_id, tier), ()):
+            subscription.put(camera_id, frame)
+        for subscription in self._subscriptions.get((ALL_CAMERAS, tier), ()):
+            subscription.put(camera_id, frame)
+
+    def active_tiers(self, camera_id: str) -> Set[str]:
+        """구독자가 하나 이상 있는 tier (구독자가 없는 tier는 인코딩하지 않음)"""
+        return {
+            tier for (key, tier), subscriptions in self._subscriptions.items()
+            if subscriptions and key in (camera_id, ALL_CAMERAS)
+        }
+
+    def subscriber_count(self, camera_id: str) -> int:
+        return sum(
+            len(subscriptions) for (key, _), subscriptions in self._subscriptions.items()
+            if key in (camera_id, ALL_CAMERAS)
+        )
+
+    async def close(self) -> None:
+        """모든 구독 해제 및 consumer task 종료"""
+        self._pending.clear()
+        tasks = []
+        for subscriptions in self._subscriptions.values():
+            for subscription in list(subscriptions):
+                if subscription.task is not None:
+                    tasks.append(subscription.task)
+                self.unsubscribe(subscription)
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        """카메라/tier별 구독자 수와 consumer(이름 + 카메라 + tier)별 전달/drop/지연"""
+        subscribers: Dict[str, Dict[str, int]] = {}
+        for (camera_id, tier), subscriptions in self._subscriptions.items():
+            subscribers.setdefault(camera_id, {})[tier] = len(subscriptions)
+        return {
+            "subscribers": subscribers,
+            "consumers": [
+                {"name": name, "camera_id": camera_id, "tier": tier, **stats.as_dict()}
+                for (name, camera_id, tier), stats in self._stats.items()
+            ],
+        }
+
+    def consumer_stats(self) -> Dict[Tuple[str, str, str], ConsumerStats]:
+        return dict(self._stats)
+
+    def _subscriber_total(self, name: str, camera_key: str) -> int:
+        """이름 + 카메라의 전체 tier 구독 수"""
+        return sum(
+            stats.subscribers for (other, key, _), stats in self._stats.items()
+            if other == name and key == camera_key
+        )
+
+    def _start_consumers(self) -> None:
+        pending, self._pending = self._pending, []
+        for subscription, handler in pending:
+            if not subscription.closed:
+                subscription.task = asyncio.create_task(self._consume(subscription, handler))
+
+    async def _consume(self, subscription: FrameSubscription, handler: FrameHandler) -> None:
+        while True:
+            item = await subscription.get()
+            if item is None:
+                return
+            try:
+                await handler(*item)
+            except Exception as e:
+                subscription.stats.errors += 1
+                logger.error(f"[{item[0]}] Frame consumer '{subscription.name}' error: {e}")
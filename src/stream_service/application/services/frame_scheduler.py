@@ -0,0 +1,88 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Sequence
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """nearest-rank 백분위수 (q: 0-100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class FrameScheduler:
+    """monotonic clock 기반 고정 deadline 프레임 스케줄러
+
+    처리 시간에 sleep을 더하는 방식과 달리 tick마다 목표 시각을 고정해 drift가 쌓이지 않으며,
+    한 tick 이상 밀리면 밀린 tick을 건너뛰어 따라잡는다.
+    """
+
+    def __init__(self, fps: float = 30.0, window: int = 300):
+        self._interval = 1.0 / fps
+        self._fps = fps
+        self._next_deadline: Optional[float] = None
+        self._skipped = 0
+        self._ticks = 0
+        self._tick_times: Deque[float] = deque(maxlen=window)
+        self._jitter: Deque[float] = deque(maxlen=window)
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def skipped(self) -> int:
+        """따라잡기 위해 건너뛴 tick 수"""
+        return self._skipped
+
+    def reset(self) -> None:
+        self._next_deadline = None
+
+    async def wait_next(self) -> int:
+        """다음 deadline까지 대기 후 이번에 건너뛴 tick 수 반환"""
+        now = time.monotonic()
+        skipped = 0
+
+        if self._next_deadline is None:
+            self._next_deadline = now
+        else:
+            self._next_deadline += self._interval
+            lag = now - self._next_deadline
+            if lag >= self._interval:
+                skipped = int(lag / self._interval)
+                self._next_deadline += skipped * self._interval
+                self._skipped += skipped
+
+        delay = self._next_deadline - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        woke_at = time.monotonic()
+        self._ticks += 1
+        self._tick_times.append(woke_at)
+        self._jitter.append(abs(woke_at - self._next_deadline))
+        return skipped
+
+    @property
+    def achieved_fps(self) -> float:
+        """최근 윈도우의 실제 tick 레이트"""
+        if len(self._tick_times) < 2:
+            return 0.0
+        span = self._tick_times[-1] - self._tick_times[0]
+        return (len(self._tick_times) - 1) / span if span > 0 else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        jitter_ms = [j * 1000 for j in self._jitter]
+        return {
+            "target_fps": self._fps,
+            "achieved_fps": round(self.achieved_fps, 2),
+            "ticks": self._ticks,
+            "skipped_ticks": self._skipped,
+            "jitter_p50_ms": round(percentile(jitter_ms, 50), 2),
+            "jitter_p95_ms": round(percentile(jitter_ms, 95), 2),
+            "jitter_p99_ms": round(percentile(jitter_ms, 99), 2),
+        }
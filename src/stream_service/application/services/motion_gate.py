@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class MotionGateConfig:
+    """카메라별 움직임 감지/keep-alive 설정"""
+    # 축소 배율 (N픽셀마다 1픽셀 샘플링)
+    downscale: int = 8
+    # 픽셀 밝기 차이가 이 값을 넘으면 변화로 판단 (0-255)
+    pixel_threshold: int = 25
+    # 변화 픽셀 비율이 이 값 이상이면 움직임으로 판단
+    area_threshold: float = 0.005
+    # 정지 장면에서 전송하는 keep-alive 프레임 레이트 (0 이하면 keep-alive 없음)
+    keepalive_fps: float = 1.0
+    # 마지막 움직임 이후 전체 프레임 레이트를 유지하는 시간
+    hold_seconds: float = 2.0
+
+
+class MotionGate:
+    """축소 grayscale 프레임 차이로 정지 장면 프레임을 걸러냄
+
+    기준 프레임은 마지막으로 통과시킨 프레임이므로 천천히 누적되는 변화도 감지한다.
+    """
+
+    def __init__(self, config: Optional[MotionGateConfig] = None):
+        self.config = config or MotionGateConfig()
+        self._reference: Optional[np.ndarray] = None
+        self._last_emit_at = 0.0
+        self._last_motion_at = 0.0
+        self._suppressed = 0
+        self._last_score = 0.0
+
+    @property
+    def suppressed(self) -> int:
+        """정지 장면으로 판단해 걸러낸 프레임 수"""
+        return self._suppressed
+
+    @property
+    def last_score(self) -> float:
+        """직전 프레임의 변화 픽셀 비율"""
+        return self._last_score
+
+    def _to_gray(self, image: np.ndarray) -> np.ndarray:
+        """stride 샘플링으로 축소한 grayscale (정수 BT.601 근사)"""
+        step = self.config.downscale
+        small = image[::step, ::step]
+        if small.ndim == 2:
+            return small.astype(np.int16)
+        b = small[..., 0].astype(np.uint16)
+        g = small[..., 1].astype(np.uint16)
+        r = small[..., 2].astype(np.uint16)
+        return ((b * 29 + g * 150 + r * 77) >> 8).astype(np.int16)
+
+    def admit(self, image: Any, now: float) -> bool:
+        """프레임 전송 여부 판단"""
+        if not isinstance(image, np.ndarray):
+            return True
+
+        gray = self._to_gray(image)
+        reference = self._reference
+
+        if reference is None or reference.shape != gray.shape:
+            motion = True
+            self._last_score = 1.0
+        else:
+            changed = np.count_nonzero(np.abs(gray - reference) > self.config.pixel_threshold)
+            self._last_score = changed / gray.size
+            motion = self._last_score >= self.config.area_threshold
+
+        if motion:
+            self._last_motion_at = now
+
+        in_hold = now - self._last_motion_at < self.config.hold_seconds
+        keepalive_fps = self.config.keepalive_fps
+        keepalive_due = keepalive_fps > 0 and now - self._last_emit_at >= 1.0 / keepalive_fps
+        if motion or in_hold or keepalive_due:
+            self._reference = gray
+            self._last_emit_at = now
+            return True
+
+        self._suppressed += 1
+        return False
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "suppressed_frames": self._suppressed,
+            "motion_score": round(self._last_score, 4),
+        }
@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import math
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from stream_service.application.dto.frame_envelope import EncodedFrame, FrameCodec
+from stream_service.application.services.frame_bus import DropPolicy, FrameBus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ClipFrame:
+    """ring에서 복사해 낸 프레임 (export 중 ring이 덮어써도 안전)"""
+    seq: int
+    captured_at: float
+    width: int
+    height: int
+    data: bytes
+
+
+class PreEventBuffer:
+    """카메라 하나의 최근 인코딩 프레임 ring (이벤트 루프 전용)
+
+    payload는 미리 할당한 bytearray 하나에 순서대로 이어 쓰고, 끝에 닿으면 앞에서부터 덮어쓴다.
+    프레임 메타데이터도 고정 크기 array에 보관하므로 warm-up 이후 프레임당 버퍼 할당이 없다.
+    바이트 용량(capacity_bytes)과 프레임 수(max_frames) 중 먼저 닿는 쪽에서 오래된 프레임이 밀려난다.
+    """
+
+    def __init__(self, capacity_bytes: int, max_frames: int):
+        self.capacity_bytes = capacity_bytes
+        self.max_frames = max_frames
+        self._data = bytearray(capacity_bytes)
+        self._view = memoryview(self._data)
+        self._offsets = array("q", bytes(8 * max_frames))
+        self._lengths = array("q", bytes(8 * max_frames))
+        self._seqs = array("q", bytes(8 * max_frames))
+        self._captured_at = array("d", bytes(8 * max_frames))
+        self._widths = array("l", bytes(array("l").itemsize * max_frames))
+        self._heights = array("l", bytes(array("l").itemsize * max_frames))
+        # 단조 증가 entry id (id % max_frames가 슬롯), [_first_id, _next_id)가 유효 구간
+        self._first_id = 0
+        self._next_id = 0
+        self._write_pos = 0
+        self._used_bytes = 0
+        self.oversized = 0
+
+    def append(self, frame: EncodedFrame) -> None:
+        nbytes = frame.nbytes
+        if nbytes > self.capacity_bytes:
+            self.oversized += 1
+            return
+
+        position = self._write_pos
+        if position + nbytes > self.capacity_bytes:
+            # 끝의 남은 공간은 버리고 앞에서부터 쓰므로, 그 뒤쪽에 남은 (가장 오래된) 프레임부터 밀어냄
+            while self._first_id < self._next_id and self._offsets[self._first_id % self.max_frames] >= position:
+                self._evict()
+            position = 0
+        while self._first_id < self._next_id and (
+            self._next_id - self._first_id >= self.max_frames or self._overlaps(position, nbytes)
+        ):
+            self._evict()
+
+        self._view[position:position + nbytes] = frame.data
+        slot = self._next_id % self.max_frames
+        self._offsets[slot] = position
+        self._lengths[slot] = nbytes
+        self._seqs[slot] = frame.seq
+        self._captured_at[slot] = frame.captured_at
+        self._widths[slot] = frame.width
+        self._heights[slot] = frame.height
+        self._next_id += 1
+        self._write_pos = position + nbytes
+        self._used_bytes += nbytes
+
+    def _overlaps(self, position: int, nbytes: int) -> bool:
+        slot = self._first_id % self.max_frames
+        offset = self._offsets[slot]
+        return offset < position + nbytes and position < offset + self._lengths[slot]
+
+    def _evict(self) -> None:
+        self._used_bytes -= self._lengths[self._first_id % self.max_frames]
+        self._first_id += 1
+
+    async def export(self, seconds: float, now: Optional[float] = None, yield_every: int = 16) -> List[ClipFrame]:
+        """최근 seconds초 프레임을 복사해 반환
+
+        한 번에 복사하지 않고 yield_every 프레임마다 이벤트 루프에 양보하므로 export 중에도 스트리밍은 계속된다.
+        양보하는 동안 밀려난 프레임은 건너뛴다.
+        """
+        cutoff = (now if now is not None else time.time()) - seconds
+        entry_id = self._next_id
+        while entry_id > self._first_id and self._captured_at[(entry_id - 1) % self.max_frames] >= cutoff:
+            entry_id -= 1
+
+        frames: List[ClipFrame] = []
+        end_id = self._next_id
+        copied = 0
+        while entry_id < end_id:
+            if entry_id >= self._first_id:
+                slot = entry_id % self.max_frames
+                offset = self._offsets[slot]
+                frames.append(ClipFrame(
+                    seq=self._seqs[slot],
+                    captured_at=self._captured_at[slot],
+                    width=self._widths[slot],
+                    height=self._heights[slot],
+                    data=bytes(self._view[offset:offset + self._lengths[slot]])
+                ))
+                copied += 1
+                if copied % yield_every == 0:
+                    await asyncio.sleep(0)
+            entry_id += 1
+        return frames
+
+    @property
+    def oldest_captured_at(self) -> Optional[float]:
+        """ring에 남은 가장 오래된 프레임의 캡처 시각 (이보다 이전 구간은 export할 수 없음)"""
+        if self._first_id == self._next_id:
+            return None
+        return self._captured_at[self._first_id % self.max_frames]
+
+    def __len__(self) -> int:
+        return self._next_id - self._first_id
+
+    def stats(self) -> Dict[str, Any]:
+        frames = len(self)
+        span = 0.0
+        if frames:
+            span = (
+                self._captured_at[(self._next_id - 1) % self.max_frames]
+                - self._captured_at[self._first_id % self.max_frames]
+            )
+        return {
+            "capacity_bytes": self.capacity_bytes,
+            "used_bytes": self._used_bytes,
+            "frames": frames,
+            "max_frames": self.max_frames,
+            "span_seconds": round(span, 3),
+            "oversized_frames": self.oversized,
+        }
+
+
+class PreEventBuffers:
+    """카메라별 PreEventBuffer 모음 (frame bus의 'pre_event' consumer)
+
+    ring 크기는 보관 목표 시간(seconds)과 예상 비트레이트/프레임 레이트로 정하고,
+    카메라의 첫 프레임 때 한 번 할당한다. camera_seconds로 카메라별 목표를 덮어쓰며 0이면 보관하지 않는다.
+    clip은 MJPEG로 내보내므로 JPEG 프레임만 보관한다.
+    """
+
+    # 비트레이트 순간 증가(키프레임, 움직임)를 흡수할 여유
+    HEADROOM = 1.25
+
+    def __init__(
+        self,
+        seconds: float = 30.0,
+        bitrate_kbps: float = 4000.0,
+        fps: float = 30.0,
+        capacity_bytes: int = 0,
+        camera_seconds: Optional[Dict[str, float]] = None
+    ):
+        self._seconds = seconds
+        self._bitrate_kbps = bitrate_kbps
+        self._fps = fps
+        # 0보다 크면 비트레이트 계산 대신 카메라당 고정 크기
+        self._capacity_bytes = capacity_bytes
+        self._camera_seconds = dict(camera_seconds or {})
+        self._buffers: Dict[str, PreEventBuffer] = {}
+
+    def attach(self, frame_bus: FrameBus) -> None:
+        """모든 카메라의 기본 tier 프레임을 구독"""
+        frame_bus.add_consumer("pre_event", self._on_frame, maxsize=8, policy=DropPolicy.DROP_OLDEST)
+
+    async def _on_frame(self, camera_id: str, frame: EncodedFrame) -> None:
+        self.append(camera_id, frame)
+
+    def target_seconds(self, camera_id: str) -> float:
+        return self._camera_seconds.get(camera_id, self._seconds)
+
+    def buffer_size(self, camera_id: str) -> Optional[Tuple[int, int]]:
+        """카메라 ring의 (바이트 용량, 최대 프레임 수), 보관하지 않으면 None"""
+        seconds = self.target_seconds(camera_id)
+        if seconds <= 0:
+            return None
+        capacity = self._capacity_bytes or int(seconds * self._bitrate_kbps * 1000 / 8 * self.HEADROOM)
+        max_frames = math.ceil(seconds * self._fps * self.HEADROOM) + 1
+        return capacity, max_frames
+
+    def append(self, camera_id: str, frame: EncodedFrame) -> None:
+        if frame.codec != FrameCodec.JPEG:
+            return
+        buffer = self._buffers.get(camera_id)
+        if buffer is None:
+            size = self.buffer_size(camera_id)
+            if size is None:
+                return
+            buffer = PreEventBuffer(*size)
+            self._buffers[camera_id] = buffer
+            logger.info(
+                f"[{camera_id}] Pre-event buffer allocated "
+                f"({size[0] / (1024 * 1024):.1f}MiB, {self.target_seconds(camera_id)}s target)"
+            )
+        buffer.append(frame)
+
+    def get(self, camera_id: str) -> Optional[PreEventBuffer]:
+        return self._buffers.get(camera_id)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            camera_id: {**buffer.stats(), "target_seconds": self.target_seconds(camera_id)}
+            for camera_id, buffer in self._buffers.items()
+        }
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class PreprocessConfig:
+    """카메라별 인코딩 전 전처리 설정 (crop 후 목표 크기 안으로 축소)"""
+    # 출력 최대 크기 (px, 0이면 제한 없음). 비율은 유지하고 확대는 하지 않음
+    max_width: int = 0
+    max_height: int = 0
+    # crop 영역 (x, y, width, height, 원본 px). None이면 전체 프레임
+    crop: Optional[Tuple[int, int, int, int]] = None
+    # area: INTER_AREA로 1/2씩 줄인 뒤 나머지는 remap, linear: 원본에서 remap 한 번 (테이블은 입력 크기별로 한 번 계산)
+    interpolation: str = "area"
+
+
+@dataclass(frozen=True)
+class PreprocessPlan:
+    """입력 크기 하나에 대한 crop 영역과 출력 크기"""
+    x: int
+    y: int
+    crop_width: int
+    crop_height: int
+    width: int
+    height: int
+
+    @property
+    def resizes(self) -> bool:
+        return (self.width, self.height) != (self.crop_width, self.crop_height)
+
+
+def plan_preprocess(config: PreprocessConfig, width: int, height: int, scale: float = 1.0) -> PreprocessPlan:
+    """입력 크기와 해상도 배율(적응형 인코딩)로 crop 영역과 출력 크기 계산
+
+    crop은 프레임 안으로 잘라 맞추고, 출력은 max_width/max_height 안에 들어가도록 줄인 뒤 scale을 곱한다.
+    """
+    x, y, crop_width, crop_height = config.crop or (0, 0, width, height)
+    x = min(max(0, x), width - 1)
+    y = min(max(0, y), height - 1)
+    crop_width = max(1, min(crop_width, width - x))
+    crop_height = max(1, min(crop_height, height - y))
+
+    fit = 1.0
+    if config.max_width > 0:
+        fit = min(fit, config.max_width / crop_width)
+    if config.max_height > 0:
+        fit = min(fit, config.max_height / crop_height)
+    factor = fit * min(1.0, scale)
+    if factor >= 1.0:
+        return PreprocessPlan(x, y, crop_width, crop_height, crop_width, crop_height)
+    return PreprocessPlan(
+        x, y, crop_width, crop_height,
+        max(1, round(crop_width * factor)), max(1, round(crop_height * factor))
+    )
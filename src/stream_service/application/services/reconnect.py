@@ -0,0 +1,103 @@
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+
+@dataclass
+class ReconnectConfig:
+    """캡처 재연결 설정"""
+    backoff_base: float = 0.5  # seconds, 첫 재시도 대기
+    backoff_max: float = 30.0  # seconds
+    backoff_multiplier: float = 2.0
+    jitter: float = 0.5  # 대기 시간을 [delay * (1 - jitter), delay]에서 무작위로 선택
+    stall_timeout: float = 5.0  # seconds, 이 시간 동안 새 프레임이 없으면 재연결
+    initial_attempts: int = 3  # 최초 연결 시도 횟수 (이후 재연결은 중지 요청 전까지 계속)
+
+
+class ExponentialBackoff:
+    """jitter가 있는 지수 backoff
+
+    여러 카메라가 같은 서버에서 동시에 끊겨도 재시도가 한 시점에 몰리지 않도록 대기 시간을 흩뜨린다.
+    """
+
+    def __init__(
+        self,
+        base: float = 0.5,
+        cap: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+        rng: Callable[[], float] = random.random
+    ):
+        self.base = base
+        self.cap = cap
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self._rng = rng
+        self.attempts = 0
+        # cap에 닿는 지수 (장애가 길어져 attempts가 커져도 multiplier ** attempts가 overflow하지 않음)
+        if base > 0 and cap > base and multiplier > 1:
+            self._max_exponent = math.ceil(math.log(cap / base, multiplier))
+        else:
+            self._max_exponent = 0
+
+    @classmethod
+    def from_config(cls, config: ReconnectConfig) -> "ExponentialBackoff":
+        return cls(config.backoff_base, config.backoff_max, config.backoff_multiplier, config.jitter)
+
+    def next_delay(self) -> float:
+        delay = min(self.cap, self.base * self.multiplier ** min(self.attempts, self._max_exponent))
+        self.attempts += 1
+        return delay * (1.0 - self.jitter * self._rng())
+
+    def reset(self) -> None:
+        self.attempts = 0
+
+
+class RecoveryTracker:
+    """스트림 끊김부터 프레임 복구까지 걸린 시간(MTTR) 측정
+
+    끊김 시각은 마지막으로 프레임을 받은 시각이므로 복구 시간에는 장애 감지 지연도 포함된다.
+    단일 writer(grabber 스레드)를 가정한다.
+    """
+
+    def __init__(self):
+        self.outages = 0
+        self.recoveries = 0
+        self.total_recovery_seconds = 0.0
+        self.last_recovery_seconds = 0.0
+        self._down_since: Optional[float] = None
+
+    @property
+    def is_down(self) -> bool:
+        return self._down_since is not None
+
+    def mark_down(self, since: float) -> None:
+        if self._down_since is None:
+            self._down_since = since
+            self.outages += 1
+
+    def mark_up(self, at: float) -> Optional[float]:
+        """복구 시간 반환 (끊김 상태가 아니었으면 None)"""
+        if self._down_since is None:
+            return None
+        elapsed = max(0.0, at - self._down_since)
+        self._down_since = None
+        self.recoveries += 1
+        self.total_recovery_seconds += elapsed
+        self.last_recovery_seconds = elapsed
+        return elapsed
+
+    @property
+    def mean_recovery_seconds(self) -> float:
+        return self.total_recovery_seconds / self.recoveries if self.recoveries else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "outages": self.outages,
+            "recoveries": self.recoveries,
+            "recovering": self.is_down,
+            "recovery_seconds_total": round(self.total_recovery_seconds, 3),
+            "last_recovery_seconds": round(self.last_recovery_seconds, 3),
+            "mean_recovery_seconds": round(self.mean_recovery_seconds, 3),
+        }
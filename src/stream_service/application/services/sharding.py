@@ -0,0 +1,46 @@
+import hashlib
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+
+def _score(camera_id: str, worker: int) -> int:
+    # 내장 hash()는 프로세스마다 salt가 달라 부모/워커/재시작 사이에 같은 값을 보장하지 않음
+    digest = hashlib.blake2b(f"{camera_id}\0{worker}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def owner(camera_id: str, workers: Sequence[int]) -> int:
+    """camera_id를 담당할 워커 (rendezvous hashing)
+
+    워커 하나가 빠지면 그 워커의 카메라만 남은 워커들로 흩어지고, 다른 카메라는 옮겨지지 않는다.
+    """
+    if not workers:
+        raise ValueError("No workers to assign cameras to")
+    return max(workers, key=lambda worker: _score(camera_id, worker))
+
+
+def assign_cameras(camera_ids: Iterable[str], workers: Sequence[int]) -> Dict[int, List[str]]:
+    """워커별 담당 카메라 목록 (카메라가 없는 워커도 빈 목록으로 포함)"""
+    assignment: Dict[int, List[str]] = {worker: [] for worker in workers}
+    for camera_id in camera_ids:
+        assignment[owner(camera_id, workers)].append(camera_id)
+    return assignment
+
+
+class CameraShard:
+    """이 프로세스가 담당하는 카메라 집합
+
+    supervisor 워커가 아니면(camera_ids=None) 모든 카메라를 담당한다.
+    """
+
+    def __init__(self, camera_ids: Optional[Iterable[str]] = None):
+        self._camera_ids: Optional[Set[str]] = set(camera_ids) if camera_ids is not None else None
+
+    @property
+    def camera_ids(self) -> Optional[List[str]]:
+        return sorted(self._camera_ids) if self._camera_ids is not None else None
+
+    def owns(self, camera_id: str) -> bool:
+        return self._camera_ids is None or camera_id in self._camera_ids
+
+    def assign(self, camera_ids: Iterable[str]) -> None:
+        self._camera_ids = set(camera_ids)
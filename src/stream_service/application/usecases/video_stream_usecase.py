@@ -1,7 +1,9 @@
 import asyncio
 import logging
-from typing import Callable, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
 
+from stream_service.domain.models.capture_session import CaptureSession, DEFAULT_CAMERA_ID
 from stream_service.domain.services.capture_service import CaptureService
 
 logger = logging.getLogger(__name__)
@@ -11,121 +13,320 @@ from stream_service.application.dto.socketio_dto import (
     ResponseClientMetadataDTO,
     CaptureStatusResponseDTO,
 )
+from stream_service.application.dto.frame_envelope import EncodedFrame
 from stream_service.application.ports.outbound.capture_engine import CaptureEngine
+from stream_service.application.services.encode_controller import AdaptiveEncodeController
+from stream_service.application.services.motion_gate import MotionGateConfig
+from stream_service.application.services.preprocess import PreprocessConfig
+from stream_service.application.services.frame_scheduler import FrameScheduler
+from stream_service.application.services.frame_bus import DropPolicy, FrameBus, MAIN_TIER
+from stream_service.application.services.sharding import CameraShard
+from stream_service.monitoring.metrics import LatencyHistogram
+from stream_service.monitoring.process_stats import process_rss_bytes
+from stream_service.monitoring.tracing import tracer
+
+
+@dataclass
+class CameraStream:
+    """카메라 하나의 런타임 상태 (엔진 인스턴스 + 스트리밍 task)"""
+    camera_id: str
+    engine: CaptureEngine
+    encode_controller: Optional[AdaptiveEncodeController] = None
+    scheduler: Optional[FrameScheduler] = None
+    frame_task: Optional[asyncio.Task] = None
+    # 마지막으로 publish한 기본 tier 프레임 (snapshot 조회용)
+    latest_frame: Optional[EncodedFrame] = None
 
 
 class VideoStreamUseCase(EventSubscriber):
     def __init__(
-        self, 
-        capture_service: CaptureService, 
-        event_publisher: EventPublisher, 
-        capture_engine: CaptureEngine
+        self,
+        capture_service: CaptureService,
+        event_publisher: EventPublisher,
+        capture_engine_factory: Callable[[], CaptureEngine],
+        encode_controller_factory: Optional[Callable[[], AdaptiveEncodeController]] = None,
+        motion_config_factory: Optional[Callable[[str], Optional[MotionGateConfig]]] = None,
+        preprocess_config_factory: Optional[Callable[[str], Optional[PreprocessConfig]]] = None,
+        frame_bus: Optional[FrameBus] = None,
+        resolution_tiers: Optional[Mapping[str, int]] = None,
+        frame_rate: float = 30.0,
+        shard: Optional[CameraShard] = None
     ):
         self.capture_service = capture_service
         self.event_publisher = event_publisher
-        self.capture_engine = capture_engine
-        
-        self._frame_task = None
-        self._frame_callback = self._send_frame_via_socketio
-    
-    async def _send_frame_via_socketio(self, frame_data: bytes) -> None:
+        self.capture_engine_factory = capture_engine_factory
+        self.encode_controller_factory = encode_controller_factory
+        self.motion_config_factory = motion_config_factory
+        self.preprocess_config_factory = preprocess_config_factory
+        # 한 번 인코딩한 프레임을 Socket.IO 송신, HTTP 뷰어 등 여러 consumer에 전달
+        self.frame_bus = frame_bus or FrameBus()
+        # 추가 해상도 tier (이름 -> 목표 높이), 구독자가 있는 tier만 인코딩
+        self.resolution_tiers = dict(resolution_tiers or {})
+        self.frame_rate = frame_rate
+        # 이 프로세스가 담당하는 카메라 (supervisor 워커면 일부, 다른 카메라 명령은 무시)
+        self.shard = shard or CameraShard()
+
+        self._streams: Dict[str, CameraStream] = {}
+        self.event_publisher.set_frame_emit_listener(self._on_frame_emitted)
+
+    def _get_stream(self, camera_id: str) -> CameraStream:
+        """카메라별 스트림 조회 (없으면 엔진 생성)"""
+        stream = self._streams.get(camera_id)
+        if stream is None:
+            controller = self.encode_controller_factory() if self.encode_controller_factory else None
+            stream = CameraStream(
+                camera_id=camera_id,
+                engine=self.capture_engine_factory(),
+                encode_controller=controller,
+                scheduler=FrameScheduler(self.frame_rate)
+            )
+            if controller is not None:
+                stream.engine.set_encode_params(controller.quality, controller.scale)
+            if self.motion_config_factory is not None:
+                stream.engine.configure_motion(self.motion_config_factory(camera_id))
+            if self.preprocess_config_factory is not None:
+                stream.engine.configure_preprocess(self.preprocess_config_factory(camera_id))
+            # publisher가 자체 송신 큐를 가지므로 버스 큐는 최신 프레임 하나만 유지
+            self.frame_bus.add_consumer(
+                "socketio", self._send_frame_via_socketio, camera_id, policy=DropPolicy.LATEST_ONLY
+            )
+            self._streams[camera_id] = stream
+        return stream
+
+    async def _send_frame_via_socketio(self, camera_id: str, frame: EncodedFrame) -> None:
         """Socket.IO를 통해 프레임 전송"""
-        from stream_service.application.dto.socketio_dto import VideoFrameFromServiceDTO
-        dto = VideoFrameFromServiceDTO(frame_data=frame_data)
-        await self.event_publisher.send_video_frame(dto)
-    
+        await self.event_publisher.send_video_frame(camera_id, frame)
+
+    async def _publish_tiers(self, stream: CameraStream, frame: EncodedFrame) -> None:
+        """구독자가 있는 해상도 tier만 인코딩해 publish (tier당 프레임마다 한 번, 구독자끼리 공유)"""
+        active = self.frame_bus.active_tiers(stream.camera_id)
+        tiers = {name: height for name, height in self.resolution_tiers.items() if name in active}
+        if not tiers:
+            return
+        frames = await stream.engine.encode_tiers(frame, tiers)
+        for tier, tier_frame in frames.items():
+            self.frame_bus.publish(stream.camera_id, tier_frame, tier)
+
+    async def get_snapshot(self, camera_id: str, width: Optional[int] = None) -> Optional[EncodedFrame]:
+        """메모리의 최신 프레임 반환 (캡처를 새로 시작하지 않음)
+
+        width가 프레임보다 작으면 엔진의 변형 캐시를 거쳐 축소본을 반환한다.
+        """
+        stream = self._streams.get(camera_id)
+        frame = stream.latest_frame if stream is not None else None
+        if frame is None or not width or width >= frame.width:
+            return frame
+        height = max(1, round(frame.height * width / frame.width))
+        frames = await stream.engine.encode_tiers(frame, {"snapshot": height})
+        return frames.get("snapshot")
+
+    def _on_frame_emitted(self, camera_id: str, frame_bytes: int, emit_latency: float) -> None:
+        """실제 emit 지연과 프레임 크기를 인코딩 컨트롤러에 반영"""
+        stream = self._streams.get(camera_id)
+        if stream is None or stream.encode_controller is None:
+            return
+        controller = stream.encode_controller
+        if controller.record(frame_bytes, emit_latency):
+            decision = controller.decisions[-1]
+            logger.info(
+                f"[{camera_id}] Encode {decision.action} ({decision.reason}): "
+                f"quality={decision.quality}, scale={decision.scale}"
+            )
+            stream.engine.set_encode_params(controller.quality, controller.scale)
+
+    @staticmethod
+    def _to_status_dto(session: CaptureSession) -> CaptureStatusResponseDTO:
+        return CaptureStatusResponseDTO(
+            status=session.status.value,
+            rtsp_url=session.rtsp_url,
+            is_active=session.is_active,
+            camera_id=session.camera_id,
+            error_message=session.error_message
+        )
+
+    @tracer.traced("usecase.request_client_metadata")
     async def handle_request_client_metadata(self) -> None:
         dto = ResponseClientMetadataDTO(
             client_type='stream-service'
         )
         await self.event_publisher.response_client_metadata(dto)
-    
-    async def handle_capture_start_request(self) -> None:
+
+    @tracer.traced("usecase.capture_start")
+    async def handle_capture_start_request(self, camera_id: str = DEFAULT_CAMERA_ID) -> None:
+        if not self.shard.owns(camera_id):
+            logger.debug(f"[{camera_id}] Not assigned to this worker, ignoring capture start")
+            return
+        await self._start_capture(camera_id)
+
+    async def _start_capture(self, camera_id: str) -> None:
+        session = self.capture_service.start_capture_session(camera_id)
         try:
-            session = self.capture_service.start_capture_session()
-            
-            await self.capture_engine.start_capture(session.rtsp_url)
-            self.capture_service.mark_capture_running()
-            
-            logger.info("Capture session marked as running, starting frame streaming task")
-            
-            self._frame_task = asyncio.create_task(self._stream_frames())
-            logger.info("Frame streaming task created")
-            
-            dto = CaptureStatusResponseDTO(
-                status=session.status.value,
-                rtsp_url=session.rtsp_url,
-                is_active=session.is_active
-            )
-            await self.event_publisher.emit_capture_status(dto)
-            
+            stream = self._get_stream(camera_id)
+
+            await stream.engine.start_capture(session.rtsp_url)
+            self.capture_service.mark_capture_running(camera_id)
+
+            logger.info(f"[{camera_id}] Capture session marked as running, starting frame streaming task")
+
+            stream.frame_task = asyncio.create_task(self._stream_frames(camera_id))
+            logger.info(f"[{camera_id}] Frame streaming task created")
+
+            await self.event_publisher.emit_capture_status(self._to_status_dto(session))
+
         except Exception as e:
-            self.capture_service.mark_capture_error(str(e))
+            self.capture_service.mark_capture_error(str(e), camera_id)
             raise
-    
-    async def handle_capture_stop_request(self) -> None:
+
+    @tracer.traced("usecase.capture_stop")
+    async def handle_capture_stop_request(self, camera_id: str = DEFAULT_CAMERA_ID) -> None:
+        if not self.shard.owns(camera_id):
+            logger.debug(f"[{camera_id}] Not assigned to this worker, ignoring capture stop")
+            return
+        await self._stop_capture(camera_id)
+
+    async def _stop_capture(self, camera_id: str) -> None:
+        session = self.capture_service.stop_capture_session(camera_id)
         try:
-            session = self.capture_service.stop_capture_session()
-            
-            if self._frame_task:
-                self._frame_task.cancel()
+            stream = self._get_stream(camera_id)
+
+            if stream.frame_task:
+                stream.frame_task.cancel()
                 try:
-                    await self._frame_task
+                    await stream.frame_task
                 except asyncio.CancelledError:
                     pass
-                self._frame_task = None
-            
-            await self.capture_engine.stop_capture()
-            self.capture_service.mark_capture_stopped()
-            
-            dto = CaptureStatusResponseDTO(
-                status=session.status.value,
-                rtsp_url=session.rtsp_url,
-                is_active=session.is_active
-            )
-            await self.event_publisher.emit_capture_status(dto)
-            
+                stream.frame_task = None
+
+            await stream.engine.stop_capture()
+            stream.latest_frame = None
+            self.capture_service.mark_capture_stopped(camera_id)
+
+            await self.event_publisher.emit_capture_status(self._to_status_dto(session))
+
         except Exception as e:
-            self.capture_service.mark_capture_error(str(e))
+            self.capture_service.mark_capture_error(str(e), camera_id)
             raise
-    
-    async def handle_request_capture_status(self) -> None:
-        session = self.capture_service.get_session_status()
-        dto = CaptureStatusResponseDTO(
-            status=session.status,
-            rtsp_url=session.rtsp_url,
-        )
-        await self.event_publisher.emit_capture_status(dto)
-    
-    async def _stream_frames(self) -> None:
+
+    @tracer.traced("usecase.capture_status")
+    async def handle_request_capture_status(self, camera_id: Optional[str] = None) -> None:
+        if camera_id is not None:
+            sessions = [self.capture_service.get_session_status(camera_id)]
+        else:
+            sessions = self.capture_service.list_sessions()
+
+        for session in sessions:
+            if self.shard.owns(session.camera_id):
+                await self.event_publisher.emit_capture_status(self._to_status_dto(session))
+
+    async def reassign_cameras(self, camera_ids: Iterable[str], resume: Iterable[str] = ()) -> Dict[str, List[str]]:
+        """담당 카메라 변경 (supervisor의 재배치)
+
+        더 이상 담당하지 않는 카메라는 중지하고, resume 중 담당이면서 멈춰 있는 카메라는 캡처를 시작한다.
+        """
+        known = set(self.capture_service.camera_ids)
+        self.shard.assign(camera_id for camera_id in camera_ids if camera_id in known)
+
+        stopped, started = [], []
+        for session in self.capture_service.list_sessions():
+            if not self.shard.owns(session.camera_id) and session.can_stop:
+                await self._stop_capture(session.camera_id)
+                stopped.append(session.camera_id)
+        for camera_id in resume:
+            if camera_id not in known or not self.shard.owns(camera_id):
+                continue
+            if not self.capture_service.get_session(camera_id).can_start:
+                continue
+            try:
+                await self._start_capture(camera_id)
+                started.append(camera_id)
+            except Exception as e:
+                logger.error(f"[{camera_id}] Failed to resume capture after reassignment: {e}")
+        return {"cameras": self.shard.camera_ids or [], "started": started, "stopped": stopped}
+
+    def get_stream_stats(self) -> Dict[str, Dict[str, Any]]:
+        """카메라별 리소스 사용량
+
+        RSS는 프로세스 단위로만 측정 가능하므로 활성 스트림 수로 나눈 값을 스트림 몫으로 보고한다.
+        """
+        active = [
+            camera_id for camera_id, stream in self._streams.items()
+            if stream.engine.is_capturing()
+        ]
+        rss = process_rss_bytes()
+        rss_share = rss // len(active) if active else 0
+
+        return {
+            camera_id: {
+                **stream.engine.get_frame_stats(),
+                **stream.scheduler.stats(),
+                "is_capturing": stream.engine.is_capturing(),
+                "rss_share_bytes": rss_share if camera_id in active else 0,
+                "process_rss_bytes": rss,
+            }
+            for camera_id, stream in self._streams.items()
+        }
+
+    def get_stage_timings(self) -> Dict[str, Dict[str, LatencyHistogram]]:
+        """카메라별 캡처 단계(grab / decode / encode) 지연 히스토그램"""
+        return {
+            camera_id: stream.engine.get_stage_timings()
+            for camera_id, stream in self._streams.items()
+        }
+
+    def get_encoding_status(self) -> Dict[str, Dict[str, Any]]:
+        """카메라별 적응형 인코딩 상태 (현재 설정과 결정 이력)"""
+        return {
+            camera_id: stream.encode_controller.snapshot()
+            for camera_id, stream in self._streams.items()
+            if stream.encode_controller is not None
+        }
+
+    async def _stream_frames(self, camera_id: str) -> None:
         """백그라운드에서 프레임 스트리밍"""
-        logger.info("Frame streaming loop started")
-        
+        logger.info(f"[{camera_id}] Frame streaming loop started")
+        stream = self._get_stream(camera_id)
+        engine = stream.engine
+        scheduler = stream.scheduler
+        scheduler.reset()
+
         try:
-            frame_rate = 30  # FPS
-            frame_interval = 1.0 / frame_rate
             frame_count = 0
-            
-            session = self.capture_service.get_session_status()
+            last_seq = 0
+
+            session = self.capture_service.get_session_status(camera_id)
             while session.is_active:
-                frame_data = await self.capture_engine.get_current_frame()
-                if frame_data and self._frame_callback:
-                    try:
-                        await self._frame_callback(frame_data)
-                        frame_count += 1
-                        if frame_count % 30 == 0:
-                            logger.info(f"Sent {frame_count} frames to Socket.IO server")
-                    except Exception as e:
-                        logger.error(f"Frame callback error: {e}")
-                elif not frame_data:
-                    logger.warning("No frame data received from capture engine")
-                elif not self._frame_callback:
-                    logger.warning("No frame callback set")
-                
-                await asyncio.sleep(frame_interval)
-                session = self.capture_service.get_session_status()
-                
+                # 고정 deadline까지 대기 (처리 시간이 간격에 더해지지 않음, 밀리면 tick 건너뜀)
+                await scheduler.wait_next()
+                frame = await engine.get_encoded_frame()
+                if frame and frame.seq == last_seq:
+                    # 캡처가 fps보다 느리면 같은 프레임이 반환되므로 다시 보내지 않음
+                    frame = None
+                if frame:
+                    last_seq = frame.seq
+                    stream.latest_frame = frame
+                    self.frame_bus.publish(camera_id, frame, MAIN_TIER)
+                    await self._publish_tiers(stream, frame)
+                    frame_count += 1
+                    if frame_count % 30 == 0:
+                        # 이 카메라 통계만 (get_stream_stats는 모든 스트림과 /proc를 읽으므로 hot loop에서 쓰지 않음)
+                        stats = {**engine.get_frame_stats(), **scheduler.stats()}
+                        logger.info(
+                            f"[{camera_id}] Published {frame_count} frames "
+                            f"({self.frame_bus.subscriber_count(camera_id)} consumers, "
+                            f"cpu {stats.get('cpu_percent', 0.0)}%, "
+                            f"suppressed {stats.get('suppressed_frames', 0)}, "
+                            f"fps {stats['achieved_fps']}/{stats['target_fps']}, jitter p95 {stats['jitter_p95_ms']}ms)"
+                        )
+                elif not engine.is_capturing():
+                    # grabber가 복구할 수 없는 오류로 멈춤 (세션을 running으로 남기지 않음)
+                    raise RuntimeError("Capture engine stopped unexpectedly")
+                else:
+                    # 새 프레임 없음 또는 정지 장면으로 억제됨
+                    logger.debug(f"[{camera_id}] No frame data received from capture engine")
+
+                session = self.capture_service.get_session_status(camera_id)
+
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            self.capture_service.mark_capture_error(f"Frame streaming error: {str(e)}")
+            self.capture_service.mark_capture_error(f"Frame streaming error: {str(e)}", camera_id)
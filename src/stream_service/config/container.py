@@ -1,20 +1,109 @@
 import socketio
 import logging
+from dataclasses import replace
+from functools import partial
+from typing import Any, Optional
+
 from dependency_injector import containers, providers
 
 from stream_service.config.settings import Settings
 from stream_service.config.constants import EmitEvent
 
 
+from stream_service.application.ports.outbound.capture_engine import CaptureEngine
+from stream_service.application.ports.outbound.frame_encoder import FrameEncoder
 from stream_service.application.usecases.video_stream_usecase import VideoStreamUseCase
+from stream_service.application.services.bounded_executor import BoundedExecutor
+from stream_service.application.services.encoder_calibration import FrameEncoderConfig
+from stream_service.application.services.encode_controller import (
+    AdaptiveEncodeController,
+    EncodeControllerConfig
+)
+from stream_service.application.services.motion_gate import MotionGateConfig
+from stream_service.application.services.preprocess import PreprocessConfig
+from stream_service.application.services.frame_bus import FrameBus
+from stream_service.application.services.pre_event_buffer import PreEventBuffers
+from stream_service.application.services.reconnect import ReconnectConfig
+from stream_service.application.services.sharding import CameraShard
 
 from stream_service.domain.services.capture_service import CaptureService
+from stream_service.monitoring.loop_monitor import LoopLagMonitor
+from stream_service.monitoring.tracing import tracer
 
-from stream_service.adapters.outbound.external.opencv_capture_engine import OpenCVCaptureEngine
+from stream_service.adapters.outbound.external.encoded_variant_cache import EncodedVariantCache
+from stream_service.adapters.outbound.external.process_capture_engine import ProcessCaptureEngine
 from stream_service.adapters.outbound.messaging.socketio_publisher import SocketIOPublisher
+from stream_service.adapters.outbound.storage.segment_recorder import SegmentRecorder
 from stream_service.adapters.inbound.websocket.socketio_client import SocketIOClient
 
 
+def motion_config_for(settings: Settings, camera_id: str) -> Optional[MotionGateConfig]:
+    """전역 설정과 카메라별 덮어쓰기를 합쳐 MotionGateConfig 생성 (비활성화면 None)"""
+    overrides = dict(settings.camera_motion.get(camera_id, {}))
+    if not overrides.pop("enabled", settings.motion_detection_enabled):
+        return None
+    
+    return MotionGateConfig(**{
+        "downscale": settings.motion_downscale,
+        "pixel_threshold": settings.motion_pixel_threshold,
+        "area_threshold": settings.motion_area_threshold,
+        "keepalive_fps": settings.motion_keepalive_fps,
+        "hold_seconds": settings.motion_hold_seconds,
+        **overrides,
+    })
+
+
+def preprocess_config_for(settings: Settings, camera_id: str) -> Optional[PreprocessConfig]:
+    """전역 설정과 카메라별 덮어쓰기를 합쳐 PreprocessConfig 생성 (crop도 크기 제한도 없으면 None)"""
+    config = PreprocessConfig(**{
+        "max_width": settings.preprocess_max_width,
+        "max_height": settings.preprocess_max_height,
+        "interpolation": settings.preprocess_interpolation,
+        **settings.camera_preprocess.get(camera_id, {}),
+    })
+    if config.crop is None and config.max_width <= 0 and config.max_height <= 0:
+        return None
+    if config.crop is not None:
+        config = replace(config, crop=tuple(config.crop))
+    return config
+
+
+# capture 스택(cv2, av)은 첫 캡처에서 엔진을 만들 때 import (서비스 기동 시간에 포함하지 않음)
+def opencv_capture_engine(**kwargs: Any) -> CaptureEngine:
+    from stream_service.adapters.outbound.external.opencv_capture_engine import OpenCVCaptureEngine
+    return OpenCVCaptureEngine(**kwargs)
+
+
+def pyav_capture_engine(**kwargs: Any) -> CaptureEngine:
+    from stream_service.adapters.outbound.external.pyav_capture_engine import PyAVCaptureEngine
+    return PyAVCaptureEngine(**kwargs)
+
+
+def pyav_capture_options(**kwargs: Any) -> Any:
+    from stream_service.adapters.outbound.external.pyav_capture_engine import PyAVCaptureOptions
+    return PyAVCaptureOptions(**kwargs)
+
+
+def jpeg_frame_encoder(config: FrameEncoderConfig) -> FrameEncoder:
+    from stream_service.adapters.outbound.external.frame_encoders import select_jpeg_encoder
+    return select_jpeg_encoder(config)
+
+
+def frame_encoder_for(config: FrameEncoderConfig, jpeg_encoder: FrameEncoder) -> FrameEncoder:
+    from stream_service.adapters.outbound.external.frame_encoders import select_frame_encoder
+    return select_frame_encoder(config, jpeg_encoder)
+
+
+def socketio_serializer_for(name: str) -> str:
+    """Socket.IO serializer 이름 확인 (msgpack은 선택 의존성이 없으면 클라이언트 생성 전에 실패)"""
+    if name == "msgpack":
+        try:
+            import msgpack  # noqa: F401
+        except ImportError as e:
+            raise RuntimeError("msgpack is not installed (pip install 'stream-service[msgpack]')") from e
+    return name
+
+
 class Container(containers.DeclarativeContainer):
     config = providers.Configuration()
     settings = Settings()
@@ -23,35 +112,188 @@ class Container(containers.DeclarativeContainer):
     logging.getLogger('engineio.server').setLevel(logging.DEBUG)
     logging.getLogger('socketio.server').setLevel(logging.DEBUG)
     
+    # 전역 tracer 설정
+    tracer.configure(settings.tracing_enabled, settings.trace_buffer_size)
+    
+    loop_lag_monitor = providers.Singleton(
+        LoopLagMonitor,
+        interval=settings.loop_lag_interval_ms / 1000,
+        threshold=settings.loop_lag_threshold_ms / 1000
+    )
+    
     # Constants
     emit_event = providers.Factory(EmitEvent)
     
     # 도메인 서비스
     capture_service = providers.Singleton(
         CaptureService,
-        rtsp_url=settings.rtsp_url
+        rtsp_url=settings.rtsp_url,
+        cameras=settings.cameras
+    )
+    
+    # supervisor 워커면 배정받은 카메라만 담당 (WORKER_CAMERAS)
+    camera_shard = providers.Singleton(CameraShard, camera_ids=settings.worker_cameras)
+    
+    # adapter (카메라마다 별도 엔진 인스턴스, capture_mode/capture_backend로 선택)
+    pyav_options = providers.Singleton(
+        pyav_capture_options,
+        rtsp_transport=settings.pyav_rtsp_transport,
+        decoder_threads=settings.pyav_decoder_threads,
+        thread_type=settings.pyav_thread_type,
+        low_latency=settings.pyav_low_latency,
+        keyframes_only=settings.pyav_keyframes_only
+    )
+    
+    reconnect_config = providers.Singleton(
+        ReconnectConfig,
+        backoff_base=settings.reconnect_backoff_base,
+        backoff_max=settings.reconnect_backoff_max,
+        jitter=settings.reconnect_jitter,
+        stall_timeout=settings.stall_timeout_ms / 1000,
+        initial_attempts=settings.connect_max_attempts
+    )
+    
+    # 엔진(스트림)마다 별도 executor, 제어 작업은 공유 executor 하나
+    stream_executor = providers.Factory(
+        BoundedExecutor,
+        name="capture-stream",
+        max_workers=settings.stream_executor_workers,
+        max_queue=settings.stream_executor_queue
+    )
+    control_executor = providers.Singleton(
+        BoundedExecutor,
+        name="control",
+        max_workers=settings.control_executor_workers,
+        max_queue=settings.control_executor_queue
+    )
+    
+    # 프레임 인코더 (auto면 처음 필요할 때 샘플 프레임으로 측정해 가장 빠른 JPEG 인코더 선택, 프로세스에서 한 번)
+    # frame_encoder는 기본 스트림(webp 가능), jpeg_encoder는 해상도 tier용
+    encoder_config = providers.Singleton(
+        FrameEncoderConfig,
+        backend=settings.frame_encoder,
+        subsampling=settings.jpeg_subsampling,
+        fast_dct=settings.jpeg_fast_dct
+    )
+    jpeg_encoder = providers.ThreadSafeSingleton(jpeg_frame_encoder, config=encoder_config)
+    frame_encoder = providers.ThreadSafeSingleton(
+        frame_encoder_for, config=encoder_config, jpeg_encoder=jpeg_encoder
+    )
+    
+    # 엔진마다 별도 인코딩 변형 캐시
+    variant_cache = providers.Factory(
+        EncodedVariantCache,
+        max_bytes=settings.variant_cache_max_bytes
     )
     
-    # adapter
-    capture_engine = providers.Singleton(OpenCVCaptureEngine)
+    capture_engine = providers.Selector(
+        providers.Object(settings.capture_mode),
+        thread=providers.Selector(
+            providers.Object(settings.capture_backend),
+            opencv=providers.Factory(
+                opencv_capture_engine,
+                variant_cache=variant_cache,
+                reconnect=reconnect_config,
+                executor=stream_executor,
+                encoder=frame_encoder,
+                tier_encoder=jpeg_encoder
+            ),
+            pyav=providers.Factory(
+                pyav_capture_engine,
+                options=pyav_options,
+                variant_cache=variant_cache,
+                reconnect=reconnect_config,
+                executor=stream_executor,
+                encoder=frame_encoder,
+                tier_encoder=jpeg_encoder
+            )
+        ),
+        process=providers.Factory(
+            ProcessCaptureEngine,
+            slot_count=settings.shm_slot_count,
+            slot_size=settings.shm_slot_size,
+            capture_backend=settings.capture_backend,
+            # opencv 백엔드면 부모 프로세스에서 PyAV 모듈을 import하지 않음
+            pyav_options=pyav_options if settings.capture_backend == "pyav" else None,
+            variant_cache=variant_cache,
+            reconnect=reconnect_config,
+            executor=stream_executor,
+            # 워커는 설정만 받아 자기 프로세스에서 인코더를 고르고, 부모는 tier가 처음 필요할 때 JPEG 인코더를 만듦
+            encoder_config=encoder_config,
+            tier_encoder=jpeg_encoder.provider
+        )
+    )
     
     sio = providers.Singleton(
         socketio.AsyncClient,
         logger=True,
-        engineio_logger=False
+        engineio_logger=False,
+        serializer=providers.Callable(socketio_serializer_for, settings.socketio_serializer)
     )
     
     event_publisher = providers.Singleton(
         SocketIOPublisher,
         sio = sio,
-        emit_event=emit_event
+        emit_event=emit_event,
+        frame_queue_size=settings.outbound_queue_size,
+        drop_policy=settings.outbound_drop_policy,
+        binary_envelope=settings.frame_envelope_enabled,
+        ready_timeout=settings.socketio_ready_timeout
+    )
+
+    # 카메라마다 별도 적응형 인코딩 컨트롤러
+    encode_controller_config = providers.Singleton(
+        EncodeControllerConfig,
+        bitrate_budget_kbps=settings.encode_bitrate_budget_kbps,
+        emit_latency_high_ms=settings.encode_latency_high_ms,
+        emit_latency_low_ms=settings.encode_latency_low_ms,
+        min_quality=settings.encode_min_quality,
+        max_quality=settings.encode_max_quality
+    )
+    
+    encode_controller = providers.Factory(
+        AdaptiveEncodeController,
+        config=encode_controller_config
+    )
+
+    # 인코딩된 프레임 fan-out (Socket.IO 송신, MJPEG 뷰어 등)
+    frame_bus = providers.Singleton(FrameBus)
+    
+    # 카메라별 최근 프레임 ring (frame bus consumer, clip export용)
+    pre_event_buffers = providers.Singleton(
+        PreEventBuffers,
+        seconds=settings.pre_event_seconds,
+        bitrate_kbps=settings.encode_bitrate_budget_kbps,
+        fps=settings.target_fps,
+        capacity_bytes=settings.pre_event_buffer_bytes,
+        camera_seconds=settings.camera_pre_event_seconds
+    )
+    
+    # 연속 녹화 (frame bus consumer)
+    segment_recorder = providers.Singleton(
+        SegmentRecorder,
+        root_dir=settings.recording_dir,
+        segment_bytes=settings.recording_segment_bytes,
+        flush_interval=settings.recording_flush_interval,
+        fsync_interval=settings.recording_fsync_interval,
+        max_pending_bytes=settings.recording_max_pending_bytes,
+        max_segments=settings.recording_max_segments
     )
 
     video_stream_usecase = providers.Singleton(
         VideoStreamUseCase,
         capture_service = capture_service,
         event_publisher = event_publisher,
-        capture_engine = capture_engine
+        capture_engine_factory = capture_engine.provider,
+        encode_controller_factory = (
+            encode_controller.provider if settings.adaptive_encoding_enabled else None
+        ),
+        motion_config_factory = partial(motion_config_for, settings),
+        preprocess_config_factory = partial(preprocess_config_for, settings),
+        frame_bus = frame_bus,
+        resolution_tiers = settings.resolution_tiers,
+        frame_rate = settings.target_fps,
+        shard = camera_shard
     )
     
     
\ No newline at end of file
@@ -1,3 +1,4 @@
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -9,10 +10,145 @@ class Settings(BaseSettings):
     
     # Socket.IO server 설정
     socketio_server_url: str = "http://localhost:8001"
+    # metadata 요청에 응답하기 전 namespace 연결을 기다리는 최대 시간 (seconds)
+    socketio_ready_timeout: float = 5.0
+    # 기동 시간 예산 (프로세스 생성부터 namespace 연결까지, ms). 넘으면 시작 로그에 경고
+    startup_budget_ms: float = 3000.0
     
     # RTSP 설정
     rtsp_url: str = "rtsp://210.99.70.120:1935/live/cctv003.stream"
     
+    # 멀티 카메라 설정 (camera_id -> rtsp_url, JSON). 비어 있으면 rtsp_url을 default 카메라로 사용
+    cameras: Dict[str, str] = {}
+    
+    # 스트리밍 목표 프레임 레이트
+    target_fps: float = 30.0
+    
+    # 프레임 송신 큐 (스트림별 bounded 큐, drop_oldest | latest_only)
+    outbound_queue_size: int = 3
+    outbound_drop_policy: str = "drop_oldest"
+    
+    # 프레임 전송 형식: false(기본)면 기존 dict(frame_data, camera_id), true면 binary envelope (수신 서버가 envelope를 해석해야 함)
+    frame_envelope_enabled: bool = False
+    # Socket.IO 패킷 serializer (default | msgpack, msgpack은 서버도 같은 설정 필요)
+    socketio_serializer: Literal["default", "msgpack"] = "default"
+    
+    # MJPEG over HTTP (GET /cameras/{camera_id}/mjpeg) 카메라당 최대 동시 뷰어 수
+    mjpeg_max_viewers: int = 64
+    
+    # 추가 해상도 tier (이름 -> 목표 높이 px, JSON). 구독자가 있는 tier만 인코딩, 기본 tier는 "main"
+    resolution_tiers: Dict[str, int] = {"480p": 480, "160p": 160}
+    # 엔진별 인코딩 변형 LRU 캐시 크기 (bytes)
+    variant_cache_max_bytes: int = 32 * 1024 * 1024
+    
+    # 이벤트 직전 구간 보관 ring (카메라별 미리 할당, 기본 비활성)
+    # 크기는 보관 목표 시간 x ENCODE_BITRATE_BUDGET_KBPS(+25%)로 정하고, PRE_EVENT_BUFFER_BYTES가 0보다 크면 고정 크기
+    pre_event_buffer_enabled: bool = False
+    pre_event_seconds: float = 30.0
+    pre_event_buffer_bytes: int = 0
+    # 카메라별 보관 목표 시간 덮어쓰기 (JSON, 0이면 해당 카메라는 보관하지 않음)
+    camera_pre_event_seconds: Dict[str, float] = {}
+    # POST /cameras/{camera_id}/clip 결과 저장 디렉터리, 요청 가능한 최대 길이 (seconds), 보관 파일 수
+    # (CLIP_MAX_FILES=0이면 응답 전송 후 삭제)
+    clip_dir: str = "clips"
+    clip_max_seconds: float = 60.0
+    clip_max_files: int = 20
+    
+    # 연속 녹화 (append-only 세그먼트 + 시간 인덱스, GET /cameras/{camera_id}/recording으로 재생)
+    recording_enabled: bool = False
+    recording_dir: str = "recordings"
+    recording_segment_bytes: int = 64 * 1024 * 1024
+    # 일괄 기록 주기와 fsync 주기 (seconds)
+    recording_flush_interval: float = 0.5
+    recording_fsync_interval: float = 5.0
+    # 디스크가 밀릴 때 메모리에 쌓아 둘 최대 바이트 (넘치면 프레임을 버림)
+    recording_max_pending_bytes: int = 16 * 1024 * 1024
+    # 카메라별 보관 세그먼트 수 (0이면 무제한)
+    recording_max_segments: int = 0
+    
+    # 캡처 실행 방식: thread(이벤트 루프 프로세스 내 스레드) | process(카메라별 워커 프로세스)
+    capture_mode: str = "thread"
+    # 캡처 백엔드: opencv(cv2.VideoCapture) | pyav(FFmpeg 직접 제어, av 패키지 필요)
+    capture_backend: str = "opencv"
+    # PyAV 백엔드 설정
+    pyav_rtsp_transport: str = "tcp"
+    pyav_decoder_threads: int = 0
+    pyav_thread_type: str = "AUTO"
+    pyav_low_latency: bool = True
+    pyav_keyframes_only: bool = False
+    # 재연결 (jitter가 있는 지수 backoff, seconds). 최초 연결은 CONNECT_MAX_ATTEMPTS회까지, 끊긴 뒤에는 중지 전까지 재시도
+    reconnect_backoff_base: float = 0.5
+    reconnect_backoff_max: float = 30.0
+    reconnect_jitter: float = 0.5
+    connect_max_attempts: int = 3
+    # 이 시간 동안 새 프레임이 없으면 capture를 다시 연결 (ms)
+    stall_timeout_ms: float = 5000.0
+    # 스트림별 전용 executor (연결, 인코딩). 대기 작업이 한도를 넘으면 그 tick의 인코딩을 건너뜀
+    stream_executor_workers: int = 2
+    stream_executor_queue: int = 4
+    # 제어 작업 executor (clip 저장, 녹화 인덱스 조회, 인코더 측정). 스트림 작업과 스레드를 나누지 않음
+    control_executor_workers: int = 2
+    control_executor_queue: int = 32
+    # process 모드 공유 메모리 링 설정
+    shm_slot_count: int = 4
+    shm_slot_size: int = 2 * 1024 * 1024
+    
+    # 적응형 JPEG 품질/해상도 설정 (emit 지연과 전송 비트레이트 기준)
+    adaptive_encoding_enabled: bool = True
+    encode_bitrate_budget_kbps: int = 4000
+    encode_latency_high_ms: float = 150.0
+    encode_latency_low_ms: float = 50.0
+    encode_min_quality: int = 40
+    encode_max_quality: int = 80
+    
+    # 정지 장면 프레임 억제 (움직임이 없으면 keep-alive 레이트로만 전송)
+    motion_detection_enabled: bool = True
+    motion_downscale: int = 8
+    motion_pixel_threshold: int = 25
+    motion_area_threshold: float = 0.005
+    # 0이면 keep-alive 없이 움직임이 있을 때만 전송
+    motion_keepalive_fps: float = 1.0
+    motion_hold_seconds: float = 2.0
+    # 카메라별 덮어쓰기 (JSON, 예: {"lobby": {"area_threshold": 0.01}, "gate": {"enabled": false}})
+    camera_motion: Dict[str, Dict[str, Any]] = {}
+    
+    # 인코딩 전 전처리: crop 후 최대 크기 안으로 축소 (0이면 제한 없음, 브라우저 뷰어 캔버스는 800x600)
+    preprocess_max_width: int = 0
+    preprocess_max_height: int = 0
+    # area: INTER_AREA 1/2 단계 축소 + 캐시한 remap 테이블, linear: remap 한 번 (더 빠르지만 큰 비율 축소에서 aliasing)
+    preprocess_interpolation: Literal["area", "linear"] = "area"
+    # 카메라별 덮어쓰기 (JSON, 예: {"gate": {"crop": [480, 270, 960, 540], "max_width": 640}})
+    camera_preprocess: Dict[str, Dict[str, Any]] = {}
+    
+    # 프레임 인코더: auto(설치된 JPEG 인코더를 샘플 프레임으로 측정해 가장 빠른 것) | opencv | turbojpeg | simplejpeg
+    # | webp (기본 스트림만 WebP, 해상도 tier는 JPEG. MJPEG/clip/녹화는 JPEG 프레임만 사용)
+    frame_encoder: Literal["auto", "opencv", "turbojpeg", "simplejpeg", "webp"] = "auto"
+    # JPEG 크로마 서브샘플링과 정수 fast DCT (fast DCT는 turbojpeg, simplejpeg만)
+    jpeg_subsampling: Literal["444", "422", "420"] = "420"
+    jpeg_fast_dct: bool = True
+    
+    # 진단용 span 수집 (/debug/timings, 비활성 시 hot path 비용 거의 없음)
+    tracing_enabled: bool = False
+    trace_buffer_size: int = 2048
+    # 이벤트 루프 지연 감시 (threshold 이상 지연되면 경고)
+    loop_lag_monitor_enabled: bool = True
+    loop_lag_interval_ms: float = 100.0
+    loop_lag_threshold_ms: float = 50.0
+    
+    # 멀티 프로세스 supervisor: 카메라를 워커 프로세스들에 stable hash로 나누고, 부모는 /health, /metrics를 집계
+    supervisor_enabled: bool = False
+    # 워커 수 (0이면 CPU 코어 수, 카메라 수를 넘지 않음)
+    supervisor_workers: int = 0
+    # 워커 i의 HTTP 포트 = base + i (0이면 PORT + 1부터)
+    supervisor_base_port: int = 0
+    # 워커 상태 확인 주기, 응답 없는 워커의 카메라를 다른 워커로 옮기기까지의 유예 (seconds)
+    supervisor_poll_interval: float = 2.0
+    supervisor_rehome_after: float = 5.0
+    # 워커 프로세스 전용 (supervisor가 환경 변수로 지정)
+    worker_index: Optional[int] = None
+    worker_cameras: Optional[List[str]] = None
+    supervisor_token: str = ""
+    
     class Config:
         env_file = ".env"
 
@@ -4,6 +4,8 @@ from enum import Enum
 from typing import Optional
 
 
+DEFAULT_CAMERA_ID = "default"
+
 class CaptureStatus(Enum):
     STOPPED = "stopped"
     STARTING = "starting"
@@ -19,11 +21,13 @@ class CaptureSession:
     started_at: Optional[datetime]
     stopped_at: Optional[datetime]
     error_message: Optional[str]
+    camera_id: str = DEFAULT_CAMERA_ID
     
     @classmethod
-    def create(cls, rtsp_url: str) -> "CaptureSession":
+    def create(cls, rtsp_url: str, camera_id: str = DEFAULT_CAMERA_ID) -> "CaptureSession":
         return cls(
             rtsp_url=rtsp_url,
+            camera_id=camera_id,
             status=CaptureStatus.STOPPED,
             started_at=None,
             stopped_at=None,
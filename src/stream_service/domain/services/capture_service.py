@@ -1,44 +1,75 @@
-from stream_service.domain.models.capture_session import CaptureSession
+from typing import Dict, List, Optional
+
+from stream_service.domain.models.capture_session import CaptureSession, DEFAULT_CAMERA_ID
 
 
 class CaptureService:
+    """카메라 ID별 캡처 세션 레지스트리"""
+    
     def __init__(
         self, 
-        rtsp_url: str = "rtsp://210.99.70.120:1935/live/cctv003.stream"
+        rtsp_url: str = "rtsp://210.99.70.120:1935/live/cctv003.stream",
+        cameras: Optional[Dict[str, str]] = None
     ):
-        self.session = CaptureSession.create(rtsp_url)
+        # cameras가 없으면 rtsp_url 하나를 기본 카메라로 등록
+        cameras = cameras or {DEFAULT_CAMERA_ID: rtsp_url}
+        self.sessions: Dict[str, CaptureSession] = {
+            camera_id: CaptureSession.create(url, camera_id=camera_id)
+            for camera_id, url in cameras.items()
+        }
+    
+    @property
+    def camera_ids(self) -> List[str]:
+        """등록된 카메라 ID 목록"""
+        return list(self.sessions.keys())
     
-    def start_capture_session(self) -> CaptureSession:
+    def get_session(self, camera_id: str = DEFAULT_CAMERA_ID) -> CaptureSession:
+        """카메라 ID로 세션 조회"""
+        session = self.sessions.get(camera_id)
+        if session is None:
+            raise ValueError(f"Unknown camera: {camera_id}")
+        return session
+    
+    def start_capture_session(self, camera_id: str = DEFAULT_CAMERA_ID) -> CaptureSession:
         """캡처 세션 시작 (비즈니스 규칙 검증)"""
-        if not self.session.can_start:
-            raise ValueError(f"Cannot start capture in status: {self.session.status}")
+        session = self.get_session(camera_id)
+        if not session.can_start:
+            raise ValueError(f"Cannot start capture in status: {session.status}")
         
-        self.session.start()
-        return self.session
+        session.start()
+        return session
     
-    def mark_capture_running(self) -> CaptureSession:
+    def mark_capture_running(self, camera_id: str = DEFAULT_CAMERA_ID) -> CaptureSession:
         """캡처를 실행 중으로 표시"""
-        self.session.mark_running()
-        return self.session
+        session = self.get_session(camera_id)
+        session.mark_running()
+        return session
     
-    def stop_capture_session(self) -> CaptureSession:
+    def stop_capture_session(self, camera_id: str = DEFAULT_CAMERA_ID) -> CaptureSession:
         """캡처 세션 중지 (비즈니스 규칙 검증)"""
-        if not self.session.can_stop:
-            raise ValueError(f"Cannot stop capture in status: {self.session.status}")
+        session = self.get_session(camera_id)
+        if not session.can_stop:
+            raise ValueError(f"Cannot stop capture in status: {session.status}")
         
-        self.session.stop()
-        return self.session
+        session.stop()
+        return session
     
-    def mark_capture_stopped(self) -> CaptureSession:
+    def mark_capture_stopped(self, camera_id: str = DEFAULT_CAMERA_ID) -> CaptureSession:
         """캡처를 중지됨으로 표시"""
-        self.session.mark_stopped()
-        return self.session
+        session = self.get_session(camera_id)
+        session.mark_stopped()
+        return session
     
-    def mark_capture_error(self, error_message: str) -> CaptureSession:
+    def mark_capture_error(self, error_message: str, camera_id: str = DEFAULT_CAMERA_ID) -> CaptureSession:
         """캡처 에러 표시"""
-        self.session.mark_error(error_message)
-        return self.session
+        session = self.get_session(camera_id)
+        session.mark_error(error_message)
+        return session
     
-    def get_session_status(self) -> CaptureSession:
+    def get_session_status(self, camera_id: str = DEFAULT_CAMERA_ID) -> CaptureSession:
         """현재 캡처 세션 상태 반환"""
-        return self.session
\ No newline at end of file
+        return self.get_session(camera_id)
+    
+    def list_sessions(self) -> List[CaptureSession]:
+        """전체 캡처 세션 목록 반환"""
+        return list(self.sessions.values())
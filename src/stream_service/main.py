@@ -1,6 +1,8 @@
+from stream_service.monitoring.startup_profile import startup_profile
 
+import asyncio
 import logging
-import socketio
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,41 +11,81 @@ from stream_service.config.settings import settings
 from stream_service.config.container import Container
 
 from stream_service.adapters.inbound.http.static_router import router
+from stream_service.adapters.inbound.http import camera_router, stream_router, metrics_router, debug_router, worker_router
 from stream_service.adapters.inbound.websocket.socketio_client import SocketIOClient
+from stream_service.domain.models.capture_session import DEFAULT_CAMERA_ID
 
 logging.basicConfig(
     level=logging.DEBUG if settings.debug else logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+startup_profile.mark("imports")
+
+
+async def warm_up_frame_encoder(container: Container) -> None:
+    """준비 완료 후 제어 executor에서 인코더 측정 (첫 캡처가 이벤트 루프에서 측정하지 않도록)"""
+    try:
+        encoder = await container.control_executor().run(container.frame_encoder)
+        logging.getLogger(__name__).info(f"Frame encoder: {encoder.name}")
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Frame encoder warm-up failed: {e}")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     container = app.container
+    if settings.loop_lag_monitor_enabled:
+        container.loop_lag_monitor().start()
+    if settings.pre_event_buffer_enabled:
+        container.pre_event_buffers().attach(container.frame_bus())
+    if settings.recording_enabled:
+        container.segment_recorder().attach(container.frame_bus())
+    publisher = container.event_publisher()
     socketio_client = SocketIOClient(
         sio=container.sio(),
-        event_subscriber=container.video_stream_usecase()
+        event_subscriber=container.video_stream_usecase(),
+        publisher=publisher
     )
     socketio_client.resister_event()
+    startup_profile.mark("services")
     await container.sio().connect(settings.socketio_server_url)
-    
+    startup_profile.mark("socketio_connect")
+    if not await publisher.wait_connected(settings.socketio_ready_timeout):
+        logging.getLogger(__name__).warning("Socket.IO namespace not connected yet, continuing startup")
+    startup_profile.ready("namespace_ready")
+    startup_profile.log_report(settings.startup_budget_ms / 1000)
+    # process 모드는 워커마다 자기 프로세스에서 측정
+    encoder_warmup = (
+        asyncio.create_task(warm_up_frame_encoder(container)) if settings.capture_mode == "thread" else None
+    )
+
     yield
-    
+
     # Shutdown
+    if encoder_warmup is not None:
+        encoder_warmup.cancel()
+    await container.loop_lag_monitor().stop()
+    await container.frame_bus().close()
+    if settings.recording_enabled:
+        await container.segment_recorder().close()
+    await container.event_publisher().close()
     await container.sio().disconnect()
+    container.control_executor().shutdown()
 
 def create_app() -> FastAPI:
     # DI Container 초기화
     container = Container()
-    
+    startup_profile.mark("container")
+
     # FastAPI 앱 생성
     app = FastAPI(
         title="RTSP Stream Service",
         version="0.1.0",
         description="Real-time RTSP stream capture and broadcast service",
         lifespan=lifespan
-    )    
-    
+    )
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -51,28 +93,84 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    
+
+    container.wire(modules=[camera_router, stream_router, metrics_router, debug_router, worker_router])
+
     app.container = container
     app.include_router(router)
-    
+    app.include_router(camera_router.router)
+    app.include_router(stream_router.router)
+    app.include_router(metrics_router.router)
+    app.include_router(debug_router.router)
+    if settings.worker_index is not None:
+        app.include_router(worker_router.router)
+    startup_profile.mark("app")
+
     return app
 
-import asyncio
 
-app = create_app()
+@asynccontextmanager
+async def supervisor_lifespan(app: FastAPI):
+    await app.state.supervisor.start()
+    yield
+    await app.state.supervisor.stop()
+
+
+def create_supervisor_app() -> FastAPI:
+    """supervisor 모드: 카메라를 워커 프로세스들에 나눠 실행하고 /health, /metrics를 집계
+
+    부모 프로세스는 캡처 스택과 Socket.IO 클라이언트를 만들지 않는다.
+    """
+    from stream_service.adapters.inbound.http import supervisor_router
+    from stream_service.supervisor import WorkerSupervisor
+
+    cameras = settings.cameras or {DEFAULT_CAMERA_ID: settings.rtsp_url}
+    # 기본은 코어당 워커 하나, 카메라보다 많이 띄우지 않음
+    workers = min(settings.supervisor_workers or os.cpu_count() or 1, len(cameras))
+    supervisor = WorkerSupervisor(
+        cameras,
+        workers=workers,
+        host=settings.host,
+        base_port=settings.supervisor_base_port or settings.port + 1,
+        poll_interval=settings.supervisor_poll_interval,
+        rehome_after=settings.supervisor_rehome_after
+    )
+
+    app = FastAPI(
+        title="RTSP Stream Service Supervisor",
+        version="0.1.0",
+        lifespan=supervisor_lifespan
+    )
+    app.state.supervisor = supervisor
+    app.include_router(supervisor_router.router)
+    return app
+
+
+def __getattr__(name: str):
+    """`uvicorn stream_service.main:app` 호환
+
+    import만으로는 container와 앱을 만들지 않는다 (process 모드 워커가 spawn될 때 main 모듈을 다시 import해도 비용 없음).
+    """
+    if name == "app":
+        global app
+        app = create_supervisor_app() if settings.supervisor_enabled else create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
     import uvicorn
     import signal
-    
+
     def signal_handler(signum, frame):
         print("Shutting down gracefully...")
-        
-        
+
+
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
-    
+
     try:
+        app = create_supervisor_app() if settings.supervisor_enabled else create_app()
         uvicorn.run(app, host=settings.host, port=settings.port)
     except KeyboardInterrupt:
-        print("Server stopped.")    
+        print("Server stopped.")
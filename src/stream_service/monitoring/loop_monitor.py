@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from stream_service.application.services.frame_scheduler import percentile
+from stream_service.monitoring.metrics import LatencyHistogram
+from stream_service.monitoring.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+
+def _noop() -> None:
+    pass
+
+
+class LoopLagMonitor:
+    """이벤트 루프 지연(lag)과 기본 executor 대기 시간 샘플러
+
+    interval마다 sleep 후 실제로 깨어난 시각과 예정 시각의 차이를 lag로 기록한다.
+    동기 호출이 루프를 막으면 lag가 threshold를 넘어 경고로 남는다.
+    probe_every 샘플마다 기본 executor에 빈 작업을 넣어 큐 대기 시간(포화 여부)을 잰다.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        threshold: float = 0.05,
+        probe_every: int = 10,
+        window: int = 600
+    ):
+        self._interval = interval
+        self._threshold = threshold
+        self._probe_every = probe_every
+        self._lag: Deque[float] = deque(maxlen=window)
+        self._executor_delay: Deque[float] = deque(maxlen=window)
+        self.lag_histogram = LatencyHistogram()
+        self.blocked = 0
+        self.executor_saturated = 0
+        self.last_blocked_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._probe_task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        for task in (self._task, self._probe_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+        self._probe_task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        samples = 0
+        while True:
+            expected = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            self.record_lag(max(0.0, loop.time() - expected))
+
+            samples += 1
+            if samples % self._probe_every == 0 and (self._probe_task is None or self._probe_task.done()):
+                # executor가 포화되면 probe 자체가 오래 걸리므로 샘플링과 분리
+                self._probe_task = asyncio.create_task(self._probe_executor())
+
+    def record_lag(self, lag: float) -> None:
+        self._lag.append(lag)
+        self.lag_histogram.observe(lag)
+        if lag >= self._threshold:
+            self.blocked += 1
+            self.last_blocked_at = time.time()
+            tracer.record("loop.blocked", lag)
+            logger.warning(f"Event loop blocked for {lag * 1000:.0f}ms")
+
+    async def _probe_executor(self) -> None:
+        started = time.perf_counter()
+        await asyncio.get_running_loop().run_in_executor(None, _noop)
+        self.record_executor_delay(time.perf_counter() - started)
+
+    def record_executor_delay(self, delay: float) -> None:
+        self._executor_delay.append(delay)
+        if delay >= self._threshold:
+            self.executor_saturated += 1
+            tracer.record("executor.queue_wait", delay)
+            logger.warning(f"Default executor saturated: no-op waited {delay * 1000:.0f}ms")
+
+    def stats(self) -> Dict[str, Any]:
+        lag_ms = [lag * 1000 for lag in self._lag]
+        delay_ms = [delay * 1000 for delay in self._executor_delay]
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_ms": self._interval * 1000,
+            "threshold_ms": self._threshold * 1000,
+            "lag_p50_ms": round(percentile(lag_ms, 50), 2),
+            "lag_p99_ms": round(percentile(lag_ms, 99), 2),
+            "lag_max_ms": round(max(lag_ms, default=0.0), 2),
+            "blocked_count": self.blocked,
+            "last_blocked_at": self.last_blocked_at,
+            "executor_delay_p50_ms": round(percentile(delay_ms, 50), 2),
+            "executor_delay_max_ms": round(max(delay_ms, default=0.0), 2),
+            "executor_saturated_count": self.executor_saturated,
+        }
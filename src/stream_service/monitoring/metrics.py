@@ -0,0 +1,152 @@
+import bisect
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 단계별 지연 히스토그램 버킷 (seconds, +Inf는 암묵적으로 마지막 버킷)
+STAGE_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.02, 0.033, 0.05, 0.1, 0.25, 0.5, 1.0
+)
+# 캡처 엔진이 측정하는 단계 (grab: 패킷 수신, decode: 프레임 디코딩, encode: JPEG 인코딩)
+CAPTURE_STAGES: Tuple[str, ...] = ("grab", "decode", "encode")
+
+Labels = Dict[str, str]
+
+
+class LatencyHistogram:
+    """고정 버킷 누적 히스토그램
+
+    observe는 bisect 한 번과 정수 증가뿐이라 프레임마다 호출해도 부담이 없다.
+    단일 writer 스레드를 가정하며 reader는 약간 어긋난 스냅샷을 볼 수 있다.
+    """
+
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: Sequence[float] = STAGE_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        # 버킷별(비누적) 개수, 마지막은 +Inf
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.sum += seconds
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def load(self, counts: Sequence[int], total: float) -> None:
+        """다른 프로세스에서 측정한 값으로 교체"""
+        self.counts = list(counts)
+        self.sum = total
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+
+
+def new_stage_timings(stages: Iterable[str] = CAPTURE_STAGES) -> Dict[str, LatencyHistogram]:
+    return {stage: LatencyHistogram() for stage in stages}
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class PrometheusExposition:
+    """Prometheus text format(0.0.4) 작성기
+
+    요청 시점에 각 컴포넌트의 통계를 읽어 한 번에 직렬화한다 (수집 경로에는 비용 없음).
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, namespace: str = "stream_service"):
+        self._namespace = namespace
+        self._families: Dict[str, Tuple[str, str, List[str]]] = {}
+
+    def _family(self, name: str, metric_type: str, help_text: str) -> Tuple[str, List[str]]:
+        full_name = f"{self._namespace}_{name}"
+        if full_name not in self._families:
+            self._families[full_name] = (metric_type, help_text, [])
+        return full_name, self._families[full_name][2]
+
+    def gauge(self, name: str, help_text: str, value: float, labels: Optional[Labels] = None) -> None:
+        full_name, lines = self._family(name, "gauge", help_text)
+        lines.append(f"{full_name}{_format_labels(labels or {})} {_format_value(value)}")
+
+    def counter(self, name: str, help_text: str, value: float, labels: Optional[Labels] = None) -> None:
+        """counter (name은 _total 접미사 포함)"""
+        full_name, lines = self._family(name, "counter", help_text)
+        lines.append(f"{full_name}{_format_labels(labels or {})} {_format_value(value)}")
+
+    def histogram(
+        self, name: str, help_text: str, histogram: LatencyHistogram, labels: Optional[Labels] = None
+    ) -> None:
+        full_name, lines = self._family(name, "histogram", help_text)
+        labels = labels or {}
+        cumulative = 0
+        counts = list(histogram.counts)
+        for bound, count in zip(histogram.buckets + (math.inf,), counts):
+            cumulative += count
+            bucket_labels = {**labels, "le": _format_value(bound)}
+            lines.append(f"{full_name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+        lines.append(f"{full_name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+        lines.append(f"{full_name}_count{_format_labels(labels)} {cumulative}")
+
+    def merge(self, text: str, labels: Optional[Labels] = None) -> None:
+        """다른 프로세스가 render()한 텍스트를 합침 (각 sample에 labels 추가, 같은 family끼리 모음)"""
+        extra = _format_labels(labels or {})[1:-1]
+        family = None
+        for line in text.splitlines():
+            if line.startswith("# HELP ") or line.startswith("# TYPE "):
+                _, kind, name, *rest = line.split(" ", 3)
+                metric_type, help_text, lines = self._families.get(name, ("untyped", "", []))
+                if kind == "HELP":
+                    help_text = help_text or (rest[0] if rest else "")
+                elif metric_type == "untyped" and rest:
+                    metric_type = rest[0]
+                self._families[name] = (metric_type, help_text, lines)
+                family = name
+                continue
+            if not line or line.startswith("#"):
+                continue
+            name_end = min(index for index in (line.find("{"), line.find(" "), len(line)) if index >= 0)
+            sample_name = line[:name_end]
+            # histogram의 _bucket/_sum/_count는 직전 TYPE family에 속함
+            if family is None or not sample_name.startswith(family):
+                family = sample_name
+                self._families.setdefault(family, ("untyped", "", []))
+            if extra:
+                rest = line[name_end:]
+                if rest.startswith("{}"):
+                    rest = rest[2:]
+                if rest.startswith("{"):
+                    line = f"{sample_name}{{{extra},{rest[1:]}"
+                else:
+                    line = f"{sample_name}{{{extra}}}{rest}"
+            self._families[family][2].append(line)
+
+    def render(self) -> str:
+        output = []
+        for full_name, (metric_type, help_text, lines) in self._families.items():
+            output.append(f"# HELP {full_name} {help_text}")
+            output.append(f"# TYPE {full_name} {metric_type}")
+            output.extend(lines)
+        return "\n".join(output) + "\n"
@@ -0,0 +1,77 @@
+import os
+import resource
+import sys
+import time
+from typing import Dict, Optional
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def process_rss_bytes() -> int:
+    """현재 프로세스 RSS (bytes)
+
+    Linux에서는 /proc/self/statm의 현재값, 그 외에는 getrusage의 최대값을 사용한다.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 bytes, Linux는 KiB 단위
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def process_uptime_seconds() -> Optional[float]:
+    """프로세스 생성 이후 경과 시간 (Linux /proc 기준, 측정할 수 없으면 None)"""
+    try:
+        with open("/proc/self/stat") as f:
+            # comm에 공백이 있을 수 있으므로 마지막 ')' 뒤부터 필드를 센다 (starttime은 22번째 필드)
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK"))
+    except (OSError, IndexError, ValueError, AttributeError):
+        return None
+
+
+def process_cpu_seconds() -> float:
+    """현재 프로세스 전체 CPU 시간 (user + system)"""
+    return time.process_time()
+
+
+class CpuMeter:
+    """스트림 하나가 사용한 CPU 시간을 누적하고 사용률을 계산"""
+
+    def __init__(self):
+        self._cpu_seconds = 0.0
+        self._started_at: Optional[float] = None
+
+    def start(self) -> None:
+        self._cpu_seconds = 0.0
+        self._started_at = time.monotonic()
+
+    def add(self, cpu_seconds: float) -> None:
+        """스레드에서 측정한 CPU 시간 누적 (time.thread_time 차이)"""
+        self._cpu_seconds += cpu_seconds
+
+    def set_total(self, cpu_seconds: float) -> None:
+        """외부(워커 프로세스 등)에서 측정한 누적 CPU 시간으로 갱신"""
+        self._cpu_seconds = cpu_seconds
+
+    @property
+    def cpu_seconds(self) -> float:
+        return self._cpu_seconds
+
+    @property
+    def cpu_percent(self) -> float:
+        """시작 이후 평균 CPU 사용률 (코어 1개 = 100%)"""
+        if self._started_at is None:
+            return 0.0
+        elapsed = time.monotonic() - self._started_at
+        return self._cpu_seconds / elapsed * 100 if elapsed > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "cpu_seconds": round(self._cpu_seconds, 3),
+            "cpu_percent": round(self.cpu_percent, 1),
+        }
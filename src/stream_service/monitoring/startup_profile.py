@@ -0,0 +1,70 @@
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from stream_service.monitoring.process_stats import process_uptime_seconds
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfile:
+    """서비스 시작 단계별 소요 시간과 time-to-ready
+
+    mark(phase)는 직전 mark 이후 경과 시간을 그 단계의 시간으로 기록한다.
+    프로세스 생성부터 이 객체가 만들어질 때까지(인터프리터 기동과 앞선 import)는 'interpreter' 단계로 넣는다.
+    """
+
+    def __init__(self, preamble: Optional[float] = None):
+        self._started_at = time.perf_counter()
+        self._last_mark = self._started_at
+        self._preamble = preamble if preamble is not None else (process_uptime_seconds() or 0.0)
+        self.phases: List[Tuple[str, float]] = [("interpreter", self._preamble)]
+        self._ready_at: Optional[float] = None
+
+    def mark(self, phase: str) -> float:
+        """직전 mark 이후 경과 시간을 phase로 기록하고 반환"""
+        now = time.perf_counter()
+        elapsed = now - self._last_mark
+        self._last_mark = now
+        self.phases.append((phase, elapsed))
+        return elapsed
+
+    def ready(self, phase: str = "ready") -> float:
+        """마지막 단계를 기록하고 time-to-ready 반환 (첫 호출만 반영)"""
+        self.mark(phase)
+        if self._ready_at is None:
+            self._ready_at = self._last_mark
+        return self.time_to_ready
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready_at is not None
+
+    @property
+    def time_to_ready(self) -> float:
+        """프로세스 생성부터 ready까지 (아직 ready가 아니면 지금까지)"""
+        end = self._ready_at if self._ready_at is not None else time.perf_counter()
+        return self._preamble + end - self._started_at
+
+    def report(self, budget: Optional[float] = None) -> Dict[str, Any]:
+        time_to_ready = self.time_to_ready
+        return {
+            "ready": self.is_ready,
+            "time_to_ready_seconds": round(time_to_ready, 4),
+            "budget_seconds": budget,
+            "over_budget": budget is not None and time_to_ready > budget,
+            "phases": [{"phase": phase, "seconds": round(seconds, 4)} for phase, seconds in self.phases],
+        }
+
+    def log_report(self, budget: Optional[float] = None) -> None:
+        report = self.report(budget)
+        breakdown = ", ".join(f"{phase['phase']} {phase['seconds'] * 1000:.0f}ms" for phase in report["phases"])
+        message = f"Time to ready {report['time_to_ready_seconds'] * 1000:.0f}ms ({breakdown})"
+        if report["over_budget"]:
+            logger.warning(f"{message} exceeds startup budget {budget * 1000:.0f}ms")
+        else:
+            logger.info(message)
+
+
+# 프로세스 전역 프로파일 (main에서 가장 먼저 import)
+startup_profile = StartupProfile()
@@ -0,0 +1,174 @@
+import functools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from stream_service.application.services.frame_scheduler import percentile
+
+
+@dataclass(slots=True)
+class SpanRecord:
+    """완료된 span 하나"""
+    name: str
+    started_at: float  # epoch seconds
+    duration: float  # seconds
+    thread: str
+    attributes: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration * 1000, 3),
+            "thread": self.thread,
+            "attributes": self.attributes or {},
+            "error": self.error,
+        }
+
+
+SpanHook = Callable[[SpanRecord], None]
+
+
+class _NoopSpan:
+    """tracing 비활성 시 반환되는 공유 span (할당/시계 호출 없음)"""
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_attributes", "_started")
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Optional[Dict[str, Any]]):
+        self._tracer = tracer
+        self._name = name
+        self._attributes = attributes
+        self._started = 0.0
+
+    def __enter__(self) -> "_Span":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        duration = time.perf_counter() - self._started
+        error = f"{exc_type.__name__}: {exc}" if exc_type is not None else None
+        self._tracer._finish(self._name, duration, self._attributes, error)
+        return False
+
+    def set(self, key: str, value: Any) -> None:
+        if self._attributes is None:
+            self._attributes = {}
+        self._attributes[key] = value
+
+
+class Tracer:
+    """hot path span 수집기
+
+    최근 span은 고정 크기 ring buffer(deque)에 보관하고 등록된 hook에도 전달한다.
+    비활성 상태의 span()은 플래그 확인 후 공유 no-op 객체를 반환하므로 항상 호출해 두어도 된다.
+    """
+
+    def __init__(self, capacity: int = 2048, enabled: bool = False):
+        self._enabled = enabled
+        self._records: Deque[SpanRecord] = deque(maxlen=capacity)
+        self._hooks: Tuple[SpanHook, ...] = ()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def configure(self, enabled: bool, capacity: Optional[int] = None) -> None:
+        self._enabled = enabled
+        if capacity is not None and capacity != self._records.maxlen:
+            self._records = deque(self._records, maxlen=capacity)
+
+    def add_hook(self, hook: SpanHook) -> None:
+        """span 완료 시 호출할 hook 등록 (예: 외부 tracing 백엔드로 전달)"""
+        self._hooks = self._hooks + (hook,)
+
+    def remove_hook(self, hook: SpanHook) -> None:
+        self._hooks = tuple(h for h in self._hooks if h is not hook)
+
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        """with 블록 실행 시간을 span으로 기록"""
+        if not self._enabled:
+            return _NOOP_SPAN
+        return _Span(self, name, attributes)
+
+    def traced(self, name: str):
+        """async 함수 전체를 span으로 감싸는 decorator"""
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if not self._enabled:
+                    return await func(*args, **kwargs)
+                with _Span(self, name, None):
+                    return await func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, name: str, duration: float, attributes: Optional[Dict[str, Any]] = None) -> None:
+        """이미 측정한 구간을 span으로 기록 (비활성이면 무시)"""
+        if self._enabled:
+            self._finish(name, duration, attributes, None)
+
+    def _finish(
+        self, name: str, duration: float, attributes: Optional[Dict[str, Any]], error: Optional[str]
+    ) -> None:
+        record = SpanRecord(
+            name=name,
+            started_at=time.time() - duration,
+            duration=duration,
+            thread=threading.current_thread().name,
+            attributes=attributes,
+            error=error,
+        )
+        self._records.append(record)
+        for hook in self._hooks:
+            try:
+                hook(record)
+            except Exception:
+                # hook 오류가 hot path로 전파되지 않도록 무시
+                pass
+
+    def recent(self, limit: Optional[int] = None, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """최근 span (최신순)"""
+        records = [r for r in reversed(self._records) if name is None or r.name == name]
+        if limit is not None:
+            records = records[:limit]
+        return [r.as_dict() for r in records]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """ring buffer에 남아 있는 span의 이름별 지연 요약"""
+        durations: Dict[str, List[float]] = {}
+        for record in list(self._records):
+            durations.setdefault(record.name, []).append(record.duration * 1000)
+        return {
+            name: {
+                "count": len(values),
+                "p50_ms": round(percentile(values, 50), 3),
+                "p95_ms": round(percentile(values, 95), 3),
+                "max_ms": round(max(values), 3),
+            }
+            for name, values in durations.items()
+        }
+
+    def clear(self) -> None:
+        self._records.clear()
+
+
+# 프로세스 전역 tracer (설정은 Container에서 적용)
+tracer = Tracer()
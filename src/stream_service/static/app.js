@@ -81,10 +81,34 @@ socket.on('broadcast_caputer_status', (data) => {
     updateStatus(data);
 });
 
+// 바이너리 프레임 envelope 헤더 (version, codec, seq, captured_at, width, height, camera_id 길이)
+const ENVELOPE_HEADER_SIZE = 23;
+const FRAME_CODEC_MIME = { 1: 'image/jpeg', 2: 'image/webp' };
+
+function parseFrameEnvelope(buffer) {
+    const view = new DataView(buffer);
+    const codec = view.getUint8(1);
+    const cameraIdLength = view.getUint8(ENVELOPE_HEADER_SIZE - 1);
+    const payloadOffset = ENVELOPE_HEADER_SIZE + cameraIdLength;
+    return {
+        cameraId: new TextDecoder().decode(new Uint8Array(buffer, ENVELOPE_HEADER_SIZE, cameraIdLength)),
+        mimeType: FRAME_CODEC_MIME[codec] || 'image/jpeg',
+        payload: new Uint8Array(buffer, payloadOffset)
+    };
+}
+
 socket.on('broadcast_video_frame', (data) => {
-    if (data.frame_data instanceof ArrayBuffer) {
+    // binary envelope(ArrayBuffer) 또는 기존 {frame_data, camera_id} 형식
+    let frame = null;
+    if (data instanceof ArrayBuffer) {
+        frame = parseFrameEnvelope(data);
+    } else if (data && data.frame_data instanceof ArrayBuffer) {
+        frame = { cameraId: data.camera_id, mimeType: 'image/jpeg', payload: data.frame_data };
+    }
+    
+    if (frame) {
         // ImageBitmap으로 직접 처리 (Network 탭에 안보임)
-        const blob = new Blob([data.frame_data], { type: 'image/jpeg' });
+        const blob = new Blob([frame.payload], { type: frame.mimeType });
         
         createImageBitmap(blob).then(imageBitmap => {
             // Canvas 크기를 컨테이너에 맞게 고정 설정
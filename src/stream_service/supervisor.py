@@ -0,0 +1,334 @@
+import asyncio
+import json
+import logging
+import os
+import secrets
+import sys
+import time
+import urllib.request
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+from stream_service.application.services.bounded_executor import BoundedExecutor
+from stream_service.application.services.reconnect import ExponentialBackoff
+from stream_service.application.services.sharding import assign_cameras, owner
+from stream_service.monitoring.metrics import PrometheusExposition
+
+logger = logging.getLogger(__name__)
+
+SUPERVISOR_TOKEN_HEADER = "X-Supervisor-Token"
+# stream_service 패키지가 있는 디렉터리 (워커 프로세스의 PYTHONPATH)
+_SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def uvicorn_worker_command(host: str, port: int) -> List[str]:
+    """워커 프로세스 실행 명령 (서비스 앱 하나를 uvicorn으로 실행)"""
+    return [
+        sys.executable, "-m", "uvicorn", "stream_service.main:create_app", "--factory",
+        "--host", host, "--port", str(port),
+    ]
+
+
+def http_request(
+    method: str, url: str, token: str, body: Optional[Dict[str, Any]] = None, timeout: float = 2.0
+) -> Tuple[int, bytes]:
+    """워커 HTTP 요청 (블로킹, executor에서 호출)"""
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(url, data=data, method=method)
+    request.add_header(SUPERVISOR_TOKEN_HEADER, token)
+    if data is not None:
+        request.add_header("Content-Type", "application/json")
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.status, response.read()
+
+
+@dataclass
+class WorkerHandle:
+    """워커 프로세스 하나의 상태"""
+    index: int
+    port: int
+    backoff: ExponentialBackoff
+    process: Optional[asyncio.subprocess.Process] = None
+    started_at: float = 0.0
+    # 마지막 상태 확인 성공 여부, 이번 프로세스가 한 번이라도 응답했는지
+    healthy: bool = False
+    responded: bool = False
+    # 응답하지 않기 시작한 시각 (재배치 유예 기준)
+    down_since: Optional[float] = None
+    # 워커가 실제로 담당 중인 카메라 (기동 시 환경 변수 또는 마지막 재배치 결과)
+    cameras: List[str] = field(default_factory=list)
+    # 기동 후 첫 응답 때 담당 카메라와 이어서 캡처할 카메라를 다시 보냄
+    synced: bool = False
+    restarts: int = 0
+    last_exit_code: Optional[int] = None
+    restart_task: Optional[asyncio.Task] = None
+    watch_task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "port": self.port,
+            "pid": self.process.pid if self.running else None,
+            "running": self.running,
+            "healthy": self.healthy,
+            "cameras": list(self.cameras),
+            "restarts": self.restarts,
+            "last_exit_code": self.last_exit_code,
+            "uptime_seconds": round(time.monotonic() - self.started_at, 3) if self.running else 0.0,
+        }
+
+
+class WorkerSupervisor:
+    """카메라를 워커 프로세스들에 나눠 실행하고 감시
+
+    - 카메라는 rendezvous hash로 워커에 배정한다 (워커 하나가 빠져도 그 워커의 카메라만 옮겨짐).
+    - 워커가 죽으면 backoff 후 다시 띄운다. rehome_after 동안 응답이 없으면 그 카메라를 남은 워커로 옮기고
+      (응답 없이 살아 있는 워커는 종료), 워커가 돌아오면 원래 카메라를 돌려준다.
+    - 캡처 중이던 카메라는 옮겨간 워커에서 이어서 캡처를 시작한다.
+    """
+
+    def __init__(
+        self,
+        cameras: Mapping[str, str],
+        workers: int,
+        host: str = "127.0.0.1",
+        base_port: int = 8001,
+        poll_interval: float = 2.0,
+        rehome_after: float = 5.0,
+        stable_after: float = 30.0,
+        restart_backoff: Tuple[float, float] = (1.0, 30.0),
+        worker_env: Optional[Mapping[str, str]] = None,
+        command: Callable[[str, int], List[str]] = uvicorn_worker_command
+    ):
+        self.camera_ids = list(cameras)
+        self.host = host
+        self.poll_interval = poll_interval
+        self.rehome_after = rehome_after
+        # 이보다 오래 실행된 워커가 죽으면 재시작 backoff를 처음부터
+        self.stable_after = stable_after
+        self.worker_env = dict(worker_env or {})
+        self.command = command
+        self.token = secrets.token_urlsafe(32)
+
+        base, cap = restart_backoff
+        self.workers = [
+            WorkerHandle(index=index, port=base_port + index, backoff=ExponentialBackoff(base, cap))
+            for index in range(max(1, workers))
+        ]
+        # 캡처 중인 카메라 (죽은 워커의 카메라는 마지막으로 확인한 상태를 유지해 옮겨간 워커에서 재개)
+        self.capturing: Set[str] = set()
+        self._executor = BoundedExecutor("supervisor", max_workers=4, max_queue=64)
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def url(self, handle: WorkerHandle, path: str) -> str:
+        return f"http://{self.host}:{handle.port}{path}"
+
+    def available(self, handle: WorkerHandle, now: float) -> bool:
+        """카메라를 맡길 수 있는 워커 (응답 중이거나 응답이 끊긴 지 rehome_after 이내)"""
+        return handle.healthy or handle.down_since is None or now - handle.down_since < self.rehome_after
+
+    def desired_assignment(self, now: Optional[float] = None) -> Dict[int, List[str]]:
+        now = time.monotonic() if now is None else now
+        live = [handle.index for handle in self.workers if self.available(handle, now)]
+        # 모두 응답이 없으면 원래 배정 유지
+        return assign_cameras(self.camera_ids, live or [handle.index for handle in self.workers])
+
+    def _owner_index(self, camera_id: str) -> Optional[int]:
+        for handle in self.workers:
+            if camera_id in handle.cameras:
+                return handle.index
+        return None
+
+    async def start(self) -> None:
+        assignment = self.desired_assignment()
+        for handle in self.workers:
+            await self._spawn(handle, assignment[handle.index])
+        self._monitor_task = asyncio.create_task(self._monitor())
+        logger.info(
+            f"Supervisor started {len(self.workers)} workers for {len(self.camera_ids)} cameras "
+            f"(ports {self.workers[0].port}-{self.workers[-1].port})"
+        )
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        self._stopping = True
+        tasks = [self._monitor_task] + [handle.restart_task for handle in self.workers]
+        for task in tasks:
+            if task is not None:
+                task.cancel()
+        for handle in self.workers:
+            if handle.running:
+                handle.process.terminate()
+        for handle in self.workers:
+            if handle.process is None:
+                continue
+            try:
+                await asyncio.wait_for(handle.process.wait(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Worker {handle.index} did not exit in {timeout}s, killing")
+                handle.process.kill()
+                await handle.process.wait()
+        self._executor.shutdown()
+
+    async def _spawn(self, handle: WorkerHandle, cameras: List[str]) -> None:
+        env = {
+            **os.environ,
+            **self.worker_env,
+            "SUPERVISOR_ENABLED": "false",
+            "WORKER_INDEX": str(handle.index),
+            "WORKER_CAMERAS": json.dumps(cameras),
+            "SUPERVISOR_TOKEN": self.token,
+            "HOST": self.host,
+            "PORT": str(handle.port),
+            "PYTHONPATH": os.pathsep.join(filter(None, [_SOURCE_ROOT, os.environ.get("PYTHONPATH")])),
+        }
+        handle.process = await asyncio.create_subprocess_exec(*self.command(self.host, handle.port), env=env)
+        handle.started_at = time.monotonic()
+        handle.cameras = list(cameras)
+        handle.healthy = False
+        handle.responded = False
+        handle.synced = False
+        handle.watch_task = asyncio.create_task(self._watch(handle, handle.process))
+        logger.info(f"Worker {handle.index} started (pid {handle.process.pid}, port {handle.port}, cameras {cameras})")
+
+    async def _watch(self, handle: WorkerHandle, process: asyncio.subprocess.Process) -> None:
+        returncode = await process.wait()
+        if self._stopping or handle.process is not process:
+            return
+        now = time.monotonic()
+        handle.healthy = False
+        handle.last_exit_code = returncode
+        if handle.down_since is None:
+            handle.down_since = now
+        if now - handle.started_at >= self.stable_after:
+            handle.backoff.reset()
+        try:
+            delay = handle.backoff.next_delay()
+        except Exception as e:
+            # backoff 계산이 실패해도 재시작은 계속 (watch task가 죽으면 이 워커의 카메라가 다시 시작되지 않음)
+            logger.error(f"Worker {handle.index} restart backoff failed, using {handle.backoff.cap:.1f}s: {e}")
+            delay = handle.backoff.cap
+        logger.warning(f"Worker {handle.index} exited with code {returncode}, restarting in {delay:.1f}s")
+        handle.restart_task = asyncio.create_task(self._restart(handle, delay))
+
+    async def _restart(self, handle: WorkerHandle, delay: float) -> None:
+        await asyncio.sleep(delay)
+        if self._stopping:
+            return
+        handle.restarts += 1
+        # 재시작 시점 배정 (다시 응답하면 원래 카메라가 돌아오도록 자신도 포함)
+        now = time.monotonic()
+        live = [other.index for other in self.workers if other is handle or self.available(other, now)]
+        cameras = [camera_id for camera_id in self.camera_ids if owner(camera_id, live) == handle.index]
+        await self._spawn(handle, cameras)
+
+    async def _monitor(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.error(f"Supervisor poll failed: {e}")
+
+    async def poll_once(self) -> None:
+        """워커 상태 확인 후 응답 없는 워커 정리, 배정이 바뀐 워커에 담당 카메라 전달"""
+        await asyncio.gather(*(self._probe(handle) for handle in self.workers if handle.running))
+
+        now = time.monotonic()
+        for handle in self.workers:
+            # 응답하다 멈춘 워커는 카메라를 옮기기 전에 종료 (같은 카메라를 두 워커가 캡처하지 않도록)
+            if handle.running and handle.responded and not handle.healthy and now - handle.down_since >= self.rehome_after:
+                logger.warning(f"Worker {handle.index} unresponsive for {now - handle.down_since:.1f}s, killing")
+                handle.process.kill()
+
+        assignment = self.desired_assignment(now)
+        await asyncio.gather(*(
+            self._push(handle, assignment[handle.index])
+            for handle in self.workers
+            if handle.healthy and (not handle.synced or set(handle.cameras) != set(assignment.get(handle.index, [])))
+        ))
+
+    async def _probe(self, handle: WorkerHandle) -> None:
+        try:
+            _, body = await self._executor.run(
+                http_request, "GET", self.url(handle, "/worker/cameras"), self.token, None, self.poll_interval
+            )
+            status = json.loads(body)
+        except Exception as e:
+            if handle.healthy:
+                logger.warning(f"Worker {handle.index} health check failed: {e}")
+            handle.healthy = False
+            if handle.responded and handle.down_since is None:
+                handle.down_since = time.monotonic()
+            return
+
+        handle.healthy = True
+        handle.responded = True
+        handle.down_since = None
+        if time.monotonic() - handle.started_at >= self.stable_after:
+            handle.backoff.reset()
+        # 재배치 전 첫 응답은 이전 워커에서의 캡처 상태를 덮어쓰지 않음
+        if handle.synced:
+            capturing = set(status.get("capturing", []))
+            for camera_id in status.get("cameras", []):
+                if camera_id in capturing:
+                    self.capturing.add(camera_id)
+                else:
+                    self.capturing.discard(camera_id)
+
+    async def _push(self, handle: WorkerHandle, cameras: List[str]) -> None:
+        resume = [camera_id for camera_id in cameras if camera_id in self.capturing]
+        try:
+            _, body = await self._executor.run(
+                http_request, "PUT", self.url(handle, "/worker/cameras"), self.token,
+                {"cameras": cameras, "resume": resume}, self.poll_interval
+            )
+        except Exception as e:
+            logger.warning(f"Failed to assign cameras to worker {handle.index}: {e}")
+            return
+        result = json.loads(body)
+        moved = sorted(set(cameras) - set(handle.cameras))
+        handle.cameras = list(cameras)
+        handle.synced = True
+        if moved or result.get("stopped") or result.get("started"):
+            logger.info(
+                f"Worker {handle.index} cameras {cameras} (added {moved}, "
+                f"stopped {result.get('stopped', [])}, resumed {result.get('started', [])})"
+            )
+
+    def health(self) -> Dict[str, Any]:
+        """워커별 상태와 카메라 배치"""
+        healthy = sum(1 for handle in self.workers if handle.healthy)
+        status = "ok" if healthy == len(self.workers) else ("degraded" if healthy else "down")
+        return {
+            "status": status,
+            "workers": [handle.as_dict() for handle in self.workers],
+            "cameras": {camera_id: self._owner_index(camera_id) for camera_id in self.camera_ids},
+            "capturing": sorted(self.capturing),
+        }
+
+    async def metrics(self) -> str:
+        """응답 중인 워커들의 /metrics를 worker 라벨을 붙여 합치고 supervisor 메트릭 추가"""
+        handles = [handle for handle in self.workers if handle.healthy]
+        results = await asyncio.gather(
+            *(self._executor.run(http_request, "GET", self.url(handle, "/metrics"), self.token) for handle in handles),
+            return_exceptions=True
+        )
+        exposition = PrometheusExposition()
+        for handle, result in zip(handles, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to scrape worker {handle.index}: {result}")
+                continue
+            exposition.merge(result[1].decode(), {"worker": str(handle.index)})
+
+        exposition.gauge("supervisor_workers", "Configured worker processes.", len(self.workers))
+        for handle in self.workers:
+            labels = {"worker": str(handle.index)}
+            exposition.gauge("supervisor_worker_up", "1 while the worker answers health checks.", handle.healthy, labels)
+            exposition.gauge("supervisor_worker_cameras", "Cameras assigned to the worker.", len(handle.cameras), labels)
+            exposition.counter("supervisor_worker_restarts_total", "Times the worker process was restarted.", handle.restarts, labels)
+        return exposition.render()
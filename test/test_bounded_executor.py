@@ -0,0 +1,55 @@
+import asyncio
+import threading
+
+import pytest
+
+from stream_service.application.services.bounded_executor import BoundedExecutor, ExecutorSaturatedError
+
+
+@pytest.fixture
+def executor():
+    executor = BoundedExecutor("test", max_workers=1, max_queue=1)
+    yield executor
+    executor.shutdown()
+
+
+class TestBoundedExecutor:
+
+    @pytest.mark.asyncio
+    async def test_runs_in_named_thread(self, executor):
+        """작업이 전용 스레드에서 실행되고 결과가 반환되는지 테스트"""
+        name = await executor.run(lambda: threading.current_thread().name)
+
+        assert name.startswith("test")
+        assert executor.stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self, executor):
+        """실행 중 1개 + 대기 1개를 넘는 작업은 거절하고 대기 수를 보고하는지 테스트"""
+        release = threading.Event()
+        running = asyncio.create_task(executor.run(release.wait, 2.0))
+        queued = asyncio.create_task(executor.run(lambda: "queued"))
+        await asyncio.sleep(0.05)
+
+        stats = executor.stats()
+        assert (stats["running"], stats["queued"]) == (1, 1)
+        with pytest.raises(ExecutorSaturatedError):
+            await executor.run(lambda: None)
+
+        release.set()
+        assert await running is True
+        assert await queued == "queued"
+        stats = executor.stats()
+        assert (stats["running"], stats["queued"], stats["rejected"]) == (0, 0, 1)
+
+    @pytest.mark.asyncio
+    async def test_exception_frees_slot(self, executor):
+        """실패한 작업도 대기 수에서 빠지는지 테스트"""
+        def _fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await executor.run(_fail)
+
+        assert executor.queue_depth == 0
+        assert await executor.run(lambda: 1) == 1
@@ -0,0 +1,252 @@
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+import pytest
+from dependency_injector import providers
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from stream_service.adapters.inbound.http import camera_router
+from stream_service.adapters.outbound.external.opencv_capture_engine import OpenCVCaptureEngine
+from stream_service.adapters.outbound.storage.segment_recorder import SegmentRecorder
+from stream_service.application.dto.frame_envelope import EncodedFrame, FrameCodec
+from stream_service.application.services.pre_event_buffer import PreEventBuffers
+from stream_service.application.usecases.video_stream_usecase import VideoStreamUseCase
+from stream_service.config.container import Container
+from stream_service.domain.services.capture_service import CaptureService
+
+
+@pytest.fixture
+def jpeg_frame():
+    image = np.full((360, 640, 3), 128, dtype=np.uint8)
+    _, buffer = cv2.imencode(".jpg", image)
+    return EncodedFrame(seq=42, captured_at=1.5, width=640, height=360, data=memoryview(buffer).cast("B"))
+
+
+@pytest.fixture
+def usecase():
+    return VideoStreamUseCase(
+        capture_service=CaptureService(cameras={"cam1": "rtsp://test/cam1", "cam2": "rtsp://test/cam2"}),
+        event_publisher=MagicMock(),
+        capture_engine_factory=OpenCVCaptureEngine
+    )
+
+
+@pytest.fixture
+def client(usecase):
+    container = Container()
+    container.video_stream_usecase.override(providers.Object(usecase))
+    container.wire(modules=[camera_router])
+    app = FastAPI()
+    app.include_router(camera_router.router)
+    yield TestClient(app)
+    container.unwire()
+
+
+class TestSnapshot:
+
+    def test_unknown_camera(self, client):
+        assert client.get("/cameras/nope/snapshot").status_code == 404
+
+    def test_no_frame_yet(self, client):
+        """캡처 중이 아니면 새 연결을 열지 않고 503"""
+        response = client.get("/cameras/cam1/snapshot")
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+
+    def test_latest_frame_with_etag(self, client, usecase, jpeg_frame):
+        usecase._get_stream("cam1").latest_frame = jpeg_frame
+
+        response = client.get("/cameras/cam1/snapshot")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.content == jpeg_frame.to_bytes()
+        assert response.headers["etag"] == '"42-1500000-640x360"'
+        assert response.headers["x-frame-seq"] == "42"
+
+    def test_if_none_match_returns_304(self, client, usecase, jpeg_frame):
+        usecase._get_stream("cam1").latest_frame = jpeg_frame
+        etag = client.get("/cameras/cam1/snapshot").headers["etag"]
+
+        response = client.get("/cameras/cam1/snapshot", headers={"If-None-Match": f'"other", {etag}'})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_width_scaling_cached(self, client, usecase, jpeg_frame):
+        """?width=는 변형 캐시를 거쳐 축소하고, 같은 요청은 다시 인코딩하지 않음"""
+        stream = usecase._get_stream("cam1")
+        stream.latest_frame = jpeg_frame
+
+        first = client.get("/cameras/cam1/snapshot?width=320")
+        second = client.get("/cameras/cam1/snapshot?width=320")
+
+        assert first.status_code == 200
+        image = cv2.imdecode(np.frombuffer(first.content, np.uint8), cv2.IMREAD_COLOR)
+        assert image.shape[:2] == (180, 320)
+        assert first.headers["etag"] == second.headers["etag"] != '"42-1500000-640x360"'
+        assert stream.engine.get_frame_stats()["variant_cache_hits"] == 1
+
+    def test_width_larger_than_frame_returns_original(self, client, usecase, jpeg_frame):
+        usecase._get_stream("cam1").latest_frame = jpeg_frame
+
+        response = client.get("/cameras/cam1/snapshot?width=1920")
+
+        assert response.content == jpeg_frame.to_bytes()
+
+    def test_webp_frame_content_type(self, client, usecase):
+        """FRAME_ENCODER=webp면 원본은 WebP, 축소본은 JPEG tier"""
+        image = np.full((360, 640, 3), 128, dtype=np.uint8)
+        _, buffer = cv2.imencode(".webp", image)
+        usecase._get_stream("cam1").latest_frame = EncodedFrame(
+            seq=7, captured_at=1.0, width=640, height=360, data=buffer.tobytes(), codec=FrameCodec.WEBP
+        )
+
+        assert client.get("/cameras/cam1/snapshot").headers["content-type"] == "image/webp"
+        assert client.get("/cameras/cam1/snapshot?width=320").headers["content-type"] == "image/jpeg"
+
+
+class TestMjpeg:
+
+    def test_unknown_tier(self, client):
+        assert client.get("/cameras/cam1/mjpeg?tier=999p").status_code == 404
+
+    def test_webp_main_stream_rejected(self, client, usecase, monkeypatch):
+        """FRAME_ENCODER=webp면 JPEG 프레임이 없는 main tier는 구독 전에 409"""
+        monkeypatch.setattr(camera_router.settings, "frame_encoder", "webp")
+        usecase.resolution_tiers = {"360p": 360}
+
+        response = client.get("/cameras/cam1/mjpeg")
+
+        assert response.status_code == 409
+        assert "360p" in response.json()["detail"]
+
+
+class TestClip:
+
+    @pytest.fixture
+    def buffers(self):
+        return PreEventBuffers(seconds=30, fps=2, capacity_bytes=1_000_000)
+
+    @pytest.fixture
+    def clip_client(self, usecase, buffers, tmp_path, monkeypatch):
+        monkeypatch.setattr(camera_router.settings, "clip_dir", str(tmp_path))
+        container = Container()
+        container.video_stream_usecase.override(providers.Object(usecase))
+        container.pre_event_buffers.override(providers.Object(buffers))
+        container.wire(modules=[camera_router])
+        app = FastAPI()
+        app.include_router(camera_router.router)
+        yield TestClient(app)
+        container.unwire()
+
+    def test_unknown_camera(self, clip_client):
+        assert clip_client.post("/cameras/nope/clip").status_code == 404
+
+    def test_no_buffered_frames(self, clip_client):
+        assert clip_client.post("/cameras/cam1/clip").status_code == 503
+
+    def test_seconds_limit(self, clip_client):
+        assert clip_client.post("/cameras/cam1/clip?seconds=100000").status_code == 422
+
+    def test_exports_recent_frames_as_avi(self, clip_client, buffers, jpeg_frame, tmp_path):
+        now = time.time()
+        for seq in range(10):
+            buffers.append("cam1", EncodedFrame(
+                seq=seq, captured_at=now - 9 + seq, width=640, height=360, data=jpeg_frame.data
+            ))
+
+        response = clip_client.post("/cameras/cam1/clip?seconds=3.5")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "video/x-msvideo"
+        assert response.headers["x-clip-frames"] == "4"
+        assert response.headers["x-clip-start-seq"] == "6"
+        assert response.headers["x-clip-seconds"] == "3.0"
+        assert response.headers["x-clip-truncated"] == "0"
+        assert response.content[:4] == b"RIFF" and response.content[8:12] == b"AVI "
+        assert len(list(tmp_path.glob("cam1-*.avi"))) == 1
+
+    def test_reports_truncated_clip(self, clip_client, buffers, jpeg_frame):
+        """ring이 요청 구간보다 짧으면 실제 길이와 함께 truncated 표시"""
+        now = time.time()
+        for seq in range(3):
+            buffers.append("cam1", EncodedFrame(
+                seq=seq, captured_at=now - 2 + seq, width=640, height=360, data=jpeg_frame.data
+            ))
+
+        response = clip_client.post("/cameras/cam1/clip?seconds=30")
+
+        assert response.headers["x-clip-frames"] == "3"
+        assert response.headers["x-clip-seconds"] == "2.0"
+        assert response.headers["x-clip-truncated"] == "1"
+
+    def test_clip_retention(self, clip_client, buffers, jpeg_frame, tmp_path, monkeypatch):
+        monkeypatch.setattr(camera_router.settings, "clip_max_files", 2)
+        now = time.time()
+        for seq in range(3):
+            buffers.append("cam1", EncodedFrame(seq=seq, captured_at=now, width=640, height=360, data=jpeg_frame.data))
+            assert clip_client.post("/cameras/cam1/clip").status_code == 200
+
+        assert len(list(tmp_path.glob("cam1-*.avi"))) == 2
+
+    def test_clip_deleted_after_send_without_retention(self, clip_client, buffers, jpeg_frame, tmp_path, monkeypatch):
+        monkeypatch.setattr(camera_router.settings, "clip_max_files", 0)
+        buffers.append("cam1", EncodedFrame(seq=1, captured_at=time.time(), width=640, height=360, data=jpeg_frame.data))
+
+        response = clip_client.post("/cameras/cam1/clip")
+
+        assert response.status_code == 200
+        assert response.content[:4] == b"RIFF"
+        assert list(tmp_path.glob("*.avi")) == []
+
+
+class TestRecording:
+
+    @pytest.fixture
+    def recorder(self, tmp_path, jpeg_frame):
+        recorder = SegmentRecorder(str(tmp_path))
+
+        async def record():
+            for seq in range(5):
+                recorder.append("cam1", EncodedFrame(
+                    seq=seq, captured_at=100.0 + seq, width=640, height=360, data=jpeg_frame.data
+                ))
+            await recorder.close()
+
+        asyncio.run(record())
+        return recorder
+
+    @pytest.fixture
+    def recording_client(self, usecase, recorder):
+        container = Container()
+        container.video_stream_usecase.override(providers.Object(usecase))
+        container.segment_recorder.override(providers.Object(recorder))
+        container.wire(modules=[camera_router])
+        app = FastAPI()
+        app.include_router(camera_router.router)
+        yield TestClient(app)
+        container.unwire()
+
+    def test_lists_segments(self, recording_client):
+        segments = recording_client.get("/cameras/cam1/recordings").json()
+
+        assert len(segments) == 1
+        assert (segments[0]["start"], segments[0]["end"], segments[0]["frames"]) == (100.0, 104.0, 5)
+
+    def test_plays_range_without_reencoding(self, recording_client, jpeg_frame):
+        response = recording_client.get("/cameras/cam1/recording?start=101&end=102.5")
+
+        assert response.status_code == 200
+        assert response.headers["x-recording-frames"] == "2"
+        assert response.content.count(jpeg_frame.to_bytes()) == 2
+
+    def test_empty_range(self, recording_client):
+        assert recording_client.get("/cameras/cam1/recording?start=0&end=50").status_code == 404
+        assert recording_client.get("/cameras/cam1/recording?start=102&end=101").status_code == 422
+        assert recording_client.get("/cameras/nope/recording?start=0&end=1").status_code == 404
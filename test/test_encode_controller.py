@@ -0,0 +1,88 @@
+import pytest
+
+from stream_service.application.services.encode_controller import (
+    AdaptiveEncodeController,
+    EncodeControllerConfig
+)
+
+
+@pytest.fixture
+def controller():
+    config = EncodeControllerConfig(
+        bitrate_budget_kbps=1000,
+        emit_latency_high_ms=100,
+        emit_latency_low_ms=20,
+        min_quality=60,
+        max_quality=80,
+        quality_step=10,
+        scales=(1.0, 0.5),
+        window_seconds=1.0,
+        downgrade_windows=2,
+        upgrade_windows=3,
+    )
+    return AdaptiveEncodeController(config)
+
+
+def _run_window(controller, start, frame_bytes, latency):
+    """1초 윈도우 동안 10개 프레임 기록"""
+    changed = False
+    for i in range(11):
+        changed = controller.record(frame_bytes, latency, now=start + i * 0.1) or changed
+    return changed
+
+
+class TestAdaptiveEncodeController:
+
+    def test_initial_settings(self, controller):
+        """초기 설정 테스트"""
+        assert controller.quality == 80
+        assert controller.scale == 1.0
+
+    def test_hysteresis_before_downgrade(self, controller):
+        """한 윈도우 초과만으로는 낮추지 않는지 테스트"""
+        # 11 * 20KB / 1s = 1760kbps > 1000kbps 예산
+        assert not _run_window(controller, 0.0, 20_000, 0.01)
+        assert controller.quality == 80
+
+    def test_steps_quality_then_scale_down(self, controller):
+        """품질을 먼저 낮추고 최저 품질에서 해상도를 낮추는지 테스트"""
+        start = 0.0
+        for _ in range(6):
+            _run_window(controller, start, 20_000, 0.01)
+            start += 1.1
+
+        actions = [d.action for d in controller.decisions]
+        assert actions == ["quality_down", "quality_down", "scale_down"]
+        assert controller.quality == 60
+        assert controller.scale == 0.5
+
+    def test_emit_latency_triggers_downgrade(self, controller):
+        """emit 지연만으로도 낮추는지 테스트"""
+        _run_window(controller, 0.0, 100, 0.5)
+        _run_window(controller, 1.1, 100, 0.5)
+
+        assert controller.decisions[-1].reason == "emit latency high"
+        assert controller.quality == 70
+
+    def test_steps_up_with_headroom(self, controller):
+        """여유가 있으면 해상도부터 다시 올리는지 테스트"""
+        start = 0.0
+        for _ in range(6):
+            _run_window(controller, start, 20_000, 0.01)
+            start += 1.1
+        # 첫 윈도우는 직전 고비트레이트 프레임이 섞이므로 한 윈도우 더 진행
+        for _ in range(4):
+            _run_window(controller, start, 1_000, 0.005)
+            start += 1.1
+
+        assert controller.decisions[-1].action == "scale_up"
+        assert controller.scale == 1.0
+        assert controller.quality == 60
+
+    def test_snapshot(self, controller):
+        """상태 스냅샷 테스트"""
+        snapshot = controller.snapshot()
+
+        assert snapshot["quality"] == 80
+        assert snapshot["config"]["bitrate_budget_kbps"] == 1000
+        assert snapshot["decisions"] == []
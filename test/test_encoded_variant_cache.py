@@ -0,0 +1,47 @@
+from stream_service.adapters.outbound.external.encoded_variant_cache import EncodedVariantCache
+from stream_service.application.dto.frame_envelope import EncodedFrame, FrameCodec
+
+
+def _frame(seq: int, size: int) -> EncodedFrame:
+    return EncodedFrame(seq=seq, captured_at=0.0, width=4, height=4, data=b"x" * size)
+
+
+class TestEncodedVariantCache:
+
+    def test_hit_and_miss(self):
+        cache = EncodedVariantCache(max_bytes=1000)
+        frame = _frame(1, 100)
+        cache.put((1, 640, 80, FrameCodec.JPEG), frame)
+
+        assert cache.get((1, 640, 80, FrameCodec.JPEG)) is frame
+        assert cache.get((1, 640, 70, FrameCodec.JPEG)) is None
+        assert cache.get((2, 640, 80, FrameCodec.JPEG)) is None
+
+        stats = cache.stats()
+        assert (stats["variant_cache_hits"], stats["variant_cache_misses"]) == (1, 2)
+        assert stats["variant_cache_hit_rate"] == 0.333
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = EncodedVariantCache(max_bytes=250)
+        cache.put((1, 1, 80, 1), _frame(1, 100))
+        cache.put((2, 1, 80, 1), _frame(2, 100))
+        # 1을 최근 사용으로 갱신 -> 2가 먼저 밀려남
+        cache.get((1, 1, 80, 1))
+        cache.put((3, 1, 80, 1), _frame(3, 100))
+
+        assert cache.get((2, 1, 80, 1)) is None
+        assert cache.get((1, 1, 80, 1)) is not None
+        assert cache.nbytes == 200
+        assert cache.stats()["variant_cache_evictions"] == 1
+
+    def test_replace_and_oversized(self):
+        cache = EncodedVariantCache(max_bytes=150)
+        cache.put((1, 1, 80, 1), _frame(1, 100))
+        cache.put((1, 1, 80, 1), _frame(1, 50))
+        cache.put((2, 1, 80, 1), _frame(2, 200))
+
+        assert cache.nbytes == 50
+        assert len(cache) == 1
+
+        cache.clear()
+        assert cache.nbytes == 0 and len(cache) == 0
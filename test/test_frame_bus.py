@@ -0,0 +1,195 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from stream_service.adapters.inbound.http.camera_router import mjpeg_parts
+from stream_service.application.dto.frame_envelope import EncodedFrame, FrameCodec
+from stream_service.application.services.frame_bus import DropPolicy, FrameBus
+from stream_service.application.usecases.video_stream_usecase import VideoStreamUseCase
+from stream_service.domain.services.capture_service import CaptureService
+
+
+def _frame(seq: int, data: bytes = b"\xff\xd8jpeg", codec: int = FrameCodec.JPEG) -> EncodedFrame:
+    return EncodedFrame(seq=seq, captured_at=0.0, width=4, height=4, data=data, codec=codec)
+
+
+class TestFrameBus:
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_oldest(self):
+        """가득 찬 구독 큐는 가장 오래된 프레임을 버림"""
+        bus = FrameBus()
+        subscription = bus.subscribe("viewer", "cam1", maxsize=2)
+
+        for seq in range(1, 5):
+            bus.publish("cam1", _frame(seq))
+
+        assert [(await subscription.get())[1].seq for _ in range(2)] == [3, 4]
+        stats = bus.consumer_stats()[("viewer", "cam1", "main")]
+        assert (stats.delivered, stats.dropped) == (2, 2)
+
+    @pytest.mark.asyncio
+    async def test_fan_out_shares_frame(self):
+        """모든 구독자가 같은 프레임 객체를 받고, 다른 카메라 구독자는 받지 않음"""
+        bus = FrameBus()
+        subscriptions = [bus.subscribe("viewer", "cam1", policy=DropPolicy.LATEST_ONLY) for _ in range(3)]
+        everything = bus.subscribe("recorder")
+        other = bus.subscribe("viewer", "cam2")
+        frame = _frame(1)
+
+        bus.publish("cam1", frame)
+
+        for subscription in subscriptions:
+            assert (await subscription.get()) == ("cam1", frame)
+        assert (await everything.get())[1] is frame
+        assert len(other) == 0
+        assert bus.subscriber_count("cam1") == 4
+        assert bus.stats()["subscribers"] == {"cam1": {"main": 3}, "*": {"main": 1}, "cam2": {"main": 1}}
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_does_not_stall_others(self):
+        """handler가 막힌 consumer가 있어도 publish와 다른 consumer는 진행"""
+        bus = FrameBus()
+        blocked = asyncio.Event()
+        received = []
+
+        async def slow(camera_id, frame):
+            await blocked.wait()
+
+        async def fast(camera_id, frame):
+            received.append(frame.seq)
+
+        bus.add_consumer("slow", slow, "cam1")
+        bus.add_consumer("fast", fast, "cam1", maxsize=10)
+
+        for seq in range(1, 6):
+            bus.publish("cam1", _frame(seq))
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert received == [1, 2, 3, 4, 5]
+        assert bus.consumer_stats()[("slow", "cam1", "main")].dropped > 0
+
+        blocked.set()
+        await bus.close()
+        assert bus.subscriber_count("cam1") == 0
+
+    @pytest.mark.asyncio
+    async def test_consumer_error_counted(self):
+        bus = FrameBus()
+        handler = AsyncMock(side_effect=[RuntimeError("boom"), None])
+        bus.add_consumer("flaky", handler, "cam1")
+
+        bus.publish("cam1", _frame(1))
+        await asyncio.sleep(0)
+        bus.publish("cam1", _frame(2))
+        await asyncio.sleep(0)
+
+        assert handler.await_count == 2
+        assert bus.consumer_stats()[("flaky", "cam1", "main")].errors == 1
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_wakes_waiter(self):
+        bus = FrameBus()
+        subscription = bus.subscribe("viewer", "cam1")
+        waiter = asyncio.create_task(subscription.get())
+        await asyncio.sleep(0)
+
+        bus.unsubscribe(subscription)
+
+        assert await waiter is None
+        assert bus.subscriber_count("cam1") == 0
+
+    @pytest.mark.asyncio
+    async def test_tiers_routed_separately(self):
+        """tier 구독자는 자기 tier 프레임만 받고, 구독자가 있는 tier만 active"""
+        bus = FrameBus()
+        main = bus.subscribe("viewer", "cam1")
+        thumb = bus.subscribe("viewer", "cam1", tier="160p")
+        assert bus.active_tiers("cam1") == {"main", "160p"}
+        assert bus.active_tiers("cam2") == set()
+
+        bus.publish("cam1", _frame(1), "main")
+        bus.publish("cam1", _frame(1, b"small"), "160p")
+
+        assert (await main.get())[1].data == b"\xff\xd8jpeg"
+        assert (await thumb.get())[1].data == b"small"
+
+        bus.unsubscribe(thumb)
+        assert bus.active_tiers("cam1") == {"main"}
+
+    def test_subscriber_limit(self):
+        bus = FrameBus()
+        bus.subscribe("mjpeg", "cam1", limit=1)
+        bus.subscribe("mjpeg", "cam2", limit=1)
+        with pytest.raises(OverflowError):
+            bus.subscribe("mjpeg", "cam1", limit=1)
+        # limit은 tier와 관계없이 이름 + 카메라 단위
+        with pytest.raises(OverflowError):
+            bus.subscribe("mjpeg", "cam1", limit=1, tier="160p")
+
+
+class TestMjpegParts:
+
+    @pytest.mark.asyncio
+    async def test_multipart_part_format(self):
+        bus = FrameBus()
+        subscription = bus.subscribe("mjpeg", "cam1")
+        parts = mjpeg_parts(bus, subscription)
+
+        bus.publish("cam1", _frame(1, b"\xff\xd8abc"))
+        part = await parts.__anext__()
+
+        assert part == (
+            b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: 5\r\n\r\n\xff\xd8abc\r\n"
+        )
+
+        await parts.aclose()
+        assert bus.subscriber_count("cam1") == 0
+
+    @pytest.mark.asyncio
+    async def test_non_jpeg_frames_skipped(self):
+        bus = FrameBus()
+        subscription = bus.subscribe("mjpeg", "cam1")
+        parts = mjpeg_parts(bus, subscription)
+        next_part = asyncio.create_task(parts.__anext__())
+
+        bus.publish("cam1", _frame(1, codec=FrameCodec.WEBP))
+        await asyncio.sleep(0)
+        bus.publish("cam1", _frame(2, b"\xff\xd8x"))
+
+        assert (await next_part).endswith(b"\xff\xd8x\r\n")
+        await parts.aclose()
+
+
+@pytest.mark.asyncio
+async def test_usecase_fans_out_through_bus():
+    """스트리밍 루프가 버스로 publish하면 Socket.IO consumer와 뷰어가 같은 프레임을 받음"""
+    engine = MagicMock()
+    engine.start_capture = AsyncMock()
+    engine.stop_capture = AsyncMock()
+    engine.get_encoded_frame = AsyncMock(return_value=_frame(1))
+    publisher = MagicMock()
+    publisher.send_video_frame = AsyncMock()
+    publisher.emit_capture_status = AsyncMock()
+    bus = FrameBus()
+    usecase = VideoStreamUseCase(
+        capture_service=CaptureService(cameras={"cam1": "rtsp://test/cam1"}),
+        event_publisher=publisher,
+        capture_engine_factory=lambda: engine,
+        frame_bus=bus,
+        frame_rate=100.0
+    )
+    subscription = bus.subscribe("mjpeg", "cam1")
+
+    await usecase.handle_capture_start_request("cam1")
+    _, frame = await asyncio.wait_for(subscription.get(), timeout=1.0)
+    await asyncio.sleep(0)
+    await usecase.handle_capture_stop_request("cam1")
+
+    assert frame.seq == 1
+    publisher.send_video_frame.assert_awaited_once_with("cam1", frame)
+    assert bus.consumer_stats()[("socketio", "cam1", "main")].delivered == 1
+    await bus.close()
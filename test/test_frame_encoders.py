@@ -0,0 +1,134 @@
+import sys
+import time
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+import pytest
+
+from stream_service.adapters.outbound.external.frame_encoders import (
+    OpenCVJpegEncoder,
+    WebPEncoder,
+    create_frame_encoder,
+    select_frame_encoder,
+    select_jpeg_encoder,
+)
+from stream_service.adapters.outbound.external.opencv_capture_engine import OpenCVCaptureEngine
+from stream_service.adapters.outbound.external.tier_encoder import encode_tier_ladder
+from stream_service.application.dto.frame_envelope import FrameCodec
+from stream_service.application.ports.outbound.frame_encoder import FrameEncoder
+from stream_service.application.services.encoder_calibration import FrameEncoderConfig, calibrate
+
+
+@pytest.fixture
+def image():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 255, (120, 160, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def opencv_only(monkeypatch):
+    """선택 의존성이 설치되어 있어도 없는 것처럼 (import 시 ImportError)"""
+    monkeypatch.setitem(sys.modules, "turbojpeg", None)
+    monkeypatch.setitem(sys.modules, "simplejpeg", None)
+
+
+class _SleepEncoder(FrameEncoder):
+    codec = FrameCodec.JPEG
+
+    def __init__(self, name: str, seconds: float, fails: bool = False):
+        self.name = name
+        self._seconds = seconds
+        self._fails = fails
+
+    def encode(self, image, quality):
+        if self._fails:
+            raise RuntimeError("broken")
+        time.sleep(self._seconds)
+        return b"jpeg"
+
+
+def _decode(data):
+    return cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+
+
+class TestEncoders:
+
+    def test_opencv_jpeg(self, image):
+        data = OpenCVJpegEncoder("444").encode(image, 80)
+
+        assert bytes(data[:2]) == b"\xff\xd8"
+        assert _decode(data).shape == image.shape
+
+    def test_webp(self, image):
+        encoder = WebPEncoder()
+        data = encoder.encode(image, 80)
+
+        assert encoder.codec == FrameCodec.WEBP
+        assert bytes(data[:4]) == b"RIFF" and bytes(data[8:12]) == b"WEBP"
+        assert _decode(data).shape == image.shape
+
+    def test_missing_optional_dependency(self, opencv_only):
+        with pytest.raises(RuntimeError, match="stream-service\\[simplejpeg\\]"):
+            create_frame_encoder("simplejpeg")
+        with pytest.raises(RuntimeError, match="stream-service\\[turbojpeg\\]"):
+            create_frame_encoder("turbojpeg")
+        with pytest.raises(ValueError):
+            create_frame_encoder("png")
+
+
+class TestSelection:
+
+    def test_calibrate_orders_by_speed_and_skips_failures(self, image):
+        slow = _SleepEncoder("slow", 0.004)
+        fast = _SleepEncoder("fast", 0.0)
+        broken = _SleepEncoder("broken", 0.0, fails=True)
+
+        results = calibrate([slow, broken, fast], [image] * 3, 80)
+
+        assert [encoder.name for encoder, _ in results] == ["fast", "slow"]
+        assert results[0][1] < results[1][1]
+
+    def test_auto_uses_only_available_backend(self, opencv_only):
+        assert select_jpeg_encoder(FrameEncoderConfig(backend="auto")).name == "opencv"
+
+    def test_webp_stream_keeps_jpeg_for_tiers(self, opencv_only):
+        config = FrameEncoderConfig(backend="webp")
+        jpeg = select_jpeg_encoder(config)
+
+        assert jpeg.codec == FrameCodec.JPEG
+        assert select_frame_encoder(config, jpeg).codec == FrameCodec.WEBP
+        assert select_frame_encoder(FrameEncoderConfig(backend="opencv"), jpeg) is jpeg
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            select_jpeg_encoder(FrameEncoderConfig(backend="png"))
+
+
+class TestEngineEncoder:
+
+    def test_tier_ladder_uses_injected_encoder(self, image):
+        encoder = MagicMock(spec=FrameEncoder)
+        encoder.codec = FrameCodec.WEBP
+        encoder.encode.return_value = b"encoded"
+
+        frames = encode_tier_ladder(image, 1, 0.0, {"native": 0, "60p": 60}, 70, encoder)
+
+        assert encoder.encode.call_count == 2
+        assert frames["60p"].codec == FrameCodec.WEBP
+        assert frames["60p"].data == b"encoded"
+
+    @pytest.mark.asyncio
+    async def test_webp_stream_with_jpeg_tiers(self, image):
+        engine = OpenCVCaptureEngine(encoder=WebPEncoder())
+        engine._is_capturing = True
+        engine._slot.put(image)
+
+        frame = await engine.get_encoded_frame()
+        tiers = await engine.encode_tiers(frame, {"60p": 60})
+
+        assert frame.codec == FrameCodec.WEBP
+        assert bytes(frame.data[:4]) == b"RIFF"
+        assert tiers["60p"].codec == FrameCodec.JPEG
+        assert _decode(tiers["60p"].data).shape == (60, 80, 3)
+        engine._is_capturing = False
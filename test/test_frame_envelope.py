@@ -0,0 +1,72 @@
+import pytest
+
+from stream_service.application.dto.frame_envelope import (
+    ENVELOPE_HEADER,
+    EncodedFrame,
+    FrameCodec,
+    pack_frame_envelope,
+    unpack_frame_envelope
+)
+
+
+class TestFrameEnvelope:
+
+    def test_round_trip(self):
+        """pack 후 unpack 시 메타데이터와 payload 보존 테스트"""
+        frame = EncodedFrame(
+            seq=42, captured_at=1700000000.25, width=1920, height=1080,
+            data=memoryview(bytearray(b"\xff\xd8jpeg")), codec=FrameCodec.WEBP
+        )
+
+        envelope = pack_frame_envelope("lobby", frame)
+        camera_id, decoded = unpack_frame_envelope(envelope)
+
+        assert len(envelope) == ENVELOPE_HEADER.size + len("lobby") + frame.nbytes
+        assert camera_id == "lobby"
+        assert (decoded.seq, decoded.captured_at, decoded.width, decoded.height, decoded.codec) == (
+            42, 1700000000.25, 1920, 1080, FrameCodec.WEBP
+        )
+        assert decoded.to_bytes() == b"\xff\xd8jpeg"
+
+    def test_unpack_payload_is_view(self):
+        """unpack한 payload가 원본 버퍼를 복사하지 않는지 테스트"""
+        envelope = bytearray(pack_frame_envelope("cam", EncodedFrame(1, 0.0, 1, 1, b"abc")))
+
+        _, decoded = unpack_frame_envelope(envelope)
+        envelope[-1:] = b"z"
+
+        assert decoded.to_bytes() == b"abz"
+
+    def test_camera_id_too_long(self):
+        with pytest.raises(ValueError, match="camera_id too long"):
+            pack_frame_envelope("x" * 256, EncodedFrame(1, 0.0, 1, 1, b"abc"))
+
+    def test_unsupported_version(self):
+        envelope = bytearray(pack_frame_envelope("cam", EncodedFrame(1, 0.0, 1, 1, b"abc")))
+        envelope[0] = 9
+
+        with pytest.raises(ValueError, match="Unsupported frame envelope version"):
+            unpack_frame_envelope(envelope)
+
+
+class TestSocketIOSerializerSetting:
+
+    def test_rejects_unknown_serializer(self):
+        from pydantic import ValidationError
+
+        from stream_service.config.settings import Settings
+
+        with pytest.raises(ValidationError):
+            Settings(socketio_serializer="json")
+
+    def test_msgpack_requires_optional_dependency(self):
+        from stream_service.config.container import socketio_serializer_for
+
+        assert socketio_serializer_for("default") == "default"
+        try:
+            import msgpack  # noqa: F401
+        except ImportError:
+            with pytest.raises(RuntimeError, match="stream-service\\[msgpack\\]"):
+                socketio_serializer_for("msgpack")
+        else:
+            assert socketio_serializer_for("msgpack") == "msgpack"
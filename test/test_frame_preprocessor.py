@@ -0,0 +1,96 @@
+import cv2
+import numpy as np
+import pytest
+
+from stream_service.adapters.outbound.external.frame_preprocessor import FramePreprocessor
+from stream_service.adapters.outbound.external.opencv_capture_engine import OpenCVCaptureEngine
+from stream_service.application.services.preprocess import PreprocessConfig, plan_preprocess
+
+
+def _smooth_frame(width: int, height: int) -> np.ndarray:
+    xs = np.linspace(0, 255, width, dtype=np.float32)
+    ys = np.linspace(0, 255, height, dtype=np.float32)
+    gray = (xs[None, :] * 0.7 + ys[:, None] * 0.3).astype(np.uint8)
+    return np.dstack([gray, 255 - gray, gray // 2])
+
+
+class TestPlanPreprocess:
+
+    def test_fits_target_and_keeps_aspect(self):
+        plan = plan_preprocess(PreprocessConfig(max_width=800, max_height=600), 1920, 1080)
+
+        assert (plan.width, plan.height) == (800, 450)
+        assert plan.resizes
+
+    def test_never_upscales(self):
+        plan = plan_preprocess(PreprocessConfig(max_width=800, max_height=600), 640, 360)
+
+        assert (plan.width, plan.height) == (640, 360)
+        assert not plan.resizes
+
+    def test_crop_is_clamped_and_scale_applies(self):
+        """프레임 밖으로 나간 crop은 잘라 맞추고 적응형 배율은 목표 크기에 곱해지는지 테스트"""
+        plan = plan_preprocess(PreprocessConfig(crop=(1800, 1000, 400, 400)), 1920, 1080, scale=0.5)
+
+        assert (plan.x, plan.y, plan.crop_width, plan.crop_height) == (1800, 1000, 120, 80)
+        assert (plan.width, plan.height) == (60, 40)
+
+
+class TestFramePreprocessor:
+
+    @pytest.mark.parametrize("interpolation", ["area", "linear"])
+    def test_reuses_output_array(self, interpolation):
+        """같은 입력 크기에서는 출력 배열과 테이블을 다시 만들지 않는지 테스트"""
+        preprocessor = FramePreprocessor(PreprocessConfig(max_width=800, max_height=600, interpolation=interpolation))
+        frame = _smooth_frame(1920, 1080)
+
+        with preprocessor.apply(frame) as first:
+            address = first.ctypes.data
+            assert first.shape == (450, 800, 3)
+        with preprocessor.apply(frame.copy()) as second:
+            assert second.ctypes.data == address
+
+        assert preprocessor.rebuilds == 1
+        with preprocessor.apply(_smooth_frame(1280, 720)) as third:
+            assert third.shape == (450, 800, 3)
+        assert preprocessor.rebuilds == 2
+
+    def test_area_matches_direct_resize(self):
+        """1/2 단계 축소 + remap 결과가 INTER_AREA 직접 축소와 거의 같은지 테스트"""
+        frame = _smooth_frame(3840, 2160)
+        preprocessor = FramePreprocessor(PreprocessConfig(max_width=800, max_height=600))
+
+        with preprocessor.apply(frame) as prepared:
+            expected = cv2.resize(frame, (800, 450), interpolation=cv2.INTER_AREA)
+            assert np.abs(prepared.astype(np.int16) - expected).mean() < 1.0
+
+    def test_crop_only_returns_view(self):
+        frame = _smooth_frame(640, 480)
+        preprocessor = FramePreprocessor(PreprocessConfig(crop=(10, 20, 100, 50)))
+
+        with preprocessor.apply(frame) as prepared:
+            assert np.shares_memory(prepared, frame)
+            assert np.array_equal(prepared, frame[20:70, 10:110])
+
+    def test_unknown_interpolation(self):
+        with pytest.raises(ValueError):
+            FramePreprocessor(PreprocessConfig(interpolation="cubic"))
+
+
+class TestEnginePreprocess:
+
+    @pytest.mark.asyncio
+    async def test_encodes_cropped_target_size(self):
+        """configure_preprocess 설정이 인코딩 출력 크기와 tier 입력에 적용되는지 테스트"""
+        engine = OpenCVCaptureEngine()
+        engine.configure_preprocess(PreprocessConfig(max_width=320, crop=(0, 0, 960, 540)))
+        engine._is_capturing = True
+        engine._slot.put(_smooth_frame(1920, 1080))
+
+        frame = await engine.get_encoded_frame()
+        tiers = await engine.encode_tiers(frame, {"small": 90})
+
+        assert (frame.width, frame.height) == (320, 180)
+        assert (tiers["small"].width, tiers["small"].height) == (160, 90)
+        assert engine.get_frame_stats()["preprocess_width"] == 320
+        engine._executor.shutdown()
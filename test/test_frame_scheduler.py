@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+import pytest
+
+from stream_service.application.services.frame_scheduler import FrameScheduler, percentile
+
+
+class TestFrameScheduler:
+
+    @pytest.mark.asyncio
+    async def test_processing_time_not_added_to_interval(self):
+        """처리 시간이 간격에 더해지지 않는지 테스트"""
+        scheduler = FrameScheduler(fps=50)
+        started_at = time.monotonic()
+
+        for _ in range(11):
+            await scheduler.wait_next()
+            await asyncio.sleep(0.01)  # 프레임 처리 시간 모사
+
+        # 10 tick * 20ms = 200ms (sleep 누적 방식이면 300ms 이상)
+        elapsed = time.monotonic() - started_at
+        assert elapsed < 0.27
+        assert scheduler.skipped == 0
+
+    @pytest.mark.asyncio
+    async def test_skips_ticks_when_behind(self):
+        """밀리면 tick을 건너뛰어 따라잡는지 테스트"""
+        scheduler = FrameScheduler(fps=100)
+
+        await scheduler.wait_next()
+        await asyncio.sleep(0.055)  # 5 tick 이상 지연
+        skipped = await scheduler.wait_next()
+
+        assert skipped >= 4
+        assert scheduler.skipped == skipped
+
+    @pytest.mark.asyncio
+    async def test_stats(self):
+        """achieved fps와 jitter 통계 테스트"""
+        scheduler = FrameScheduler(fps=100)
+
+        for _ in range(20):
+            await scheduler.wait_next()
+
+        stats = scheduler.stats()
+        assert stats["target_fps"] == 100
+        assert 50 < stats["achieved_fps"] < 150
+        assert stats["ticks"] == 20
+        assert stats["jitter_p99_ms"] >= stats["jitter_p50_ms"]
+
+    def test_percentile(self):
+        """nearest-rank 백분위수 테스트"""
+        values = list(range(1, 101))
+
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 100) == 100
+        assert percentile([], 50) == 0.0
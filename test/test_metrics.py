@@ -0,0 +1,84 @@
+from stream_service.monitoring.metrics import LatencyHistogram, PrometheusExposition
+
+
+class TestLatencyHistogram:
+
+    def test_observe_buckets(self):
+        """경계값은 해당 버킷(le)에 포함되고 초과값은 +Inf 버킷에 들어가는지 테스트"""
+        histogram = LatencyHistogram(buckets=(0.01, 0.1))
+
+        histogram.observe(0.01)
+        histogram.observe(0.05)
+        histogram.observe(3.0)
+
+        assert histogram.counts == [1, 1, 1]
+        assert histogram.count == 3
+        assert histogram.sum == 3.06
+
+
+class TestPrometheusExposition:
+
+    def test_render_histogram(self):
+        """히스토그램이 누적 버킷, sum, count로 직렬화되는지 테스트"""
+        histogram = LatencyHistogram(buckets=(0.01, 0.1))
+        histogram.observe(0.005)
+        histogram.observe(0.05)
+        exposition = PrometheusExposition()
+
+        exposition.histogram("stage_duration_seconds", "Stage duration.", histogram, {"stage": "encode"})
+        text = exposition.render()
+
+        assert text.splitlines() == [
+            "# HELP stream_service_stage_duration_seconds Stage duration.",
+            "# TYPE stream_service_stage_duration_seconds histogram",
+            'stream_service_stage_duration_seconds_bucket{stage="encode",le="0.01"} 1',
+            'stream_service_stage_duration_seconds_bucket{stage="encode",le="0.1"} 2',
+            'stream_service_stage_duration_seconds_bucket{stage="encode",le="+Inf"} 2',
+            'stream_service_stage_duration_seconds_sum{stage="encode"} 0.055',
+            'stream_service_stage_duration_seconds_count{stage="encode"} 2',
+        ]
+
+    def test_samples_grouped_by_family(self):
+        """같은 이름의 샘플이 HELP/TYPE 한 번 아래로 모이는지 테스트"""
+        exposition = PrometheusExposition()
+
+        exposition.counter("dropped_frames_total", "Dropped.", 3, {"camera_id": "a", "reason": "stale"})
+        exposition.gauge("achieved_fps", "Fps.", 29.5, {"camera_id": "a"})
+        exposition.counter("dropped_frames_total", "Dropped.", 1, {"camera_id": "a", "reason": "queue_full"})
+        lines = exposition.render().splitlines()
+
+        assert lines.count("# TYPE stream_service_dropped_frames_total counter") == 1
+        assert lines[2:4] == [
+            'stream_service_dropped_frames_total{camera_id="a",reason="stale"} 3',
+            'stream_service_dropped_frames_total{camera_id="a",reason="queue_full"} 1',
+        ]
+        assert 'stream_service_achieved_fps{camera_id="a"} 29.5' in lines
+
+    def test_label_escaping(self):
+        exposition = PrometheusExposition()
+
+        exposition.gauge("capturing", "Up.", True, {"camera_id": 'lobby "A"'})
+
+        assert 'stream_service_capturing{camera_id="lobby \\"A\\""} 1' in exposition.render()
+
+    def test_merge_adds_labels_and_groups_families(self):
+        """다른 프로세스 출력을 합칠 때 라벨을 붙이고 같은 family를 한곳에 모으는지 테스트"""
+        histogram = LatencyHistogram(buckets=(0.1,))
+        histogram.observe(0.05)
+        worker = PrometheusExposition()
+        worker.gauge("capturing", "Capturing.", True)
+        worker.histogram("lag_seconds", "Lag.", histogram, {"camera_id": "cam1"})
+        merged = PrometheusExposition()
+
+        merged.merge(worker.render(), {"worker": "0"})
+        merged.merge(worker.render(), {"worker": "1"})
+        lines = merged.render().splitlines()
+
+        assert lines[:4] == [
+            "# HELP stream_service_capturing Capturing.",
+            "# TYPE stream_service_capturing gauge",
+            'stream_service_capturing{worker="0"} 1',
+            'stream_service_capturing{worker="1"} 1',
+        ]
+        assert lines.count("# TYPE stream_service_lag_seconds histogram") == 1
+        assert 'stream_service_lag_seconds_bucket{worker="1",camera_id="cam1",le="+Inf"} 1' in lines
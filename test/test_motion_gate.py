@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from stream_service.application.services.motion_gate import MotionGate, MotionGateConfig
+
+
+@pytest.fixture
+def gate():
+    return MotionGate(MotionGateConfig(
+        downscale=4,
+        pixel_threshold=20,
+        area_threshold=0.01,
+        keepalive_fps=1.0,
+        hold_seconds=0.5,
+    ))
+
+
+@pytest.fixture
+def static_frame():
+    return np.full((120, 160, 3), 100, dtype=np.uint8)
+
+
+class TestMotionGate:
+
+    def test_first_frame_admitted(self, gate, static_frame):
+        """첫 프레임은 항상 통과하는지 테스트"""
+        assert gate.admit(static_frame, now=0.0)
+
+    def test_static_scene_suppressed_until_keepalive(self, gate, static_frame):
+        """정지 장면은 keep-alive 주기에만 통과하는지 테스트"""
+        gate.admit(static_frame, now=0.0)
+
+        admitted = [gate.admit(static_frame, now=0.6 + i * 0.1) for i in range(4)]
+        keepalive = gate.admit(static_frame, now=1.0)
+
+        assert admitted == [False, False, False, False]
+        assert keepalive
+        assert gate.suppressed == 4
+
+    def test_zero_keepalive_fps_disables_keepalive(self, static_frame):
+        """keepalive_fps=0이면 정지 장면은 keep-alive 없이 계속 걸러지는지 테스트"""
+        gate = MotionGate(MotionGateConfig(keepalive_fps=0, hold_seconds=0))
+        gate.admit(static_frame, now=0.0)
+
+        admitted = [gate.admit(static_frame, now=float(i)) for i in range(1, 11)]
+
+        assert not any(admitted)
+        assert gate.suppressed == 10
+
+    def test_motion_resumes_full_rate(self, gate, static_frame):
+        """움직임이 생기면 즉시 통과하는지 테스트"""
+        gate.admit(static_frame, now=0.0)
+        gate.admit(static_frame, now=0.6)
+
+        moving = static_frame.copy()
+        moving[40:80, 40:80] = 255
+
+        assert gate.admit(moving, now=0.7)
+        assert gate.last_score > 0.01
+        # hold 구간 동안은 정지 프레임도 통과
+        assert gate.admit(moving, now=0.8)
+
+    def test_small_noise_ignored(self, gate, static_frame):
+        """임계값 이하 노이즈는 움직임으로 보지 않는지 테스트"""
+        gate.admit(static_frame, now=0.0)
+        noisy = static_frame + np.uint8(10)
+
+        assert not gate.admit(noisy, now=0.6)
+
+    def test_non_array_frames_pass_through(self, gate):
+        """디코딩 프레임이 아니면 판단 없이 통과하는지 테스트"""
+        assert gate.admit(b"raw", now=0.0)
+        assert gate.admit(b"raw", now=0.1)
@@ -4,7 +4,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from stream_service.infrastructure.adapters.output.opencv_capture_engine import OpenCVCaptureEngine
+from stream_service.adapters.outbound.external.opencv_capture_engine import OpenCVCaptureEngine
+from stream_service.adapters.outbound.external.latest_frame_slot import LatestFrameSlot
+from stream_service.application.services.reconnect import ReconnectConfig
 
 
 @pytest.fixture
@@ -18,6 +20,8 @@ def mock_cv2_videocapture():
     mock_cap = MagicMock()
     mock_cap.isOpened.return_value = True
     mock_cap.read.return_value = (True, b"fake_frame_data")
+    mock_cap.grab.return_value = True
+    mock_cap.retrieve.return_value = (True, b"fake_frame_data")
     mock_cap.set.return_value = True
     mock_cap.release.return_value = None
     return mock_cap
@@ -48,6 +52,10 @@ class TestOpenCVCaptureEngine:
         assert capture_engine.is_capturing()
         mock_videocapture.assert_called_once_with(rtsp_url)
         mock_cv2_videocapture.set.assert_called()
+        assert capture_engine._grabber_thread.is_alive()
+        
+        await capture_engine.stop_capture()
+        assert capture_engine._grabber_thread is None
     
     @pytest.mark.asyncio
     @patch('cv2.VideoCapture')
@@ -60,10 +68,175 @@ class TestOpenCVCaptureEngine:
         mock_videocapture.return_value = mock_cap
         
         # Act & Assert
-        with pytest.raises(RuntimeError, match="Failed to open RTSP stream"):
+        with pytest.raises(RuntimeError, match="Failed to open RTSP stream after 3 attempts"):
             await capture_engine.start_capture(rtsp_url)
         
         assert not capture_engine.is_capturing()
+        assert mock_videocapture.call_count == 3
+        assert capture_engine.get_frame_stats()["reconnect_attempts"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_stop_interrupts_backoff(self):
+        """backoff 대기 중 stop_capture가 연결 재시도를 바로 끝내는지 테스트"""
+        import time
+        
+        failing = MagicMock()
+        failing.isOpened.return_value = False
+        engine = OpenCVCaptureEngine(
+            capture_factory=lambda url: failing,
+            reconnect=ReconnectConfig(backoff_base=10.0, jitter=0.0, initial_attempts=5)
+        )
+        
+        start_task = asyncio.create_task(engine.start_capture("rtsp://test.url"))
+        await asyncio.sleep(0.1)
+        started = time.perf_counter()
+        await engine.stop_capture()
+        
+        with pytest.raises(RuntimeError, match="cancelled"):
+            await asyncio.wait_for(start_task, timeout=2.0)
+        assert time.perf_counter() - started < 1.0
+        assert not engine.is_capturing()
+    
+    @pytest.mark.asyncio
+    async def test_stop_while_connecting_returns_immediately(self):
+        """연결 시도에 묶여 있어도 stop_capture는 기다리지 않고, 다른 스트림의 인코딩도 막히지 않는지 테스트"""
+        import threading
+        import time
+        import numpy as np
+        
+        unblock = threading.Event()
+        
+        def _hanging_open(url):
+            unblock.wait(2.0)
+            failing = MagicMock()
+            failing.isOpened.return_value = False
+            return failing
+        
+        stuck = OpenCVCaptureEngine(capture_factory=_hanging_open)
+        healthy = OpenCVCaptureEngine()
+        healthy._is_capturing = True
+        healthy._slot.put(np.zeros((8, 8, 3), dtype=np.uint8))
+        
+        start_task = asyncio.create_task(stuck.start_capture("rtsp://stuck.url"))
+        await asyncio.sleep(0.05)
+        
+        started = time.perf_counter()
+        frame = await healthy.get_encoded_frame()
+        await stuck.stop_capture()
+        elapsed = time.perf_counter() - started
+        
+        assert frame is not None
+        assert elapsed < 0.2
+        assert not stuck.is_capturing()
+        unblock.set()
+        with pytest.raises(RuntimeError, match="cancelled"):
+            await asyncio.wait_for(start_task, timeout=2.0)
+    
+    @pytest.mark.asyncio
+    async def test_watchdog_reconnects_stalled_stream(self):
+        """프레임이 끊기면 세션을 유지한 채 capture만 다시 열고 복구 시간을 기록하는지 테스트"""
+        stalled = MagicMock()
+        stalled.isOpened.return_value = True
+        stalled.read.return_value = (True, "first")
+        stalled.grab.return_value = False
+        healthy = MagicMock()
+        healthy.isOpened.return_value = True
+        healthy.read.return_value = (True, "reconnected")
+        healthy.grab.return_value = True
+        healthy.retrieve.return_value = (True, "frame")
+        captures = iter([stalled, healthy])
+        
+        engine = OpenCVCaptureEngine(
+            capture_factory=lambda url: next(captures),
+            reconnect=ReconnectConfig(backoff_base=0.01, jitter=0.0, stall_timeout=0.1)
+        )
+        engine._failure_backoff = 0.01
+        engine._max_consecutive_failures = 1000  # 연속 실패 한도가 아닌 무프레임 시간으로 감지
+        
+        await engine.start_capture("rtsp://test.url")
+        try:
+            for _ in range(100):
+                if engine.get_frame_stats()["recoveries"]:
+                    break
+                await asyncio.sleep(0.02)
+            
+            stats = engine.get_frame_stats()
+            assert engine.is_capturing()
+            assert stats["outages"] == 1
+            assert stats["recoveries"] == 1
+            assert stats["recovering"] is False
+            assert 0.1 <= stats["last_recovery_seconds"] < 1.0
+            assert stats["reconnect_attempts"] == 1
+            stalled.release.assert_called_once()
+            assert engine._cap is healthy
+        finally:
+            await engine.stop_capture()
+    
+    @pytest.mark.asyncio
+    async def test_reconnect_survives_unexpected_error(self):
+        """재연결 경로에서 예상치 못한 오류가 나도 grabber가 죽지 않고 다시 시도하는지 테스트"""
+        stalled = MagicMock()
+        stalled.isOpened.return_value = True
+        stalled.read.return_value = (True, "first")
+        stalled.grab.return_value = False
+        refused = MagicMock()
+        refused.isOpened.return_value = False
+        healthy = MagicMock()
+        healthy.isOpened.return_value = True
+        healthy.read.return_value = (True, "reconnected")
+        healthy.grab.return_value = True
+        healthy.retrieve.return_value = (True, "frame")
+        captures = iter([stalled, refused, healthy])
+        
+        engine = OpenCVCaptureEngine(
+            capture_factory=lambda url: next(captures),
+            reconnect=ReconnectConfig(backoff_base=0.01, backoff_max=0.05, jitter=0.0, stall_timeout=0.1)
+        )
+        engine._failure_backoff = 0.01
+        engine._max_consecutive_failures = 1000
+        
+        await engine.start_capture("rtsp://test.url")
+        try:
+            # 재연결 첫 시도가 실패한 뒤 backoff 계산에서 오류
+            engine._backoff.next_delay = MagicMock(side_effect=OverflowError("math range error"))
+            for _ in range(100):
+                if engine.get_frame_stats()["recoveries"]:
+                    break
+                await asyncio.sleep(0.02)
+            
+            stats = engine.get_frame_stats()
+            assert engine.is_capturing()
+            assert engine._grabber_thread.is_alive()
+            assert stats["recoveries"] == 1
+            # 실패한 시도와 성공한 시도를 한 번씩만 셈
+            assert stats["reconnect_attempts"] == 2
+            assert engine._cap is healthy
+        finally:
+            await engine.stop_capture()
+    
+    @pytest.mark.asyncio
+    async def test_grabber_failure_stops_capture(self):
+        """grabber가 복구할 수 없는 오류로 멈추면 캡처 중이 아님으로 보고하는지 테스트"""
+        cap = MagicMock()
+        cap.isOpened.return_value = True
+        cap.read.return_value = (True, "first")
+        cap.grab.return_value = False
+        engine = OpenCVCaptureEngine(
+            capture_factory=lambda url: cap,
+            reconnect=ReconnectConfig(backoff_base=0.01, jitter=0.0, stall_timeout=0.05)
+        )
+        engine._failure_backoff = 0.01
+        engine._reopen_capture = MagicMock(side_effect=ValueError("boom"))
+        
+        await engine.start_capture("rtsp://test.url")
+        for _ in range(100):
+            if not engine.is_capturing():
+                break
+            await asyncio.sleep(0.02)
+        
+        assert not engine.is_capturing()
+        cap.release.assert_called()
+        await engine.stop_capture()
     
     @pytest.mark.asyncio
     async def test_start_capture_already_running(self, capture_engine):
@@ -107,16 +280,37 @@ class TestOpenCVCaptureEngine:
         import numpy as np
         capture_engine._is_capturing = True
         capture_engine._cap = mock_cv2_videocapture
-        mock_cv2_videocapture.read.return_value = (True, b"frame_data")
+        capture_engine._slot.put(b"frame_data")
         mock_buffer = np.array([1, 2, 3, 4], dtype=np.uint8)  # numpy array로 모킹
         mock_imencode.return_value = (True, mock_buffer)
         
         # Act
         frame = await capture_engine.get_current_frame()
         
-        # Assert
+        # Assert - 네트워크 읽기 없이 슬롯의 프레임만 인코딩
         assert frame == mock_buffer.tobytes()
-        mock_cv2_videocapture.read.assert_called_once()
+        mock_cv2_videocapture.read.assert_not_called()
+        mock_cv2_videocapture.grab.assert_not_called()
+        mock_imencode.assert_called_once()
+    
+    @pytest.mark.asyncio
+    @patch('cv2.imencode')
+    async def test_get_current_frame_reuses_encoded_frame(self, mock_imencode, capture_engine, mock_cv2_videocapture):
+        """새 프레임이 없을 때 재인코딩하지 않는지 테스트"""
+        # Arrange
+        import numpy as np
+        capture_engine._is_capturing = True
+        capture_engine._cap = mock_cv2_videocapture
+        capture_engine._slot.put(b"frame_data")
+        mock_buffer = np.array([1, 2, 3, 4], dtype=np.uint8)
+        mock_imencode.return_value = (True, mock_buffer)
+        
+        # Act
+        first = await capture_engine.get_current_frame()
+        second = await capture_engine.get_current_frame()
+        
+        # Assert
+        assert first == second
         mock_imencode.assert_called_once()
     
     @pytest.mark.asyncio
@@ -130,12 +324,11 @@ class TestOpenCVCaptureEngine:
     
     @pytest.mark.asyncio
     @patch('cv2.imencode')
-    async def test_get_current_frame_read_failure(self, mock_imencode, capture_engine, mock_cv2_videocapture):
-        """프레임 읽기 실패 테스트"""
+    async def test_get_current_frame_no_grabbed_frame(self, mock_imencode, capture_engine, mock_cv2_videocapture):
+        """grabber가 아직 프레임을 받지 못했을 때 테스트"""
         # Arrange
         capture_engine._is_capturing = True
         capture_engine._cap = mock_cv2_videocapture
-        mock_cv2_videocapture.read.return_value = (False, None)
         
         # Act
         frame = await capture_engine.get_current_frame()
@@ -144,6 +337,48 @@ class TestOpenCVCaptureEngine:
         assert frame is None
         mock_imencode.assert_not_called()
     
+    def test_grab_loop_read_failure(self, capture_engine, mock_cv2_videocapture):
+        """grabber 프레임 읽기 실패 테스트"""
+        # Arrange
+        capture_engine._is_capturing = True
+        capture_engine._cap = mock_cv2_videocapture
+        capture_engine._failure_backoff = 0
+        
+        def _grab():
+            if capture_engine._consecutive_failures >= 2:
+                capture_engine._is_capturing = False
+            return False
+        mock_cv2_videocapture.grab.side_effect = _grab
+        
+        # Act
+        capture_engine._grab_loop(mock_cv2_videocapture, "rtsp://test.url", capture_engine._stop_event)
+        
+        # Assert
+        assert capture_engine._consecutive_failures == 3
+        assert capture_engine._slot.take() is None
+        assert capture_engine.get_stage_timings()["grab"].count == 3
+        mock_cv2_videocapture.retrieve.assert_not_called()
+    
+    def test_grab_loop_records_stage_timings(self, capture_engine, mock_cv2_videocapture):
+        """grab과 decode(retrieve) 시간이 따로 기록되는지 테스트"""
+        # Arrange
+        capture_engine._is_capturing = True
+        capture_engine._cap = mock_cv2_videocapture
+        
+        def _retrieve():
+            capture_engine._is_capturing = False
+            return (True, "frame")
+        mock_cv2_videocapture.retrieve.side_effect = _retrieve
+        
+        # Act
+        capture_engine._grab_loop(mock_cv2_videocapture, "rtsp://test.url", capture_engine._stop_event)
+        
+        # Assert
+        timings = capture_engine.get_stage_timings()
+        assert timings["grab"].count == 1
+        assert timings["decode"].count == 1
+        assert capture_engine._slot.take().image == "frame"
+    
     @pytest.mark.asyncio
     @patch('cv2.imencode')
     async def test_get_current_frame_encode_failure(self, mock_imencode, capture_engine, mock_cv2_videocapture):
@@ -151,7 +386,7 @@ class TestOpenCVCaptureEngine:
         # Arrange
         capture_engine._is_capturing = True
         capture_engine._cap = mock_cv2_videocapture
-        mock_cv2_videocapture.read.return_value = (True, b"frame_data")
+        capture_engine._slot.put(b"frame_data")
         mock_imencode.return_value = (False, None)
         
         # Act
@@ -181,8 +416,7 @@ class TestOpenCVCaptureEngine:
         capture_engine._is_capturing = True
         capture_engine._cap = mock_cv2_videocapture
         capture_engine._frame_interval = 0.01  # 빠른 테스트를 위해
-        
-        mock_cv2_videocapture.read.return_value = (True, b"frame_data")
+        capture_engine._slot.put(b"frame_data")
         import numpy as np
         mock_buffer = np.array([1, 2, 3, 4], dtype=np.uint8)
         mock_imencode.return_value = (True, mock_buffer)
@@ -199,8 +433,7 @@ class TestOpenCVCaptureEngine:
         
         # Assert
         assert len(frames) == 2
-        expected_frame = base64.b64encode(mock_buffer.tobytes()).decode('utf-8').encode('utf-8')
-        assert all(frame == expected_frame for frame in frames)
+        assert all(frame == mock_buffer.tobytes() for frame in frames)
     
     def test_cleanup(self, capture_engine, mock_cv2_videocapture):
         """리소스 정리 테스트"""
@@ -216,6 +449,57 @@ class TestOpenCVCaptureEngine:
         mock_cv2_videocapture.release.assert_called_once()
         assert capture_engine._cap is None
     
+    @pytest.mark.asyncio
+    async def test_stop_capture_with_stuck_grabber(self, capture_engine):
+        """grab()에 묶인 grabber가 있어도 stop은 루프를 막지 않고, capture는 grabber 종료 후에 해제"""
+        import threading
+        import time
+
+        release_event = threading.Event()
+        events = []
+
+        class StuckCapture:
+            def grab(self):
+                release_event.wait(2.0)
+                return False
+
+            def release(self):
+                events.append(("release", threading.current_thread().name))
+
+        capture_engine._read_timeout = 200  # ms
+        capture_engine._is_capturing = True
+        capture_engine._cap = StuckCapture()
+        capture_engine._start_grabber(capture_engine._cap, "rtsp://test.url", capture_engine._stop_event)
+        await asyncio.sleep(0.05)
+        thread = capture_engine._grabber_thread
+
+        async def measure_lag():
+            worst = 0.0
+            while True:
+                started = time.perf_counter()
+                await asyncio.sleep(0.01)
+                worst = max(worst, time.perf_counter() - started - 0.01)
+                if not lag_task_running:
+                    return worst
+
+        lag_task_running = True
+        lag_task = asyncio.create_task(measure_lag())
+        started = time.perf_counter()
+        await capture_engine.stop_capture()
+        elapsed = time.perf_counter() - started
+        lag_task_running = False
+        worst_lag = await lag_task
+
+        assert elapsed < 0.5
+        assert worst_lag < 0.1
+        assert thread.is_alive()
+        assert events == []
+        assert capture_engine._cap is None
+
+        release_event.set()
+        thread.join(timeout=2.0)
+        assert events == [("release", "opencv-frame-grabber")]
+
     def test_cleanup_with_exception(self, capture_engine, mock_cv2_videocapture):
         """리소스 정리 중 예외 발생 테스트"""
         # Arrange
@@ -228,4 +512,59 @@ class TestOpenCVCaptureEngine:
         
         # Assert
         assert not capture_engine._is_capturing
-        assert capture_engine._cap is None
\ No newline at end of file
+        assert capture_engine._cap is None
+
+
+class TestLatestFrameSlot:
+    
+    def test_take_returns_latest_frame(self):
+        """최신 프레임만 반환하는지 테스트"""
+        slot = LatestFrameSlot()
+        slot.put("frame1")
+        slot.put("frame2")
+        
+        grabbed = slot.take()
+        
+        assert grabbed.image == "frame2"
+        assert grabbed.seq == 2
+    
+    def test_dropped_counts_unconsumed_frames(self):
+        """소비되지 않고 덮어써진 프레임 집계 테스트"""
+        slot = LatestFrameSlot()
+        slot.put("frame1")
+        slot.put("frame2")  # frame1 drop
+        slot.take()
+        slot.put("frame3")
+        slot.take()
+        
+        assert slot.dropped == 1
+
+
+class TestMotionSuppression:
+    
+    @pytest.mark.asyncio
+    @patch('cv2.imencode')
+    async def test_static_frame_not_encoded(self, mock_imencode, capture_engine, mock_cv2_videocapture):
+        """정지 장면 프레임은 인코딩하지 않는지 테스트"""
+        # Arrange
+        import numpy as np
+        from stream_service.application.services.motion_gate import MotionGateConfig
+        capture_engine._is_capturing = True
+        capture_engine._cap = mock_cv2_videocapture
+        capture_engine.configure_motion(MotionGateConfig(keepalive_fps=0.001, hold_seconds=0))
+        mock_imencode.return_value = (True, np.array([1, 2], dtype=np.uint8))
+        frame = np.zeros((64, 64, 3), dtype=np.uint8)
+        
+        # Act
+        capture_engine._slot.put(frame)
+        first = await capture_engine.get_current_frame()
+        capture_engine._slot.put(frame.copy())
+        second = await capture_engine.get_current_frame()
+        third = await capture_engine.get_current_frame()
+        
+        # Assert
+        assert first is not None
+        assert second is None
+        assert third is None
+        assert mock_imencode.call_count == 1
+        assert capture_engine.get_frame_stats()["suppressed_frames"] == 1
@@ -0,0 +1,149 @@
+import asyncio
+import os
+
+import cv2
+import numpy as np
+
+from stream_service.adapters.outbound.storage.mjpeg_avi_writer import clip_fps, prune_clips, write_mjpeg_avi
+from stream_service.application.dto.frame_envelope import EncodedFrame, FrameCodec
+from stream_service.application.services.pre_event_buffer import PreEventBuffer, PreEventBuffers
+
+
+def _frame(seq: int, size: int, captured_at: float = 0.0) -> EncodedFrame:
+    return EncodedFrame(seq=seq, captured_at=captured_at, width=4, height=4, data=bytes([seq % 256]) * size)
+
+
+def _jpeg(seq: int, captured_at: float) -> EncodedFrame:
+    image = np.full((120, 160, 3), seq * 10 % 256, dtype=np.uint8)
+    _, buffer = cv2.imencode(".jpg", image)
+    return EncodedFrame(seq=seq, captured_at=captured_at, width=160, height=120, data=memoryview(buffer).cast("B"))
+
+
+class TestPreEventBuffer:
+
+    def test_evicts_oldest_by_bytes_and_wraps(self):
+        buffer = PreEventBuffer(capacity_bytes=250, max_frames=16)
+        for seq in range(5):
+            buffer.append(_frame(seq, 100, captured_at=seq))
+
+        frames = asyncio.run(buffer.export(seconds=100, now=10))
+
+        # 100바이트 프레임 두 개까지만 들어감, 끝의 50바이트는 건너뛰고 앞에서부터 덮어씀
+        assert [frame.seq for frame in frames] == [3, 4]
+        assert [frame.data for frame in frames] == [b"\x03" * 100, b"\x04" * 100]
+        assert buffer.stats()["used_bytes"] == 200
+
+    def test_evicts_oldest_by_frame_count(self):
+        buffer = PreEventBuffer(capacity_bytes=10_000, max_frames=3)
+        for seq in range(5):
+            buffer.append(_frame(seq, 10, captured_at=seq))
+
+        assert len(buffer) == 3
+        assert buffer.stats()["span_seconds"] == 2.0
+
+    def test_export_last_seconds(self):
+        buffer = PreEventBuffer(capacity_bytes=10_000, max_frames=100)
+        for seq in range(10):
+            buffer.append(_frame(seq, 10, captured_at=100 + seq))
+
+        frames = asyncio.run(buffer.export(seconds=3, now=109))
+
+        assert [frame.seq for frame in frames] == [6, 7, 8, 9]
+
+    def test_oversized_frame_skipped(self):
+        buffer = PreEventBuffer(capacity_bytes=50, max_frames=4)
+        buffer.append(_frame(1, 60))
+
+        assert len(buffer) == 0
+        assert buffer.stats()["oversized_frames"] == 1
+
+    def test_export_copies_out_of_ring(self):
+        """export 후 ring이 덮어써도 복사본은 유지됨"""
+        buffer = PreEventBuffer(capacity_bytes=100, max_frames=4)
+        buffer.append(_frame(1, 60))
+        frames = asyncio.run(buffer.export(seconds=100, now=0))
+        buffer.append(_frame(2, 60))
+
+        assert frames[0].data == b"\x01" * 60
+
+    def test_export_skips_frames_evicted_while_yielding(self):
+        buffer = PreEventBuffer(capacity_bytes=1000, max_frames=8)
+        for seq in range(8):
+            buffer.append(_frame(seq, 10, captured_at=seq))
+
+        async def export_while_streaming():
+            export = asyncio.create_task(buffer.export(seconds=100, now=8, yield_every=2))
+            await asyncio.sleep(0)
+            # 첫 양보 동안 새 프레임 4개가 들어와 오래된 프레임이 밀려남
+            for seq in range(8, 12):
+                buffer.append(_frame(seq, 10, captured_at=seq))
+            return await export
+
+        frames = asyncio.run(export_while_streaming())
+
+        assert [frame.seq for frame in frames] == [0, 1, 4, 5, 6, 7]
+
+
+class TestPreEventBuffers:
+
+    def test_allocates_per_camera_and_keeps_jpeg_only(self):
+        buffers = PreEventBuffers(capacity_bytes=1000)
+        buffers.append("cam1", _frame(1, 10))
+        buffers.append("cam1", EncodedFrame(seq=2, captured_at=0, width=4, height=4, data=b"x", codec=FrameCodec.WEBP))
+
+        assert buffers.get("cam2") is None
+        assert buffers.stats()["cam1"]["frames"] == 1
+        assert buffers.stats()["cam1"]["capacity_bytes"] == 1000
+
+    def test_sized_from_seconds_and_bitrate(self):
+        """30초 x 4Mbps(+25%) ≈ 18.75MB, 30초 x 30fps(+25%) 프레임"""
+        buffers = PreEventBuffers(seconds=30, bitrate_kbps=4000, fps=30)
+
+        assert buffers.buffer_size("cam1") == (18_750_000, 1126)
+
+    def test_camera_override(self):
+        buffers = PreEventBuffers(seconds=30, bitrate_kbps=8, fps=10, camera_seconds={"gate": 60, "lobby": 0})
+        for camera_id in ("cam1", "gate", "lobby"):
+            buffers.append(camera_id, _frame(1, 10))
+
+        assert buffers.buffer_size("gate") == (75_000, 751)
+        assert buffers.get("lobby") is None
+        assert buffers.stats()["gate"]["target_seconds"] == 60
+        assert set(buffers.stats()) == {"cam1", "gate"}
+
+
+class TestMjpegAviWriter:
+
+    def test_written_clip_is_playable(self, tmp_path):
+        buffer = PreEventBuffer(capacity_bytes=1_000_000, max_frames=64)
+        for seq in range(20):
+            buffer.append(_jpeg(seq, captured_at=seq * 0.1))
+        frames = asyncio.run(buffer.export(seconds=100, now=2))
+        path = str(tmp_path / "clip.avi")
+
+        size = write_mjpeg_avi(path, frames, clip_fps(frames))
+
+        capture = cv2.VideoCapture(path)
+        decoded = []
+        while True:
+            success, image = capture.read()
+            if not success:
+                break
+            decoded.append(image)
+        capture.release()
+        assert size > sum(len(frame.data) for frame in frames)
+        assert len(decoded) == 20
+        assert decoded[0].shape == (120, 160, 3)
+        assert round(clip_fps(frames)) == 10
+
+    def test_prune_keeps_newest_clips(self, tmp_path):
+        for index in range(4):
+            path = tmp_path / f"clip{index}.avi"
+            path.write_bytes(b"x")
+            os.utime(path, (index, index))
+        (tmp_path / "notes.txt").write_bytes(b"x")
+
+        removed = prune_clips(str(tmp_path), 2, keep=str(tmp_path / "clip0.avi"))
+
+        assert removed == 2
+        assert sorted(os.listdir(tmp_path)) == ["clip0.avi", "clip3.avi", "notes.txt"]
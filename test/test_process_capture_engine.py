@@ -0,0 +1,171 @@
+import asyncio
+import multiprocessing
+import time
+from unittest.mock import AsyncMock
+
+import cv2
+import numpy as np
+import pytest
+
+from stream_service.adapters.outbound.external.process_capture_engine import ProcessCaptureEngine
+from stream_service.adapters.outbound.external.shared_frame_ring import SharedFrameRing
+from stream_service.application.dto.frame_envelope import FrameCodec
+from stream_service.application.services.encoder_calibration import FrameEncoderConfig
+from stream_service.monitoring.metrics import new_stage_timings
+
+
+@pytest.fixture
+def ring():
+    ring = SharedFrameRing.create(slot_count=3, slot_size=64)
+    yield ring
+    ring.close()
+
+
+@pytest.fixture
+def sample_video(tmp_path):
+    """워커가 읽을 로컬 MJPEG 비디오 파일"""
+    path = tmp_path / "sample.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 30, (64, 48))
+    for i in range(90):
+        writer.write(np.full((48, 64, 3), i, dtype=np.uint8))
+    writer.release()
+    return str(path)
+
+
+class TestSharedFrameRing:
+
+    def test_read_latest_returns_newest_frame(self, ring):
+        """가장 최근 프레임 반환 테스트"""
+        ring.write(b"frame1", 1.0)
+        ring.write(b"frame2", 2.0, width=640, height=480)
+
+        frame = ring.read_latest()
+
+        assert (frame.seq, frame.captured_at, frame.data) == (2, 2.0, b"frame2")
+        assert (frame.width, frame.height) == (640, 480)
+        assert ring.read_latest(after_seq=2) is None
+
+    def test_attach_reads_same_memory(self, ring):
+        """다른 핸들에서 같은 링 접근 테스트"""
+        other = SharedFrameRing.attach(ring.name)
+        try:
+            other.write(b"from-worker", 3.0)
+            other.write_stats(5, 1, 0.25, 7, 2)
+
+            assert ring.read_latest().data == b"from-worker"
+            assert ring.read_stats() == (5, 1, 0.25, 7, 2)
+        finally:
+            other.close()
+
+    def test_timings_round_trip(self, ring):
+        """워커 히스토그램이 공유 메모리로 전달되는지 테스트"""
+        written = new_stage_timings()
+        written["encode"].observe(0.004)
+        written["grab"].observe(2.0)
+        ring.write(b"frame", 1.0)
+
+        read = new_stage_timings()
+        ring.write_timings(written)
+        ring.read_timings(read)
+
+        assert read["encode"].counts == written["encode"].counts
+        assert read["grab"].counts[-1] == 1
+        assert read["grab"].sum == 2.0
+        assert ring.read_latest().data == b"frame"
+
+    def test_recovery_round_trip(self, ring):
+        """워커의 끊김/복구 통계가 타이밍 영역과 겹치지 않고 전달되는지 테스트"""
+        written = new_stage_timings()
+        written["encode"].observe(0.004)
+        ring.write_timings(written)
+        ring.write_recovery(3, 2, 4.5, 1.25, True)
+
+        read = new_stage_timings()
+        ring.read_timings(read)
+
+        assert ring.read_recovery() == (3, 2, 4.5, 1.25, True)
+        assert read["encode"].counts == written["encode"].counts
+
+    def test_write_oversized_frame(self, ring):
+        """슬롯보다 큰 프레임 기록 테스트"""
+        with pytest.raises(ValueError, match="exceeds ring slot size"):
+            ring.write(b"x" * 65, 0.0)
+
+    def test_wraps_around_slots(self, ring):
+        """슬롯 순환 테스트"""
+        for i in range(10):
+            ring.write(f"frame{i}".encode(), float(i))
+
+        assert ring.read_latest().data == b"frame9"
+
+
+class TestProcessCaptureEngine:
+
+    @pytest.mark.asyncio
+    async def test_worker_process_streams_frames(self, sample_video):
+        """워커 프로세스에서 인코딩한 프레임 수신 테스트"""
+        engine = ProcessCaptureEngine(slot_count=4, slot_size=64 * 1024)
+
+        await asyncio.wait_for(engine.start_capture(sample_video), timeout=30)
+        try:
+            frame = await engine.get_current_frame()
+            assert frame[:2] == b"\xff\xd8"  # JPEG SOI
+
+            stream = engine.frame_stream()
+            next_frame = await asyncio.wait_for(stream.__anext__(), timeout=5)
+            await stream.aclose()
+            assert next_frame[:2] == b"\xff\xd8"
+            assert engine.get_frame_stats()["seq"] >= 2
+            assert engine.get_stage_timings()["encode"].count >= 2
+        finally:
+            await engine.stop_capture()
+
+        assert not engine.is_capturing()
+        assert await engine.get_current_frame() is None
+
+    @pytest.mark.asyncio
+    async def test_wait_exit_uses_sentinel(self):
+        """워커 종료를 executor 스레드 없이 sentinel로 기다리는지 테스트"""
+        process = multiprocessing.get_context("spawn").Process(target=time.sleep, args=(30,), daemon=True)
+        process.start()
+        try:
+            assert not await ProcessCaptureEngine._wait_exit(process, 0.1)
+            process.terminate()
+            started_at = time.monotonic()
+            assert await ProcessCaptureEngine._wait_exit(process, 5.0)
+            assert time.monotonic() - started_at < 2.0
+        finally:
+            process.kill()
+            process.join()
+
+    @pytest.mark.asyncio
+    async def test_stop_cleans_up_when_wait_fails(self, sample_video):
+        """종료 대기가 실패해도 워커를 남기지 않고 정리하는지 테스트"""
+        engine = ProcessCaptureEngine(slot_count=4, slot_size=64 * 1024)
+        await asyncio.wait_for(engine.start_capture(sample_video), timeout=30)
+        process = engine._process
+        engine._wait_exit = AsyncMock(side_effect=RuntimeError("wait failed"))
+
+        with pytest.raises(RuntimeError, match="wait failed"):
+            await engine.stop_capture()
+
+        assert not process.is_alive()
+        assert engine._ring is None and engine._process is None
+        assert not engine.is_capturing()
+
+    @pytest.mark.asyncio
+    async def test_worker_uses_encoder_config(self, sample_video):
+        """워커가 전달받은 인코더 설정으로 WebP 프레임을 만들고, 부모 tier는 JPEG"""
+        engine = ProcessCaptureEngine(
+            slot_count=4, slot_size=64 * 1024, encoder_config=FrameEncoderConfig(backend="webp")
+        )
+
+        await asyncio.wait_for(engine.start_capture(sample_video), timeout=30)
+        try:
+            frame = await engine.get_encoded_frame()
+            tiers = await engine.encode_tiers(frame, {"small": frame.height // 2})
+            assert frame.codec == FrameCodec.WEBP
+            assert bytes(frame.data[:4]) == b"RIFF"
+            assert tiers["small"].codec == FrameCodec.JPEG
+        finally:
+            await engine.stop_capture()
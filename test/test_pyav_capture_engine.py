@@ -0,0 +1,76 @@
+import asyncio
+import importlib.util
+
+import cv2
+import numpy as np
+import pytest
+
+from stream_service.adapters.outbound.external.pyav_capture_engine import (
+    PyAVCaptureEngine,
+    PyAVCaptureOptions,
+)
+
+HAS_AV = importlib.util.find_spec("av") is not None
+
+
+@pytest.fixture
+def sample_video(tmp_path):
+    """움직이는 사각형이 있는 로컬 MJPG 샘플 영상"""
+    path = str(tmp_path / "sample.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 30, (320, 240))
+    for i in range(60):
+        frame = np.zeros((240, 320, 3), dtype=np.uint8)
+        cv2.rectangle(frame, (i * 4, 60), (i * 4 + 40, 120), (255, 255, 255), -1)
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+class TestPyAVCaptureEngine:
+
+    @pytest.mark.skipif(HAS_AV, reason="PyAV is installed")
+    @pytest.mark.asyncio
+    async def test_start_capture_without_av(self):
+        """PyAV가 없으면 재시도 없이 즉시 실패"""
+        engine = PyAVCaptureEngine()
+        with pytest.raises(RuntimeError, match="PyAV is not installed"):
+            await engine.start_capture("rtsp://127.0.0.1/stream")
+        assert not engine.is_capturing()
+
+    @pytest.mark.asyncio
+    async def test_capture_local_file(self, sample_video):
+        """로컬 영상 파일을 디코딩해 JPEG 프레임과 단계별 지연을 기록"""
+        pytest.importorskip("av")
+        engine = PyAVCaptureEngine(PyAVCaptureOptions(decoder_threads=1))
+        await engine.start_capture(sample_video)
+        try:
+            frame = None
+            for _ in range(100):
+                frame = await engine.get_encoded_frame()
+                if frame is not None:
+                    break
+                await asyncio.sleep(0.01)
+            assert frame is not None
+            assert (frame.width, frame.height) == (320, 240)
+            assert bytes(frame.data[:2]) == b"\xff\xd8"
+
+            timings = engine.get_stage_timings()
+            assert timings["grab"].count > 0
+            assert timings["decode"].count > 0
+        finally:
+            await engine.stop_capture()
+
+    @pytest.mark.asyncio
+    async def test_keyframes_only(self, sample_video):
+        """MJPG는 모든 프레임이 키프레임이므로 keyframes_only에서도 디코딩됨"""
+        pytest.importorskip("av")
+        engine = PyAVCaptureEngine(PyAVCaptureOptions(keyframes_only=True))
+        await engine.start_capture(sample_video)
+        try:
+            for _ in range(100):
+                if await engine.get_encoded_frame() is not None:
+                    break
+                await asyncio.sleep(0.01)
+            assert engine.get_stage_timings()["grab"].count > 0
+        finally:
+            await engine.stop_capture()
@@ -0,0 +1,71 @@
+import pytest
+
+from stream_service.application.services.reconnect import ExponentialBackoff, ReconnectConfig, RecoveryTracker
+
+
+class TestExponentialBackoff:
+
+    def test_grows_until_cap(self):
+        """jitter가 없으면 base부터 배수로 늘어나 cap에서 멈추는지 테스트"""
+        backoff = ExponentialBackoff(base=0.5, cap=3.0, multiplier=2.0, jitter=0.0)
+
+        delays = [backoff.next_delay() for _ in range(5)]
+
+        assert delays == [0.5, 1.0, 2.0, 3.0, 3.0]
+        assert backoff.attempts == 5
+
+    def test_long_outage_does_not_overflow(self):
+        """장애가 수 시간 이어져 수천 번 재시도해도 cap에 머무는지 테스트 (지수 overflow 없음)"""
+        backoff = ExponentialBackoff.from_config(ReconnectConfig(jitter=0.0))
+
+        delays = [backoff.next_delay() for _ in range(5000)]
+
+        assert delays[-1] == 30.0
+        assert max(delays) == 30.0
+        assert backoff.attempts == 5000
+
+    def test_jitter_shortens_delay(self):
+        """jitter 비율만큼 대기 시간이 줄어드는지 테스트"""
+        backoff = ExponentialBackoff(base=1.0, cap=10.0, jitter=0.5, rng=lambda: 1.0)
+
+        assert backoff.next_delay() == pytest.approx(0.5)
+        assert backoff.next_delay() == pytest.approx(1.0)
+
+    def test_reset(self):
+        """reset 후 다시 base부터 시작하는지 테스트"""
+        backoff = ExponentialBackoff.from_config(ReconnectConfig(backoff_base=0.1, jitter=0.0))
+        backoff.next_delay()
+        backoff.next_delay()
+
+        backoff.reset()
+
+        assert backoff.next_delay() == pytest.approx(0.1)
+
+
+class TestRecoveryTracker:
+
+    def test_measures_recovery_time(self):
+        """끊김부터 복구까지 시간과 평균 집계 테스트"""
+        tracker = RecoveryTracker()
+
+        tracker.mark_down(10.0)
+        tracker.mark_down(11.0)  # 이미 끊긴 상태면 시작 시각 유지
+        assert tracker.is_down
+        assert tracker.mark_up(12.0) == pytest.approx(2.0)
+
+        tracker.mark_down(20.0)
+        tracker.mark_up(24.0)
+
+        stats = tracker.as_dict()
+        assert stats["outages"] == 2
+        assert stats["recoveries"] == 2
+        assert stats["recovering"] is False
+        assert stats["last_recovery_seconds"] == pytest.approx(4.0)
+        assert stats["mean_recovery_seconds"] == pytest.approx(3.0)
+
+    def test_mark_up_without_outage(self):
+        """끊김 없이 연결되면 복구로 집계하지 않는지 테스트"""
+        tracker = RecoveryTracker()
+
+        assert tracker.mark_up(1.0) is None
+        assert tracker.recoveries == 0
@@ -0,0 +1,95 @@
+import asyncio
+import os
+
+from stream_service.adapters.outbound.storage.segment_recorder import SegmentRecorder, iter_recorded_frames
+from stream_service.application.dto.frame_envelope import EncodedFrame, FrameCodec
+
+
+def _frame(seq: int, size: int = 100, captured_at: float = None) -> EncodedFrame:
+    return EncodedFrame(
+        seq=seq,
+        captured_at=1000.0 + seq if captured_at is None else captured_at,
+        width=640,
+        height=360,
+        data=bytes([seq % 256]) * size
+    )
+
+
+async def _record(recorder: SegmentRecorder, frames, camera_id: str = "cam1") -> None:
+    for frame in frames:
+        recorder.append(camera_id, frame)
+    await recorder.close()
+
+
+class TestSegmentRecorder:
+
+    def test_playback_slices_recorded_bytes(self, tmp_path):
+        recorder = SegmentRecorder(str(tmp_path), segment_bytes=10_000)
+        asyncio.run(_record(recorder, [_frame(seq) for seq in range(10)]))
+
+        frames = list(iter_recorded_frames(recorder.find_range("cam1", 1003, 1006)))
+
+        assert [frame.seq for frame in frames] == [3, 4, 5, 6]
+        assert frames[0].data == b"\x03" * 100
+        assert (frames[0].width, frames[0].height, frames[0].captured_at) == (640, 360, 1003.0)
+        assert recorder.stats()["recorded_frames"] == 10
+        assert recorder.stats()["fsyncs"] >= 1
+
+    def test_rolls_over_fixed_size_segments(self, tmp_path):
+        recorder = SegmentRecorder(str(tmp_path), segment_bytes=300)
+        asyncio.run(_record(recorder, [_frame(seq) for seq in range(7)]))
+
+        segments = recorder.segments("cam1")
+
+        assert [segment.frames for segment in segments] == [3, 3, 1]
+        assert all(segment.nbytes <= 300 for segment in segments)
+        assert (segments[1].start, segments[1].end) == (1003.0, 1005.0)
+        # 구간이 세그먼트 경계를 넘어도 순서대로 이어짐
+        frames = list(iter_recorded_frames(recorder.find_range("cam1", 1002, 1004)))
+        assert [frame.seq for frame in frames] == [2, 3, 4]
+
+    def test_retention_keeps_latest_segments(self, tmp_path):
+        recorder = SegmentRecorder(str(tmp_path), segment_bytes=200, max_segments=2)
+        asyncio.run(_record(recorder, [_frame(seq) for seq in range(8)]))
+
+        segments = recorder.segments("cam1")
+
+        assert len(segments) == 2
+        assert segments[0].start == 1004.0
+
+    def test_drops_when_pending_exceeds_limit(self, tmp_path):
+        recorder = SegmentRecorder(str(tmp_path), max_pending_bytes=250)
+        asyncio.run(_record(recorder, [_frame(seq) for seq in range(4)]))
+
+        assert recorder.stats()["recorded_frames"] == 2
+        assert recorder.stats()["dropped_frames"] == 2
+
+    def test_skips_non_jpeg_frames(self, tmp_path):
+        recorder = SegmentRecorder(str(tmp_path))
+        webp = EncodedFrame(seq=1, captured_at=1.0, width=4, height=4, data=b"x", codec=FrameCodec.WEBP)
+        asyncio.run(_record(recorder, [webp]))
+
+        assert recorder.segments("cam1") == []
+
+    def test_ignores_truncated_index_record(self, tmp_path):
+        """기록 도중 잘린 마지막 인덱스 레코드는 재생에서 제외"""
+        recorder = SegmentRecorder(str(tmp_path))
+        asyncio.run(_record(recorder, [_frame(seq) for seq in range(3)]))
+        index_path = [name for name in os.listdir(tmp_path / "cam1") if name.endswith(".idx")][0]
+        with open(tmp_path / "cam1" / index_path, "ab") as index:
+            index.write(b"\x00" * 10)
+
+        assert recorder.segments("cam1")[0].frames == 3
+
+    def test_periodic_flush_in_background(self, tmp_path):
+        async def scenario():
+            recorder = SegmentRecorder(str(tmp_path), flush_interval=0.01)
+            recorder.append("cam1", _frame(1))
+            await asyncio.sleep(0.1)
+            segments = recorder.segments("cam1")
+            await recorder.close()
+            return segments
+
+        segments = asyncio.run(scenario())
+
+        assert [segment.frames for segment in segments] == [1]
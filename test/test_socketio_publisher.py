@@ -0,0 +1,202 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from stream_service.adapters.outbound.messaging.socketio_publisher import (
+    DropPolicy,
+    OutboundFrameQueue,
+    SocketIOPublisher
+)
+from stream_service.application.dto.frame_envelope import EncodedFrame, unpack_frame_envelope
+from stream_service.application.dto.socketio_dto import CaptureStatusResponseDTO, ResponseClientMetadataDTO
+from stream_service.config.constants import EmitEvent
+
+
+@pytest.fixture
+def mock_sio():
+    sio = AsyncMock()
+    sio.emit = AsyncMock()
+    return sio
+
+
+@pytest.fixture
+async def publisher(mock_sio):
+    publisher = SocketIOPublisher(mock_sio, EmitEvent(), frame_queue_size=2, binary_envelope=True)
+    yield publisher
+    await publisher.close()
+
+
+def _frame(data=b"jpeg", seq=1):
+    return EncodedFrame(seq=seq, captured_at=1.5, width=640, height=480, data=data)
+
+
+def _status():
+    return CaptureStatusResponseDTO(rtsp_url="rtsp://test", status="running", is_active=True)
+
+
+class TestOutboundFrameQueue:
+
+    def test_drop_oldest(self):
+        """가득 차면 가장 오래된 프레임을 버리는지 테스트"""
+        queue = OutboundFrameQueue(maxsize=2)
+        for i in range(3):
+            queue.put({"i": i}, 1)
+
+        assert queue.dropped == 1
+        assert queue.pop()[0] == {"i": 1}
+
+    def test_latest_only(self):
+        """latest_only는 최신 프레임 하나만 유지하는지 테스트"""
+        queue = OutboundFrameQueue(maxsize=5, policy=DropPolicy.LATEST_ONLY)
+        for i in range(3):
+            queue.put({"i": i}, 1)
+
+        assert len(queue) == 1
+        assert queue.dropped == 2
+        assert queue.pop()[0] == {"i": 2}
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError, match="Unknown drop policy"):
+            OutboundFrameQueue(policy="block")
+
+
+class TestSocketIOPublisher:
+
+    @pytest.mark.asyncio
+    async def test_send_video_frame_does_not_block_on_slow_emit(self, publisher, mock_sio):
+        """emit이 느려도 send_video_frame은 즉시 반환하는지 테스트"""
+        release = asyncio.Event()
+
+        async def _slow_emit(*args):
+            await release.wait()
+        mock_sio.emit.side_effect = _slow_emit
+
+        # Act
+        await asyncio.wait_for(publisher.send_video_frame("cam1", _frame()), timeout=0.1)
+        await asyncio.sleep(0)
+        for _ in range(5):
+            await asyncio.wait_for(publisher.send_video_frame("cam1", _frame()), timeout=0.1)
+
+        # Assert - 1개는 전송 중, 큐(크기 2)를 넘친 3개는 drop
+        stats = publisher.get_queue_stats()["streams"]["cam1"]
+        assert stats["depth"] == 2
+        assert stats["dropped"] == 3
+        release.set()
+
+    @pytest.mark.asyncio
+    async def test_frames_emitted_with_listener(self, publisher, mock_sio):
+        """전송 후 listener에 크기와 지연이 통지되는지 테스트"""
+        emitted = []
+        publisher.set_frame_emit_listener(lambda *args: emitted.append(args))
+
+        # Act
+        await publisher.send_video_frame("cam1", _frame(data=b"12345"))
+        await asyncio.sleep(0.01)
+
+        # Assert
+        mock_sio.emit.assert_called_once()
+        assert mock_sio.emit.call_args.args[0] == EmitEvent.VIDEO_FRAME_RELAY
+        assert emitted[0][:2] == ("cam1", 5)
+        assert publisher.get_queue_stats()["streams"]["cam1"]["sent"] == 1
+
+    @pytest.mark.asyncio
+    async def test_status_has_priority_over_frames(self, publisher, mock_sio):
+        """상태 이벤트가 대기 중인 프레임보다 먼저 전송되는지 테스트"""
+        release = asyncio.Event()
+        events = []
+
+        async def _emit(event, data):
+            events.append(event)
+            if len(events) == 1:
+                await release.wait()
+        mock_sio.emit.side_effect = _emit
+
+        # Act - 첫 프레임 전송 중에 프레임과 상태가 쌓임
+        await publisher.send_video_frame("cam1", _frame())
+        await asyncio.sleep(0)
+        await publisher.send_video_frame("cam1", _frame())
+        status_task = asyncio.create_task(publisher.emit_capture_status(_status()))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.wait_for(status_task, timeout=1)
+        await asyncio.sleep(0.01)
+
+        # Assert
+        assert events == [
+            EmitEvent.VIDEO_FRAME_RELAY,
+            EmitEvent.BROADCAST_CAPTURE_STATUS,
+            EmitEvent.VIDEO_FRAME_RELAY,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_status_emit_error_propagates(self, publisher, mock_sio):
+        """상태 이벤트 전송 실패가 호출자에게 전달되는지 테스트"""
+        mock_sio.emit.side_effect = Exception("Socket error")
+
+        with pytest.raises(Exception, match="Socket error"):
+            await publisher.emit_capture_status(_status())
+
+    @pytest.mark.asyncio
+    async def test_round_robin_between_streams(self, publisher, mock_sio):
+        """여러 스트림이 번갈아 전송되는지 테스트"""
+        await publisher.send_video_frame("cam1", _frame())
+        await publisher.send_video_frame("cam1", _frame())
+        await publisher.send_video_frame("cam2", _frame())
+        await asyncio.sleep(0.01)
+
+        cameras = [unpack_frame_envelope(c.args[1])[0] for c in mock_sio.emit.call_args_list]
+        assert cameras == ["cam1", "cam2", "cam1"]
+
+    @pytest.mark.asyncio
+    async def test_frame_sent_as_binary_envelope(self, publisher, mock_sio):
+        """프레임이 단일 binary envelope로 전송되는지 테스트"""
+        await publisher.send_video_frame("cam1", _frame(data=memoryview(b"12345"), seq=7))
+        await asyncio.sleep(0.01)
+
+        payload = mock_sio.emit.call_args.args[1]
+        assert isinstance(payload, bytes)
+        camera_id, frame = unpack_frame_envelope(payload)
+        assert camera_id == "cam1"
+        assert (frame.seq, frame.captured_at, frame.width, frame.height) == (7, 1.5, 640, 480)
+        assert frame.data == b"12345"
+
+    @pytest.mark.asyncio
+    async def test_legacy_dict_payload(self, mock_sio):
+        """기본값(binary_envelope=False)이면 기존 dict 형식으로 전송하는지 테스트"""
+        publisher = SocketIOPublisher(mock_sio, EmitEvent())
+        try:
+            await publisher.send_video_frame("cam1", _frame(data=memoryview(b"12345")))
+            await asyncio.sleep(0.01)
+        finally:
+            await publisher.close()
+
+        assert mock_sio.emit.call_args.args[1] == {"frame_data": b"12345", "camera_id": "cam1"}
+
+
+class TestClientMetadataHandshake:
+
+    @pytest.mark.asyncio
+    async def test_waits_for_namespace_connect(self, publisher, mock_sio):
+        """namespace 연결 이벤트가 오면 고정 대기 없이 바로 응답하는지 테스트"""
+        task = asyncio.create_task(publisher.response_client_metadata(ResponseClientMetadataDTO(client_type="stream-service")))
+        await asyncio.sleep(0.02)
+        mock_sio.emit.assert_not_called()
+
+        started = asyncio.get_running_loop().time()
+        publisher.set_connected(True)
+        await asyncio.wait_for(task, timeout=1.0)
+
+        assert asyncio.get_running_loop().time() - started < 0.1
+        mock_sio.emit.assert_awaited_once_with(EmitEvent.RESPONSE_CLIENT_METADATA, {"client_type": "stream-service"})
+
+    @pytest.mark.asyncio
+    async def test_skips_when_namespace_never_connects(self, mock_sio):
+        publisher = SocketIOPublisher(mock_sio, EmitEvent(), ready_timeout=0.05)
+        publisher.set_connected(True)
+        publisher.set_connected(False)
+
+        await publisher.response_client_metadata(ResponseClientMetadataDTO(client_type="stream-service"))
+
+        assert not publisher.is_connected
+        mock_sio.emit.assert_not_called()
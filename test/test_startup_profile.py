@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from stream_service.monitoring.startup_profile import StartupProfile
+
+
+class TestStartupProfile:
+
+    def test_phases_and_time_to_ready(self):
+        """단계별 시간과 interpreter 구간을 포함한 time-to-ready 테스트"""
+        profile = StartupProfile(preamble=0.5)
+        time.sleep(0.01)
+        profile.mark("imports")
+        assert not profile.is_ready
+
+        time_to_ready = profile.ready("namespace_ready")
+        profile.mark("later")
+
+        report = profile.report(budget=10.0)
+        phases = [phase["phase"] for phase in report["phases"]]
+        assert phases == ["interpreter", "imports", "namespace_ready", "later"]
+        assert report["phases"][1]["seconds"] >= 0.01
+        assert report["ready"] is True
+        assert report["time_to_ready_seconds"] == pytest.approx(time_to_ready, abs=1e-4)
+        assert time_to_ready >= 0.51
+        assert report["over_budget"] is False
+
+    def test_over_budget(self):
+        profile = StartupProfile(preamble=2.0)
+        profile.ready()
+
+        assert profile.report(budget=1.0)["over_budget"] is True
+
+
+def test_create_app_does_not_import_capture_stack():
+    """앱 생성까지는 cv2/av를 import하지 않는지 테스트 (별도 프로세스)"""
+    code = (
+        "import sys\n"
+        "from stream_service.main import create_app\n"
+        "create_app()\n"
+        "print(sorted(name for name in ('cv2', 'av') if name in sys.modules))\n"
+    )
+    src = os.path.join(os.path.dirname(__file__), "..", "src")
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, timeout=60,
+        env={**os.environ, "PYTHONPATH": os.path.abspath(src)}
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"
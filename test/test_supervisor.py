@@ -0,0 +1,176 @@
+import asyncio
+import json
+import socket
+import sys
+import textwrap
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from stream_service.application.services.sharding import assign_cameras, owner
+from stream_service.supervisor import WorkerSupervisor, http_request
+
+# /worker/cameras, /metrics만 흉내 내는 워커 (시작 시 담당 카메라를 모두 캡처 중으로 보고)
+FAKE_WORKER = textwrap.dedent('''
+    import json, os
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    state = {"cameras": json.loads(os.environ["WORKER_CAMERAS"])}
+    state["capturing"] = list(state["cameras"])
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, body, content_type="application/json"):
+            data = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == "/metrics":
+                self._reply("# HELP stream_service_capturing Capturing.\\n# TYPE stream_service_capturing gauge\\n"
+                            + "".join('stream_service_capturing{camera_id="%s"} 1\\n' % c for c in state["capturing"]),
+                            "text/plain")
+            else:
+                self._reply(json.dumps(state))
+
+        def do_PUT(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            stopped = [c for c in state["capturing"] if c not in body["cameras"]]
+            started = [c for c in body["resume"] if c not in state["capturing"]]
+            state["cameras"] = body["cameras"]
+            state["capturing"] = [c for c in state["capturing"] if c in body["cameras"]] + started
+            self._reply(json.dumps({"cameras": body["cameras"], "started": started, "stopped": stopped}))
+
+        def log_message(self, *args):
+            pass
+
+    HTTPServer(("127.0.0.1", int(os.environ["PORT"])), Handler).serve_forever()
+''')
+
+
+def _free_base_port(count: int) -> int:
+    for _ in range(50):
+        sockets = []
+        try:
+            probe = socket.socket()
+            probe.bind(("127.0.0.1", 0))
+            base = probe.getsockname()[1]
+            sockets.append(probe)
+            for offset in range(1, count):
+                extra = socket.socket()
+                sockets.append(extra)
+                extra.bind(("127.0.0.1", base + offset))
+            return base
+        except OSError:
+            continue
+        finally:
+            for sock in sockets:
+                sock.close()
+    raise RuntimeError("No free port range")
+
+
+async def _wait_for(condition, timeout: float = 10.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("Condition not met in time")
+        await asyncio.sleep(0.05)
+
+
+class TestSharding:
+
+    def test_owner_is_stable_and_balanced(self):
+        """같은 입력이면 항상 같은 워커, 카메라가 워커들에 고르게 분산되는지 테스트"""
+        cameras = [f"cam{i}" for i in range(400)]
+        assignment = assign_cameras(cameras, [0, 1, 2, 3])
+
+        assert assignment == assign_cameras(cameras, [0, 1, 2, 3])
+        assert sum(len(ids) for ids in assignment.values()) == 400
+        assert all(70 <= len(ids) <= 130 for ids in assignment.values())
+
+    def test_removing_worker_moves_only_its_cameras(self):
+        cameras = [f"cam{i}" for i in range(100)]
+        before = {camera_id: owner(camera_id, [0, 1, 2]) for camera_id in cameras}
+        after = {camera_id: owner(camera_id, [0, 2]) for camera_id in cameras}
+
+        moved = [camera_id for camera_id in cameras if before[camera_id] != after[camera_id]]
+        assert moved and all(before[camera_id] == 1 for camera_id in moved)
+
+    def test_no_workers(self):
+        with pytest.raises(ValueError):
+            owner("cam1", [])
+
+
+class TestWorkerSupervisor:
+
+    @pytest.mark.asyncio
+    async def test_restart_scheduled_after_many_crashes(self):
+        """안정 실행 없이 수천 번 죽어도 재시작 대기는 cap이고, backoff 오류에도 재시작을 예약하는지 테스트"""
+        supervisor = WorkerSupervisor({"cam1": "rtsp://test/cam1"}, workers=1, restart_backoff=(1.0, 30.0))
+        handle = supervisor.workers[0]
+        process = MagicMock()
+        process.wait = AsyncMock(return_value=1)
+        supervisor._restart = AsyncMock()
+
+        for _ in range(3000):
+            handle.process = process
+            handle.started_at = time.monotonic()
+            await supervisor._watch(handle, process)
+            await handle.restart_task
+        delay = supervisor._restart.await_args.args[1]
+        assert 30.0 * (1 - handle.backoff.jitter) <= delay <= 30.0
+
+        handle.backoff.next_delay = MagicMock(side_effect=OverflowError("math range error"))
+        await supervisor._watch(handle, process)
+        await handle.restart_task
+        assert supervisor._restart.await_args.args == (handle, 30.0)
+
+    @pytest.mark.asyncio
+    async def test_rehomes_and_restarts_crashed_worker(self, tmp_path):
+        """죽은 워커의 카메라가 유예 후 다른 워커에서 이어서 캡처되고, 재시작되면 돌아오는지 테스트"""
+        script = tmp_path / "fake_worker.py"
+        script.write_text(FAKE_WORKER)
+        cameras = {f"cam{i}": f"rtsp://test/cam{i}" for i in range(6)}
+        supervisor = WorkerSupervisor(
+            cameras, workers=2, base_port=_free_base_port(2), poll_interval=0.1,
+            rehome_after=0.3, restart_backoff=(1.5, 1.5), command=lambda host, port: [sys.executable, str(script)]
+        )
+        home = assign_cameras(cameras, [0, 1])
+        assert home[0] and home[1]
+        await supervisor.start()
+        try:
+            await _wait_for(lambda: supervisor.health()["status"] == "ok" and set(supervisor.capturing) == set(cameras))
+            assert supervisor.health()["cameras"] == {
+                camera_id: owner(camera_id, [0, 1]) for camera_id in cameras
+            }
+
+            crashed, survivor = supervisor.workers
+            crashed.process.kill()
+            await _wait_for(lambda: set(survivor.cameras) == set(cameras))
+
+            # 옮겨간 카메라는 살아 있는 워커에서 캡처 재개
+            _, body = await asyncio.to_thread(
+                http_request, "GET", supervisor.url(survivor, "/worker/cameras"), supervisor.token
+            )
+            assert set(json.loads(body)["capturing"]) == set(cameras)
+            assert supervisor.health()["status"] == "degraded"
+
+            await _wait_for(lambda: crashed.healthy and crashed.synced and survivor.cameras == home[1])
+            assert crashed.restarts == 1
+            assert sorted(crashed.cameras) == sorted(home[0])
+            _, body = await asyncio.to_thread(
+                http_request, "GET", supervisor.url(crashed, "/worker/cameras"), supervisor.token
+            )
+            assert sorted(json.loads(body)["capturing"]) == sorted(home[0])
+
+            metrics = await supervisor.metrics()
+            assert 'stream_service_capturing{worker="0",camera_id=' in metrics
+            assert 'stream_service_supervisor_worker_restarts_total{worker="0"} 1' in metrics
+            assert metrics.count("# TYPE stream_service_capturing gauge") == 1
+        finally:
+            await supervisor.stop(timeout=5.0)
+
+        assert not any(handle.running for handle in supervisor.workers)
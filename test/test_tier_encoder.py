@@ -0,0 +1,122 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import cv2
+import numpy as np
+import pytest
+
+from stream_service.adapters.outbound.external.latest_frame_slot import GrabbedFrame
+from stream_service.adapters.outbound.external.opencv_capture_engine import OpenCVCaptureEngine
+from stream_service.adapters.outbound.external.tier_encoder import decode_for_tiers, encode_tier_ladder
+from stream_service.application.dto.frame_envelope import EncodedFrame
+from stream_service.application.services.frame_bus import FrameBus
+from stream_service.application.usecases.video_stream_usecase import VideoStreamUseCase
+from stream_service.domain.services.capture_service import CaptureService
+
+
+@pytest.fixture
+def image():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 255, (720, 1280, 3), dtype=np.uint8)
+
+
+def _decoded_shape(frame: EncodedFrame):
+    return cv2.imdecode(np.frombuffer(frame.data, np.uint8), cv2.IMREAD_COLOR).shape
+
+
+class TestTierLadder:
+
+    def test_tier_sizes_keep_aspect(self, image):
+        frames = encode_tier_ladder(image, 7, 1.0, {"native": 0, "480p": 480, "160p": 160}, 70)
+
+        assert (frames["native"].width, frames["native"].height) == (1280, 720)
+        assert (frames["480p"].width, frames["480p"].height) == (853, 480)
+        assert (frames["160p"].width, frames["160p"].height) == (284, 160)
+        assert _decoded_shape(frames["160p"]) == (160, 284, 3)
+        assert all(frame.seq == 7 for frame in frames.values())
+
+    def test_tier_larger_than_source_not_upscaled(self, image):
+        frames = encode_tier_ladder(image, 1, 0.0, {"1080p": 1080}, 70)
+        assert frames["1080p"].height == 720
+
+    def test_each_tier_resized_once_from_previous(self, image):
+        """작은 tier는 원본이 아니라 바로 위 tier 결과에서 축소"""
+        with patch("cv2.resize", wraps=cv2.resize) as resize:
+            encode_tier_ladder(image, 1, 0.0, {"160p": 160, "480p": 480}, 70)
+
+        assert resize.call_count == 2
+        assert resize.call_args_list[0].args[0].shape[0] == 720
+        assert resize.call_args_list[1].args[0].shape[0] == 480
+
+    def test_reduced_decode(self, image):
+        """필요한 해상도까지만 JPEG을 축소 디코딩"""
+        _, buffer = cv2.imencode(".jpg", image)
+
+        assert decode_for_tiers(buffer, 720, {"160p": 160}).shape[0] == 180  # 1/4
+        assert decode_for_tiers(buffer, 720, {"480p": 480}).shape[0] == 720
+        assert decode_for_tiers(buffer, 720, {"160p": 160, "native": 0}).shape[0] == 720
+
+
+class TestEngineTiers:
+
+    @pytest.mark.asyncio
+    async def test_encode_tiers_cached_per_frame(self, image):
+        engine = OpenCVCaptureEngine()
+        engine._last_encoded_source = GrabbedFrame(seq=3, image=image, captured_at=0.0)
+        frame = EncodedFrame(seq=3, captured_at=0.0, width=1280, height=720, data=b"")
+
+        with patch("cv2.imencode", wraps=cv2.imencode) as imencode:
+            first = await engine.encode_tiers(frame, {"160p": 160})
+            second = await engine.encode_tiers(frame, {"160p": 160})
+            both = await engine.encode_tiers(frame, {"160p": 160, "480p": 480})
+
+        assert first["160p"] is second["160p"] is both["160p"]
+        assert both["480p"].height == 480
+        assert imencode.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_encode_tiers_falls_back_to_jpeg(self, image):
+        """원본 프레임이 없으면 (다른 seq) JPEG을 축소 디코딩해 인코딩"""
+        _, buffer = cv2.imencode(".jpg", image)
+        engine = OpenCVCaptureEngine()
+        frame = EncodedFrame(seq=5, captured_at=0.0, width=1280, height=720, data=memoryview(buffer).cast("B"))
+
+        frames = await engine.encode_tiers(frame, {"160p": 160})
+
+        assert (frames["160p"].width, frames["160p"].height) == (284, 160)
+
+
+@pytest.mark.asyncio
+async def test_usecase_encodes_only_subscribed_tiers():
+    engine = MagicMock()
+    engine.start_capture = AsyncMock()
+    engine.stop_capture = AsyncMock()
+    main = EncodedFrame(seq=1, captured_at=0.0, width=4, height=4, data=b"main")
+    thumb = EncodedFrame(seq=1, captured_at=0.0, width=2, height=2, data=b"thumb")
+    engine.get_encoded_frame = AsyncMock(return_value=main)
+    engine.encode_tiers = AsyncMock(return_value={"160p": thumb})
+    publisher = MagicMock()
+    publisher.send_video_frame = AsyncMock()
+    publisher.emit_capture_status = AsyncMock()
+    bus = FrameBus()
+    usecase = VideoStreamUseCase(
+        capture_service=CaptureService(cameras={"cam1": "rtsp://test/cam1"}),
+        event_publisher=publisher,
+        capture_engine_factory=lambda: engine,
+        frame_bus=bus,
+        resolution_tiers={"480p": 480, "160p": 160},
+        frame_rate=100.0
+    )
+
+    # 구독자 없는 tier는 인코딩하지 않음
+    await usecase._publish_tiers(usecase._get_stream("cam1"), main)
+    engine.encode_tiers.assert_not_awaited()
+
+    subscription = bus.subscribe("mjpeg", "cam1", tier="160p")
+    await usecase.handle_capture_start_request("cam1")
+    _, frame = await asyncio.wait_for(subscription.get(), timeout=1.0)
+    await usecase.handle_capture_stop_request("cam1")
+
+    assert frame is thumb
+    engine.encode_tiers.assert_awaited_with(main, {"160p": 160})
+    await bus.close()
@@ -0,0 +1,91 @@
+import asyncio
+import time
+
+import pytest
+
+from stream_service.monitoring.loop_monitor import LoopLagMonitor
+from stream_service.monitoring.tracing import Tracer
+
+
+class TestTracer:
+
+    def test_disabled_records_nothing(self):
+        """비활성 상태에서는 공유 no-op span만 반환하는지 테스트"""
+        tracer = Tracer(enabled=False)
+
+        with tracer.span("capture.encode") as span:
+            span.set("bytes", 10)
+        tracer.record("capture.read_frame", 0.01)
+
+        assert tracer.span("a") is tracer.span("b")
+        assert tracer.recent() == []
+
+    def test_span_records_duration_and_error(self):
+        """span 지속 시간, 속성, 예외가 기록되는지 테스트"""
+        tracer = Tracer(enabled=True)
+
+        with tracer.span("capture.open") as span:
+            span.set("attempts", 2)
+        with pytest.raises(ValueError):
+            with tracer.span("capture.encode"):
+                raise ValueError("bad frame")
+
+        latest, first = tracer.recent()
+        assert first["name"] == "capture.open"
+        assert first["attributes"] == {"attempts": 2}
+        assert latest["error"] == "ValueError: bad frame"
+
+    def test_ring_buffer_and_hooks(self):
+        """ring buffer 크기 제한과 hook 호출 테스트"""
+        tracer = Tracer(capacity=3, enabled=True)
+        seen = []
+        tracer.add_hook(lambda record: seen.append(record.name))
+
+        for i in range(5):
+            tracer.record(f"span{i}", 0.001 * i)
+
+        assert [s["name"] for s in tracer.recent()] == ["span4", "span3", "span2"]
+        assert len(seen) == 5
+        assert tracer.summary()["span4"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_traced_decorator(self):
+        """async 함수 전체가 span으로 기록되는지 테스트"""
+        tracer = Tracer(enabled=True)
+
+        @tracer.traced("usecase.capture_start")
+        async def handler(value):
+            await asyncio.sleep(0.01)
+            return value * 2
+
+        assert await handler(2) == 4
+        assert tracer.recent()[0]["duration_ms"] >= 10
+
+
+class TestLoopLagMonitor:
+
+    @pytest.mark.asyncio
+    async def test_detects_blocking_call(self):
+        """동기 호출로 루프가 막히면 blocked로 기록되는지 테스트"""
+        monitor = LoopLagMonitor(interval=0.01, threshold=0.05, probe_every=1)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.03)
+            time.sleep(0.1)  # 이벤트 루프 차단
+            await asyncio.sleep(0.05)
+        finally:
+            await monitor.stop()
+
+        stats = monitor.stats()
+        assert stats["blocked_count"] >= 1
+        assert stats["lag_max_ms"] >= 50
+        assert monitor.lag_histogram.count >= 2
+
+    def test_executor_saturation(self):
+        monitor = LoopLagMonitor(threshold=0.05)
+
+        monitor.record_executor_delay(0.01)
+        monitor.record_executor_delay(0.2)
+
+        assert monitor.executor_saturated == 1
+        assert monitor.stats()["executor_delay_max_ms"] == 200.0
@@ -0,0 +1,235 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from stream_service.application.dto.frame_envelope import EncodedFrame
+from stream_service.application.services.sharding import CameraShard
+from stream_service.application.usecases.video_stream_usecase import VideoStreamUseCase
+from stream_service.domain.models.capture_session import CaptureStatus
+from stream_service.domain.services.capture_service import CaptureService
+
+
+def _make_engine():
+    engine = MagicMock()
+    engine.start_capture = AsyncMock()
+    engine.stop_capture = AsyncMock()
+    engine.get_encoded_frame = AsyncMock(
+        return_value=EncodedFrame(seq=1, captured_at=0.0, width=4, height=4, data=b"jpeg")
+    )
+    engine.is_capturing.return_value = True
+    engine.get_frame_stats.return_value = {"cpu_seconds": 0.0, "cpu_percent": 0.0}
+    return engine
+
+
+@pytest.fixture
+def capture_service():
+    return CaptureService(cameras={
+        "cam1": "rtsp://test/cam1",
+        "cam2": "rtsp://test/cam2",
+    })
+
+
+@pytest.fixture
+def event_publisher():
+    publisher = MagicMock()
+    publisher.send_video_frame = AsyncMock()
+    publisher.emit_capture_status = AsyncMock()
+    publisher.response_client_metadata = AsyncMock()
+    return publisher
+
+
+@pytest.fixture
+def engine_factory():
+    return MagicMock(side_effect=_make_engine)
+
+
+@pytest.fixture
+def usecase(capture_service, event_publisher, engine_factory):
+    return VideoStreamUseCase(
+        capture_service=capture_service,
+        event_publisher=event_publisher,
+        capture_engine_factory=engine_factory
+    )
+
+
+class TestVideoStreamUseCase:
+
+    @pytest.mark.asyncio
+    async def test_start_creates_engine_per_camera(self, usecase, capture_service, engine_factory):
+        """카메라마다 별도 엔진과 스트리밍 task 생성 테스트"""
+        # Act
+        await usecase.handle_capture_start_request("cam1")
+        await usecase.handle_capture_start_request("cam2")
+
+        # Assert
+        assert engine_factory.call_count == 2
+        assert usecase._streams["cam1"].engine is not usecase._streams["cam2"].engine
+        usecase._streams["cam1"].engine.start_capture.assert_called_once_with("rtsp://test/cam1")
+        assert capture_service.get_session("cam1").status == CaptureStatus.RUNNING
+        assert capture_service.get_session("cam2").status == CaptureStatus.RUNNING
+
+        await usecase.handle_capture_stop_request("cam1")
+        await usecase.handle_capture_stop_request("cam2")
+
+    @pytest.mark.asyncio
+    async def test_stop_only_affects_target_camera(self, usecase, capture_service):
+        """한 카메라 중지가 다른 카메라에 영향 없는지 테스트"""
+        # Arrange
+        await usecase.handle_capture_start_request("cam1")
+        await usecase.handle_capture_start_request("cam2")
+
+        # Act
+        await usecase.handle_capture_stop_request("cam1")
+
+        # Assert
+        assert capture_service.get_session("cam1").status == CaptureStatus.STOPPED
+        assert capture_service.get_session("cam2").status == CaptureStatus.RUNNING
+        assert usecase._streams["cam1"].frame_task is None
+        assert not usecase._streams["cam2"].frame_task.done()
+
+        await usecase.handle_capture_stop_request("cam2")
+
+    @pytest.mark.asyncio
+    async def test_frames_tagged_with_camera_id(self, usecase, event_publisher):
+        """전송 프레임에 camera_id가 포함되는지 테스트"""
+        # Act
+        await usecase.handle_capture_start_request("cam2")
+        await asyncio.sleep(0.05)
+        await usecase.handle_capture_stop_request("cam2")
+
+        # Assert - 같은 seq 프레임은 한 번만 전송
+        event_publisher.send_video_frame.assert_called_once()
+        camera_id, frame = event_publisher.send_video_frame.call_args.args
+        assert camera_id == "cam2"
+        assert frame.data == b"jpeg"
+
+    @pytest.mark.asyncio
+    async def test_dead_engine_marks_session_error(self, usecase, capture_service):
+        """엔진이 스스로 캡처를 멈추면 세션을 running으로 남기지 않고 ERROR로 전환"""
+        await usecase.handle_capture_start_request("cam1")
+        engine = usecase._get_stream("cam1").engine
+        engine.get_encoded_frame.return_value = None
+        engine.is_capturing.return_value = False
+
+        await asyncio.wait_for(usecase._get_stream("cam1").frame_task, timeout=1.0)
+
+        session = capture_service.get_session_status("cam1")
+        assert session.status == CaptureStatus.ERROR
+
+    @pytest.mark.asyncio
+    async def test_progress_log_uses_only_own_stats(self, capture_service, event_publisher, engine_factory):
+        """진행 로그는 이 카메라 엔진 통계만 읽고, cpu 통계가 없는 엔진에서도 스트리밍이 계속되는지 테스트"""
+        usecase = VideoStreamUseCase(
+            capture_service=capture_service,
+            event_publisher=event_publisher,
+            capture_engine_factory=engine_factory,
+            frame_rate=1000.0
+        )
+        usecase.get_stream_stats = MagicMock(side_effect=AssertionError("stats for every stream"))
+        await usecase.handle_capture_start_request("cam1")
+        engine = usecase._get_stream("cam1").engine
+        engine.get_frame_stats.return_value = {}
+        seq = iter(range(2, 1000))
+        engine.get_encoded_frame.side_effect = lambda: EncodedFrame(
+            seq=next(seq), captured_at=0.0, width=4, height=4, data=b"jpeg"
+        )
+
+        await asyncio.sleep(0.2)
+
+        assert engine.get_frame_stats.called
+        assert capture_service.get_session_status("cam1").status == CaptureStatus.RUNNING
+        await usecase.handle_capture_stop_request("cam1")
+
+    @pytest.mark.asyncio
+    async def test_start_unknown_camera(self, usecase):
+        """등록되지 않은 카메라 시작 테스트"""
+        with pytest.raises(ValueError, match="Unknown camera"):
+            await usecase.handle_capture_start_request("missing")
+
+    @pytest.mark.asyncio
+    async def test_request_capture_status_all_cameras(self, usecase, event_publisher):
+        """camera_id 없이 상태 요청 시 전체 카메라 상태 전송 테스트"""
+        # Act
+        await usecase.handle_request_capture_status()
+
+        # Assert
+        camera_ids = [c.args[0].camera_id for c in event_publisher.emit_capture_status.call_args_list]
+        assert camera_ids == ["cam1", "cam2"]
+
+    @pytest.mark.asyncio
+    async def test_get_stream_stats(self, usecase):
+        """스트림별 리소스 통계 테스트"""
+        # Arrange
+        await usecase.handle_capture_start_request("cam1")
+        await usecase.handle_capture_start_request("cam2")
+
+        # Act
+        stats = usecase.get_stream_stats()
+
+        # Assert
+        assert set(stats) == {"cam1", "cam2"}
+        assert stats["cam1"]["rss_share_bytes"] == stats["cam1"]["process_rss_bytes"] // 2
+
+        await usecase.handle_capture_stop_request("cam1")
+        await usecase.handle_capture_stop_request("cam2")
+
+    @pytest.mark.asyncio
+    async def test_emit_feedback_updates_encode_params(self, capture_service, event_publisher, engine_factory):
+        """실제 emit 피드백으로 인코딩 파라미터가 조정되는지 테스트"""
+        # Arrange
+        controller = MagicMock()
+        controller.quality, controller.scale = 70, 0.5
+        controller.record.return_value = True
+        usecase = VideoStreamUseCase(
+            capture_service=capture_service,
+            event_publisher=event_publisher,
+            capture_engine_factory=engine_factory,
+            encode_controller_factory=lambda: controller
+        )
+        listener = event_publisher.set_frame_emit_listener.call_args.args[0]
+        engine = usecase._get_stream("cam1").engine
+
+        # Act
+        listener("cam1", 1000, 0.2)
+
+        # Assert
+        controller.record.assert_called_once_with(1000, 0.2)
+        engine.set_encode_params.assert_called_with(70, 0.5)
+
+
+class TestCameraShard:
+
+    @pytest.fixture
+    def worker_usecase(self, capture_service, event_publisher, engine_factory):
+        return VideoStreamUseCase(
+            capture_service=capture_service,
+            event_publisher=event_publisher,
+            capture_engine_factory=engine_factory,
+            shard=CameraShard(["cam1"])
+        )
+
+    @pytest.mark.asyncio
+    async def test_ignores_cameras_of_other_workers(self, worker_usecase, capture_service, event_publisher):
+        """담당하지 않는 카메라의 명령과 상태 요청은 무시하는지 테스트"""
+        await worker_usecase.handle_capture_start_request("cam2")
+        await worker_usecase.handle_request_capture_status()
+
+        assert capture_service.get_session("cam2").status == CaptureStatus.STOPPED
+        assert "cam2" not in worker_usecase._streams
+        statuses = [call.args[0].camera_id for call in event_publisher.emit_capture_status.call_args_list]
+        assert statuses == ["cam1"]
+
+    @pytest.mark.asyncio
+    async def test_reassign_stops_removed_and_resumes_added(self, worker_usecase, capture_service):
+        """재배치 시 빠진 카메라는 중지하고 옮겨온 카메라는 캡처를 이어서 시작하는지 테스트"""
+        await worker_usecase.handle_capture_start_request("cam1")
+
+        result = await worker_usecase.reassign_cameras(["cam2", "unknown"], resume=["cam1", "cam2"])
+
+        assert result == {"cameras": ["cam2"], "started": ["cam2"], "stopped": ["cam1"]}
+        assert capture_service.get_session("cam1").status == CaptureStatus.STOPPED
+        assert capture_service.get_session("cam2").status == CaptureStatus.RUNNING
+        worker_usecase._streams["cam2"].engine.start_capture.assert_called_once_with("rtsp://test/cam2")
+
+        await worker_usecase.handle_capture_stop_request("cam2")